@@ -29,6 +29,7 @@ from kintsugi.oracle.hooks import AgentTurn
 from kintsugi.oracle.monitor import OracleLoopMonitor, get_oracle_monitor
 from kintsugi.security.monitor import SecurityMonitor, Verdict
 from kintsugi.security.pii import PIIRedactor
+from kintsugi.security.scan_cache import get_scan_cache
 from kintsugi.skills.base import SkillContext, SkillRequest
 from kintsugi.skills.registry import SkillRegistry, get_registry
 
@@ -101,8 +102,8 @@ class AgentInstance:
         self.stats = {"messages": 0, "skills_executed": 0, "security_blocks": 0, "oracle_blocks": 0}
         self.last_active: datetime | None = None
 
-        self._security = SecurityMonitor()
-        self._redactor = PIIRedactor()
+        self._security = SecurityMonitor(cache=get_scan_cache())
+        self._redactor = PIIRedactor(cache=get_scan_cache())
         self._skills = skill_registry or get_registry()
         self._oracle = oracle_monitor or get_oracle_monitor()
         self._events = event_bus or get_event_bus()
@@ -11,10 +11,16 @@ import uuid
 
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.requests import Request
-from starlette.responses import JSONResponse, Response
+from starlette.responses import JSONResponse, Response, StreamingResponse
 
 from kintsugi.config.settings import settings
-from kintsugi.security.pii import PIIRedactor
+from kintsugi.security.pii import (
+    PIIRedactor,
+    StreamingRedactor,
+    is_redactable,
+    redact_stream,
+)
+from kintsugi.security.scan_cache import get_scan_cache
 
 logger = logging.getLogger("kintsugi.api")
 
@@ -51,20 +57,40 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
 # PII redaction
 # ---------------------------------------------------------------------------
 
-_redactor = PIIRedactor()
+_redactor = PIIRedactor(cache=get_scan_cache())
 
 
 class PIIRedactionMiddleware(BaseHTTPMiddleware):
-    """Scan JSON response bodies for PII and redact before sending."""
+    """Scan JSON response bodies for PII and redact before sending.
+
+    Bodies with a ``content-length`` up to ``PII_BUFFER_LIMIT_BYTES`` are
+    redacted whole and report ``X-PII-Redacted: true|false``.  Larger or
+    unsized bodies (exports, streaming responses) are redacted chunk by
+    chunk without being buffered and report ``X-PII-Redacted: streamed``,
+    since headers go out before the body has been scanned.  Compressed
+    bodies are passed through unread.
+    """
 
     async def dispatch(self, request: Request, call_next):  # noqa: ANN001
         response: Response = await call_next(request)
 
         content_type = response.headers.get("content-type", "")
-        if "application/json" not in content_type:
+        if "application/json" not in content_type or not is_redactable(response.headers):
             response.headers["X-PII-Redacted"] = "false"
             return response
 
+        length = response.headers.get("content-length")
+        if length is None or int(length) > settings.PII_BUFFER_LIMIT_BYTES:
+            headers = {k: v for k, v in response.headers.items() if k != "content-length"}
+            headers["X-PII-Redacted"] = "streamed"
+            body = response.body_iterator  # type: ignore[attr-defined]
+            return StreamingResponse(
+                redact_stream(body, StreamingRedactor(_redactor)),
+                status_code=response.status_code,
+                headers=headers,
+                media_type=response.media_type,
+            )
+
         # Read the full body
         body_bytes = b""
         async for chunk in response.body_iterator:  # type: ignore[attr-defined]
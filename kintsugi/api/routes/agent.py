@@ -13,9 +13,11 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from kintsugi.db import get_session
+from kintsugi.memory.temporal import get_temporal_log
 from kintsugi.models.base import Organization, TemporalMemory
 from kintsugi.security.monitor import SecurityMonitor
 from kintsugi.security.pii import PIIRedactor
+from kintsugi.security.scan_cache import get_scan_cache
 from kintsugi.cognition.orchestrator import Orchestrator, OrchestratorConfig
 from kintsugi.cognition.model_router import ModelRouter
 from kintsugi.config.settings import settings
@@ -24,8 +26,8 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/agent", tags=["agent"])
 
-_monitor = SecurityMonitor()
-_redactor = PIIRedactor()
+_monitor = SecurityMonitor(cache=get_scan_cache())
+_redactor = PIIRedactor(cache=get_scan_cache())
 
 # LLM client - lazy initialization to handle missing API key gracefully
 _llm_client = None
@@ -125,11 +127,11 @@ async def agent_message(
 
     # 4/5. Log to TemporalMemory and build response
     if verdict_str == "block":
-        event = TemporalMemory(
-            org_id=org_uuid,
-            category="security",
-            message=redacted_text,
-            metadata_json={
+        event_id = await get_temporal_log().log_event(
+            org_uuid,
+            "security",
+            redacted_text,
+            {
                 "security_verdict": verdict_str,
                 "security_reason": verdict.reason,
                 "matched_pattern": verdict.matched_pattern,
@@ -137,9 +139,8 @@ async def agent_message(
                 "context": req.context,
                 "pii_types_found": redaction.types_found,
             },
+            session,
         )
-        session.add(event)
-        await session.flush()
 
         return AgentResponse(
             response=f"Message blocked by security monitor: {verdict.reason}",
@@ -147,7 +148,7 @@ async def agent_message(
             security_verdict=verdict_str,
             redacted_input=redacted_text,
             memory_context=[],
-            temporal_event_id=str(event.id),
+            temporal_event_id=event_id,
         )
 
     # ALLOW or WARN - proceed with LLM processing
@@ -201,11 +202,11 @@ provide actionable guidance. If you need more information, ask clarifying questi
         )
 
     # Log to temporal memory
-    event = TemporalMemory(
-        org_id=org_uuid,
-        category="interaction",
-        message=redacted_text,
-        metadata_json={
+    event_id = await get_temporal_log().log_event(
+        org_uuid,
+        "interaction",
+        redacted_text,
+        {
             "security_verdict": verdict_str,
             "security_reason": verdict.reason,
             "context": req.context,
@@ -214,9 +215,8 @@ provide actionable guidance. If you need more information, ask clarifying questi
             "routing_confidence": routing.confidence,
             "routing_reasoning": routing.reasoning,
         },
+        session,
     )
-    session.add(event)
-    await session.flush()
 
     return AgentResponse(
         response=response_text,
@@ -224,7 +224,7 @@ provide actionable guidance. If you need more information, ask clarifying questi
         security_verdict=verdict_str,
         redacted_input=redacted_text,
         memory_context=[],
-        temporal_event_id=str(event.id),
+        temporal_event_id=event_id,
     )
 
 
@@ -268,3 +268,14 @@ async def get_temporal_events(
     ]
 
     return TemporalListResponse(events=events, org_id=org_id, count=len(events))
+
+
+# ---------------------------------------------------------------------------
+# GET /api/agent/scan-cache
+# ---------------------------------------------------------------------------
+
+@router.get("/scan-cache")
+async def scan_cache_stats() -> dict:
+    """Hit/miss counters for the shared security/PII verdict cache."""
+    cache = get_scan_cache()
+    return {"enabled": True, **cache.info()} if cache is not None else {"enabled": False}
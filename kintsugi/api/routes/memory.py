@@ -2,20 +2,20 @@
 
 from __future__ import annotations
 
-import asyncio
 import logging
 import uuid
 from typing import Any
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from pydantic import BaseModel
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from kintsugi.config.settings import settings
 from kintsugi.db import get_session
-from kintsugi.memory.cma_stage3 import ScoredResult, estimate_complexity, retrieve
-from kintsugi.memory.embeddings import get_embedding_provider
+from kintsugi.memory.bulk_ingest import DEFAULT_CHUNK_SIZE, ingest_ndjson, load_checkpoint
+from kintsugi.memory.embedding_cache import get_provider_registry
+from kintsugi.memory.hybrid_search import hybrid_search
 
 logger = logging.getLogger(__name__)
 
@@ -33,33 +33,12 @@ def _parse_uuid(value: str, field: str = "org_id") -> uuid.UUID:
         raise HTTPException(status_code=400, detail=f"Invalid UUID for {field}: {value!r}")
 
 
-def _vec_literal(vec) -> str:
-    """Convert a numpy array to a pgvector literal string like '[0.1,0.2,...]'."""
-    return "[" + ",".join(str(float(v)) for v in vec) + "]"
-
-
-def _rows_to_scored(rows, source: str) -> list[ScoredResult]:
-    results: list[ScoredResult] = []
-    for row in rows:
-        results.append(ScoredResult(
-            id=str(row.id),
-            content=row.content,
-            score=float(row.score),
-            source=source,
-            metadata={
-                "significance": row.significance,
-                "memory_layer": row.memory_layer,
-                "created_at": row.created_at.isoformat() if row.created_at else None,
-            },
-        ))
-    return results
-
-
 def _get_provider():
+    """Shared, cached provider — the model loads once per process."""
     kwargs: dict[str, Any] = {}
     if settings.EMBEDDING_MODE == "api":
         kwargs["api_key"] = settings.OPENAI_API_KEY
-    return get_embedding_provider(mode=settings.EMBEDDING_MODE, **kwargs)
+    return get_provider_registry().get(mode=settings.EMBEDDING_MODE, **kwargs)
 
 
 # ---------------------------------------------------------------------------
@@ -83,62 +62,9 @@ async def memory_search(
         logger.exception("Embedding generation failed")
         raise HTTPException(status_code=500, detail=f"Embedding failure: {exc}")
 
-    vec_lit = _vec_literal(query_vec)
-
-    # --- three parallel searches ---
-    dense_sql = text("""
-        SELECT mu.id, mu.content, mu.significance, mu.memory_layer, mu.created_at,
-               1 - (me.embedding <=> :query_vec::vector) AS score
-        FROM memory_units mu
-        JOIN memory_embeddings me ON me.memory_id = mu.id
-        WHERE mu.org_id = :org_id
-        ORDER BY me.embedding <=> :query_vec::vector
-        LIMIT :limit
-    """)
-
-    lexical_sql = text("""
-        SELECT mu.id, mu.content, mu.significance, mu.memory_layer, mu.created_at,
-               ts_rank(ml.tsv, plainto_tsquery('english', :query)) AS score
-        FROM memory_units mu
-        JOIN memory_lexical ml ON ml.memory_id = mu.id
-        WHERE mu.org_id = :org_id AND ml.tsv @@ plainto_tsquery('english', :query)
-        ORDER BY score DESC
-        LIMIT :limit
-    """)
-
-    symbolic_sql = text("""
-        SELECT mu.id, mu.content, mu.significance, mu.memory_layer, mu.created_at,
-               (10 - mu.significance)::float / 10.0 AS score
-        FROM memory_units mu
-        WHERE mu.org_id = :org_id
-        ORDER BY mu.significance ASC, mu.created_at DESC
-        LIMIT :limit
-    """)
-
-    params_dense = {"query_vec": vec_lit, "org_id": str(oid), "limit": limit}
-    params_lex = {"query": q, "org_id": str(oid), "limit": limit}
-    params_sym = {"org_id": str(oid), "limit": limit}
-
-    dense_task = session.execute(dense_sql, params_dense)
-    lexical_task = session.execute(lexical_sql, params_lex)
-    symbolic_task = session.execute(symbolic_sql, params_sym)
-
-    dense_res, lexical_res, symbolic_res = await asyncio.gather(
-        dense_task, lexical_task, symbolic_task
-    )
-
-    dense_hits = _rows_to_scored(dense_res.fetchall(), "dense")
-    lexical_hits = _rows_to_scored(lexical_res.fetchall(), "lexical")
-    symbolic_hits = _rows_to_scored(symbolic_res.fetchall(), "symbolic")
-
-    # --- CMA Stage 3 fusion ---
-    profile = estimate_complexity(q)
-    fused = retrieve(
-        query=q,
-        dense_results=dense_hits,
-        lexical_results=lexical_hits,
-        symbolic_results=symbolic_hits,
-        n_results=limit,
+    # --- retrieval + CMA Stage 3 fusion, server-side ---
+    fused, profile = await hybrid_search(
+        session, q, query_vec, str(oid), n_results=limit,
     )
 
     return {
@@ -157,6 +83,7 @@ async def memory_search(
         "org_id": str(oid),
         "query_profile": {
             "complexity": profile.complexity,
+            "ef_search": profile.ef_search,
             "weights": {
                 "dense": profile.dense_weight,
                 "lexical": profile.lexical_weight,
@@ -193,8 +120,6 @@ async def memory_store(
         logger.exception("Embedding generation failed")
         raise HTTPException(status_code=500, detail=f"Embedding failure: {exc}")
 
-    vec_lit = _vec_literal(vec)
-
     # --- insert memory unit ---
     await session.execute(
         text("""
@@ -214,11 +139,11 @@ async def memory_store(
     await session.execute(
         text("""
             INSERT INTO memory_embeddings (memory_id, embedding, model)
-            VALUES (:memory_id, :embedding::vector, :model)
+            VALUES (:memory_id, CAST(:embedding AS vector), :model)
         """),
         {
             "memory_id": str(memory_id),
-            "embedding": vec_lit,
+            "embedding": vec,
             "model": settings.EMBEDDING_MODE,
         },
     )
@@ -253,3 +178,71 @@ async def memory_store(
         "org_id": str(oid),
         "status": "created",
     }
+
+
+# ---------------------------------------------------------------------------
+# POST /api/memory/bulk
+# ---------------------------------------------------------------------------
+
+@router.post("/bulk")
+async def memory_bulk_store(
+    request: Request,
+    org_id: str = Query(..., description="Organization ID"),
+    job_id: str | None = Query(
+        None, max_length=128, description="Checkpoint key; reuse it to resume an interrupted upload",
+    ),
+    chunk_size: int = Query(DEFAULT_CHUNK_SIZE, ge=1, le=5000),
+    session: AsyncSession = Depends(get_session),
+) -> dict:
+    """Stream an NDJSON body of memories, one JSON object per line.
+
+    Each chunk is embedded in one batch and committed in one transaction
+    together with the job checkpoint.
+    """
+    oid = _parse_uuid(org_id)
+    try:
+        provider = _get_provider()
+    except Exception as exc:
+        logger.exception("Embedding provider unavailable")
+        raise HTTPException(status_code=500, detail=f"Embedding failure: {exc}")
+
+    progress = await ingest_ndjson(
+        session,
+        str(oid),
+        request.stream(),
+        provider,
+        job_id=job_id,
+        chunk_size=chunk_size,
+        model=settings.EMBEDDING_MODE,
+    )
+    return {**progress.to_dict(), "status": "completed"}
+
+
+@router.get("/bulk/{job_id}")
+async def memory_bulk_progress(
+    job_id: str,
+    org_id: str = Query(..., description="Organization ID"),
+    session: AsyncSession = Depends(get_session),
+) -> dict:
+    """Committed progress of a (possibly still running) bulk upload."""
+    oid = _parse_uuid(org_id)
+    checkpoint = await load_checkpoint(session, job_id, str(oid))
+    if checkpoint is None:
+        raise HTTPException(status_code=404, detail=f"Unknown ingest job: {job_id!r}")
+    lines, memories = checkpoint
+    return {
+        "job_id": job_id,
+        "org_id": str(oid),
+        "lines_committed": lines,
+        "memories_committed": memories,
+    }
+
+
+# ---------------------------------------------------------------------------
+# GET /api/memory/embedding-cache
+# ---------------------------------------------------------------------------
+
+@router.get("/embedding-cache")
+async def embedding_cache_stats() -> dict:
+    """Hit/miss counters for the shared embedding cache."""
+    return get_provider_registry().stats()
@@ -2,7 +2,7 @@
 
 from dataclasses import asdict
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 from .models import (
     BDIBelief,
@@ -16,7 +16,12 @@ from .models import (
 
 
 class BDIStore:
-    """Thread-unsafe in-memory store for BDI entities with revision tracking."""
+    """Thread-unsafe in-memory store for BDI entities with revision tracking.
+
+    Every change bumps :attr:`revision` and notifies subscribers, so
+    consumers that precompute lookups from the store (e.g. the memory
+    ``BDIBridge``) know when to rebuild them.
+    """
 
     def __init__(self, org_id: str) -> None:
         self.org_id = org_id
@@ -24,6 +29,21 @@ class BDIStore:
         self._desires: Dict[str, BDIDesire] = {}
         self._intentions: Dict[str, BDIIntention] = {}
         self._revisions: List[dict] = []
+        self._revision = 1
+        self._listeners: List[Callable[[dict], None]] = []
+
+    @property
+    def revision(self) -> int:
+        """Snapshot version: 1 for a new store, plus one per recorded change."""
+        return self._revision
+
+    def subscribe(self, callback: Callable[[dict], None]) -> None:
+        """Call *callback* with each revision record as it is recorded."""
+        self._listeners.append(callback)
+
+    def unsubscribe(self, callback: Callable[[dict], None]) -> None:
+        if callback in self._listeners:
+            self._listeners.remove(callback)
 
     # ------------------------------------------------------------------
     # Beliefs
@@ -139,6 +159,7 @@ class BDIStore:
             desires=list(self._desires.values()),
             intentions=list(self._intentions.values()),
             snapshot_at=datetime.now(timezone.utc),
+            version=self._revision,
         )
 
     def get_revision_history(
@@ -157,12 +178,14 @@ class BDIStore:
         before: Optional[dict],
         after: dict,
     ) -> None:
-        self._revisions.append(
-            {
-                "entity_type": entity_type,
-                "entity_id": entity_id,
-                "before": before,
-                "after": after,
-                "timestamp": datetime.now(timezone.utc).isoformat(),
-            }
-        )
+        revision = {
+            "entity_type": entity_type,
+            "entity_id": entity_id,
+            "before": before,
+            "after": after,
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+        }
+        self._revisions.append(revision)
+        self._revision += 1
+        for callback in list(self._listeners):
+            callback(revision)
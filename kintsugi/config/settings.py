@@ -25,6 +25,9 @@ class Settings(BaseSettings):
     # --- Embeddings ---
     EMBEDDING_MODE: Literal["local", "api"] = "local"
     EMBEDDING_MODEL: str = "all-mpnet-base-v2"
+    EMBEDDING_CACHE_MAX_ENTRIES: int = 10_000
+    EMBEDDING_CACHE_TTL_SECONDS: float = 0.0  # 0 = no expiry
+    EMBEDDING_CACHE_DIR: str = ""  # empty = in-memory only
 
     # --- LLM Keys (optional) ---
     ANTHROPIC_API_KEY: str = ""
@@ -51,9 +54,32 @@ class Settings(BaseSettings):
     DASHBOARD_ENABLED: bool = True
     MAX_AGENTS: int = 64
 
+    # --- Expiration reaper ---
+    REAPER_INTERVAL_SECONDS: float = 0.0  # 0 = no background reaper
+    REAPER_BATCH_SIZE: int = 1000
+    REAPER_ARCHIVE_CONTENT: bool = False  # also copy content to the cold archive
+
+    # --- Temporal log ---
+    TEMPORAL_LOG_DURABILITY: Literal["sync", "buffered"] = "sync"  # buffered = group commit
+    TEMPORAL_LOG_BATCH_SIZE: int = 500
+    TEMPORAL_LOG_FLUSH_INTERVAL: float = 0.05  # seconds an event may wait
+    TEMPORAL_LOG_QUEUE_SIZE: int = 10_000
+    TEMPORAL_PARTITION_INTERVAL_SECONDS: float = 86_400.0  # 0 = no partition maintenance
+    TEMPORAL_PARTITION_MONTHS_AHEAD: int = 3
+    TEMPORAL_RETENTION_MONTHS: int = 0  # 0 = keep every month attached
+    TEMPORAL_RETENTION_ACTION: Literal["detach", "drop"] = "detach"
+
     # --- Shield budgets ---
     SHIELD_BUDGET_PER_SESSION: float = 5.0
     SHIELD_BUDGET_PER_DAY: float = 50.0
+    SHIELD_STATE_BACKEND: Literal["memory", "redis"] = "memory"  # redis: shared via REDIS_URL
+
+    # --- PII redaction ---
+    PII_BUFFER_LIMIT_BYTES: int = 65_536  # larger/unsized JSON bodies are redacted as they stream
+
+    # --- Scan cache (security / PII verdicts) ---
+    SCAN_CACHE_MAX_ENTRIES: int = 10_000  # 0 = no caching
+    SCAN_CACHE_MAX_TEXT_LENGTH: int = 16_384  # longer texts are always rescanned
 
     # --- Observability ---
     OTEL_EXPORTER_ENDPOINT: str = ""
@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import logging
 from collections.abc import AsyncGenerator
+from typing import Any
 
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
     async_sessionmaker,
@@ -19,6 +22,26 @@ engine = create_async_engine(
     pool_pre_ping=True,
 )
 
+logger = logging.getLogger(__name__)
+
+
+async def _register_vector_codec(conn: Any) -> None:
+    """Let asyncpg send/receive pgvector values in binary form."""
+    try:
+        from pgvector.asyncpg import register_vector
+
+        await register_vector(conn)
+    except Exception as exc:  # extension not installed yet (e.g. before migrations)
+        logger.debug("pgvector codec not registered: %s", exc)
+
+
+if engine.dialect.driver == "asyncpg":
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _on_connect(dbapi_connection: Any, connection_record: Any) -> None:
+        dbapi_connection.run_async(_register_vector_codec)
+
+
 async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
 
@@ -30,6 +30,12 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     except Exception as exc:  # pragma: no cover - defensive
         logger.warning("skill bootstrap failed: %s", exc)
 
+    # Embedding providers are pooled process-wide; the registry is created
+    # lazily on first use and released on shutdown.
+    from kintsugi.memory.embedding_cache import get_provider_registry
+
+    app.state.embedding_registry = get_provider_registry()
+
     app.state.db_available = False
     try:
         from kintsugi.db import engine
@@ -42,8 +48,85 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
             "database unavailable (%s) — running without persistent memory", exc
         )
 
+    # Expired memories are reaped across all orgs in the background.
+    reaper_task = None
+    if app.state.db_available and settings.REAPER_INTERVAL_SECONDS > 0:
+        import asyncio
+
+        from kintsugi.db import async_session
+        from kintsugi.memory.cold_archive import ColdArchive
+        from kintsugi.memory.significance import ExpiredMemoryReaper
+
+        reaper = ExpiredMemoryReaper(
+            batch_size=settings.REAPER_BATCH_SIZE,
+            cold_archive=ColdArchive() if settings.REAPER_ARCHIVE_CONTENT else None,
+        )
+        reaper_stop = asyncio.Event()
+        reaper_task = asyncio.create_task(
+            reaper.run_periodically(
+                async_session, settings.REAPER_INTERVAL_SECONDS, stop=reaper_stop
+            )
+        )
+
+    # Temporal events are group-committed when durability is "buffered".
+    temporal_buffer = None
+    if app.state.db_available and settings.TEMPORAL_LOG_DURABILITY == "buffered":
+        from kintsugi.db import async_session
+        from kintsugi.memory.temporal import (
+            TemporalLog,
+            TemporalWriteBuffer,
+            set_temporal_log,
+        )
+
+        temporal_buffer = TemporalWriteBuffer(
+            async_session,
+            batch_size=settings.TEMPORAL_LOG_BATCH_SIZE,
+            flush_interval=settings.TEMPORAL_LOG_FLUSH_INTERVAL,
+            max_queue=settings.TEMPORAL_LOG_QUEUE_SIZE,
+        )
+        temporal_buffer.start()
+        set_temporal_log(TemporalLog(buffer=temporal_buffer))
+
+    # Monthly temporal_memories partitions are created ahead and retired.
+    partition_task = None
+    if app.state.db_available and settings.TEMPORAL_PARTITION_INTERVAL_SECONDS > 0:
+        import asyncio
+
+        from kintsugi.db import async_session
+        from kintsugi.memory.temporal_partitions import TemporalPartitionManager
+
+        partitions = TemporalPartitionManager(
+            months_ahead=settings.TEMPORAL_PARTITION_MONTHS_AHEAD,
+            retain_months=settings.TEMPORAL_RETENTION_MONTHS,
+            retention_action=settings.TEMPORAL_RETENTION_ACTION,
+        )
+        partition_stop = asyncio.Event()
+        partition_task = asyncio.create_task(
+            partitions.run_periodically(
+                async_session,
+                settings.TEMPORAL_PARTITION_INTERVAL_SECONDS,
+                stop=partition_stop,
+            )
+        )
+
     yield
 
+    if partition_task is not None:
+        partition_stop.set()
+        await partition_task
+
+    if temporal_buffer is not None:
+        await temporal_buffer.close()
+        set_temporal_log(None)
+
+    if reaper_task is not None:
+        reaper_stop.set()
+        await reaper_task
+
+    from kintsugi.memory.embedding_cache import reset_provider_registry
+
+    reset_provider_registry()
+
     if app.state.db_available:
         from kintsugi.db import engine
 
@@ -57,6 +57,7 @@ except ImportError:
 from kintsugi.cognition import Orchestrator, OrchestratorConfig, ModelTier
 from kintsugi.security.monitor import SecurityMonitor
 from kintsugi.security.pii import PIIRedactor
+from kintsugi.security.scan_cache import get_scan_cache
 from kintsugi.bdi.store import BDIStore
 
 
@@ -67,8 +68,8 @@ def create_server(org_id: str, config_path: str = "") -> "Server":
         )
 
     server = Server("kintsugi")
-    redactor = PIIRedactor()
-    monitor = SecurityMonitor()
+    redactor = PIIRedactor(cache=get_scan_cache())
+    monitor = SecurityMonitor(cache=get_scan_cache())
     bdi = BDIStore(org_id)
     orchestrator = None
 
@@ -3,8 +3,11 @@
 Implements the SimpleMem pipeline (arXiv:2601.02553) with five modules:
 
 - **embeddings**: Vector embedding providers (local + API)
+- **embedding_cache**: Shared provider pool and content-addressed embedding cache
+- **bulk_ingest**: Resumable NDJSON bulk ingestion with COPY-based writes
 - **cma_stage1**: Semantic structured compression (sliding window, entropy, normalization)
 - **cold_archive**: Sub-threshold compressed storage with integrity verification
+- **archive_codecs**: gzip / zstd (per-org dictionary) codecs for the cold archive
 - **temporal**: Append-only decision/event log
 - **significance**: Memory layers, expiration policies, and reaper
 - **spaced**: Fibonacci spaced retrieval scheduling
@@ -17,14 +20,30 @@ from kintsugi.memory.cma_stage1 import (
     Window,
     filter_windows,
     normalize_window,
+    normalize_windows,
     run_stage1,
     score_entropy,
+    score_entropy_batch,
     segment_dialogue,
 )
+from kintsugi.memory.archive_codecs import (
+    ArchiveCodec,
+    GzipCodec,
+    ZstdCodec,
+    get_codec,
+)
 from kintsugi.memory.cold_archive import (
     ArchivedWindow,
     ColdArchive,
     IntegrityReport,
+    RecompactResult,
+)
+from kintsugi.memory.embedding_cache import (
+    CachedEmbeddingProvider,
+    EmbeddingCache,
+    EmbeddingCacheStats,
+    ProviderRegistry,
+    get_provider_registry,
 )
 from kintsugi.memory.embeddings import (
     APIEmbeddingProvider,
@@ -33,11 +52,14 @@ from kintsugi.memory.embeddings import (
     get_embedding_provider,
 )
 from kintsugi.memory.significance import (
+    BulkSignificanceMaintenance,
     ExpiredMemoryReaper,
     MemoryLayer,
+    ReapBatch,
     ReapResult,
     compute_expiration,
     compute_layer,
+    decay_significance,
 )
 from kintsugi.memory.spaced import (
     FIBONACCI,
@@ -49,14 +71,30 @@ from kintsugi.memory.temporal import (
     Category,
     TemporalEvent,
     TemporalLog,
+    TemporalWriteBuffer,
+    get_temporal_log,
+    set_temporal_log,
+)
+from kintsugi.memory.enrichment import (
+    EnrichmentEngine,
+    MemoryLink,
+    linked_memories,
+    save_links,
+)
+from kintsugi.memory.temporal_partitions import (
+    MaintenanceResult,
+    TemporalPartitionManager,
 )
 
 from kintsugi.memory.cma_stage2 import (
+    DriftStats,
     Fact,
+    IncrementalResult,
     Insight,
     compute_affinity,
     cluster_facts,
     consolidate,
+    consolidate_incremental,
 )
 from kintsugi.memory.cma_stage3 import (
     QueryProfile,
@@ -66,6 +104,17 @@ from kintsugi.memory.cma_stage3 import (
     fuse_weighted,
     retrieve,
 )
+from kintsugi.memory.hybrid_search import hybrid_search
+from kintsugi.memory.bulk_ingest import (
+    BulkMemory,
+    IngestProgress,
+    ingest_ndjson,
+)
+from kintsugi.memory.synthesis import (
+    FileSynthesisCache,
+    InMemorySynthesisCache,
+    SynthesisScheduler,
+)
 from kintsugi.memory.org_isolation import (
     ORG_MEMORIES_SCHEMA,
     OrgMemoryStore,
@@ -74,6 +123,7 @@ from kintsugi.memory.org_isolation import (
 )
 from kintsugi.memory.bdi_bridge import (
     BDIBridge,
+    BDIIndex,
     Belief,
     Desire,
     Intention,
@@ -85,6 +135,12 @@ __all__ = [
     "LocalEmbeddingProvider",
     "APIEmbeddingProvider",
     "get_embedding_provider",
+    # embedding_cache
+    "EmbeddingCache",
+    "EmbeddingCacheStats",
+    "CachedEmbeddingProvider",
+    "ProviderRegistry",
+    "get_provider_registry",
     # cma_stage1
     "Turn",
     "Window",
@@ -92,8 +148,10 @@ __all__ = [
     "Stage1Result",
     "segment_dialogue",
     "score_entropy",
+    "score_entropy_batch",
     "filter_windows",
     "normalize_window",
+    "normalize_windows",
     "run_stage1",
     # cma_stage2
     "Fact",
@@ -101,6 +159,13 @@ __all__ = [
     "compute_affinity",
     "cluster_facts",
     "consolidate",
+    "consolidate_incremental",
+    "DriftStats",
+    "IncrementalResult",
+    # synthesis
+    "SynthesisScheduler",
+    "InMemorySynthesisCache",
+    "FileSynthesisCache",
     # cma_stage3
     "QueryProfile",
     "ScoredResult",
@@ -108,6 +173,12 @@ __all__ = [
     "fuse_rrf",
     "fuse_weighted",
     "retrieve",
+    # hybrid_search
+    "hybrid_search",
+    # bulk_ingest
+    "BulkMemory",
+    "IngestProgress",
+    "ingest_ndjson",
     # org_isolation
     "ORG_MEMORIES_SCHEMA",
     "OrgMemoryStore",
@@ -115,6 +186,7 @@ __all__ = [
     "get_org_connection",
     # bdi_bridge
     "BDIBridge",
+    "BDIIndex",
     "Belief",
     "Desire",
     "Intention",
@@ -122,9 +194,26 @@ __all__ = [
     "ColdArchive",
     "ArchivedWindow",
     "IntegrityReport",
+    "RecompactResult",
+    # archive_codecs
+    "ArchiveCodec",
+    "GzipCodec",
+    "ZstdCodec",
+    "get_codec",
     # temporal
     "TemporalLog",
     "TemporalEvent",
+    "TemporalWriteBuffer",
+    "get_temporal_log",
+    "set_temporal_log",
+    # enrichment
+    "EnrichmentEngine",
+    "MemoryLink",
+    "linked_memories",
+    "save_links",
+    # temporal_partitions
+    "TemporalPartitionManager",
+    "MaintenanceResult",
     "Category",
     # significance
     "MemoryLayer",
@@ -132,6 +221,9 @@ __all__ = [
     "compute_expiration",
     "ExpiredMemoryReaper",
     "ReapResult",
+    "ReapBatch",
+    "decay_significance",
+    "BulkSignificanceMaintenance",
     # spaced
     "FIBONACCI",
     "fib_interval",
@@ -0,0 +1,141 @@
+"""Compression codecs for the cold archive.
+
+Every ``memory_archives`` row records the codec that wrote it, so rows
+written by an older codec stay readable after the default changes:
+
+- ``gzip``: the original per-window gzip (level 6); also the value of
+  pre-existing rows.
+- ``zstd``: Zstandard, optionally with a per-org trained dictionary
+  (``memory_archives.dictionary_id``).  Dialogue windows are short and
+  share most of their structure, so a dictionary recovers the ratio that
+  per-window compression loses.
+
+``zstd`` needs the optional ``zstandard`` package
+(``pip install kintsugi-engine[archive]``).
+"""
+
+from __future__ import annotations
+
+import gzip
+import threading
+from abc import ABC, abstractmethod
+from typing import Any, Optional
+
+GZIP = "gzip"
+ZSTD = "zstd"
+
+DEFAULT_DICT_SIZE = 16 * 1024
+MIN_TRAINING_SAMPLES = 32
+
+
+def _zstd() -> Any:
+    try:
+        import zstandard
+    except ImportError as exc:
+        raise ImportError(
+            "The zstd archive codec requires the 'zstandard' package. "
+            "Install it with: pip install kintsugi-engine[archive]"
+        ) from exc
+    return zstandard
+
+
+class ArchiveCodec(ABC):
+    """Byte-level compressor used for archived windows."""
+
+    name: str
+
+    @abstractmethod
+    def compress(self, data: bytes) -> bytes:
+        """Compress *data*."""
+
+    @abstractmethod
+    def decompress(self, data: bytes) -> bytes:
+        """Invert :meth:`compress`."""
+
+
+class GzipCodec(ArchiveCodec):
+    """The original cold-archive format."""
+
+    name = GZIP
+
+    def __init__(self, level: int = 6) -> None:
+        self.level = level
+
+    def compress(self, data: bytes) -> bytes:
+        return gzip.compress(data, compresslevel=self.level)
+
+    def decompress(self, data: bytes) -> bytes:
+        return gzip.decompress(data)
+
+
+class ZstdCodec(ArchiveCodec):
+    """Zstandard, with an optional trained dictionary.
+
+    Instances are picklable (only the level and dictionary bytes are sent),
+    so they can be handed to a process pool.  python-zstandard compressor
+    and decompressor objects must not be used by two threads at once, so
+    each thread lazily builds its own pair.
+    """
+
+    name = ZSTD
+
+    def __init__(self, level: int = 3, dictionary: Optional[bytes] = None) -> None:
+        self.level = level
+        self.dictionary = dictionary
+        self._local = threading.local()
+
+    def __getstate__(self) -> dict[str, Any]:
+        return {"level": self.level, "dictionary": self.dictionary}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__init__(**state)  # type: ignore[misc]
+
+    def _contexts(self) -> tuple[Any, Any]:
+        contexts = getattr(self._local, "contexts", None)
+        if contexts is None:
+            zstd = _zstd()
+            zdict = zstd.ZstdCompressionDict(self.dictionary) if self.dictionary else None
+            contexts = self._local.contexts = (
+                zstd.ZstdCompressor(level=self.level, dict_data=zdict),
+                zstd.ZstdDecompressor(dict_data=zdict),
+            )
+        return contexts
+
+    def compress(self, data: bytes) -> bytes:
+        return self._contexts()[0].compress(data)
+
+    def decompress(self, data: bytes) -> bytes:
+        return self._contexts()[1].decompress(data)
+
+
+def get_codec(name: str, dictionary: Optional[bytes] = None, **kwargs: Any) -> ArchiveCodec:
+    """Return a codec instance by its stored name.
+
+    Raises:
+        ValueError: If *name* is unknown, or a dictionary is given for gzip.
+    """
+    if name == GZIP:
+        if dictionary is not None:
+            raise ValueError("gzip codec does not support dictionaries")
+        return GzipCodec(**kwargs)
+    if name == ZSTD:
+        return ZstdCodec(dictionary=dictionary, **kwargs)
+    raise ValueError(f"Unknown archive codec: {name!r}. Use {GZIP!r} or {ZSTD!r}.")
+
+
+def train_dictionary(samples: list[bytes], dict_size: int = DEFAULT_DICT_SIZE) -> bytes:
+    """Train a zstd dictionary from raw (uncompressed) window samples.
+
+    Raises:
+        ValueError: If there are fewer than :data:`MIN_TRAINING_SAMPLES`
+            samples, or zstd cannot build a dictionary from them.
+    """
+    if len(samples) < MIN_TRAINING_SAMPLES:
+        raise ValueError(
+            f"need at least {MIN_TRAINING_SAMPLES} samples to train, got {len(samples)}"
+        )
+    zstd = _zstd()
+    try:
+        return zstd.train_dictionary(dict_size, samples).as_bytes()
+    except zstd.ZstdError as exc:
+        raise ValueError(f"zstd dictionary training failed: {exc}") from exc
@@ -24,12 +24,23 @@ Usage:
 
     # Prioritize results based on active intentions
     ranked = bridge.prioritize_by_intentions(biased, active_intentions)
+
+    # Per-request pipeline: the desire/intention lookups are built once per
+    # org and BDI snapshot version and dropped when the watched BDIStore
+    # changes.
+    bridge = BDIBridge(store=bdi_store)
+    beliefs, ranked = bridge.process_pipeline(
+        memories, desires, intentions,
+        version=bdi_store.revision, org_id=bdi_store.org_id,
+    )
 """
 
 from __future__ import annotations
 
 import hashlib
+from collections.abc import Sequence
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Any, Optional
 
 
@@ -121,6 +132,68 @@ class Intention:
             )
 
 
+# ---------------------------------------------------------------------------
+# Precomputed lookups
+# ---------------------------------------------------------------------------
+
+@dataclass(frozen=True)
+class BDIIndex:
+    """Lookups derived from desires and intentions, built once per snapshot.
+
+    Attributes:
+        version: Snapshot version the index was built for (``None`` if ad hoc).
+        tag_boosts: Inverted index of tag -> best weighted desire boost.
+        avg_decay: Priority-weighted decay for memories matching no desire.
+        belief_boosts: Belief ID -> summed ``priority_boost`` of the active
+            intentions referencing it.  Belief IDs are content hashes or
+            memory IDs, so one dict serves both lookups.
+        id_boost: Boost for a memory whose ID is itself a referenced belief.
+        has_desires: Whether any desires were given.
+        has_active_intentions: Whether any intention is active.
+    """
+    version: Optional[int]
+    tag_boosts: dict[str, float]
+    avg_decay: float
+    belief_boosts: dict[str, float]
+    id_boost: float
+    has_desires: bool
+    has_active_intentions: bool
+
+    @classmethod
+    def build(
+        cls,
+        desires: Sequence[Desire] = (),
+        intentions: Sequence[Intention] = (),
+        version: Optional[int] = None,
+    ) -> BDIIndex:
+        tag_boosts: dict[str, float] = {}
+        for desire in desires:
+            weighted_boost = 1.0 + (desire.boost_factor - 1.0) * desire.priority
+            for tag in desire.related_tags:
+                tag_boosts[tag] = max(tag_boosts.get(tag, 1.0), weighted_boost)
+
+        total_priority = sum(d.priority for d in desires)
+        avg_decay = sum(
+            d.decay_factor * d.priority for d in desires
+        ) / total_priority if any(d.priority > 0 for d in desires) else 1.0
+
+        active = [i for i in intentions if i.status == "active"]
+        belief_boosts: dict[str, float] = {}
+        for intention in active:
+            for bid in intention.belief_ids:
+                belief_boosts[bid] = belief_boosts.get(bid, 0.0) + intention.priority_boost
+
+        return cls(
+            version=version,
+            tag_boosts=tag_boosts,
+            avg_decay=avg_decay,
+            belief_boosts=belief_boosts,
+            id_boost=max((i.priority_boost for i in active), default=0.0),
+            has_desires=bool(desires),
+            has_active_intentions=bool(active),
+        )
+
+
 # ---------------------------------------------------------------------------
 # BDI Bridge
 # ---------------------------------------------------------------------------
@@ -128,9 +201,14 @@ class Intention:
 class BDIBridge:
     """Translates between raw memory records and BDI cognitive primitives.
 
-    This bridge is stateless — it operates on memory dicts as returned by
+    The bridge operates on memory dicts as returned by
     OrgMemoryStore.hybrid_search() and produces BDI objects or re-ranked
-    memory lists.
+    memory lists.  Its only state is one cached :class:`BDIIndex` per org,
+    reused by :meth:`process_pipeline` while that org's snapshot version
+    stays the same and dropped whenever the org's watched ``BDIStore``
+    records a revision.  Versions only identify a snapshot together with
+    the org, so a bridge shared by several stores must be given
+    ``org_id``.
 
     Memory dict expected shape:
         {
@@ -143,8 +221,49 @@ class BDIBridge:
             "created_at": datetime | str,
             "score": float | None,
         }
+
+    Args:
+        store: Optional ``BDIStore`` whose revisions invalidate the cache.
     """
 
+    def __init__(self, store: Any = None) -> None:
+        self._indexes: dict[Optional[str], BDIIndex] = {}
+        if store is not None:
+            self.watch(store)
+
+    # -- Index cache ---------------------------------------------------------
+
+    def watch(self, store: Any) -> None:
+        """Invalidate the org's cached index whenever *store* records a revision."""
+        org_id = store.org_id
+        store.subscribe(lambda revision: self.invalidate(org_id))
+
+    def invalidate(self, org_id: Optional[str] = None) -> None:
+        """Drop the cached index of *org_id*, or of every org if None."""
+        if org_id is None:
+            self._indexes.clear()
+        else:
+            self._indexes.pop(org_id, None)
+
+    def index(
+        self,
+        desires: Sequence[Desire],
+        intentions: Sequence[Intention],
+        version: Optional[int] = None,
+        org_id: Optional[str] = None,
+    ) -> BDIIndex:
+        """Return the index for (*org_id*, *version*), building and caching it if needed.
+
+        Without a *version* nothing is cached and the index is rebuilt.
+        """
+        cached = self._indexes.get(org_id)
+        if version is not None and cached is not None and cached.version == version:
+            return cached
+        built = BDIIndex.build(desires, intentions, version)
+        if version is not None:
+            self._indexes[org_id] = built
+        return built
+
     # -- Belief extraction ---------------------------------------------------
 
     def extract_beliefs(
@@ -173,37 +292,33 @@ class BDIBridge:
         if not candidates:
             return []
 
-        beliefs: list[Belief] = []
-        seen_hashes: set[str] = set()
+        by_hash: dict[str, Belief] = {}
 
         for mem in candidates:
             content = mem.get("content", "")
             content_hash = self._content_hash(content)
 
-            if content_hash in seen_hashes:
+            existing = by_hash.get(content_hash)
+            if existing is not None:
                 # Merge into existing belief as corroboration
-                for b in beliefs:
-                    if b.id == content_hash:
-                        b.source_memory_ids.append(mem["id"])
-                        b.confidence = min(1.0, b.confidence + 0.05)
-                        break
+                existing.source_memory_ids.append(mem["id"])
+                existing.confidence = min(1.0, existing.confidence + 0.05)
                 continue
 
-            seen_hashes.add(content_hash)
-
             significance = mem.get("significance", 5)
             base_confidence = significance / 10.0
 
             all_tags = list(set(mem.get("tags", [])))
 
-            beliefs.append(Belief(
+            by_hash[content_hash] = Belief(
                 id=content_hash,
                 content=content,
                 confidence=round(base_confidence, 3),
                 source_memory_ids=[mem["id"]],
                 tags=all_tags,
-            ))
+            )
 
+        beliefs = list(by_hash.values())
         beliefs.sort(key=lambda b: b.confidence, reverse=True)
         return beliefs
 
@@ -233,40 +348,11 @@ class BDIBridge:
         if not desires:
             return list(memories)
 
-        # Build tag -> weighted boost mapping
-        tag_boosts: dict[str, float] = {}
-        for desire in desires:
-            for tag in desire.related_tags:
-                existing = tag_boosts.get(tag, 1.0)
-                weighted_boost = 1.0 + (desire.boost_factor - 1.0) * desire.priority
-                tag_boosts[tag] = max(existing, weighted_boost)
-
-        # Compute aggregate decay for unaligned memories
-        avg_decay = sum(d.decay_factor * d.priority for d in desires) / sum(
-            d.priority for d in desires
-        ) if any(d.priority > 0 for d in desires) else 1.0
-
-        results: list[dict[str, Any]] = []
+        index = BDIIndex.build(desires)
+        results = []
         for mem in memories:
             adjusted = dict(mem)
-            base_score = mem.get("score") or 0.0
-            mem_tags = set(mem.get("tags", []))
-
-            # Find best boost from overlapping tags
-            best_boost = 1.0
-            aligned = False
-            for tag in mem_tags:
-                if tag in tag_boosts:
-                    aligned = True
-                    best_boost = max(best_boost, tag_boosts[tag])
-
-            if aligned:
-                adjusted["score"] = round(base_score * best_boost, 6)
-                adjusted["_desire_aligned"] = True
-            else:
-                adjusted["score"] = round(base_score * avg_decay, 6)
-                adjusted["_desire_aligned"] = False
-
+            self._bias(adjusted, index)
             results.append(adjusted)
 
         results.sort(key=lambda m: m.get("score", 0), reverse=True)
@@ -292,44 +378,14 @@ class BDIBridge:
         Returns:
             New list of memory dicts re-ranked by intention relevance.
         """
-        active = [i for i in intentions if i.status == "active"]
-        if not active:
+        index = BDIIndex.build(intentions=intentions)
+        if not index.has_active_intentions:
             return list(results)
 
-        # Collect all belief IDs referenced by active intentions
-        relevant_belief_ids: set[str] = set()
-        total_boost = 0.0
-        belief_boost_map: dict[str, float] = {}
-
-        for intention in active:
-            for bid in intention.belief_ids:
-                relevant_belief_ids.add(bid)
-                current = belief_boost_map.get(bid, 0.0)
-                belief_boost_map[bid] = current + intention.priority_boost
-
-        # Boost memories whose IDs appear as source memories for relevant beliefs
-        # or whose content hash matches a belief ID
-        output: list[dict[str, Any]] = []
+        output = []
         for mem in results:
             adjusted = dict(mem)
-            base_score = mem.get("score") or 0.0
-            mem_id = mem.get("id", "")
-            content_hash = self._content_hash(mem.get("content", ""))
-
-            boost = 0.0
-            # Check if this memory's content hash matches a relevant belief
-            if content_hash in belief_boost_map:
-                boost += belief_boost_map[content_hash]
-            # Check if memory ID is directly referenced
-            if mem_id in relevant_belief_ids:
-                boost += max(i.priority_boost for i in active)
-
-            if boost > 0:
-                adjusted["score"] = round(base_score + boost, 6)
-                adjusted["_intention_boosted"] = True
-            else:
-                adjusted["_intention_boosted"] = False
-
+            self._prioritize(adjusted, index)
             output.append(adjusted)
 
         output.sort(key=lambda m: m.get("score", 0), reverse=True)
@@ -343,29 +399,79 @@ class BDIBridge:
         desires: list[Desire],
         intentions: list[Intention],
         min_belief_significance: int = 2,
+        version: Optional[int] = None,
+        org_id: Optional[str] = None,
     ) -> tuple[list[Belief], list[dict[str, Any]]]:
         """Run the full BDI pipeline: extract beliefs, bias, prioritize.
 
-        Convenience method that chains extract_beliefs -> apply_desire_bias
-        -> prioritize_by_intentions.
+        Equivalent to chaining extract_beliefs -> apply_desire_bias
+        -> prioritize_by_intentions, but each memory is copied and scored
+        once against a :class:`BDIIndex` and the results are sorted once,
+        so the cost is linear in the number of memories (plus the sort).
 
         Args:
             memories: Raw memory dicts from search.
             desires: Active organizational desires.
             intentions: All intentions.
             min_belief_significance: Threshold for belief extraction.
+            version: BDI snapshot version (e.g. ``BDIStore.revision``);
+                when given, the index is reused until the version changes.
+            org_id: Org the snapshot belongs to; versions of different
+                orgs are cached separately.
 
         Returns:
             Tuple of (extracted_beliefs, re-ranked_memories).
         """
         beliefs = self.extract_beliefs(memories, min_significance=min_belief_significance)
-        biased = self.apply_desire_bias(memories, desires)
-        ranked = self.prioritize_by_intentions(biased, intentions)
-        return beliefs, ranked
+        index = self.index(desires, intentions, version, org_id)
+
+        ranked: list[tuple[float, float, dict[str, Any]]] = []
+        for mem in memories:
+            adjusted = dict(mem)
+            biased_score = 0.0
+            if index.has_desires:
+                self._bias(adjusted, index)
+                biased_score = adjusted["score"]
+            if index.has_active_intentions:
+                self._prioritize(adjusted, index)
+            ranked.append((adjusted.get("score", 0), biased_score, adjusted))
+
+        # One stable sort on (final, biased) score orders ties exactly as
+        # the chained methods' two successive sorts would.
+        if index.has_desires or index.has_active_intentions:
+            ranked.sort(key=lambda r: (r[0] or 0, r[1] or 0), reverse=True)
+        return beliefs, [r[2] for r in ranked]
 
     # -- Internal helpers ----------------------------------------------------
 
     @staticmethod
+    def _bias(mem: dict[str, Any], index: BDIIndex) -> None:
+        """Apply the desire boost or decay to *mem* in place."""
+        base_score = mem.get("score") or 0.0
+        tag_boosts = index.tag_boosts
+        boosts = [tag_boosts[t] for t in set(mem.get("tags", [])) if t in tag_boosts]
+        if boosts:
+            mem["score"] = round(base_score * max(1.0, *boosts), 6)
+            mem["_desire_aligned"] = True
+        else:
+            mem["score"] = round(base_score * index.avg_decay, 6)
+            mem["_desire_aligned"] = False
+
+    def _prioritize(self, mem: dict[str, Any], index: BDIIndex) -> None:
+        """Apply the intention boost to *mem* in place."""
+        belief_boosts = index.belief_boosts
+        boost = belief_boosts.get(self._content_hash(mem.get("content", "")), 0.0)
+        if mem.get("id", "") in belief_boosts:
+            boost += index.id_boost
+
+        if boost > 0:
+            mem["score"] = round((mem.get("score") or 0.0) + boost, 6)
+            mem["_intention_boosted"] = True
+        else:
+            mem["_intention_boosted"] = False
+
+    @staticmethod
+    @lru_cache(maxsize=8192)
     def _content_hash(content: str) -> str:
         """Produce a short deterministic hash of content for deduplication."""
         return hashlib.sha256(content.encode("utf-8")).hexdigest()[:16]
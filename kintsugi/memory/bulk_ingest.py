@@ -0,0 +1,335 @@
+"""Bulk memory ingestion from NDJSON with resumable checkpoints.
+
+:func:`ingest_ndjson` streams newline-delimited JSON memories (one object
+per line, ``{"content": ..., "significance": 5, "entity_type": "general",
+"extra": {...}}``) into ``memory_units`` and its side tables:
+
+- lines are parsed incrementally, so the input is never held in memory;
+- each chunk is embedded with a single ``embed_batch`` call;
+- rows are written with asyncpg ``COPY`` (multi-row ``INSERT`` on other
+  drivers) and ``memory_lexical`` is filled with one ``INSERT ... SELECT``;
+- every chunk is one transaction that also upserts the job's row in
+  ``memory_ingest_checkpoints`` (keyed by ``(org_id, job_id)``), so a
+  re-run with the same ``job_id`` for the same org skips exactly the
+  lines that were already committed.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import uuid
+from collections.abc import AsyncIterable, AsyncIterator, Awaitable, Callable
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Optional
+
+from pgvector import Vector
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from kintsugi.memory.embeddings import EmbeddingProvider
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_SIZE = 500
+MAX_REJECTED_REPORTED = 100
+
+_MEMORY_UNIT_COLUMNS = (
+    "id", "org_id", "content", "significance", "memory_layer", "created_at", "updated_at",
+)
+_EMBEDDING_COLUMNS = ("id", "memory_id", "embedding", "model")
+_METADATA_COLUMNS = ("id", "memory_id", "timestamp", "entity_type", "significance", "extra")
+
+_INSERT_LEXICAL = text("""
+    INSERT INTO memory_lexical (id, memory_id, tsv)
+    SELECT gen_random_uuid(), mu.id, to_tsvector('english', mu.content)
+    FROM memory_units mu
+    WHERE mu.id = ANY(CAST(:ids AS uuid[]))
+""")
+
+_LOAD_CHECKPOINT = text("""
+    SELECT lines_committed, memories_committed
+    FROM memory_ingest_checkpoints
+    WHERE job_id = :job_id AND org_id = :org_id
+""")
+
+_SAVE_CHECKPOINT = text("""
+    INSERT INTO memory_ingest_checkpoints
+        (job_id, org_id, lines_committed, memories_committed, updated_at)
+    VALUES (:job_id, :org_id, :lines_committed, :memories_committed, now())
+    ON CONFLICT (org_id, job_id) DO UPDATE
+    SET lines_committed = EXCLUDED.lines_committed,
+        memories_committed = EXCLUDED.memories_committed,
+        updated_at = now()
+""")
+
+
+@dataclass
+class BulkMemory:
+    """One parsed NDJSON memory line."""
+
+    content: str
+    significance: int = 5
+    entity_type: str = "general"
+    extra: dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class IngestProgress:
+    """Running totals for a bulk ingestion job.
+
+    ``lines_committed`` counts every input line (blank and rejected lines
+    included) up to the last committed chunk; it is the resume offset.
+    """
+
+    job_id: str
+    org_id: str
+    lines_committed: int = 0
+    memories_committed: int = 0
+    chunks_committed: int = 0
+    resumed_from: int = 0
+    rejected: list[tuple[int, str]] = field(default_factory=list)
+    rejected_count: int = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "job_id": self.job_id,
+            "org_id": self.org_id,
+            "lines_committed": self.lines_committed,
+            "memories_committed": self.memories_committed,
+            "chunks_committed": self.chunks_committed,
+            "resumed_from": self.resumed_from,
+            "rejected_count": self.rejected_count,
+            "rejected": [{"line": n, "error": e} for n, e in self.rejected],
+        }
+
+
+def parse_memory_line(line: str) -> BulkMemory:
+    """Parse and validate one NDJSON line.
+
+    Raises:
+        ValueError: If the line is not a JSON object with non-empty
+            ``content`` and an integer ``significance`` in 1-10.
+    """
+    try:
+        obj = json.loads(line)
+    except json.JSONDecodeError as exc:
+        raise ValueError(f"invalid JSON: {exc.msg}") from exc
+    if not isinstance(obj, dict):
+        raise ValueError("line is not a JSON object")
+
+    content = obj.get("content")
+    if not isinstance(content, str) or not content.strip():
+        raise ValueError("missing or empty 'content'")
+    significance = obj.get("significance", 5)
+    if isinstance(significance, bool) or not isinstance(significance, int) \
+            or not 1 <= significance <= 10:
+        raise ValueError(f"significance must be an integer 1-10, got {significance!r}")
+    extra = obj.get("extra") or {}
+    if not isinstance(extra, dict):
+        raise ValueError("'extra' must be a JSON object")
+
+    return BulkMemory(
+        content=content,
+        significance=significance,
+        entity_type=str(obj.get("entity_type") or "general"),
+        extra=extra,
+    )
+
+
+async def iter_ndjson_lines(stream: AsyncIterable[bytes | str]) -> AsyncIterator[str]:
+    """Split an async byte/str stream into lines without buffering it whole.
+
+    Chunks may cut lines (and UTF-8 sequences) anywhere; a trailing line
+    without a newline is still yielded.
+    """
+    buffer = b""
+    async for chunk in stream:
+        if isinstance(chunk, str):
+            chunk = chunk.encode("utf-8")
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            yield line.decode("utf-8", errors="replace").rstrip("\r")
+    if buffer:
+        yield buffer.decode("utf-8", errors="replace").rstrip("\r")
+
+
+async def load_checkpoint(
+    session: AsyncSession, job_id: str, org_id: str,
+) -> Optional[tuple[int, int]]:
+    """Return ``(lines_committed, memories_committed)`` for a job, if any."""
+    row = (await session.execute(
+        _LOAD_CHECKPOINT, {"job_id": job_id, "org_id": str(org_id)},
+    )).first()
+    if row is None:
+        return None
+    return int(row.lines_committed), int(row.memories_committed)
+
+
+async def _write_records(
+    session: AsyncSession,
+    table: str,
+    columns: tuple[str, ...],
+    records: list[tuple],
+    vector_columns: tuple[str, ...] = (),
+) -> None:
+    """Write *records* via asyncpg COPY, or a multi-row INSERT elsewhere.
+
+    COPY sends *vector_columns* through the pgvector codec registered on
+    the connection; the INSERT path binds them as pgvector text and casts
+    with ``CAST(:col AS vector)``, as ``POST /api/memory/store`` does.
+
+    Raises:
+        RuntimeError: On asyncpg, if the session has not opened its
+            transaction yet; the COPY would otherwise autocommit.
+    """
+    conn = await session.connection()
+    if conn.dialect.driver == "asyncpg":
+        raw = await conn.get_raw_connection()
+        driver = raw.driver_connection
+        if not driver.is_in_transaction():
+            raise RuntimeError(
+                f"COPY into {table} outside a transaction would autocommit; "
+                "execute a statement on the session first"
+            )
+        await driver.copy_records_to_table(table, records=records, columns=list(columns))
+        return
+
+    placeholders = ", ".join(
+        f"CAST(:{c} AS vector)" if c in vector_columns else f":{c}" for c in columns
+    )
+    params = [dict(zip(columns, r)) for r in records]
+    for row in params:
+        for c in vector_columns:
+            row[c] = Vector(row[c]).to_text()
+    await session.execute(
+        text(f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({placeholders})"),
+        params,
+    )
+
+
+async def write_chunk(
+    session: AsyncSession,
+    org_id: str,
+    memories: list[BulkMemory],
+    vectors: list[Any],
+    *,
+    model: str,
+) -> list[uuid.UUID]:
+    """Write one embedded chunk of memories in the current transaction.
+
+    Rows match what ``POST /api/memory/store`` writes per memory.  On
+    asyncpg the session must already have executed a statement in this
+    transaction: SQLAlchemy only sends BEGIN on the first execute, and
+    the COPYs go straight to the driver connection.
+
+    Returns:
+        The new memory ids, in input order.
+    """
+    oid = uuid.UUID(str(org_id))
+    now = datetime.now(timezone.utc)
+    ids = [uuid.uuid4() for _ in memories]
+
+    await _write_records(session, "memory_units", _MEMORY_UNIT_COLUMNS, [
+        (mid, oid, m.content, m.significance, "core", now, now)
+        for mid, m in zip(ids, memories)
+    ])
+    await _write_records(session, "memory_embeddings", _EMBEDDING_COLUMNS, [
+        (uuid.uuid4(), mid, vec, model) for mid, vec in zip(ids, vectors)
+    ], vector_columns=("embedding",))
+    await _write_records(session, "memory_metadata", _METADATA_COLUMNS, [
+        (uuid.uuid4(), mid, now, m.entity_type, m.significance, json.dumps(m.extra))
+        for mid, m in zip(ids, memories)
+    ])
+    await session.execute(_INSERT_LEXICAL, {"ids": ids})
+    return ids
+
+
+async def ingest_ndjson(
+    session: AsyncSession,
+    org_id: str,
+    stream: AsyncIterable[bytes | str],
+    provider: EmbeddingProvider,
+    *,
+    job_id: Optional[str] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    model: Optional[str] = None,
+    on_progress: Optional[Callable[[IngestProgress], Awaitable[None] | None]] = None,
+) -> IngestProgress:
+    """Ingest an NDJSON stream of memories for one organisation.
+
+    Args:
+        session: Async session; committed once per chunk.
+        org_id: Organisation that owns every ingested memory.
+        stream: Async iterable of raw NDJSON bytes (e.g. a request body).
+        provider: Embedding provider; called once per chunk.
+        job_id: Checkpoint key.  Re-running with the same id and the same
+            input resumes after the last committed line.  Generated when
+            omitted.
+        chunk_size: Memories per embedding batch and transaction.
+        model: Value for ``memory_embeddings.model`` (defaults to the
+            provider's ``model_id``).
+        on_progress: Called (and awaited, if it returns an awaitable)
+            after every committed chunk.
+
+    Returns:
+        Final :class:`IngestProgress`.  Malformed lines are skipped and
+        reported in ``rejected`` rather than aborting the job.
+    """
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be >= 1, got {chunk_size}")
+
+    progress = IngestProgress(job_id=job_id or uuid.uuid4().hex, org_id=str(org_id))
+    checkpoint = await load_checkpoint(session, progress.job_id, progress.org_id)
+    if checkpoint is not None:
+        progress.lines_committed, progress.memories_committed = checkpoint
+        progress.resumed_from = progress.lines_committed
+        logger.info(
+            "Resuming ingest job %s at line %d", progress.job_id, progress.resumed_from,
+        )
+    model = model or provider.model_id
+
+    line_no = 0
+    pending: list[BulkMemory] = []
+
+    async def flush() -> None:
+        vectors = await provider.embed_batch([m.content for m in pending]) if pending else []
+        # The checkpoint upsert opens the chunk's transaction, so the COPYs
+        # in write_chunk run inside it rather than autocommitting.
+        await session.execute(_SAVE_CHECKPOINT, {
+            "job_id": progress.job_id,
+            "org_id": progress.org_id,
+            "lines_committed": line_no,
+            "memories_committed": progress.memories_committed + len(pending),
+        })
+        if pending:
+            await write_chunk(session, progress.org_id, pending, vectors, model=model)
+        await session.commit()
+        progress.memories_committed += len(pending)
+        progress.lines_committed = line_no
+        progress.chunks_committed += 1
+        pending.clear()
+        if on_progress is not None:
+            result = on_progress(progress)
+            if result is not None:
+                await result
+
+    async for line in iter_ndjson_lines(stream):
+        line_no += 1
+        if line_no <= progress.resumed_from or not line.strip():
+            continue
+        try:
+            pending.append(parse_memory_line(line))
+        except ValueError as exc:
+            progress.rejected_count += 1
+            if len(progress.rejected) < MAX_REJECTED_REPORTED:
+                progress.rejected.append((line_no, str(exc)))
+            continue
+        if len(pending) >= chunk_size:
+            await flush()
+
+    if line_no > progress.lines_committed:
+        await flush()
+    return progress
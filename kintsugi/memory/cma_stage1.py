@@ -11,15 +11,18 @@ generative steps, and an :class:`EmbeddingProvider` handles vector encoding.
 
 from __future__ import annotations
 
+import asyncio
+import inspect
 import json
 import logging
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Callable
+from typing import Awaitable, Callable, Union
 
 import numpy as np
 from numpy.typing import NDArray
 
+from kintsugi.memory.embedding_cache import CachedEmbeddingProvider, EmbeddingCache
 from kintsugi.memory.embeddings import EmbeddingProvider
 
 logger = logging.getLogger(__name__)
@@ -163,6 +166,35 @@ async def score_entropy(
     return window.entropy_score
 
 
+async def score_entropy_batch(
+    windows: list[Window],
+    embedding_provider: EmbeddingProvider,
+) -> list[float]:
+    """Vectorized :func:`score_entropy` over a whole window sequence.
+
+    All windows are embedded with a single ``embed_batch`` call; entropy is
+    then ``1 - cos`` between adjacent rows of the stacked matrix, computed
+    in one pass. The first window receives 1.0, as in the serial path.
+
+    Side-effect: sets ``embedding`` and ``entropy_score`` on every window.
+    """
+    if not windows:
+        return []
+
+    vecs = await embedding_provider.embed_batch([_window_text(w) for w in windows])
+    matrix = np.stack(vecs, axis=0)
+    norms = np.linalg.norm(matrix, axis=1)
+    dots = np.einsum("ij,ij->i", matrix[1:], matrix[:-1])
+    denom = norms[1:] * norms[:-1]
+    sims = np.divide(dots, denom, out=np.zeros_like(dots), where=denom != 0.0)
+
+    scores = [1.0] + [1.0 - float(s) for s in sims]
+    for w, vec, score in zip(windows, vecs, scores):
+        w.embedding = vec
+        w.entropy_score = score
+    return scores
+
+
 # ---------------------------------------------------------------------------
 # 3. Entropy-based filtering
 # ---------------------------------------------------------------------------
@@ -196,8 +228,18 @@ def filter_windows(
 # 4. Window normalization (LLM-assisted)
 # ---------------------------------------------------------------------------
 
-# Type alias: llm_call(system_prompt, user_prompt) -> response_text
-LLMCall = Callable[[str, str], str]
+# Type alias: llm_call(system_prompt, user_prompt) -> response_text.
+# Async callables are awaited, which lets windows normalize concurrently.
+LLMCall = Union[Callable[[str, str], str], Callable[[str, str], Awaitable[str]]]
+
+DEFAULT_NORMALIZE_CONCURRENCY: int = 8
+
+
+async def _call_llm(llm_call: LLMCall, system: str, user: str) -> str:
+    result = llm_call(system, user)
+    if inspect.isawaitable(result):
+        result = await result
+    return result
 
 _COREFERENCE_SYSTEM = (
     "You are a coreference resolution engine. Replace all pronouns and ambiguous "
@@ -232,7 +274,8 @@ async def normalize_window(
 
     Args:
         window: The window to normalize.
-        llm_call: ``(system_prompt, user_prompt) -> response_text``.
+        llm_call: ``(system_prompt, user_prompt) -> response_text``, sync
+            or async.
 
     Returns:
         List of :class:`AtomicFact` objects.
@@ -241,14 +284,14 @@ async def normalize_window(
     reference_time = window.turns[-1].timestamp if window.turns else datetime.utcnow()
 
     # a. Coreference resolution
-    resolved = llm_call(_COREFERENCE_SYSTEM, text)
+    resolved = await _call_llm(llm_call, _COREFERENCE_SYSTEM, text)
 
     # b. Timestamp anchoring
     ts_prompt = f"Reference time: {reference_time.isoformat()}\n\nText:\n{resolved}"
-    anchored = llm_call(_TIMESTAMP_SYSTEM, ts_prompt)
+    anchored = await _call_llm(llm_call, _TIMESTAMP_SYSTEM, ts_prompt)
 
     # c. Atomic fact extraction
-    raw_facts = llm_call(_ATOMIC_SYSTEM, anchored)
+    raw_facts = await _call_llm(llm_call, _ATOMIC_SYSTEM, anchored)
 
     # Parse JSON response
     try:
@@ -288,6 +331,31 @@ async def normalize_window(
     return atomic_facts
 
 
+async def normalize_windows(
+    windows: list[Window],
+    llm_call: LLMCall,
+    max_concurrency: int = DEFAULT_NORMALIZE_CONCURRENCY,
+) -> list[list[AtomicFact]]:
+    """Normalize many windows concurrently, preserving input order.
+
+    Each window's three LLM steps stay sequential (each depends on the
+    previous), but up to ``max_concurrency`` windows are in flight at once.
+    With a synchronous ``llm_call`` this degrades to the serial path.
+
+    Returns:
+        One list of :class:`AtomicFact` per input window.
+    """
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be >= 1")
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def _one(window: Window) -> list[AtomicFact]:
+        async with semaphore:
+            return await normalize_window(window, llm_call)
+
+    return list(await asyncio.gather(*(_one(w) for w in windows)))
+
+
 # ---------------------------------------------------------------------------
 # 5. Full Stage 1 pipeline
 # ---------------------------------------------------------------------------
@@ -301,6 +369,9 @@ async def run_stage1(
     stride: int = 5,
     threshold: float = 0.35,
     conditions: dict | None = None,
+    embedding_cache: EmbeddingCache | None = None,
+    batched: bool = False,
+    max_concurrency: int = DEFAULT_NORMALIZE_CONCURRENCY,
 ) -> Stage1Result:
     """Execute the complete CMA Stage 1 pipeline.
 
@@ -322,28 +393,52 @@ async def run_stage1(
             layer) use this to record the reading-stance, methodology, or
             configurational state active at ingest time. When ``None``,
             facts are stored without conditions (backward-compatible).
+        embedding_cache: Optional :class:`EmbeddingCache`. When given, the
+            provider is wrapped so overlapping or re-ingested windows are
+            not re-embedded. Providers from the shared registry are
+            already cached and are used as-is.
+        batched: Embed all windows in one ``embed_batch`` call, score
+            entropy as a single vectorized pass, and normalize retained
+            windows concurrently. Produces the same result as the serial
+            path.
+        max_concurrency: Upper bound on windows normalized at once when
+            ``batched`` is set.
 
     Returns:
         :class:`Stage1Result` with retained facts and archived windows.
     """
+    if embedding_cache is not None and not isinstance(
+        embedding_provider, CachedEmbeddingProvider
+    ):
+        embedding_provider = CachedEmbeddingProvider(embedding_provider, embedding_cache)
+
     # 1. Segment
     windows = segment_dialogue(turns, window_size=window_size, stride=stride)
     if not windows:
         return Stage1Result(retained_facts=[], archived_windows=[], retained_windows=[])
 
     # 2. Score entropy
-    prev_embedding: NDArray[np.float32] | None = None
-    for w in windows:
-        await score_entropy(w, prev_embedding, embedding_provider)
-        prev_embedding = w.embedding
+    if batched:
+        await score_entropy_batch(windows, embedding_provider)
+    else:
+        prev_embedding: NDArray[np.float32] | None = None
+        for w in windows:
+            await score_entropy(w, prev_embedding, embedding_provider)
+            prev_embedding = w.embedding
 
     # 3. Filter
     retained, archived = filter_windows(windows, threshold=threshold)
 
     # 4. Normalize retained windows -> atomic facts
+    if batched:
+        per_window = await normalize_windows(
+            retained, llm_call, max_concurrency=max_concurrency
+        )
+    else:
+        per_window = [await normalize_window(w, llm_call) for w in retained]
+
     all_facts: list[AtomicFact] = []
-    for w in retained:
-        facts = await normalize_window(w, llm_call)
+    for facts in per_window:
         # Attach conditions to every extracted fact if provided
         if conditions is not None:
             for fact in facts:
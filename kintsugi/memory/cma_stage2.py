@@ -17,6 +17,15 @@ Algorithm
    matrix (``1 - omega``) and apply scipy's ``linkage`` with the ``average``
    method, then ``fcluster`` at ``1 - threshold``.
 
+   The affinity matrix is computed in one vectorized pass (``E @ E.T`` over
+   L2-normalised embeddings plus a broadcast temporal-decay term). Large
+   inputs use a *blocked* mode instead: average-linkage clusters cut at
+   ``1 - threshold`` never span two connected components of the graph whose
+   edges are pairs with ``omega >= threshold``, so that graph is built
+   block by block (pruning pairs too far apart in time to ever reach the
+   threshold) and linkage runs per component. The result is identical and
+   the full ``n x n`` matrix is never materialized.
+
 3. **Cluster synthesis** — Each cluster is merged into a single
    :class:`Insight`.  An optional async ``llm_call`` produces a coherent
    natural-language summary; the fallback is deduplicated concatenation.
@@ -24,22 +33,35 @@ Algorithm
 4. **Recursive loop** — Synthesized insights are promoted back to fact-like
    inputs and the process repeats until no new clusters form above threshold.
 
+5. **Incremental mode** — :func:`consolidate_incremental` takes the insights
+   already on record and assigns each new fact to the nearest insight
+   centroid when their affinity reaches the threshold. Only insights that
+   received facts are re-synthesized; unassigned facts are consolidated
+   among themselves. A full re-cluster runs only when :class:`DriftStats`
+   shows the existing insights no longer describe the incoming facts.
+
 This module is a pure algorithm with no database dependencies.
 """
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import logging
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Awaitable, Callable, Optional
+from typing import TYPE_CHECKING, Awaitable, Callable, Optional
 
 import numpy as np
 from numpy.typing import NDArray
 from scipy.cluster.hierarchy import fcluster, linkage
+from scipy.sparse import coo_matrix
+from scipy.sparse.csgraph import connected_components
 from scipy.spatial.distance import squareform
 
+if TYPE_CHECKING:
+    from kintsugi.memory.synthesis import SynthesisScheduler
+
 logger = logging.getLogger(__name__)
 
 # ---------------------------------------------------------------------------
@@ -50,6 +72,9 @@ DEFAULT_BETA: float = 0.6
 DEFAULT_LAMBDA: float = 0.1  # per day
 DEFAULT_THRESHOLD: float = 0.85
 MAX_RECURSION_DEPTH: int = 20
+# Above this many facts, cluster_facts switches to the blocked mode.
+DENSE_CLUSTER_LIMIT: int = 2048
+DEFAULT_BLOCK_SIZE: int = 512
 
 # Type alias for the optional LLM synthesis callable.
 # Signature: (system_prompt, user_prompt) -> response_text
@@ -82,6 +107,7 @@ class Insight:
     source_ids: list[str]
     significance: int
     tags: list[str]
+    timestamp: Optional[datetime] = None  # latest source fact timestamp
 
 
 # ---------------------------------------------------------------------------
@@ -130,6 +156,50 @@ def compute_affinity(
     return float(beta * sem + (1.0 - beta) * temp)
 
 
+def _affinity_matrix_pairwise(
+    facts: list[Fact],
+    beta: float = DEFAULT_BETA,
+    lam: float = DEFAULT_LAMBDA,
+) -> NDArray[np.float64]:
+    """Reference O(n^2) Python implementation, kept for benchmarks/tests."""
+    n = len(facts)
+    matrix = np.ones((n, n), dtype=np.float64)
+    for i in range(n):
+        for j in range(i + 1, n):
+            score = compute_affinity(facts[i], facts[j], beta=beta, lam=lam)
+            matrix[i, j] = score
+            matrix[j, i] = score
+    return matrix
+
+
+def _unit_embeddings(facts: list[Fact]) -> NDArray[np.float64]:
+    """Stacked embeddings with each row L2-normalised (zero rows stay zero)."""
+    stacked = np.stack([f.embedding for f in facts], axis=0).astype(np.float64)
+    norms = np.linalg.norm(stacked, axis=1, keepdims=True)
+    return np.divide(stacked, norms, out=np.zeros_like(stacked), where=norms > 0.0)
+
+
+def _timestamps_days(facts: list[Fact]) -> NDArray[np.float64]:
+    """Fact timestamps as fractional days relative to the first fact."""
+    origin = facts[0].timestamp
+    return np.array(
+        [(f.timestamp - origin).total_seconds() for f in facts], dtype=np.float64
+    ) / 86400.0
+
+
+def _affinity_block(
+    unit_a: NDArray[np.float64],
+    days_a: NDArray[np.float64],
+    unit_b: NDArray[np.float64],
+    days_b: NDArray[np.float64],
+    beta: float,
+    lam: float,
+) -> NDArray[np.float64]:
+    sem = unit_a @ unit_b.T
+    temp = np.exp(-lam * np.abs(days_a[:, None] - days_b[None, :]))
+    return beta * sem + (1.0 - beta) * temp
+
+
 def build_affinity_matrix(
     facts: list[Fact],
     beta: float = DEFAULT_BETA,
@@ -137,6 +207,10 @@ def build_affinity_matrix(
 ) -> NDArray[np.float64]:
     """Build a symmetric affinity matrix for a list of facts.
 
+    Vectorized: embeddings are normalised once and the semantic term is a
+    single ``E @ E.T``; the temporal term is broadcast over timestamp
+    differences.
+
     Args:
         facts: The facts to compare pairwise.
         beta: Semantic weight.
@@ -146,36 +220,156 @@ def build_affinity_matrix(
         Square numpy array of shape ``(n, n)`` with affinity scores.
     """
     n = len(facts)
-    matrix = np.ones((n, n), dtype=np.float64)
-    for i in range(n):
-        for j in range(i + 1, n):
-            score = compute_affinity(facts[i], facts[j], beta=beta, lam=lam)
-            matrix[i, j] = score
-            matrix[j, i] = score
+    if n == 0:
+        return np.ones((0, 0), dtype=np.float64)
+    unit = _unit_embeddings(facts)
+    days = _timestamps_days(facts)
+    matrix = _affinity_block(unit, days, unit, days, beta, lam)
+    np.fill_diagonal(matrix, 1.0)
     return matrix
 
 
+def _temporal_horizon(beta: float, lam: float, threshold: float) -> float:
+    """Largest time gap (days) at which a pair can still reach *threshold*.
+
+    Cosine similarity is at most 1, so ``omega <= beta + (1 - beta) *
+    exp(-lam * dt)``; beyond the returned gap no pair can clear the bar.
+    """
+    if lam <= 0.0 or beta >= 1.0 or threshold <= beta:
+        return float("inf")
+    ratio = (threshold - beta) / (1.0 - beta)
+    if ratio >= 1.0:
+        return 0.0
+    # Small slack so float rounding never prunes a boundary pair.
+    return -np.log(ratio) / lam + 1e-6
+
+
+def affinity_edges(
+    facts: list[Fact],
+    beta: float = DEFAULT_BETA,
+    lam: float = DEFAULT_LAMBDA,
+    threshold: float = DEFAULT_THRESHOLD,
+    block_size: int = DEFAULT_BLOCK_SIZE,
+) -> tuple[NDArray[np.intp], NDArray[np.intp]]:
+    """Index pairs ``(i, j)``, ``i != j``, whose affinity reaches *threshold*.
+
+    Facts are sorted by time and compared in row blocks of ``block_size``
+    against only those later facts inside the temporal horizon, so peak
+    memory is ``O(block_size * window)`` instead of ``O(n^2)``.
+    """
+    if block_size < 1:
+        raise ValueError("block_size must be >= 1")
+    n = len(facts)
+    if n < 2:
+        empty = np.empty(0, dtype=np.intp)
+        return empty, empty
+
+    days = _timestamps_days(facts)
+    order = np.argsort(days, kind="stable")
+    sdays = days[order]
+    unit = _unit_embeddings(facts)[order]
+    horizon = _temporal_horizon(beta, lam, threshold)
+    cutoff = 1.0 - threshold
+
+    rows: list[NDArray[np.intp]] = []
+    cols: list[NDArray[np.intp]] = []
+    for start in range(0, n, block_size):
+        stop = min(start + block_size, n)
+        hi = n if horizon == float("inf") else int(
+            np.searchsorted(sdays, sdays[stop - 1] + horizon, side="right")
+        )
+        block = _affinity_block(
+            unit[start:stop], sdays[start:stop], unit[start:hi], sdays[start:hi], beta, lam
+        )
+        # Same comparison the dense path makes on the distance matrix.
+        mask = np.clip(1.0 - block, 0.0, None) <= cutoff
+        r_off, c_off = np.nonzero(mask)
+        upper = c_off > r_off
+        rows.append(order[r_off[upper] + start])
+        cols.append(order[c_off[upper] + start])
+
+    return np.concatenate(rows), np.concatenate(cols)
+
+
 # ---------------------------------------------------------------------------
 # Clustering
 # ---------------------------------------------------------------------------
 
 
+def _linkage_labels(
+    facts: list[Fact],
+    beta: float,
+    lam: float,
+    threshold: float,
+) -> NDArray[np.int32]:
+    """Flat average-linkage cluster labels for *facts* (dense)."""
+    affinity = build_affinity_matrix(facts, beta=beta, lam=lam)
+
+    # Convert affinity to distance; clip to avoid negative values from
+    # floating-point imprecision.
+    distance = np.clip(1.0 - affinity, 0.0, None)
+
+    # Extract the condensed upper-triangle for scipy.
+    condensed = squareform(distance, checks=False)
+
+    Z = linkage(condensed, method="average")
+    return fcluster(Z, t=1.0 - threshold, criterion="distance")
+
+
+def _blocked_labels(
+    facts: list[Fact],
+    beta: float,
+    lam: float,
+    threshold: float,
+    block_size: int,
+) -> NDArray[np.int64]:
+    """Cluster labels computed per connected component of the threshold graph."""
+    n = len(facts)
+    rows, cols = affinity_edges(
+        facts, beta=beta, lam=lam, threshold=threshold, block_size=block_size
+    )
+    graph = coo_matrix((np.ones(len(rows), dtype=np.int8), (rows, cols)), shape=(n, n))
+    n_comp, comp = connected_components(graph, directed=False)
+
+    labels = np.empty(n, dtype=np.int64)
+    next_label = 0
+    members_by_comp: dict[int, list[int]] = {}
+    for idx, c in enumerate(comp):
+        members_by_comp.setdefault(int(c), []).append(idx)
+    for members in members_by_comp.values():
+        if len(members) == 1:
+            labels[members[0]] = next_label
+            next_label += 1
+            continue
+        sub = _linkage_labels([facts[i] for i in members], beta, lam, threshold)
+        for i, sub_label in zip(members, sub):
+            labels[i] = next_label + int(sub_label)
+        next_label += int(sub.max()) + 1
+    logger.debug("Blocked clustering: %d facts, %d components", n, n_comp)
+    return labels
+
+
 def cluster_facts(
     facts: list[Fact],
     beta: float = DEFAULT_BETA,
     lam: float = DEFAULT_LAMBDA,
     threshold: float = DEFAULT_THRESHOLD,
+    block_size: Optional[int] = None,
 ) -> list[list[Fact]]:
     """Agglomerative clustering of facts by temporal-semantic affinity.
 
     Facts that do not cluster with any other fact are returned as
-    single-element clusters (singletons).
+    single-element clusters (singletons). Clusters are ordered by their
+    first member's position in *facts*.
 
     Args:
         facts: Facts to cluster.
         beta: Semantic weight for affinity.
         lam: Temporal decay rate.
         threshold: Minimum affinity to merge clusters.
+        block_size: Use the blocked (sparse) mode with this row-block size.
+            ``None`` picks dense for up to :data:`DENSE_CLUSTER_LIMIT`
+            facts and blocked with :data:`DEFAULT_BLOCK_SIZE` above that.
 
     Returns:
         List of clusters, each a list of :class:`Fact`.
@@ -184,17 +378,13 @@ def cluster_facts(
     if n <= 1:
         return [facts] if facts else []
 
-    affinity = build_affinity_matrix(facts, beta=beta, lam=lam)
-
-    # Convert affinity to distance; clip to avoid negative values from
-    # floating-point imprecision.
-    distance = np.clip(1.0 - affinity, 0.0, None)
-
-    # Extract the condensed upper-triangle for scipy.
-    condensed = squareform(distance, checks=False)
+    if block_size is None and n > DENSE_CLUSTER_LIMIT:
+        block_size = DEFAULT_BLOCK_SIZE
 
-    Z = linkage(condensed, method="average")
-    labels = fcluster(Z, t=1.0 - threshold, criterion="distance")
+    if block_size is None:
+        labels = _linkage_labels(facts, beta, lam, threshold)
+    else:
+        labels = _blocked_labels(facts, beta, lam, threshold, block_size)
 
     clusters: dict[int, list[Fact]] = {}
     for idx, label in enumerate(labels):
@@ -216,7 +406,11 @@ _SYNTHESIS_SYSTEM = (
 
 
 def _deterministic_id(*parts: str) -> str:
-    """SHA-256-based deterministic ID from concatenated parts."""
+    """SHA-256-based deterministic ID from concatenated parts.
+
+    Insight ids are built from *sorted* source ids, so the same cluster
+    always maps to the same id regardless of member order.
+    """
     h = hashlib.sha256("|".join(parts).encode()).hexdigest()
     return f"insight-{h[:16]}"
 
@@ -258,6 +452,8 @@ def _mean_embedding(facts: list[Fact]) -> NDArray[np.float32]:
 async def synthesize_cluster(
     cluster: list[Fact],
     llm_call: Optional[LLMCall] = None,
+    scheduler: Optional[SynthesisScheduler] = None,
+    org_id: Optional[str] = None,
 ) -> Insight:
     """Synthesize a cluster of facts into a single :class:`Insight`.
 
@@ -267,6 +463,10 @@ async def synthesize_cluster(
     Args:
         cluster: Non-empty list of clustered facts.
         llm_call: Optional async callable ``(system, user) -> str``.
+        scheduler: Optional :class:`SynthesisScheduler` that routes the LLM
+            call through its concurrency limit, per-org rate limit,
+            request coalescing and synthesis cache.
+        org_id: Org the cluster belongs to, for rate limiting.
 
     Returns:
         A synthesized :class:`Insight`.
@@ -278,13 +478,19 @@ async def synthesize_cluster(
     tags = _merge_tags(cluster)
     significance = max(f.significance for f in cluster)
     embedding = _mean_embedding(cluster)
+    insight_id = _deterministic_id(*sorted(source_ids))
 
     if llm_call is not None and len(cluster) > 1:
         user_prompt = "Atomic facts:\n" + "\n".join(
             f"- {f.content}" for f in cluster
         )
         try:
-            content = await llm_call(_SYNTHESIS_SYSTEM, user_prompt)
+            if scheduler is not None:
+                content = await scheduler.complete(
+                    insight_id, _SYNTHESIS_SYSTEM, user_prompt, llm_call, org_id=org_id
+                )
+            else:
+                content = await llm_call(_SYNTHESIS_SYSTEM, user_prompt)
         except Exception:
             logger.warning(
                 "LLM synthesis failed for cluster of %d facts; using fallback",
@@ -294,8 +500,6 @@ async def synthesize_cluster(
     else:
         content = _fallback_synthesis(cluster)
 
-    insight_id = _deterministic_id(*source_ids)
-
     return Insight(
         id=insight_id,
         content=content,
@@ -303,6 +507,7 @@ async def synthesize_cluster(
         source_ids=source_ids,
         significance=significance,
         tags=tags,
+        timestamp=max(f.timestamp for f in cluster),
     )
 
 
@@ -329,6 +534,21 @@ def _insight_to_fact(insight: Insight, timestamp: datetime) -> Fact:
 # ---------------------------------------------------------------------------
 
 
+async def _synthesize_clusters(
+    clusters: list[list[Fact]],
+    llm_call: Optional[LLMCall],
+    scheduler: Optional[SynthesisScheduler],
+    org_id: Optional[str],
+) -> list[Insight]:
+    """Synthesize *clusters* in order; concurrently when a scheduler is set."""
+    if scheduler is None:
+        return [await synthesize_cluster(c, llm_call=llm_call) for c in clusters]
+    return list(await asyncio.gather(*(
+        synthesize_cluster(c, llm_call=llm_call, scheduler=scheduler, org_id=org_id)
+        for c in clusters
+    )))
+
+
 async def consolidate(
     facts: list[Fact],
     beta: float = DEFAULT_BETA,
@@ -336,6 +556,8 @@ async def consolidate(
     threshold: float = DEFAULT_THRESHOLD,
     llm_call: Optional[LLMCall] = None,
     max_depth: int = MAX_RECURSION_DEPTH,
+    scheduler: Optional[SynthesisScheduler] = None,
+    org_id: Optional[str] = None,
 ) -> list[Insight]:
     """Recursively consolidate atomic facts into higher-order insights.
 
@@ -354,6 +576,10 @@ async def consolidate(
         threshold: Minimum affinity to merge clusters.
         llm_call: Optional async LLM callable for synthesis.
         max_depth: Safety limit on recursion depth.
+        scheduler: Optional :class:`SynthesisScheduler`. When given, the
+            multi-fact clusters of each depth are synthesized concurrently
+            through it; otherwise they are synthesized one at a time.
+        org_id: Org the facts belong to, for per-org rate limiting.
 
     Returns:
         List of consolidated :class:`Insight` objects at all levels.
@@ -393,11 +619,8 @@ async def consolidate(
             break
 
         # Synthesize multi-fact clusters.
-        new_insights: list[Insight] = []
-        for cluster in multi:
-            insight = await synthesize_cluster(cluster, llm_call=llm_call)
-            new_insights.append(insight)
-            all_insights.append(insight)
+        new_insights = await _synthesize_clusters(multi, llm_call, scheduler, org_id)
+        all_insights.extend(new_insights)
 
         logger.info(
             "Depth %d: %d clusters merged into %d insights, %d singletons remain",
@@ -429,3 +652,264 @@ async def consolidate(
         )
 
     return all_insights
+
+
+# ---------------------------------------------------------------------------
+# Incremental consolidation
+# ---------------------------------------------------------------------------
+
+# Full re-clustering triggers (see DriftStats.needs_full_recluster).
+DEFAULT_MAX_UNASSIGNED_RATIO: float = 0.5
+DEFAULT_MAX_CENTROID_SHIFT: float = 0.15
+
+
+@dataclass
+class DriftStats:
+    """How well existing insights absorbed a batch of new facts."""
+
+    new_facts: int = 0
+    assigned: int = 0
+    mean_best_affinity: float = 0.0
+    max_centroid_shift: float = 0.0  # cosine distance, old vs. updated centroid
+
+    @property
+    def unassigned_ratio(self) -> float:
+        if not self.new_facts:
+            return 0.0
+        return 1.0 - self.assigned / self.new_facts
+
+    def needs_full_recluster(
+        self,
+        max_unassigned_ratio: float = DEFAULT_MAX_UNASSIGNED_RATIO,
+        max_centroid_shift: float = DEFAULT_MAX_CENTROID_SHIFT,
+    ) -> bool:
+        """True when most facts found no home or a centroid moved too far."""
+        return (
+            self.unassigned_ratio > max_unassigned_ratio
+            or self.max_centroid_shift > max_centroid_shift
+        )
+
+
+@dataclass
+class IncrementalResult:
+    """Outcome of :func:`consolidate_incremental`.
+
+    ``insights`` is the complete current set: untouched existing insights,
+    re-synthesized ones (which replace the ids in ``superseded_ids``) and
+    newly created ones.
+    """
+
+    insights: list[Insight]
+    updated: list[Insight] = field(default_factory=list)
+    created: list[Insight] = field(default_factory=list)
+    superseded_ids: list[str] = field(default_factory=list)
+    stats: DriftStats = field(default_factory=DriftStats)
+    full_recluster: bool = False
+
+
+def _cross_affinity(
+    facts: list[Fact],
+    others: list[Fact],
+    beta: float,
+    lam: float,
+) -> NDArray[np.float64]:
+    """Affinity of every fact in *facts* against every fact in *others*."""
+    days = _timestamps_days(facts + others)
+    return _affinity_block(
+        _unit_embeddings(facts), days[: len(facts)],
+        _unit_embeddings(others), days[len(facts):],
+        beta, lam,
+    )
+
+
+def _insight_reference_time(insight: Insight, fallback: datetime) -> datetime:
+    return insight.timestamp if insight.timestamp is not None else fallback
+
+
+def _updated_centroid(insight: Insight, new_facts: list[Fact]) -> tuple[np.ndarray, float]:
+    """Return *insight*'s centroid with *new_facts* folded in, and its shift."""
+    # The existing centroid stands for all of its sources, not one vector.
+    weight = max(1, len(insight.source_ids))
+    centroid = insight.embedding.astype(np.float64) * weight + np.sum(
+        [f.embedding for f in new_facts], axis=0
+    )
+    norm = np.linalg.norm(centroid)
+    if norm > 0.0:
+        centroid = centroid / norm
+    shift = 1.0 - _cosine_similarity(insight.embedding, centroid)
+    return centroid, shift
+
+
+async def _resynthesize(
+    insight: Insight,
+    new_facts: list[Fact],
+    centroid: np.ndarray,
+    reference_time: datetime,
+    llm_call: Optional[LLMCall],
+    scheduler: Optional[SynthesisScheduler] = None,
+    org_id: Optional[str] = None,
+) -> Insight:
+    """Fold *new_facts* into *insight* with the centroid already computed."""
+    anchor = _insight_to_fact(insight, _insight_reference_time(insight, reference_time))
+    merged = await synthesize_cluster(
+        [anchor, *new_facts], llm_call=llm_call, scheduler=scheduler, org_id=org_id
+    )
+
+    source_ids = list(insight.source_ids) + [f.id for f in new_facts]
+    merged.id = _deterministic_id(*sorted(source_ids))
+    merged.source_ids = source_ids
+    merged.embedding = centroid.astype(np.float32)
+    return merged
+
+
+async def consolidate_incremental(
+    facts: list[Fact],
+    existing: list[Insight],
+    beta: float = DEFAULT_BETA,
+    lam: float = DEFAULT_LAMBDA,
+    threshold: float = DEFAULT_THRESHOLD,
+    llm_call: Optional[LLMCall] = None,
+    max_depth: int = MAX_RECURSION_DEPTH,
+    max_unassigned_ratio: float = DEFAULT_MAX_UNASSIGNED_RATIO,
+    max_centroid_shift: float = DEFAULT_MAX_CENTROID_SHIFT,
+    scheduler: Optional[SynthesisScheduler] = None,
+    org_id: Optional[str] = None,
+) -> IncrementalResult:
+    """Consolidate *facts* against the insights already on record.
+
+    Each new fact joins the existing insight with the highest affinity if
+    that affinity reaches ``threshold``; only insights that gained facts
+    are re-synthesized. Facts that match nothing are consolidated among
+    themselves with :func:`consolidate`. When the resulting
+    :class:`DriftStats` exceed the limits, the update is discarded and the
+    existing insights plus new facts are re-clustered from scratch.
+
+    Cost is proportional to ``len(facts) * len(existing)`` affinity checks
+    plus one LLM call per touched insight, instead of re-clustering the
+    whole fact history.
+
+    Args:
+        facts: New atomic facts.
+        existing: Current top-level insights (with centroids).
+        beta: Semantic weight for affinity scoring.
+        lam: Temporal decay rate (per day).
+        threshold: Minimum affinity to join an insight or merge clusters.
+        llm_call: Optional async LLM callable for synthesis.
+        max_depth: Recursion limit for :func:`consolidate`.
+        max_unassigned_ratio: Re-cluster when a larger share of facts
+            matched no insight.
+        max_centroid_shift: Re-cluster when any updated centroid moved by
+            more than this cosine distance.
+        scheduler: Optional :class:`SynthesisScheduler`; touched insights
+            are then re-synthesized concurrently.
+        org_id: Org the facts belong to, for per-org rate limiting.
+
+    Returns:
+        An :class:`IncrementalResult`.
+    """
+    if not facts:
+        return IncrementalResult(insights=list(existing))
+    if not existing:
+        created = await consolidate(
+            facts, beta=beta, lam=lam, threshold=threshold,
+            llm_call=llm_call, max_depth=max_depth, scheduler=scheduler, org_id=org_id,
+        )
+        return IncrementalResult(
+            insights=created,
+            created=created,
+            stats=DriftStats(new_facts=len(facts)),
+        )
+
+    reference_time = max(f.timestamp for f in facts)
+    anchors = [
+        _insight_to_fact(ins, _insight_reference_time(ins, reference_time))
+        for ins in existing
+    ]
+    affinity = _cross_affinity(facts, anchors, beta, lam)
+    best = np.argmax(affinity, axis=1)
+    best_aff = affinity[np.arange(len(facts)), best]
+
+    assignments: dict[int, list[Fact]] = {}
+    unassigned: list[Fact] = []
+    for fact, j, aff in zip(facts, best, best_aff):
+        if 1.0 - aff <= 1.0 - threshold:
+            assignments.setdefault(int(j), []).append(fact)
+        else:
+            unassigned.append(fact)
+
+    stats = DriftStats(
+        new_facts=len(facts),
+        assigned=len(facts) - len(unassigned),
+        mean_best_affinity=float(np.mean(best_aff)),
+    )
+
+    # Drift is decided on centroids alone so that no LLM call is spent on
+    # insights a full re-cluster would throw away.
+    centroids: dict[int, np.ndarray] = {}
+    for j, members in assignments.items():
+        centroids[j], shift = _updated_centroid(existing[j], members)
+        stats.max_centroid_shift = max(stats.max_centroid_shift, shift)
+
+    if stats.needs_full_recluster(max_unassigned_ratio, max_centroid_shift):
+        logger.info(
+            "Drift limits exceeded (unassigned %.2f, shift %.3f); full re-cluster",
+            stats.unassigned_ratio,
+            stats.max_centroid_shift,
+        )
+        reclustered = await consolidate(
+            anchors + list(facts), beta=beta, lam=lam, threshold=threshold,
+            llm_call=llm_call, max_depth=max_depth, scheduler=scheduler, org_id=org_id,
+        )
+        by_id = {ins.id: ins for ins in existing}
+        insights: list[Insight] = []
+        for ins in reclustered:
+            if len(ins.source_ids) == 1 and ins.source_ids[0] in by_id:
+                # An existing insight that stayed on its own is kept as-is.
+                insights.append(by_id[ins.source_ids[0]])
+                continue
+            expanded: list[str] = []
+            for sid in ins.source_ids:
+                expanded.extend(by_id[sid].source_ids if sid in by_id else [sid])
+            ins.source_ids = expanded
+            insights.append(ins)
+        kept_ids = {ins.id for ins in insights}
+        return IncrementalResult(
+            insights=insights,
+            created=[ins for ins in insights if ins.id not in by_id],
+            superseded_ids=[ins.id for ins in existing if ins.id not in kept_ids],
+            stats=stats,
+            full_recluster=True,
+        )
+
+    jobs = [
+        _resynthesize(
+            existing[j], members, centroids[j], reference_time, llm_call, scheduler, org_id
+        )
+        for j, members in assignments.items()
+    ]
+    if scheduler is None:
+        updated = [await job for job in jobs]
+    else:
+        updated = list(await asyncio.gather(*jobs))
+    superseded = [existing[j].id for j in assignments]
+
+    created = await consolidate(
+        unassigned, beta=beta, lam=lam, threshold=threshold,
+        llm_call=llm_call, max_depth=max_depth, scheduler=scheduler, org_id=org_id,
+    ) if unassigned else []
+
+    touched = set(assignments)
+    kept = [ins for j, ins in enumerate(existing) if j not in touched]
+    logger.info(
+        "Incremental consolidation: %d facts -> %d insights updated, %d created",
+        len(facts),
+        len(updated),
+        len(created),
+    )
+    return IncrementalResult(
+        insights=kept + updated + created,
+        updated=updated,
+        created=created,
+        superseded_ids=superseded,
+        stats=stats,
+    )
@@ -51,6 +51,14 @@ _PROFILES: Dict[str, tuple[float, float, float]] = {
     "balanced":      (0.40,   0.35,    0.25),
 }
 
+# HNSW ``ef_search`` per complexity class: lookups want the nearest few
+# neighbours fast; conceptual queries trade latency for recall.
+_EF_SEARCH: Dict[str, int] = {
+    "lookup":       40,
+    "balanced":     80,
+    "conceptual":  200,
+}
+
 _LOOKUP_WORDS = frozenset({"who", "what", "when", "where", "which", "name", "list", "define"})
 _CONCEPTUAL_WORDS = frozenset({"why", "how", "explain", "describe", "compare", "analyse", "analyze"})
 
@@ -71,6 +79,11 @@ class QueryProfile:
         if self.complexity not in _PROFILES:
             raise ValueError(f"Unknown complexity class: {self.complexity!r}")
 
+    @property
+    def ef_search(self) -> int:
+        """HNSW candidate-list size to use for the dense view of this query."""
+        return _EF_SEARCH[self.complexity]
+
 
 @dataclass(slots=True)
 class ScoredResult:
@@ -283,8 +296,9 @@ def retrieve(
     query:
         Raw query string used for complexity estimation.
     query_embedding:
-        Pre-computed embedding vector (reserved for future scoring use;
-        not consumed by the current pure-fusion logic).
+        Pre-computed embedding vector (not consumed by the in-memory
+        fusion; :func:`kintsugi.memory.hybrid_search.hybrid_search` binds
+        it server-side and fuses in SQL).
     dense_results:
         Scored hits from the dense (embedding) retrieval view.
     lexical_results:
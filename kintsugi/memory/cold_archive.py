@@ -1,25 +1,50 @@
 """CMA Cold Archive — sub-threshold compressed storage.
 
-Windows that fall below the entropy threshold are compressed with gzip,
-integrity-hashed with SHA-256, and stored in the ``memory_archives`` table
-for potential future retrieval.
+Windows that fall below the entropy threshold are compressed, integrity-
+hashed with SHA-256, and stored in the ``memory_archives`` table for
+potential future retrieval.  Each row records its codec (see
+:mod:`kintsugi.memory.archive_codecs`), so gzip rows written before zstd
+was enabled stay readable, and :meth:`ColdArchive.recompact` migrates them
+in the background.
+
+Reads are keyset-paginated: each page is a bounded query, and the page's
+decompression or hashing runs in an executor, so scanning years of an
+org's archive neither holds it in memory nor blocks the event loop.
 """
 
 from __future__ import annotations
 
+import asyncio
 import gzip
 import hashlib
 import logging
+import time
+from collections.abc import AsyncIterator
+from concurrent.futures import Executor
 from dataclasses import dataclass
 from datetime import datetime
+from typing import Any, Callable, Optional, TypeVar
 
-from sqlalchemy import select
+from sqlalchemy import or_, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from kintsugi.memory.archive_codecs import (
+    DEFAULT_DICT_SIZE,
+    GZIP,
+    ZSTD,
+    ArchiveCodec,
+    get_codec,
+    train_dictionary,
+)
 from kintsugi.memory.cma_stage1 import Window
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_PAGE_SIZE = 256
+DEFAULT_DICTIONARY_TTL = 300.0
+
+_T = TypeVar("_T")
+
 
 # ---------------------------------------------------------------------------
 # Result types
@@ -39,12 +64,37 @@ class ArchivedWindow:
 
 @dataclass
 class IntegrityReport:
-    """Result of an archive integrity verification pass."""
+    """Result of an archive integrity verification pass.
+
+    ``last_checked_id`` is the resume point of a chunked scan; pass it as
+    ``after_id`` to continue where an incomplete (``complete=False``) pass
+    stopped.
+    """
 
     total_checked: int
     passed: int
     failed: int
     failed_ids: list[str]
+    last_checked_id: Optional[str] = None
+    complete: bool = True
+
+
+@dataclass
+class RecompactResult:
+    """Result of a re-compaction pass; resumable like :class:`IntegrityReport`.
+
+    Rows whose stored hash no longer matches are left untouched and listed
+    in ``corrupt_ids``.
+    """
+
+    scanned: int
+    recompacted: int
+    corrupt: int
+    bytes_before: int
+    bytes_after: int
+    corrupt_ids: list[str]
+    last_checked_id: Optional[str] = None
+    complete: bool = True
 
 
 # ---------------------------------------------------------------------------
@@ -68,13 +118,156 @@ def _sha256(data: bytes) -> str:
     return hashlib.sha256(data).hexdigest()
 
 
+def _raw_batch(blobs: list[bytes], codecs: list[ArchiveCodec]) -> list[bytes]:
+    return [c.decompress(b) for b, c in zip(blobs, codecs)]
+
+
+def _decompress_batch(
+    blobs: list[bytes], codecs: Optional[list[ArchiveCodec]] = None,
+) -> list[str]:
+    if codecs is None:
+        return [_decompress(b) for b in blobs]
+    return [raw.decode("utf-8") for raw in _raw_batch(blobs, codecs)]
+
+
+def _sha256_batch(blobs: list[bytes]) -> list[str]:
+    return [_sha256(b) for b in blobs]
+
+
+def _encode_batch(raws: list[bytes], codec: ArchiveCodec) -> list[tuple[bytes, str]]:
+    out = []
+    for raw in raws:
+        blob = codec.compress(raw)
+        out.append((blob, _sha256(blob)))
+    return out
+
+
+def _recompress_batch(
+    blobs: list[bytes],
+    hashes: list[str],
+    codecs: list[ArchiveCodec],
+    target: ArchiveCodec,
+) -> list[Optional[tuple[bytes, str]]]:
+    """Re-encode verified blobs with *target*; ``None`` marks a corrupt row."""
+    out: list[Optional[tuple[bytes, str]]] = []
+    for blob, expected, codec in zip(blobs, hashes, codecs):
+        if _sha256(blob) != expected:
+            out.append(None)
+            continue
+        raw = codec.decompress(blob)
+        encoded = target.compress(raw)
+        if target.decompress(encoded) != raw:
+            raise RuntimeError(f"{target.name} round-trip mismatch during re-compaction")
+        out.append((encoded, _sha256(encoded)))
+    return out
+
+
 # ---------------------------------------------------------------------------
 # ColdArchive
 # ---------------------------------------------------------------------------
 
 
 class ColdArchive:
-    """Manages the compressed cold-storage tier for sub-threshold windows."""
+    """Manages the compressed cold-storage tier for sub-threshold windows.
+
+    Args:
+        executor: Thread or process pool for page decompression and
+            hashing.  ``None`` uses the event loop's default executor.
+        page_size: Rows fetched per keyset page.
+        codec: Codec for new rows, ``"gzip"`` (default) or ``"zstd"``.
+            With zstd, the org's newest trained dictionary is used if any.
+        level: Compression level for new rows (codec default if ``None``).
+        dictionary_ttl: Seconds an org's newest-dictionary lookup is
+            reused before it is re-read, so dictionaries trained by other
+            workers are picked up.
+    """
+
+    def __init__(
+        self,
+        executor: Optional[Executor] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        codec: str = GZIP,
+        level: Optional[int] = None,
+        dictionary_ttl: float = DEFAULT_DICTIONARY_TTL,
+    ) -> None:
+        if page_size < 1:
+            raise ValueError(f"page_size must be >= 1, got {page_size}")
+        if codec not in (GZIP, ZSTD):
+            raise ValueError(f"Unknown archive codec: {codec!r}. Use {GZIP!r} or {ZSTD!r}.")
+        self._executor = executor
+        self._page_size = page_size
+        self._codec_name = codec
+        self._level = level
+        self._dictionary_ttl = dictionary_ttl
+        self._codecs: dict[tuple[str, Optional[str]], ArchiveCodec] = {}
+        self._dictionaries: dict[str, bytes] = {}
+        # org_id -> (id of its newest dictionary or None, monotonic expiry)
+        self._active_dictionary: dict[str, tuple[Optional[str], float]] = {}
+
+    async def _offload(self, fn: Callable[..., _T], *args: Any) -> _T:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, fn, *args)
+
+    def _codec(self, name: str, dictionary_id: Optional[str]) -> ArchiveCodec:
+        """Cached codec instance for a stored ``(codec, dictionary_id)`` pair."""
+        key = (name, dictionary_id)
+        codec = self._codecs.get(key)
+        if codec is None:
+            kwargs: dict[str, Any] = {}
+            if self._level is not None:
+                kwargs["level"] = self._level
+            dictionary = self._dictionaries[dictionary_id] if dictionary_id else None
+            codec = get_codec(name, dictionary, **kwargs)
+            self._codecs[key] = codec
+        return codec
+
+    async def _write_codec(
+        self, org_id: str, session: AsyncSession,
+    ) -> tuple[ArchiveCodec, Optional[str]]:
+        """Codec and dictionary id that new rows for *org_id* are written with."""
+        if self._codec_name == GZIP:
+            return self._codec(GZIP, None), None
+
+        from kintsugi.models.base import ArchiveDictionary
+
+        org_key = str(org_id)
+        cached = self._active_dictionary.get(org_key)
+        if cached is None or cached[1] <= time.monotonic():
+            stmt = (
+                select(ArchiveDictionary)
+                .where(ArchiveDictionary.org_id == org_id, ArchiveDictionary.codec == ZSTD)
+                .order_by(ArchiveDictionary.created_at.desc())
+                .limit(1)
+            )
+            row = (await session.execute(stmt)).scalars().first()
+            expires = time.monotonic() + self._dictionary_ttl
+            if row is None:
+                cached = (None, expires)
+            else:
+                self._dictionaries[str(row.id)] = row.dictionary
+                cached = (str(row.id), expires)
+            self._active_dictionary[org_key] = cached
+
+        dictionary_id = cached[0]
+        return self._codec(ZSTD, dictionary_id), dictionary_id
+
+    async def _read_codecs(self, rows: list[Any], session: AsyncSession) -> list[ArchiveCodec]:
+        """Codecs for decoding *rows*, loading unseen dictionaries in one query."""
+        from kintsugi.models.base import ArchiveDictionary
+
+        missing = {
+            r.dictionary_id for r in rows
+            if r.dictionary_id is not None and str(r.dictionary_id) not in self._dictionaries
+        }
+        if missing:
+            stmt = select(ArchiveDictionary).where(ArchiveDictionary.id.in_(missing))
+            for d in (await session.execute(stmt)).scalars().all():
+                self._dictionaries[str(d.id)] = d.dictionary
+
+        return [
+            self._codec(r.codec or GZIP, str(r.dictionary_id) if r.dictionary_id else None)
+            for r in rows
+        ]
 
     async def archive_window(
         self,
@@ -96,8 +289,9 @@ class ColdArchive:
         """
         from kintsugi.models.base import MemoryArchive
 
+        codec, dictionary_id = await self._write_codec(org_id, session)
         text = _window_text(window)
-        compressed = _compress(text)
+        compressed = codec.compress(text.encode("utf-8"))
         content_hash = _sha256(compressed)
 
         row = MemoryArchive(
@@ -105,6 +299,8 @@ class ColdArchive:
             content_compressed=compressed,
             entropy_score=entropy_score,
             content_hash=content_hash,
+            codec=codec.name,
+            dictionary_id=dictionary_id,
         )
         session.add(row)
         await session.flush()
@@ -118,93 +314,350 @@ class ColdArchive:
         )
         return str(row.id)
 
-    async def retrieve_archive(
+    async def archive_contents(
+        self,
+        org_id: str,
+        contents: list[str],
+        session: AsyncSession,
+        *,
+        entropy_score: float = 0.0,
+    ) -> list[str]:
+        """Compress and store raw texts (e.g. expired memories) in one flush.
+
+        Compression runs in the executor; rows are added to *session*
+        without committing, so callers can archive inside their own
+        transaction.
+
+        Returns:
+            String UUIDs of the new archive rows, in input order.
+        """
+        if not contents:
+            return []
+
+        from kintsugi.models.base import MemoryArchive
+
+        codec, dictionary_id = await self._write_codec(org_id, session)
+        encoded = await self._offload(
+            _encode_batch, [c.encode("utf-8") for c in contents], codec
+        )
+        rows = [
+            MemoryArchive(
+                org_id=org_id,
+                content_compressed=blob,
+                entropy_score=entropy_score,
+                content_hash=content_hash,
+                codec=codec.name,
+                dictionary_id=dictionary_id,
+            )
+            for blob, content_hash in encoded
+        ]
+        session.add_all(rows)
+        await session.flush()
+        return [str(r.id) for r in rows]
+
+    async def iter_archive(
         self,
         org_id: str,
         date_range: tuple[datetime, datetime],
         session: AsyncSession,
-    ) -> list[ArchivedWindow]:
-        """Retrieve archived windows within a date range.
+    ) -> AsyncIterator[ArchivedWindow]:
+        """Stream archived windows within a date range, oldest first.
+
+        Rows are fetched in keyset pages on ``(archived_at, id)``, so no
+        cursor or transaction is held open while the caller consumes a page.
 
         Args:
             org_id: Organisation scope.
             date_range: ``(start, end)`` inclusive datetime bounds.
             session: Active async database session.
 
-        Returns:
-            List of :class:`ArchivedWindow` with decompressed content.
+        Yields:
+            :class:`ArchivedWindow` with decompressed content.
         """
         from kintsugi.models.base import MemoryArchive
 
         start, end = date_range
-        stmt = (
-            select(MemoryArchive)
-            .where(
+        after: Optional[tuple[datetime, Any]] = None
+        while True:
+            stmt = select(MemoryArchive).where(
                 MemoryArchive.org_id == org_id,
                 MemoryArchive.archived_at >= start,
                 MemoryArchive.archived_at <= end,
             )
-            .order_by(MemoryArchive.archived_at)
-        )
-        result = await session.execute(stmt)
-        rows = result.scalars().all()
-
-        return [
-            ArchivedWindow(
-                id=str(r.id),
-                content=_decompress(r.content_compressed),
-                entropy_score=r.entropy_score,
-                content_hash=r.content_hash,
-                archived_at=r.archived_at,
+            if after is not None:
+                stmt = stmt.where(
+                    tuple_(MemoryArchive.archived_at, MemoryArchive.id) > tuple_(*after)
+                )
+            stmt = stmt.order_by(MemoryArchive.archived_at, MemoryArchive.id).limit(
+                self._page_size
             )
-            for r in rows
-        ]
+            result = await session.execute(stmt)
+            rows = result.scalars().all()
+            if not rows:
+                return
+
+            codecs = await self._read_codecs(rows, session)
+            texts = await self._offload(
+                _decompress_batch, [r.content_compressed for r in rows], codecs
+            )
+            for r, text in zip(rows, texts):
+                yield ArchivedWindow(
+                    id=str(r.id),
+                    content=text,
+                    entropy_score=r.entropy_score,
+                    content_hash=r.content_hash,
+                    archived_at=r.archived_at,
+                )
+
+            if len(rows) < self._page_size:
+                return
+            after = (rows[-1].archived_at, rows[-1].id)
+
+    async def retrieve_archive(
+        self,
+        org_id: str,
+        date_range: tuple[datetime, datetime],
+        session: AsyncSession,
+    ) -> list[ArchivedWindow]:
+        """Retrieve archived windows within a date range.
+
+        Collects :meth:`iter_archive`; prefer that for large ranges.
+
+        Args:
+            org_id: Organisation scope.
+            date_range: ``(start, end)`` inclusive datetime bounds.
+            session: Active async database session.
+
+        Returns:
+            List of :class:`ArchivedWindow` with decompressed content.
+        """
+        return [w async for w in self.iter_archive(org_id, date_range, session)]
 
     async def verify_integrity(
         self,
         org_id: str,
         session: AsyncSession,
+        *,
+        after_id: Optional[str] = None,
+        max_rows: Optional[int] = None,
     ) -> IntegrityReport:
         """Recompute SHA-256 hashes and compare against stored values.
 
+        Scans the org's archive in ``id`` order, one keyset page at a time,
+        hashing each page in the executor.
+
+        Args:
+            org_id: Organisation scope.
+            session: Active async database session.
+            after_id: Resume after this archive id (see
+                :attr:`IntegrityReport.last_checked_id`).
+            max_rows: Stop after roughly this many rows (whole pages);
+                the report is then marked ``complete=False``.
+
         Returns:
             :class:`IntegrityReport` summarising the check.
         """
         from kintsugi.models.base import MemoryArchive
 
-        stmt = select(MemoryArchive).where(MemoryArchive.org_id == org_id)
-        result = await session.execute(stmt)
-        rows = result.scalars().all()
-
         passed = 0
         failed = 0
         failed_ids: list[str] = []
-
-        for row in rows:
-            computed = _sha256(row.content_compressed)
-            if computed == row.content_hash:
-                passed += 1
-            else:
-                failed += 1
-                failed_ids.append(str(row.id))
-                logger.error(
-                    "Integrity failure for archive %s: expected=%s got=%s",
-                    row.id,
-                    row.content_hash,
-                    computed,
-                )
+        last_id: Optional[Any] = after_id
+        complete = True
+
+        while True:
+            stmt = select(MemoryArchive).where(MemoryArchive.org_id == org_id)
+            if last_id is not None:
+                stmt = stmt.where(MemoryArchive.id > last_id)
+            stmt = stmt.order_by(MemoryArchive.id).limit(self._page_size)
+            result = await session.execute(stmt)
+            rows = result.scalars().all()
+            if not rows:
+                break
+
+            hashes = await self._offload(
+                _sha256_batch, [r.content_compressed for r in rows]
+            )
+            for row, computed in zip(rows, hashes):
+                if computed == row.content_hash:
+                    passed += 1
+                else:
+                    failed += 1
+                    failed_ids.append(str(row.id))
+                    logger.error(
+                        "Integrity failure for archive %s: expected=%s got=%s",
+                        row.id,
+                        row.content_hash,
+                        computed,
+                    )
+            last_id = rows[-1].id
+
+            if len(rows) < self._page_size:
+                break
+            if max_rows is not None and passed + failed >= max_rows:
+                complete = False
+                break
 
         total = passed + failed
         logger.info(
-            "Integrity check for org=%s: %d checked, %d passed, %d failed",
+            "Integrity check for org=%s: %d checked, %d passed, %d failed%s",
             org_id,
             total,
             passed,
             failed,
+            "" if complete else " (partial)",
         )
         return IntegrityReport(
             total_checked=total,
             passed=passed,
             failed=failed,
             failed_ids=failed_ids,
+            last_checked_id=str(last_id) if last_id is not None else None,
+            complete=complete,
+        )
+
+    async def train_dictionary(
+        self,
+        org_id: str,
+        session: AsyncSession,
+        *,
+        sample_limit: int = 2000,
+        dict_size: int = DEFAULT_DICT_SIZE,
+    ) -> str:
+        """Train a zstd dictionary on the org's most recent archived windows.
+
+        The new dictionary becomes the org's active one for zstd writes and
+        for :meth:`recompact`.
+
+        Returns:
+            String UUID of the new ``archive_dictionaries`` row.
+
+        Raises:
+            ValueError: If the org has too few archived windows to train on.
+        """
+        from kintsugi.models.base import ArchiveDictionary, MemoryArchive
+
+        stmt = (
+            select(MemoryArchive)
+            .where(MemoryArchive.org_id == org_id)
+            .order_by(MemoryArchive.archived_at.desc())
+            .limit(sample_limit)
+        )
+        rows = (await session.execute(stmt)).scalars().all()
+        codecs = await self._read_codecs(rows, session)
+        samples = await self._offload(_raw_batch, [r.content_compressed for r in rows], codecs)
+        dictionary = await self._offload(train_dictionary, samples, dict_size)
+
+        row = ArchiveDictionary(
+            org_id=org_id,
+            codec=ZSTD,
+            dictionary=dictionary,
+            sample_count=len(samples),
+        )
+        session.add(row)
+        await session.flush()
+
+        dictionary_id = str(row.id)
+        self._dictionaries[dictionary_id] = dictionary
+        self._active_dictionary[str(org_id)] = (
+            dictionary_id, time.monotonic() + self._dictionary_ttl,
+        )
+        logger.info(
+            "Trained %d-byte archive dictionary %s for org=%s from %d windows",
+            len(dictionary),
+            dictionary_id,
+            org_id,
+            len(samples),
+        )
+        return dictionary_id
+
+    async def recompact(
+        self,
+        org_id: str,
+        session: AsyncSession,
+        *,
+        after_id: Optional[str] = None,
+        max_rows: Optional[int] = None,
+    ) -> RecompactResult:
+        """Re-encode the org's rows that are not in the current write format.
+
+        Intended as a periodic background job with its own session: each
+        page is verified against its stored hash, re-encoded in the
+        executor, and committed.  Re-encoding changes the stored bytes, so
+        ``content_hash`` is recomputed; the decoded content is checked to
+        round-trip before anything is written.
+
+        Args:
+            org_id: Organisation scope.
+            session: Async session; committed once per page.
+            after_id: Resume after this archive id.
+            max_rows: Stop after roughly this many rows (whole pages).
+
+        Returns:
+            :class:`RecompactResult` summarising the pass.
+        """
+        from kintsugi.models.base import MemoryArchive
+
+        target, dictionary_id = await self._write_codec(org_id, session)
+        stale = or_(
+            MemoryArchive.codec != target.name,
+            MemoryArchive.dictionary_id.is_distinct_from(dictionary_id),
+        )
+
+        result = RecompactResult(
+            scanned=0, recompacted=0, corrupt=0, bytes_before=0, bytes_after=0, corrupt_ids=[],
+        )
+        last_id: Optional[Any] = after_id
+
+        while True:
+            stmt = select(MemoryArchive).where(MemoryArchive.org_id == org_id, stale)
+            if last_id is not None:
+                stmt = stmt.where(MemoryArchive.id > last_id)
+            stmt = stmt.order_by(MemoryArchive.id).limit(self._page_size)
+            rows = (await session.execute(stmt)).scalars().all()
+            if not rows:
+                break
+
+            codecs = await self._read_codecs(rows, session)
+            encoded = await self._offload(
+                _recompress_batch,
+                [r.content_compressed for r in rows],
+                [r.content_hash for r in rows],
+                codecs,
+                target,
+            )
+            for row, new in zip(rows, encoded):
+                if new is None:
+                    result.corrupt += 1
+                    result.corrupt_ids.append(str(row.id))
+                    logger.error("Skipping re-compaction of corrupt archive %s", row.id)
+                    continue
+                result.bytes_before += len(row.content_compressed)
+                result.bytes_after += len(new[0])
+                row.content_compressed, row.content_hash = new
+                row.codec = target.name
+                row.dictionary_id = dictionary_id
+                result.recompacted += 1
+
+            result.scanned += len(rows)
+            last_id = rows[-1].id
+            await session.commit()
+
+            if len(rows) < self._page_size:
+                break
+            if max_rows is not None and result.scanned >= max_rows:
+                result.complete = False
+                break
+
+        result.last_checked_id = str(last_id) if last_id is not None else None
+        logger.info(
+            "Re-compaction for org=%s: %d scanned, %d re-encoded (%d -> %d bytes), %d corrupt%s",
+            org_id,
+            result.scanned,
+            result.recompacted,
+            result.bytes_before,
+            result.bytes_after,
+            result.corrupt,
+            "" if result.complete else " (partial)",
         )
+        return result
@@ -13,23 +13,63 @@ Designed to run as a background task (periodic timer, cron, or
 triggered at session start). Each cycle is idempotent — safe to
 run multiple times.
 
+The phases are independent and run concurrently. Consolidation, decay
+and archive page through the whole memory set (``memory_pages``) rather
+than a fixed-size slice. Each phase can have a time budget. A phase that
+runs out of budget saves its cursor in a :class:`DreamCheckpointStore`,
+and the next cycle resumes from there.
+
 "Your AI kept working while you slept."
 """
 from __future__ import annotations
 
+import asyncio
+import inspect
+import json
 import logging
+import time
+from collections.abc import AsyncIterator, Iterable
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
-from typing import Any, Callable, Awaitable
+from pathlib import Path
+from typing import Any, Callable, Awaitable, Optional, Protocol
+
+import numpy as np
 
 from kintsugi.cognition.proactive_advisor import (
     ProactiveAdvisor,
     ActivityRecord,
     Suggestion,
 )
+from kintsugi.memory.embedding_cache import CachedEmbeddingProvider, EmbeddingCache
+from kintsugi.memory.enrichment import EnrichmentEngine
+from kintsugi.memory.embeddings import EmbeddingProvider
+from kintsugi.memory.synthesis import SynthesisScheduler
 
 logger = logging.getLogger(__name__)
 
+PHASES = ("consolidation", "decay", "archive", "enrichment", "suggestions")
+
+
+def _epoch(value: datetime | str | None) -> float:
+    """POSIX seconds for a datetime or ISO string; NaN when missing."""
+    if value is None:
+        return float("nan")
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    return value.timestamp()
+
+
+def _days_since(now: datetime, value: datetime | str | None) -> float:
+    return (now.timestamp() - _epoch(value)) / 86400.0
+
+
+async def _maybe_await(value: Any) -> Any:
+    """Let injected callables be either sync or async."""
+    if inspect.isawaitable(value):
+        return await value
+    return value
+
 
 @dataclass
 class DreamerConfig:
@@ -39,7 +79,110 @@ class DreamerConfig:
     archive_after_days: int = 180
     archive_below_significance: int = 2
     max_suggestions: int = 5
-    enrichment_batch_size: int = 10
+    enrichment_batch_size: int = 500
+    enrichment_min_shared_tags: int = 2
+    enrichment_similarity: float = 0.8
+    page_size: int = 500
+    # Seconds each phase may run per cycle (None = unlimited); per-phase
+    # entries in phase_budgets override the default.
+    phase_budget_seconds: float | None = None
+    phase_budgets: dict[str, float] = field(default_factory=dict)
+
+    def budget_for(self, phase: str) -> float | None:
+        return self.phase_budgets.get(phase, self.phase_budget_seconds)
+
+
+# ---------------------------------------------------------------------------
+# Checkpoints
+# ---------------------------------------------------------------------------
+
+
+class BulkMaintenance(Protocol):
+    """Set-based decay/archive backend, e.g.
+    :class:`kintsugi.memory.significance.BulkSignificanceMaintenance`."""
+
+    async def decay(self, now: datetime, half_life_days: float) -> int: ...
+
+    async def archive_stale(
+        self, now: datetime, archive_after_days: float, below_significance: int,
+    ) -> int: ...
+
+
+class DreamCheckpointStore(Protocol):
+    """Where paged phases keep their cursor between cycles.
+
+    A cursor is the id of the last memory a phase finished with; ``None``
+    means the phase completed its last pass and starts from the top.
+    """
+
+    def load(self, key: str) -> Optional[str]: ...
+
+    def save(self, key: str, cursor: Optional[str]) -> None: ...
+
+
+class InMemoryDreamCheckpoints:
+    """Process-local :class:`DreamCheckpointStore`."""
+
+    def __init__(self) -> None:
+        self._data: dict[str, str] = {}
+
+    def load(self, key: str) -> Optional[str]:
+        return self._data.get(key)
+
+    def save(self, key: str, cursor: Optional[str]) -> None:
+        if cursor is None:
+            self._data.pop(key, None)
+        else:
+            self._data[key] = cursor
+
+
+class FileDreamCheckpoints(InMemoryDreamCheckpoints):
+    """Persistent :class:`DreamCheckpointStore` backed by a small JSON file."""
+
+    def __init__(self, path: str | Path) -> None:
+        super().__init__()
+        self._path = Path(path)
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        if self._path.exists():
+            try:
+                self._data = {
+                    str(k): str(v)
+                    for k, v in json.loads(self._path.read_text(encoding="utf-8")).items()
+                }
+            except (json.JSONDecodeError, AttributeError):
+                logger.warning("Ignoring corrupt dreamer checkpoint file %s", self._path)
+
+    def save(self, key: str, cursor: Optional[str]) -> None:
+        if self._data.get(key) == cursor:
+            return
+        super().save(key, cursor)
+        tmp = self._path.with_suffix(self._path.suffix + ".tmp")
+        tmp.write_text(json.dumps(self._data), encoding="utf-8")
+        tmp.replace(self._path)
+
+
+@dataclass
+class PhaseReport:
+    """What one phase did in a cycle."""
+    name: str
+    processed: int = 0
+    pages: int = 0
+    duration_seconds: float = 0.0
+    completed: bool = True
+    resumed_from: str | None = None
+    error: str | None = None
+
+
+class _PhaseRun:
+    """Budget and cursor bookkeeping for one phase of one cycle."""
+
+    def __init__(self, name: str, budget: float | None, cursor: str | None) -> None:
+        self.report = PhaseReport(name=name, resumed_from=cursor)
+        self.cursor = cursor
+        self._deadline = None if budget is None else time.monotonic() + budget
+
+    def out_of_time(self) -> bool:
+        return self._deadline is not None and time.monotonic() >= self._deadline
 
 
 @dataclass
@@ -53,6 +196,14 @@ class DreamCycleReport:
     suggestions: list[Suggestion] = field(default_factory=list)
     duration_seconds: float = 0.0
     errors: list[str] = field(default_factory=list)
+    phases: dict[str, PhaseReport] = field(default_factory=dict)
+
+    @property
+    def incomplete_phases(self) -> list[str]:
+        """Phases that stopped early and will resume next cycle."""
+        return [
+            name for name, p in self.phases.items() if not p.completed and p.error is None
+        ]
 
     def summary(self) -> str:
         parts = []
@@ -66,6 +217,8 @@ class DreamCycleReport:
             parts.append(f"{self.connections_found} new connections")
         if self.suggestions:
             parts.append(f"{len(self.suggestions)} suggestions")
+        if self.incomplete_phases:
+            parts.append(f"to resume: {', '.join(self.incomplete_phases)}")
         if not parts:
             return "Nothing to report — memory is healthy."
         return "; ".join(parts) + f" ({self.duration_seconds:.1f}s)"
@@ -81,17 +234,57 @@ class Dreamer:
     Args:
         config: Dreamer configuration.
         memory_store: Callable that returns memory records for processing.
-            Signature: (query, limit) -> list[dict]
+            Signature: (query, limit) -> list[dict]. Used for ``recent``
+            and, when ``memory_pages`` is not given, as a single page.
         update_memory: Callable to update a memory record.
             Signature: (memory_id, updates) -> None
         archive_memory: Callable to archive a memory to cold storage.
             Signature: (memory_id) -> None
+        memory_pages: Keyset-paged memory source.
+            Signature: (query, after_id, limit) -> list[dict], returning
+            up to ``limit`` records with ``id > after_id`` in id order
+            (``after_id`` is None for the first page). Consolidation,
+            decay and archive use it to cover the whole memory set.
+        checkpoints: :class:`DreamCheckpointStore` for paged-phase cursors.
+        update_memories: Batch form of ``update_memory``, called once per
+            decayed page. Signature: ({memory_id: updates}) -> None
+        archive_memories: Batch form of ``archive_memory``, called once
+            per page. Signature: (memory_ids) -> None
+        bulk_maintenance: :class:`BulkMaintenance` that decays and
+            archives in the database with set-based UPDATEs; when given,
+            the decay and archive phases do not fetch memories at all.
+        link_sink: Callable persisting enrichment links, e.g. a wrapper
+            around :func:`kintsugi.memory.enrichment.save_links`.
+            Signature: (list[MemoryLink]) -> None
         consolidate_fn: Async callable for Stage 2 consolidation.
-            Signature: (facts, llm_call) -> list[Insight]
+            Signature: (facts, llm_call) -> list[Insight]; when
+            ``synthesis`` is set it also gets ``scheduler`` and ``org_id``
+            keywords, as :func:`~kintsugi.memory.cma_stage2.consolidate`
+            takes them.
         llm_call: Async callable for LLM operations.
             Signature: (prompt) -> str
         activity_source: Callable that returns recent activity records.
             Signature: (days) -> list[ActivityRecord]
+        embedding_provider: Optional :class:`EmbeddingProvider`. When set,
+            consolidation receives Stage 2 ``Fact`` objects carrying
+            embeddings (stored ones are reused, missing ones are embedded
+            in one batch).
+        embedding_cache: Optional :class:`EmbeddingCache` wrapped around
+            ``embedding_provider``.
+        insight_source: Callable returning the current top-level insights.
+            Signature: () -> list[Insight]. Together with
+            ``embedding_provider`` this switches consolidation to
+            :func:`consolidate_incremental`, so new facts join existing
+            insights instead of re-clustering everything.
+        insight_sink: Callable that persists an incremental result.
+            Signature: (IncrementalResult) -> None
+        synthesis: Optional :class:`SynthesisScheduler` for Stage 2
+            consolidation. Give it a persistent cache so a re-run skips
+            clusters that were already synthesized.
+        org_id: Org this dreamer tends, used for per-org rate limiting
+            and to scope checkpoint keys.
+
+    Any of the injected callables may be async.
     """
 
     def __init__(
@@ -103,6 +296,18 @@ class Dreamer:
         consolidate_fn: Callable[..., Awaitable[list]] | None = None,
         llm_call: Callable[..., Awaitable[str]] | None = None,
         activity_source: Callable[..., list[ActivityRecord]] | None = None,
+        embedding_provider: EmbeddingProvider | None = None,
+        embedding_cache: EmbeddingCache | None = None,
+        insight_source: Callable[..., list] | None = None,
+        insight_sink: Callable[..., None] | None = None,
+        synthesis: SynthesisScheduler | None = None,
+        org_id: str | None = None,
+        memory_pages: Callable[..., list[dict] | Awaitable[list[dict]]] | None = None,
+        checkpoints: DreamCheckpointStore | None = None,
+        update_memories: Callable[..., Any] | None = None,
+        archive_memories: Callable[..., Any] | None = None,
+        bulk_maintenance: BulkMaintenance | None = None,
+        link_sink: Callable[..., Any] | None = None,
     ) -> None:
         self._config = config or DreamerConfig()
         self._memory_store = memory_store
@@ -111,74 +316,151 @@ class Dreamer:
         self._consolidate_fn = consolidate_fn
         self._llm_call = llm_call
         self._activity_source = activity_source
+        if (
+            embedding_provider is not None
+            and embedding_cache is not None
+            and not isinstance(embedding_provider, CachedEmbeddingProvider)
+        ):
+            embedding_provider = CachedEmbeddingProvider(embedding_provider, embedding_cache)
+        self._embedding_provider = embedding_provider
+        self._insight_source = insight_source
+        self._insight_sink = insight_sink
+        self._synthesis = synthesis
+        self._org_id = org_id
+        self._memory_pages = memory_pages
+        self._checkpoints = checkpoints
+        self._update_memories = update_memories
+        self._archive_memories = archive_memories
+        self._bulk = bulk_maintenance
+        self._link_sink = link_sink
+        self._enrichment = EnrichmentEngine(
+            min_shared_tags=self._config.enrichment_min_shared_tags,
+            similarity_threshold=self._config.enrichment_similarity,
+        )
         self._advisor = ProactiveAdvisor(max_suggestions=self._config.max_suggestions)
 
-    async def dream(self) -> DreamCycleReport:
-        """Run a full dream cycle. Returns a report of what was done."""
-        import time
+    async def dream(self, phases: Iterable[str] | None = None) -> DreamCycleReport:
+        """Run a dream cycle. Returns a report of what was done.
+
+        Args:
+            phases: Subset of :data:`PHASES` to run (default: all), so
+                phases can be scheduled independently, e.g. suggestions
+                hourly and decay nightly.
+        """
+        selected = list(PHASES if phases is None else phases)
+        unknown = set(selected) - set(PHASES)
+        if unknown:
+            raise ValueError(f"Unknown dreamer phases: {sorted(unknown)}")
+
         t0 = time.perf_counter()
         now = datetime.now(timezone.utc)
         report = DreamCycleReport(timestamp=now)
 
         logger.info("Dreamer waking up...")
 
-        # Phase 1: Consolidate unconsolidated facts
-        try:
-            consolidated = await self._consolidate(now)
-            report.facts_consolidated = consolidated
-        except Exception as e:
-            report.errors.append(f"consolidation: {e}")
-            logger.warning("Consolidation failed: %s", e)
-
-        # Phase 2: Apply significance decay
-        try:
-            decayed = self._apply_decay(now)
-            report.memories_decayed = decayed
-        except Exception as e:
-            report.errors.append(f"decay: {e}")
-            logger.warning("Decay failed: %s", e)
-
-        # Phase 3: Archive old low-significance memories
-        try:
-            archived = self._archive_stale(now)
-            report.memories_archived = archived
-        except Exception as e:
-            report.errors.append(f"archive: {e}")
-            logger.warning("Archive failed: %s", e)
-
-        # Phase 4: Enrich — find connections between memories
-        try:
-            connections = await self._enrich(now)
-            report.connections_found = connections
-        except Exception as e:
-            report.errors.append(f"enrichment: {e}")
-            logger.warning("Enrichment failed: %s", e)
-
-        # Phase 5: Generate proactive suggestions
-        try:
-            suggestions = self._generate_suggestions(now)
-            report.suggestions = suggestions
-        except Exception as e:
-            report.errors.append(f"suggestions: {e}")
-            logger.warning("Suggestion generation failed: %s", e)
+        runners = {
+            "consolidation": self._consolidate,
+            "decay": self._apply_decay,
+            "archive": self._archive_stale,
+            "enrichment": self._enrich,
+            "suggestions": self._generate_suggestions,
+        }
+        results = await asyncio.gather(*(
+            self._run_phase(name, runners[name], now, report) for name in selected
+        ))
+        outcome = dict(zip(selected, results))
+
+        report.facts_consolidated = outcome.get("consolidation") or 0
+        report.memories_decayed = outcome.get("decay") or 0
+        report.memories_archived = outcome.get("archive") or 0
+        report.connections_found = outcome.get("enrichment") or 0
+        report.suggestions = outcome.get("suggestions") or []
 
         report.duration_seconds = round(time.perf_counter() - t0, 2)
         logger.info("Dreamer cycle complete: %s", report.summary())
 
         return report
 
-    async def _consolidate(self, now: datetime) -> int:
-        """Run Stage 2 consolidation on unconsolidated facts."""
-        if not self._consolidate_fn or not self._memory_store or not self._llm_call:
-            return 0
+    def _checkpoint_key(self, phase: str) -> str:
+        return f"{self._org_id or 'default'}:{phase}"
 
-        memories = self._memory_store(
-            "unconsolidated", self._config.consolidation_batch_size
+    async def _run_phase(
+        self,
+        name: str,
+        fn: Callable[[datetime, _PhaseRun], Awaitable[Any]],
+        now: datetime,
+        report: DreamCycleReport,
+    ) -> Any:
+        """Run one phase, recording its :class:`PhaseReport` and checkpoint."""
+        key = self._checkpoint_key(name)
+        cursor = self._checkpoints.load(key) if self._checkpoints is not None else None
+        run = _PhaseRun(name, self._config.budget_for(name), cursor)
+        report.phases[name] = run.report
+        t0 = time.perf_counter()
+        result = None
+        try:
+            result = await fn(now, run)
+        except Exception as e:
+            run.report.completed = False
+            run.report.error = str(e)
+            report.errors.append(f"{name}: {e}")
+            logger.warning("Dreamer phase %s failed: %s", name, e)
+        if self._checkpoints is not None and run.report.error is None:
+            self._checkpoints.save(key, None if run.report.completed else run.cursor)
+        run.report.duration_seconds = round(time.perf_counter() - t0, 2)
+        return result
+
+    async def _pages(
+        self, run: _PhaseRun, query: str, limit: int,
+    ) -> AsyncIterator[list[dict]]:
+        """Yield pages of *query*, advancing and checkpointing ``run.cursor``.
+
+        Stops early (``completed = False``) when the phase budget runs
+        out; the cursor then points after the last fully processed page.
+        """
+        if self._memory_pages is None:
+            page = await _maybe_await(self._memory_store(query, limit))
+            if page:
+                run.report.pages += 1
+                yield page
+            return
+
+        while True:
+            if run.out_of_time():
+                run.report.completed = False
+                return
+            page = await _maybe_await(self._memory_pages(query, run.cursor, limit))
+            if not page:
+                return
+            run.report.pages += 1
+            yield page
+            run.cursor = str(page[-1]["id"])
+            if self._checkpoints is not None:
+                self._checkpoints.save(self._checkpoint_key(run.report.name), run.cursor)
+            if len(page) < limit:
+                return
+
+    async def _consolidate(self, now: datetime, run: _PhaseRun) -> int:
+        """Run Stage 2 consolidation on unconsolidated facts, page by page."""
+        incremental = (
+            self._insight_source is not None and self._embedding_provider is not None
         )
-
-        if not memories:
+        if not (self._memory_store or self._memory_pages) or not self._llm_call:
+            return 0
+        if not self._consolidate_fn and not incremental:
             return 0
 
+        consolidated = 0
+        async for memories in self._pages(
+            run, "unconsolidated", self._config.consolidation_batch_size
+        ):
+            consolidated += await self._consolidate_page(memories, now, incremental)
+            run.report.processed += len(memories)
+        return consolidated
+
+    async def _consolidate_page(
+        self, memories: list[dict], now: datetime, incremental: bool,
+    ) -> int:
         from kintsugi.memory.cma_stage1 import AtomicFact
         facts = []
         for mem in memories:
@@ -196,87 +478,189 @@ class Dreamer:
         if not facts:
             return 0
 
-        insights = await self._consolidate_fn(facts, self._llm_call)
+        if self._embedding_provider is not None:
+            facts = await self._embed_facts(memories, facts)
+
+        if incremental:
+            from kintsugi.memory.cma_stage2 import consolidate_incremental
+
+            result = await consolidate_incremental(
+                facts,
+                await _maybe_await(self._insight_source()),
+                llm_call=self._llm_call,
+                scheduler=self._synthesis,
+                org_id=self._org_id,
+            )
+            if self._insight_sink is not None:
+                await _maybe_await(self._insight_sink(result))
+            return len(result.updated) + len(result.created)
+
+        if self._synthesis is None:
+            insights = await self._consolidate_fn(facts, self._llm_call)
+        else:
+            insights = await self._consolidate_fn(
+                facts, self._llm_call, scheduler=self._synthesis, org_id=self._org_id,
+            )
         return len(insights)
 
-    def _apply_decay(self, now: datetime) -> int:
-        """Reduce significance of memories not accessed recently."""
-        if not self._memory_store or not self._update_memory:
+    async def _embed_facts(self, memories: list[dict], facts: list) -> list:
+        """Turn atomic facts into Stage 2 facts with embeddings attached.
+
+        Stored embeddings are reused; the rest go to the provider in a
+        single ``embed_batch`` call, where the cache absorbs repeats.
+        """
+        import numpy as np
+
+        from kintsugi.memory.cma_stage2 import Fact
+
+        missing = [
+            i for i, mem in enumerate(memories) if mem.get("embedding") is None
+        ]
+        fresh = await self._embedding_provider.embed_batch(
+            [facts[i].content for i in missing]
+        ) if missing else []
+        vectors: dict[int, Any] = dict(zip(missing, fresh))
+
+        out = []
+        for i, (mem, fact) in enumerate(zip(memories, facts)):
+            vec = vectors.get(i)
+            if vec is None:
+                vec = np.asarray(mem["embedding"], dtype=np.float32)
+            out.append(Fact(
+                id=str(mem.get("id") or fact.kintsugi_ref or i),
+                content=fact.content,
+                embedding=vec,
+                timestamp=fact.timestamp,
+                significance=mem.get("significance", 5),
+                tags=mem.get("tags", []),
+            ))
+        return out
+
+    async def _apply_decay(self, now: datetime, run: _PhaseRun) -> int:
+        """Reduce significance of memories not accessed recently.
+
+        With ``bulk_maintenance`` this is one set-based UPDATE per batch;
+        otherwise each page is decayed in one NumPy pass and written with a
+        single ``update_memories`` call (``update_memory`` per row if only
+        that is given).
+        """
+        if self._bulk is not None:
+            return await self._bulk.decay(now, self._config.decay_half_life_days)
+        if not (self._memory_store or self._memory_pages):
+            return 0
+        if not (self._update_memories or self._update_memory):
             return 0
 
-        memories = self._memory_store("all_active", 100)
-        half_life = timedelta(days=self._config.decay_half_life_days)
-        decayed = 0
+        from kintsugi.memory.significance import decay_significance
 
-        for mem in memories:
-            last_accessed = mem.get("last_accessed")
-            if last_accessed is None:
-                continue
-
-            if isinstance(last_accessed, str):
-                last_accessed = datetime.fromisoformat(last_accessed)
-
-            age = now - last_accessed
-            if age > half_life:
-                current_sig = mem.get("significance", 5)
-                if current_sig > 1:
-                    periods = age / half_life
-                    new_sig = max(1, int(current_sig * (0.5 ** periods)))
-                    if new_sig < current_sig:
-                        self._update_memory(mem["id"], {"significance": new_sig})
-                        decayed += 1
+        decayed = 0
+        async for memories in self._pages(run, "all_active", self._config.page_size):
+            sig = np.fromiter(
+                (m.get("significance", 5) for m in memories), np.int64, len(memories)
+            )
+            idle = np.fromiter(
+                (_days_since(now, m.get("last_accessed")) for m in memories),
+                np.float64,
+                len(memories),
+            )
+            new_sig = decay_significance(sig, idle, self._config.decay_half_life_days)
+            changed = np.flatnonzero(new_sig < sig)
+            updates = {
+                memories[i]["id"]: {"significance": int(new_sig[i])} for i in changed
+            }
+            await self._write_updates(updates)
+            decayed += len(updates)
+            run.report.processed += len(memories)
 
         return decayed
 
-    def _archive_stale(self, now: datetime) -> int:
+    async def _write_updates(self, updates: dict[Any, dict]) -> None:
+        if not updates:
+            return
+        if self._update_memories is not None:
+            await _maybe_await(self._update_memories(updates))
+            return
+        for memory_id, values in updates.items():
+            await _maybe_await(self._update_memory(memory_id, values))
+
+    async def _archive_stale(self, now: datetime, run: _PhaseRun) -> int:
         """Move old, low-significance memories to cold storage."""
-        if not self._memory_store or not self._archive_memory:
+        if self._bulk is not None:
+            return await self._bulk.archive_stale(
+                now,
+                self._config.archive_after_days,
+                self._config.archive_below_significance,
+            )
+        if not (self._memory_store or self._memory_pages):
+            return 0
+        if not (self._archive_memories or self._archive_memory):
             return 0
 
-        memories = self._memory_store("all_active", 200)
-        cutoff = now - timedelta(days=self._config.archive_after_days)
+        cutoff = (now - timedelta(days=self._config.archive_after_days)).timestamp()
         archived = 0
 
-        for mem in memories:
-            created = mem.get("created_at")
-            if isinstance(created, str):
-                created = datetime.fromisoformat(created)
-            if created is None:
-                continue
-
-            sig = mem.get("significance", 5)
-            if created < cutoff and sig <= self._config.archive_below_significance:
-                self._archive_memory(mem["id"])
-                archived += 1
+        async for memories in self._pages(run, "all_active", self._config.page_size):
+            created = np.fromiter(
+                (_epoch(m.get("created_at")) for m in memories), np.float64, len(memories)
+            )
+            sig = np.fromiter(
+                (m.get("significance", 5) for m in memories), np.int64, len(memories)
+            )
+            with np.errstate(invalid="ignore"):
+                stale = (created < cutoff) & (sig <= self._config.archive_below_significance)
+            ids = [memories[i]["id"] for i in np.flatnonzero(stale)]
+            if ids:
+                if self._archive_memories is not None:
+                    await _maybe_await(self._archive_memories(ids))
+                else:
+                    for memory_id in ids:
+                        await _maybe_await(self._archive_memory(memory_id))
+            archived += len(ids)
+            run.report.processed += len(memories)
 
         return archived
 
-    async def _enrich(self, now: datetime) -> int:
-        """Find connections between recent memories across domains."""
-        if not self._memory_store or not self._llm_call:
+    async def _enrich(self, now: datetime, run: _PhaseRun) -> int:
+        """Find connections between recent memories across domains.
+
+        Uses :class:`EnrichmentEngine` (tag inverted index plus blocked
+        embedding similarity); discovered links go to ``link_sink``.
+        """
+        if not self._memory_store:
             return 0
 
-        recent = self._memory_store("recent", self._config.enrichment_batch_size)
+        recent = await _maybe_await(
+            self._memory_store("recent", self._config.enrichment_batch_size)
+        )
+        run.report.processed = len(recent)
         if len(recent) < 2:
             return 0
 
-        connections = 0
-        for i, mem_a in enumerate(recent):
-            for mem_b in recent[i+1:]:
-                tags_a = set(mem_a.get("tags", []))
-                tags_b = set(mem_b.get("tags", []))
-                overlap = tags_a & tags_b
-                if len(overlap) >= 2 and mem_a.get("domain") != mem_b.get("domain"):
-                    connections += 1
-
-        return connections
-
-    def _generate_suggestions(self, now: datetime) -> list[Suggestion]:
+        if self._embedding_provider is not None:
+            missing = [
+                i for i, m in enumerate(recent)
+                if m.get("embedding") is None and m.get("content")
+            ]
+            if missing:
+                vectors = await self._embedding_provider.embed_batch(
+                    [recent[i]["content"] for i in missing]
+                )
+                recent = list(recent)
+                for i, vec in zip(missing, vectors):
+                    recent[i] = {**recent[i], "embedding": vec}
+
+        links = self._enrichment.find_links(recent)
+        if links and self._link_sink is not None:
+            await _maybe_await(self._link_sink(links))
+        return len(links)
+
+    async def _generate_suggestions(self, now: datetime, run: _PhaseRun) -> list[Suggestion]:
         """Generate proactive suggestions from activity patterns."""
         if not self._activity_source:
             return []
 
-        activities = self._activity_source(self._advisor.lookback_days)
+        activities = await _maybe_await(self._activity_source(self._advisor.lookback_days))
+        run.report.processed = len(activities)
         return self._advisor.scan(activities)
 
     def morning_briefing(self, report: DreamCycleReport) -> str:
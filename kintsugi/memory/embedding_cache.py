@@ -0,0 +1,353 @@
+"""Shared embedding providers and a content-addressed embedding cache.
+
+Loading a sentence-transformers model costs seconds and hundreds of MB, so
+providers are owned by a process-wide :class:`ProviderRegistry` instead of
+being built per request. Embeddings themselves are cached by
+``(model, sha256(normalized text))``:
+
+- an in-memory LRU tier with optional TTL expiry, and
+- an optional on-disk tier (one ``.npy`` file per entry) that survives
+  restarts and is shared between workers on the same host.
+
+:class:`CachedEmbeddingProvider` wraps any :class:`EmbeddingProvider` and is
+a drop-in replacement for it, so Stage 1, the Dreamer and the memory routes
+all benefit without changing their call sites. Hit/miss counters are kept
+on :class:`EmbeddingCacheStats`.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import re
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+from numpy.typing import NDArray
+
+from kintsugi.memory.embeddings import EmbeddingProvider, get_embedding_provider
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES: int = 10_000
+DEFAULT_TTL_SECONDS: float | None = None
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+# ---------------------------------------------------------------------------
+# Keys
+# ---------------------------------------------------------------------------
+
+
+def normalize_text(text: str) -> str:
+    """Canonical form used for cache keys.
+
+    Unicode is NFC-normalized and runs of whitespace collapse to a single
+    space. Case is preserved: embedding models are case-sensitive.
+    """
+    return _WHITESPACE_RE.sub(" ", unicodedata.normalize("NFC", text)).strip()
+
+
+def cache_key(model: str, text: str) -> tuple[str, str]:
+    """Return the ``(model, sha256-hex)`` key for *text* under *model*."""
+    digest = hashlib.sha256(normalize_text(text).encode("utf-8")).hexdigest()
+    return model, digest
+
+
+# ---------------------------------------------------------------------------
+# Cache
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class EmbeddingCacheStats:
+    """Counters for an :class:`EmbeddingCache`."""
+
+    hits: int = 0
+    misses: int = 0
+    disk_hits: int = 0
+    evictions: int = 0
+    expirations: int = 0
+
+    @property
+    def lookups(self) -> int:
+        return self.hits + self.misses
+
+    @property
+    def hit_rate(self) -> float:
+        return self.hits / self.lookups if self.lookups else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        data = asdict(self)
+        data["lookups"] = self.lookups
+        data["hit_rate"] = round(self.hit_rate, 4)
+        return data
+
+
+class EmbeddingCache:
+    """LRU/TTL embedding cache with an optional on-disk tier.
+
+    Args:
+        max_entries: Maximum number of vectors kept in memory. The least
+            recently used entry is evicted first.
+        ttl_seconds: Entries older than this are treated as misses.
+            ``None`` disables expiry.
+        disk_dir: Directory for the persistent tier. ``None`` disables it.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        ttl_seconds: float | None = DEFAULT_TTL_SECONDS,
+        disk_dir: str | Path | None = None,
+    ) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be >= 1")
+        self._max_entries = max_entries
+        self._ttl = ttl_seconds
+        self._disk_dir = Path(disk_dir) if disk_dir else None
+        self._entries: OrderedDict[tuple[str, str], tuple[float, NDArray[np.float32]]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+        self.stats = EmbeddingCacheStats()
+        if self._disk_dir is not None:
+            self._disk_dir.mkdir(parents=True, exist_ok=True)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    # -- disk tier ----------------------------------------------------------
+
+    def _disk_path(self, key: tuple[str, str]) -> Path:
+        assert self._disk_dir is not None
+        model, digest = key
+        safe_model = re.sub(r"[^A-Za-z0-9_.-]", "_", model)
+        return self._disk_dir / safe_model / digest[:2] / f"{digest}.npy"
+
+    def _disk_get(self, key: tuple[str, str]) -> NDArray[np.float32] | None:
+        if self._disk_dir is None:
+            return None
+        path = self._disk_path(key)
+        try:
+            if self._ttl is not None and time.time() - path.stat().st_mtime > self._ttl:
+                return None
+            return np.load(path, allow_pickle=False).astype(np.float32, copy=False)
+        except (OSError, ValueError):
+            return None
+
+    def _disk_put(self, key: tuple[str, str], vec: NDArray[np.float32]) -> None:
+        if self._disk_dir is None:
+            return
+        path = self._disk_path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(".tmp")
+            with open(tmp, "wb") as fh:
+                np.save(fh, vec, allow_pickle=False)
+            tmp.replace(path)
+        except OSError as exc:
+            logger.warning("Embedding cache disk write failed: %s", exc)
+
+    # -- public API ---------------------------------------------------------
+
+    def get(self, model: str, text: str) -> NDArray[np.float32] | None:
+        """Return the cached vector for *text*, or ``None`` on a miss."""
+        key = cache_key(model, text)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                stored_at, vec = entry
+                if self._ttl is None or now - stored_at <= self._ttl:
+                    self._entries.move_to_end(key)
+                    self.stats.hits += 1
+                    return vec
+                del self._entries[key]
+                self.stats.expirations += 1
+
+        vec = self._disk_get(key)
+        with self._lock:
+            if vec is None:
+                self.stats.misses += 1
+                return None
+            self.stats.hits += 1
+            self.stats.disk_hits += 1
+            self._insert(key, vec, now)
+        return vec
+
+    def put(self, model: str, text: str, vec: NDArray[np.float32]) -> None:
+        """Store *vec* as the embedding of *text* under *model*."""
+        key = cache_key(model, text)
+        vec = np.asarray(vec, dtype=np.float32)
+        with self._lock:
+            self._insert(key, vec, time.monotonic())
+        self._disk_put(key, vec)
+
+    def _insert(self, key: tuple[str, str], vec: NDArray[np.float32], now: float) -> None:
+        self._entries[key] = (now, vec)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+            self.stats.evictions += 1
+
+    def clear(self) -> None:
+        """Drop the in-memory tier and reset counters (disk tier is kept)."""
+        with self._lock:
+            self._entries.clear()
+            self.stats = EmbeddingCacheStats()
+
+
+# ---------------------------------------------------------------------------
+# Caching provider
+# ---------------------------------------------------------------------------
+
+
+class CachedEmbeddingProvider(EmbeddingProvider):
+    """An :class:`EmbeddingProvider` that consults an :class:`EmbeddingCache`.
+
+    ``embed_batch`` deduplicates the batch and sends only the missing texts
+    to the wrapped provider, in a single call.
+    """
+
+    def __init__(self, provider: EmbeddingProvider, cache: EmbeddingCache) -> None:
+        self._provider = provider
+        self._cache = cache
+
+    @property
+    def dimension(self) -> int:
+        return self._provider.dimension
+
+    @property
+    def model_id(self) -> str:
+        return self._provider.model_id
+
+    @property
+    def provider(self) -> EmbeddingProvider:
+        return self._provider
+
+    @property
+    def cache(self) -> EmbeddingCache:
+        return self._cache
+
+    async def embed(self, text: str) -> NDArray[np.float32]:
+        cached = self._cache.get(self.model_id, text)
+        if cached is not None:
+            return cached
+        vec = await self._provider.embed(text)
+        self._cache.put(self.model_id, text, vec)
+        return vec
+
+    async def embed_batch(self, texts: list[str]) -> list[NDArray[np.float32]]:
+        results: list[NDArray[np.float32] | None] = [None] * len(texts)
+        pending: dict[str, list[int]] = {}
+        for i, text in enumerate(texts):
+            key = normalize_text(text)
+            if key in pending:
+                pending[key].append(i)
+                continue
+            cached = self._cache.get(self.model_id, text)
+            if cached is not None:
+                results[i] = cached
+            else:
+                pending[key] = [i]
+
+        if pending:
+            miss_texts = [texts[idxs[0]] for idxs in pending.values()]
+            vecs = await self._provider.embed_batch(miss_texts)
+            for text, idxs, vec in zip(miss_texts, pending.values(), vecs):
+                self._cache.put(self.model_id, text, vec)
+                for i in idxs:
+                    results[i] = vec
+
+        return results  # type: ignore[return-value]
+
+
+# ---------------------------------------------------------------------------
+# Process-wide registry
+# ---------------------------------------------------------------------------
+
+
+class ProviderRegistry:
+    """Process-wide pool of embedding providers sharing one cache.
+
+    Providers are created on first request for a given ``(mode, model)``
+    and reused afterwards, so model weights load once per process. The
+    FastAPI lifespan calls :meth:`close` on shutdown.
+    """
+
+    def __init__(self, cache: EmbeddingCache | None = None) -> None:
+        self._cache = cache or EmbeddingCache()
+        self._providers: dict[tuple[str, str], CachedEmbeddingProvider] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def cache(self) -> EmbeddingCache:
+        return self._cache
+
+    def get(self, mode: str = "local", **kwargs: Any) -> CachedEmbeddingProvider:
+        """Return the shared provider for *mode*, creating it on first use.
+
+        ``kwargs`` are forwarded to :func:`get_embedding_provider` when the
+        provider is first built; ``api_key`` is not part of the pool key.
+        """
+        model = str(kwargs.get("model_name") or kwargs.get("model") or "")
+        key = (mode, model)
+        with self._lock:
+            provider = self._providers.get(key)
+            if provider is None:
+                inner = get_embedding_provider(mode=mode, **kwargs)
+                provider = CachedEmbeddingProvider(inner, self._cache)
+                self._providers[key] = provider
+                logger.info("Registered shared %s embedding provider %s", mode, inner.model_id)
+            return provider
+
+    def stats(self) -> dict[str, Any]:
+        """Cache counters plus the list of pooled providers."""
+        return {
+            "providers": sorted(p.model_id for p in self._providers.values()),
+            "cache_entries": len(self._cache),
+            **self._cache.stats.to_dict(),
+        }
+
+    def close(self) -> None:
+        """Release pooled providers and the in-memory cache tier."""
+        with self._lock:
+            self._providers.clear()
+        self._cache.clear()
+
+
+_registry: ProviderRegistry | None = None
+
+
+def get_provider_registry() -> ProviderRegistry:
+    """Return the process-wide :class:`ProviderRegistry`.
+
+    The cache is configured from ``EMBEDDING_CACHE_*`` settings on first use.
+    """
+    global _registry
+    if _registry is None:
+        from kintsugi.config.settings import settings
+
+        cache = EmbeddingCache(
+            max_entries=settings.EMBEDDING_CACHE_MAX_ENTRIES,
+            ttl_seconds=settings.EMBEDDING_CACHE_TTL_SECONDS or None,
+            disk_dir=settings.EMBEDDING_CACHE_DIR or None,
+        )
+        _registry = ProviderRegistry(cache)
+    return _registry
+
+
+def reset_provider_registry() -> None:
+    """Close and discard the process-wide registry (used on shutdown/tests)."""
+    global _registry
+    if _registry is not None:
+        _registry.close()
+    _registry = None
@@ -28,6 +28,11 @@ class EmbeddingProvider(ABC):
     def dimension(self) -> int:
         """Dimensionality of the output embedding vectors."""
 
+    @property
+    def model_id(self) -> str:
+        """Identifier of the underlying model, used to key embedding caches."""
+        return type(self).__name__
+
     @abstractmethod
     async def embed(self, text: str) -> NDArray[np.float32]:
         """Embed a single text string and return a 1-D float32 array."""
@@ -62,6 +67,10 @@ class LocalEmbeddingProvider(EmbeddingProvider):
     def dimension(self) -> int:
         return _LOCAL_DIM
 
+    @property
+    def model_id(self) -> str:
+        return self._model_name
+
     # -- lazy loading -------------------------------------------------------
 
     def _load_model(self) -> Any:
@@ -144,6 +153,10 @@ class APIEmbeddingProvider(EmbeddingProvider):
     def dimension(self) -> int:
         return _API_DIM
 
+    @property
+    def model_id(self) -> str:
+        return self._model
+
     async def _request(self, texts: list[str]) -> list[NDArray[np.float32]]:
         import httpx
 
@@ -0,0 +1,291 @@
+"""Cross-domain enrichment: link related memories from different domains.
+
+The Dreamer's enrichment phase used to compare every pair of recent
+memories by their tag sets.  :class:`EnrichmentEngine` finds the same
+kind of link without the all-pairs loop:
+
+- **tags**: an inverted index (tag -> memories) produces candidate
+  pairs only among memories that share a tag; tags carried by more than
+  ``max_posting`` memories are too common to be informative and skipped.
+- **embedding**: unit-normalised embeddings are compared block by block
+  with one matrix product per block, keeping each memory's ``top_k``
+  nearest cross-domain neighbours above ``similarity_threshold``.
+
+Links are undirected and stored once, with ``source_id < target_id``,
+in ``memory_links`` so that retrieval can follow them
+(:func:`linked_memories`).
+"""
+
+from __future__ import annotations
+
+import logging
+from collections import defaultdict
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from itertools import combinations
+from typing import Any, Optional
+
+import numpy as np
+from sqlalchemy import func, or_, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+logger = logging.getLogger(__name__)
+
+TAGS = "tags"
+EMBEDDING = "embedding"
+BOTH = "tags+embedding"
+
+
+@dataclass
+class MemoryLink:
+    """An undirected link between two memories (``source_id < target_id``)."""
+
+    source_id: str
+    target_id: str
+    kind: str
+    score: float
+    shared_tags: list[str] = field(default_factory=list)
+
+
+def _pair(a: Any, b: Any) -> tuple[str, str]:
+    a, b = str(a), str(b)
+    return (a, b) if a < b else (b, a)
+
+
+def find_tag_links(
+    ids: Sequence[Any],
+    tags: Sequence[Sequence[str]],
+    domains: Sequence[Any],
+    *,
+    min_shared: int = 2,
+    max_posting: int = 200,
+) -> list[MemoryLink]:
+    """Links between cross-domain memories sharing at least *min_shared* tags.
+
+    Score is the Jaccard overlap of the two tag sets.
+    """
+    tag_sets = [set(t or ()) for t in tags]
+    postings: dict[str, list[int]] = defaultdict(list)
+    for i, ts in enumerate(tag_sets):
+        for tag in ts:
+            postings[tag].append(i)
+
+    shared: dict[tuple[int, int], list[str]] = defaultdict(list)
+    for tag, members in postings.items():
+        if len(members) < 2 or len(members) > max_posting:
+            continue
+        for a, b in combinations(members, 2):
+            if domains[a] != domains[b]:
+                shared[(a, b)].append(tag)
+
+    links = []
+    for (a, b), common in shared.items():
+        if len(common) < min_shared:
+            continue
+        source, target = _pair(ids[a], ids[b])
+        union = len(tag_sets[a] | tag_sets[b])
+        links.append(MemoryLink(
+            source_id=source,
+            target_id=target,
+            kind=TAGS,
+            score=len(common) / union,
+            shared_tags=sorted(common),
+        ))
+    return links
+
+
+def find_embedding_links(
+    ids: Sequence[Any],
+    vectors: np.ndarray,
+    domains: Sequence[Any],
+    *,
+    threshold: float = 0.8,
+    top_k: int = 5,
+    block_size: int = 1024,
+) -> list[MemoryLink]:
+    """Each memory's *top_k* most similar cross-domain memories above *threshold*.
+
+    Cosine similarity is computed one ``block_size x n`` matrix product at
+    a time, so memory stays bounded by the block rather than ``n x n``.
+    """
+    n = len(ids)
+    if n < 2:
+        return []
+    x = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(x, axis=1, keepdims=True)
+    x = x / np.where(norms == 0, 1.0, norms)
+
+    _, domain_codes = np.unique(np.asarray([str(d) for d in domains]), return_inverse=True)
+    k = min(top_k, n - 1)
+
+    best: dict[tuple[str, str], float] = {}
+    for start in range(0, n, block_size):
+        stop = min(start + block_size, n)
+        sims = x[start:stop] @ x.T
+        rows = np.arange(stop - start)
+        sims[rows, start + rows] = -np.inf
+        sims[domain_codes[start:stop, None] == domain_codes[None, :]] = -np.inf
+
+        idx = np.argpartition(-sims, k - 1, axis=1)[:, :k]
+        top = np.take_along_axis(sims, idx, axis=1)
+        for r, c in zip(*np.nonzero(top >= threshold)):
+            pair = _pair(ids[start + r], ids[idx[r, c]])
+            score = float(top[r, c])
+            if score > best.get(pair, -1.0):
+                best[pair] = score
+
+    return [
+        MemoryLink(source_id=a, target_id=b, kind=EMBEDDING, score=score)
+        for (a, b), score in best.items()
+    ]
+
+
+class EnrichmentEngine:
+    """Finds cross-domain links among a batch of memory dicts.
+
+    Each memory needs an ``id`` and may carry ``tags``, ``domain`` and
+    ``embedding``; memories without an embedding only take part in tag
+    matching.
+
+    Args:
+        min_shared_tags: Shared tags needed for a tag link.
+        similarity_threshold: Minimum cosine similarity for an embedding link.
+        top_k: Embedding neighbours considered per memory.
+        block_size: Rows per similarity block.
+        max_posting: Tags on more memories than this are ignored.
+    """
+
+    def __init__(
+        self,
+        min_shared_tags: int = 2,
+        similarity_threshold: float = 0.8,
+        top_k: int = 5,
+        block_size: int = 1024,
+        max_posting: int = 200,
+    ) -> None:
+        self.min_shared_tags = min_shared_tags
+        self.similarity_threshold = similarity_threshold
+        self.top_k = top_k
+        self.block_size = block_size
+        self.max_posting = max_posting
+
+    def find_links(self, memories: Sequence[dict]) -> list[MemoryLink]:
+        """Tag and embedding links, merged so each pair appears once."""
+        ids = [m["id"] for m in memories]
+        domains = [m.get("domain") for m in memories]
+        links: dict[tuple[str, str], MemoryLink] = {}
+
+        for link in find_tag_links(
+            ids,
+            [m.get("tags", []) for m in memories],
+            domains,
+            min_shared=self.min_shared_tags,
+            max_posting=self.max_posting,
+        ):
+            links[(link.source_id, link.target_id)] = link
+
+        embedded = [i for i, m in enumerate(memories) if m.get("embedding") is not None]
+        if len(embedded) >= 2:
+            for link in find_embedding_links(
+                [ids[i] for i in embedded],
+                np.stack([np.asarray(memories[i]["embedding"], dtype=np.float32)
+                          for i in embedded]),
+                [domains[i] for i in embedded],
+                threshold=self.similarity_threshold,
+                top_k=self.top_k,
+                block_size=self.block_size,
+            ):
+                key = (link.source_id, link.target_id)
+                existing = links.get(key)
+                if existing is None:
+                    links[key] = link
+                else:
+                    existing.kind = BOTH
+                    existing.score = max(existing.score, link.score)
+
+        return list(links.values())
+
+
+# ---------------------------------------------------------------------------
+# Persistence
+# ---------------------------------------------------------------------------
+
+
+async def save_links(
+    session: AsyncSession,
+    org_id: str,
+    links: Sequence[MemoryLink],
+) -> int:
+    """Upsert *links* into ``memory_links`` in one statement (no commit).
+
+    A re-discovered link keeps the higher of its old and new score.
+    """
+    if not links:
+        return 0
+
+    from kintsugi.models.base import MemoryLink as MemoryLinkRow
+
+    stmt = insert(MemoryLinkRow).values([
+        {
+            "source_id": link.source_id,
+            "target_id": link.target_id,
+            "org_id": org_id,
+            "kind": link.kind,
+            "score": link.score,
+            "shared_tags": link.shared_tags or None,
+        }
+        for link in links
+    ])
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[MemoryLinkRow.source_id, MemoryLinkRow.target_id],
+        set_={
+            "kind": stmt.excluded.kind,
+            "score": func.greatest(MemoryLinkRow.score, stmt.excluded.score),
+            "shared_tags": stmt.excluded.shared_tags,
+            "updated_at": func.now(),
+        },
+    )
+    await session.execute(stmt)
+    return len(links)
+
+
+async def linked_memories(
+    session: AsyncSession,
+    memory_ids: Sequence[str],
+    *,
+    min_score: float = 0.0,
+    limit: Optional[int] = 20,
+) -> list[MemoryLink]:
+    """Links touching any of *memory_ids*, strongest first.
+
+    Both directions are served by an index (the primary key leads with
+    ``source_id``, ``ix_memory_links_target`` covers ``target_id``).
+    """
+    if not memory_ids:
+        return []
+
+    from kintsugi.models.base import MemoryLink as MemoryLinkRow
+
+    ids = list(memory_ids)
+    stmt = (
+        select(MemoryLinkRow)
+        .where(
+            or_(MemoryLinkRow.source_id.in_(ids), MemoryLinkRow.target_id.in_(ids)),
+            MemoryLinkRow.score >= min_score,
+        )
+        .order_by(MemoryLinkRow.score.desc())
+    )
+    if limit is not None:
+        stmt = stmt.limit(limit)
+    rows = (await session.execute(stmt)).scalars().all()
+    return [
+        MemoryLink(
+            source_id=str(r.source_id),
+            target_id=str(r.target_id),
+            kind=r.kind,
+            score=r.score,
+            shared_tags=list(r.shared_tags or []),
+        )
+        for r in rows
+    ]
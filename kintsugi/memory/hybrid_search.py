@@ -0,0 +1,172 @@
+"""Server-side hybrid retrieval for CMA Stage 3.
+
+:func:`hybrid_search` runs the dense, lexical and symbolic views *and* the
+Stage 3 fusion inside Postgres:
+
+- each view yields only ``(id, score, rank)`` candidates;
+- per-view min-max normalisation and the weighted sum (or RRF) are window
+  and aggregate functions over those candidates, with the weights taken
+  from :func:`cma_stage3.estimate_complexity`;
+- ``content`` and metadata are joined in for the final top-k only;
+- ``hnsw.ef_search`` is set transaction-locally from
+  :attr:`QueryProfile.ef_search`, so conceptual queries search wider.
+
+The fused scores match :func:`cma_stage3.fuse_weighted` /
+:func:`cma_stage3.fuse_rrf` applied to the same per-view candidates.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Optional
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from kintsugi.memory.cma_stage3 import QueryProfile, ScoredResult, estimate_complexity
+
+logger = logging.getLogger(__name__)
+
+# method -> (fused score expression, result source label)
+_FUSED_SCORE: dict[str, tuple[str, str]] = {
+    "weighted": ("sum(weight * norm)", "fused"),
+    "rrf": ("sum(1.0 / (:rrf_k + rank))", "rrf"),
+}
+
+_SEARCH_TEMPLATE = """
+    WITH dense AS (
+        SELECT me.memory_id AS id,
+               (1 - (me.embedding <=> CAST(:query_vec AS vector)))::float8 AS score,
+               row_number() OVER (ORDER BY me.embedding <=> CAST(:query_vec AS vector)) AS rank
+        FROM memory_embeddings me
+        JOIN memory_units mu ON mu.id = me.memory_id
+        WHERE mu.org_id = :org_id
+        ORDER BY me.embedding <=> CAST(:query_vec AS vector)
+        LIMIT :candidates
+    ),
+    lexical AS (
+        SELECT ml.memory_id AS id,
+               ts_rank(ml.tsv, q.query)::float8 AS score,
+               row_number() OVER (ORDER BY ts_rank(ml.tsv, q.query) DESC) AS rank
+        FROM memory_lexical ml
+        JOIN memory_units mu ON mu.id = ml.memory_id,
+             plainto_tsquery('english', :query) AS q(query)
+        WHERE mu.org_id = :org_id AND ml.tsv @@ q.query
+        ORDER BY score DESC
+        LIMIT :candidates
+    ),
+    symbolic AS (
+        SELECT mu.id,
+               (10 - mu.significance)::float8 / 10.0 AS score,
+               row_number() OVER (ORDER BY mu.significance ASC, mu.created_at DESC) AS rank
+        FROM memory_units mu
+        WHERE mu.org_id = :org_id
+        ORDER BY mu.significance ASC, mu.created_at DESC
+        LIMIT :candidates
+    ),
+    hits AS (
+        SELECT 'dense' AS view, id, score, rank, CAST(:w_dense AS float8) AS weight FROM dense
+        UNION ALL
+        SELECT 'lexical', id, score, rank, CAST(:w_lexical AS float8) FROM lexical
+        UNION ALL
+        SELECT 'symbolic', id, score, rank, CAST(:w_symbolic AS float8) FROM symbolic
+    ),
+    normed AS (
+        SELECT id, rank, weight,
+               COALESCE(
+                   (score - min(score) OVER v)
+                   / NULLIF(max(score) OVER v - min(score) OVER v, 0),
+                   0
+               ) AS norm
+        FROM hits
+        WINDOW v AS (PARTITION BY view)
+    ),
+    fused AS (
+        SELECT id, {score} AS score
+        FROM normed
+        GROUP BY id
+        ORDER BY score DESC, id
+        LIMIT :limit
+    )
+    SELECT mu.id, mu.content, mu.significance, mu.memory_layer, mu.created_at, f.score
+    FROM fused f
+    JOIN memory_units mu ON mu.id = f.id
+    ORDER BY f.score DESC, mu.id
+"""
+
+_SEARCH_SQL = {
+    method: text(_SEARCH_TEMPLATE.format(score=expr))
+    for method, (expr, _) in _FUSED_SCORE.items()
+}
+
+_SET_EF_SEARCH = text("SELECT set_config('hnsw.ef_search', :ef_search, true)")
+
+
+async def hybrid_search(
+    session: AsyncSession,
+    query: str,
+    query_embedding,
+    org_id: str,
+    *,
+    n_results: int = 10,
+    candidates: Optional[int] = None,
+    method: str = "weighted",
+    rrf_k: int = 60,
+    profile_override: Optional[QueryProfile] = None,
+) -> tuple[list[ScoredResult], QueryProfile]:
+    """Retrieve and fuse the three memory views in a single statement.
+
+    Args:
+        session: Active async database session.
+        query: Raw query text (lexical view and complexity estimation).
+        query_embedding: Query vector, bound natively as a pgvector value.
+        org_id: Organisation scope.
+        n_results: Size of the fused top-k returned.
+        candidates: Per-view candidate depth before fusion
+            (defaults to *n_results*).
+        method: ``"weighted"`` (default) or ``"rrf"``.
+        rrf_k: Smoothing constant for RRF.
+        profile_override: Explicit profile instead of the heuristic.
+
+    Returns:
+        ``(results, profile)`` — fused results in descending score order
+        and the profile whose weights and ``ef_search`` were applied.
+    """
+    if method not in _FUSED_SCORE:
+        raise ValueError(f"Unknown fusion method: {method!r}. Use 'weighted' or 'rrf'.")
+    profile = profile_override if profile_override is not None else estimate_complexity(query)
+
+    # Transaction-local, so pooled connections never keep a stale value.
+    await session.execute(_SET_EF_SEARCH, {"ef_search": str(profile.ef_search)})
+
+    params = {
+        "query_vec": query_embedding,
+        "query": query,
+        "org_id": str(org_id),
+        "limit": n_results,
+        "candidates": candidates or n_results,
+        "w_dense": profile.dense_weight,
+        "w_lexical": profile.lexical_weight,
+        "w_symbolic": profile.symbolic_weight,
+    }
+    if method == "rrf":
+        params["rrf_k"] = rrf_k
+    rows = (await session.execute(_SEARCH_SQL[method], params)).fetchall()
+
+    source = _FUSED_SCORE[method][1]
+    results = [
+        ScoredResult(
+            id=str(row.id),
+            content=row.content,
+            score=float(row.score),
+            source=source,
+            metadata={
+                "significance": row.significance,
+                "memory_layer": row.memory_layer,
+                "created_at": row.created_at.isoformat() if row.created_at else None,
+                "query_profile": profile.complexity,
+            },
+        )
+        for row in rows
+    ]
+    return results, profile
@@ -21,7 +21,8 @@ from __future__ import annotations
 
 import uuid
 from dataclasses import dataclass, field
-from typing import Any, Optional, Sequence
+from itertools import islice
+from typing import Any, Callable, Iterable, Mapping, Optional, Sequence
 
 # psycopg2 typing — used for type hints only, no runtime dependency required
 try:
@@ -142,6 +143,24 @@ def sql_insert_memory() -> str:
     """
 
 
+_INSERT_ROW = "(%s, %s, %s, %s, %s, %s, %s)"
+
+
+def sql_insert_memories(n_rows: int) -> str:
+    """Return a multi-row INSERT for *n_rows* new org memories.
+
+    Parameters are flattened row by row in the same column order as
+    :func:`sql_insert_memory`, so one statement writes a whole batch.
+    """
+    if n_rows < 1:
+        raise ValueError(f"n_rows must be >= 1, got {n_rows}")
+    values = ",\n            ".join([_INSERT_ROW] * n_rows)
+    return f"""
+        INSERT INTO org_memories (id, org_id, content, embedding_768, significance, tags, metadata)
+        VALUES {values}
+    """
+
+
 def sql_hybrid_search(*, has_embedding: bool = True) -> str:
     """Return a hybrid search query combining vector similarity and full-text.
 
@@ -362,6 +381,75 @@ class OrgMemoryStore:
             created_at=row[1],
         )
 
+    def store_many(
+        self,
+        items: Iterable[Mapping[str, Any]],
+        *,
+        embed_batch: Optional[Callable[[list[str]], Sequence[list[float]]]] = None,
+        chunk_size: int = 500,
+        skip: int = 0,
+        on_progress: Optional[Callable[[int, int], None]] = None,
+    ) -> int:
+        """Store many memories with one multi-row INSERT and commit per chunk.
+
+        *items* is consumed lazily, so it may be a generator over an NDJSON
+        file of any size.  Each item accepts the same keys as :meth:`store`
+        (``content``, ``tags``, ``significance``, ``embedding_768``,
+        ``metadata``).
+
+        Args:
+            items: Iterable of memory mappings.
+            embed_batch: Optional callable embedding a list of texts; used
+                for items in a chunk that carry no ``embedding_768``.
+            chunk_size: Items written per statement / transaction.
+            skip: Number of leading items to skip, e.g. the count reported
+                by the last ``on_progress`` call of an interrupted run.
+            on_progress: Called after every commit with
+                ``(items_consumed, memories_stored)``, both counted from
+                the start of *items* / this call respectively.
+
+        Returns:
+            Number of memories stored by this call.
+
+        Raises:
+            ValueError: If an item has no content or significance is
+                outside [1, 10].  Earlier chunks stay committed.
+        """
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be >= 1, got {chunk_size}")
+
+        iterator = iter(items)
+        consumed = sum(1 for _ in islice(iterator, skip))
+        stored = 0
+
+        while True:
+            chunk = list(islice(iterator, chunk_size))
+            if not chunk:
+                break
+
+            rows = [_memory_row(item, self._org_id) for item in chunk]
+            if embed_batch is not None:
+                missing = [i for i, row in enumerate(rows) if row[3] is None]
+                if missing:
+                    vectors = embed_batch([rows[i][2] for i in missing])
+                    for i, vec in zip(missing, vectors):
+                        rows[i][3] = list(vec)
+
+            with self._conn.cursor() as cur:
+                self._set_org_context()
+                cur.execute(
+                    sql_insert_memories(len(rows)),
+                    tuple(value for row in rows for value in row),
+                )
+            self._conn.commit()
+
+            consumed += len(chunk)
+            stored += len(rows)
+            if on_progress is not None:
+                on_progress(consumed, stored)
+
+        return stored
+
     def hybrid_search(
         self,
         query_text: str,
@@ -477,6 +565,25 @@ class OrgMemoryStore:
 # Internal helpers
 # ---------------------------------------------------------------------------
 
+def _memory_row(item: Mapping[str, Any], org_id: str) -> list[Any]:
+    """Validate one bulk item and return its INSERT parameters."""
+    content = item.get("content")
+    if not content:
+        raise ValueError("memory item has no content")
+    significance = item.get("significance", 5)
+    if not 1 <= significance <= 10:
+        raise ValueError(f"significance must be 1-10, got {significance}")
+    return [
+        str(uuid.uuid4()),
+        org_id,
+        content,
+        item.get("embedding_768"),
+        significance,
+        list(item.get("tags") or []),
+        _json_adapter(item.get("metadata") or {}),
+    ]
+
+
 def _json_adapter(obj: dict[str, Any]) -> Any:
     """Wrap a dict for psycopg2 JSONB insertion.
 
@@ -3,18 +3,32 @@
 Maps integer significance scores (1-10) to named memory layers with
 tiered expiration policies. An :class:`ExpiredMemoryReaper` handles
 the periodic archival of expired memories.
+
+Significance decay (halving per ``half_life`` without access) is done in
+bulk: :func:`decay_significance` over NumPy arrays, or
+:class:`BulkSignificanceMaintenance` as one batched ``UPDATE`` per
+batch.
 """
 
 from __future__ import annotations
 
+import asyncio
 import enum
 import logging
-from dataclasses import dataclass
+import time
+from collections import defaultdict
+from collections.abc import Callable
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Any, Optional
 
-from sqlalchemy import select, update
+import numpy as np
+from sqlalchemy import DateTime, Integer, cast, func, literal, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+if TYPE_CHECKING:
+    from kintsugi.memory.cold_archive import ColdArchive
+
 logger = logging.getLogger(__name__)
 
 
@@ -81,80 +95,396 @@ def compute_expiration(significance: int, created_at: datetime) -> datetime | No
     return created_at + timedelta(days=days)
 
 
+# ---------------------------------------------------------------------------
+# Significance decay
+# ---------------------------------------------------------------------------
+
+
+def decay_significance(
+    significance: np.ndarray,
+    idle_days: np.ndarray,
+    half_life_days: float,
+) -> np.ndarray:
+    """Vectorized significance decay.
+
+    Memories idle for longer than *half_life_days* get
+    ``max(1, floor(significance * 0.5 ** (idle / half_life)))``; all
+    others (including ``NaN`` idle times, i.e. never accessed) keep their
+    significance.
+
+    Returns:
+        New integer significance array, same shape as *significance*.
+    """
+    sig = np.asarray(significance, dtype=np.int64)
+    idle = np.asarray(idle_days, dtype=np.float64)
+    with np.errstate(invalid="ignore"):
+        eligible = (idle > half_life_days) & (sig > 1)
+    decayed = np.floor(sig * np.power(0.5, np.where(eligible, idle, 0.0) / half_life_days))
+    return np.where(eligible, np.maximum(1, decayed).astype(np.int64), sig)
+
+
+class BulkSignificanceMaintenance:
+    """Set-based decay and stale-memory archival for one organisation.
+
+    Each batch is a single ``UPDATE ... WHERE id IN (SELECT ... LIMIT n
+    FOR UPDATE SKIP LOCKED) RETURNING id`` committed in a fresh session,
+    so no rows are fetched into Python.
+
+    Args:
+        session_factory: Callable returning an async session context manager.
+        org_id: Organisation whose memories are maintained.
+        batch_size: Rows per statement / transaction.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Any],
+        org_id: str,
+        batch_size: int = 5000,
+    ) -> None:
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be >= 1, got {batch_size}")
+        self._session_factory = session_factory
+        self._org_id = org_id
+        self._batch_size = batch_size
+
+    def decay_stmt(self, now: datetime, half_life_days: float, after_id: Any = None) -> Any:
+        """One decay batch, in id order after *after_id*."""
+        from kintsugi.models.base import MemoryUnit
+
+        half_life = timedelta(days=half_life_days)
+        idle_seconds = func.extract(
+            "epoch", literal(now, DateTime(timezone=True)) - MemoryUnit.last_accessed_at
+        )
+        new_sig = func.greatest(
+            1,
+            func.floor(
+                MemoryUnit.significance
+                * func.power(0.5, idle_seconds / half_life.total_seconds())
+            ),
+        )
+        candidates = select(MemoryUnit.id).where(
+            MemoryUnit.org_id == self._org_id,
+            MemoryUnit.memory_layer != "archived",
+            MemoryUnit.last_accessed_at < now - half_life,
+            MemoryUnit.significance > 1,
+            new_sig < MemoryUnit.significance,
+        )
+        if after_id is not None:
+            candidates = candidates.where(MemoryUnit.id > after_id)
+        candidates = (
+            candidates.order_by(MemoryUnit.id)
+            .limit(self._batch_size)
+            .with_for_update(skip_locked=True)
+        )
+        return (
+            update(MemoryUnit)
+            .where(MemoryUnit.id.in_(candidates))
+            .values(significance=cast(new_sig, Integer), updated_at=now)
+            .returning(MemoryUnit.id)
+            .execution_options(synchronize_session=False)
+        )
+
+    def archive_stmt(
+        self, now: datetime, archive_after_days: float, below_significance: int,
+    ) -> Any:
+        """One batch flagging old, low-significance memories as archived."""
+        from kintsugi.models.base import MemoryUnit
+
+        candidates = (
+            select(MemoryUnit.id)
+            .where(
+                MemoryUnit.org_id == self._org_id,
+                MemoryUnit.memory_layer != "archived",
+                MemoryUnit.created_at < now - timedelta(days=archive_after_days),
+                MemoryUnit.significance <= below_significance,
+            )
+            .limit(self._batch_size)
+            .with_for_update(skip_locked=True)
+        )
+        return (
+            update(MemoryUnit)
+            .where(MemoryUnit.id.in_(candidates))
+            .values(memory_layer="archived", updated_at=now)
+            .returning(MemoryUnit.id)
+            .execution_options(synchronize_session=False)
+        )
+
+    async def _execute_batch(self, stmt: Any) -> list[Any]:
+        async with self._session_factory() as session:
+            ids = (await session.execute(stmt)).scalars().all()
+            await session.commit()
+        return list(ids)
+
+    async def decay(self, now: datetime, half_life_days: float) -> int:
+        """Decay every idle memory of the org; returns rows updated."""
+        total, after_id = 0, None
+        while True:
+            ids = await self._execute_batch(self.decay_stmt(now, half_life_days, after_id))
+            total += len(ids)
+            # A decayed row still matches the predicate, so walk forward by id.
+            if len(ids) < self._batch_size:
+                return total
+            after_id = max(ids)
+
+    async def archive_stale(
+        self, now: datetime, archive_after_days: float, below_significance: int,
+    ) -> int:
+        """Archive every stale low-significance memory; returns rows flagged."""
+        total = 0
+        while True:
+            ids = await self._execute_batch(
+                self.archive_stmt(now, archive_after_days, below_significance)
+            )
+            total += len(ids)
+            if len(ids) < self._batch_size:
+                return total
+
+
 # ---------------------------------------------------------------------------
 # Reaper
 # ---------------------------------------------------------------------------
 
 
+@dataclass
+class ReapBatch:
+    """One reaper batch."""
+
+    org_id: Optional[str]  # None for a cross-org batch
+    reaped: int
+    cold_archived: int
+    seconds: float
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.reaped / self.seconds if self.seconds > 0 else 0.0
+
+
 @dataclass
 class ReapResult:
-    """Summary of a reaper pass."""
+    """Summary of a reaper pass.
+
+    ``checked`` (and ``expired``) count the expired, unarchived rows found
+    when the pass started; ``archived`` counts those it flagged, which is
+    fewer when other workers hold some of them, a batch fails or
+    ``max_batches`` stops the pass early.
+    """
 
     checked: int
     expired: int
     archived: int
     errors: int
+    cold_archived: int = 0
+    batches: list[ReapBatch] = field(default_factory=list)
 
 
 class ExpiredMemoryReaper:
-    """Finds and archives memories that have passed their expiration date."""
+    """Finds and archives memories that have passed their expiration date.
+
+    Work is done in batches of one ``UPDATE ... WHERE id IN (SELECT ...
+    LIMIT n FOR UPDATE SKIP LOCKED) RETURNING ...`` each, so a large
+    backlog never loads ORM objects, and several workers can reap
+    concurrently without blocking.  :meth:`reap_all` commits every batch
+    in its own session, so it never holds long locks either.
+
+    Args:
+        batch_size: Rows flagged per batch / transaction.
+        cold_archive: If given, the content of each reaped memory is
+            written to the cold archive in the same transaction.
+        max_batches: Upper bound on batches per pass (``None`` = drain).
+    """
+
+    def __init__(
+        self,
+        batch_size: int = 1000,
+        cold_archive: Optional[ColdArchive] = None,
+        max_batches: Optional[int] = None,
+    ) -> None:
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be >= 1, got {batch_size}")
+        self._batch_size = batch_size
+        self._cold_archive = cold_archive
+        self._max_batches = max_batches
+
+    @staticmethod
+    def _expired(org_id: Optional[str], now: datetime) -> list[Any]:
+        from kintsugi.models.base import MemoryUnit
+
+        conditions = [MemoryUnit.expires_at <= now, MemoryUnit.memory_layer != "archived"]
+        if org_id is not None:
+            conditions.append(MemoryUnit.org_id == org_id)
+        return conditions
+
+    def _count_stmt(self, org_id: Optional[str], now: datetime) -> Any:
+        from kintsugi.models.base import MemoryUnit
+
+        return select(func.count()).select_from(MemoryUnit).where(*self._expired(org_id, now))
+
+    def _batch_stmt(self, org_id: Optional[str], now: datetime) -> Any:
+        from kintsugi.models.base import MemoryUnit
+
+        candidates = (
+            select(MemoryUnit.id)
+            .where(*self._expired(org_id, now))
+            .order_by(MemoryUnit.expires_at)
+            .limit(self._batch_size)
+            .with_for_update(skip_locked=True)
+        )
+
+        returning = [MemoryUnit.id, MemoryUnit.org_id]
+        if self._cold_archive is not None:
+            returning.append(MemoryUnit.content)
+        return (
+            update(MemoryUnit)
+            .where(MemoryUnit.id.in_(candidates))
+            .values(memory_layer="archived", updated_at=now)
+            .returning(*returning)
+            .execution_options(synchronize_session=False)
+        )
+
+    async def _reap_batch(
+        self,
+        session: AsyncSession,
+        org_id: Optional[str],
+        commit: bool,
+    ) -> ReapBatch:
+        t0 = time.perf_counter()
+        now = datetime.now(timezone.utc)
+        rows = (await session.execute(self._batch_stmt(org_id, now))).all()
+
+        cold = 0
+        if self._cold_archive is not None and rows:
+            by_org: dict[str, list[str]] = defaultdict(list)
+            for row in rows:
+                by_org[str(row.org_id)].append(row.content)
+            for oid, contents in by_org.items():
+                cold += len(await self._cold_archive.archive_contents(oid, contents, session))
+
+        if commit:
+            await session.commit()
+        batch = ReapBatch(
+            org_id=org_id,
+            reaped=len(rows),
+            cold_archived=cold,
+            seconds=time.perf_counter() - t0,
+        )
+        if batch.reaped:
+            logger.info(
+                "Reaper batch org=%s: archived=%d cold=%d in %.3fs (%.0f rows/s)",
+                org_id or "*",
+                batch.reaped,
+                batch.cold_archived,
+                batch.seconds,
+                batch.rows_per_second,
+            )
+        return batch
+
+    async def _run(
+        self,
+        org_id: Optional[str],
+        next_session: Callable[[], Any],
+        commit: bool,
+    ) -> ReapResult:
+        result = ReapResult(checked=0, expired=0, archived=0, errors=0)
+        try:
+            async with next_session() as session:
+                count = self._count_stmt(org_id, datetime.now(timezone.utc))
+                result.checked = result.expired = (await session.execute(count)).scalar_one()
+        except Exception:
+            logger.exception("Error counting expired memories for org=%s", org_id or "*")
+            result.errors += 1
+            return result
+
+        while self._max_batches is None or len(result.batches) < self._max_batches:
+            try:
+                async with next_session() as session:
+                    batch = await self._reap_batch(session, org_id, commit)
+            except Exception:
+                logger.exception("Error archiving expired memories for org=%s", org_id or "*")
+                result.errors += 1
+                break
+            result.batches.append(batch)
+            result.archived += batch.reaped
+            result.cold_archived += batch.cold_archived
+            if batch.reaped < self._batch_size:
+                break
+
+        logger.info(
+            "Reaper org=%s: checked=%d expired=%d archived=%d errors=%d batches=%d",
+            org_id or "*",
+            result.checked,
+            result.expired,
+            result.archived,
+            result.errors,
+            len(result.batches),
+        )
+        return result
 
     async def reap(
         self,
         org_id: str,
         session: AsyncSession,
     ) -> ReapResult:
-        """Scan for expired memories and mark them as archived.
+        """Archive one organisation's expired memories, batch by batch.
 
-        Memories with ``expires_at <= now()`` and ``is_archived = False``
-        are flagged as archived. In a full implementation this would also
-        move content to cold storage; here we set the flag for downstream
-        processing.
+        Memories with ``expires_at <= now()`` that are not yet archived get
+        ``memory_layer = 'archived'``.  Nothing is committed: each batch
+        runs in a savepoint of *session* and becomes durable when the
+        caller commits.  A failed batch is rolled back to its savepoint and
+        ends the pass.
 
         Returns:
-            :class:`ReapResult` with counts.
+            :class:`ReapResult` with counts and per-batch timings.
         """
-        from kintsugi.models.base import MemoryUnit
+        return await self._run(org_id, lambda: _BorrowedSession(session), commit=False)
 
-        now = datetime.now(timezone.utc)
-
-        # Find non-archived, expired memories
-        stmt = select(MemoryUnit).where(
-            MemoryUnit.org_id == org_id,
-            MemoryUnit.expires_at.isnot(None),
-            MemoryUnit.expires_at <= now,
-        )
-        result = await session.execute(stmt)
-        rows = result.scalars().all()
+    async def reap_all(
+        self,
+        session_factory: Callable[[], Any],
+    ) -> ReapResult:
+        """Archive expired memories across all organisations.
 
-        checked = len(rows)
-        archived = 0
-        errors = 0
+        Each batch runs in a fresh session from *session_factory* (e.g.
+        :data:`kintsugi.db.async_session`) and is committed on its own.
+        """
+        return await self._run(None, session_factory, commit=True)
 
-        expired_ids = [r.id for r in rows]
-        if expired_ids:
+    async def run_periodically(
+        self,
+        session_factory: Callable[[], Any],
+        interval_seconds: float,
+        stop: Optional[asyncio.Event] = None,
+    ) -> None:
+        """Run :meth:`reap_all` every *interval_seconds* until *stop* is set."""
+        stop = stop or asyncio.Event()
+        while not stop.is_set():
             try:
-                await session.execute(
-                    update(MemoryUnit)
-                    .where(MemoryUnit.id.in_(expired_ids))
-                    .values(memory_layer="archived")
-                )
-                archived = len(expired_ids)
+                await self.reap_all(session_factory)
             except Exception:
-                logger.exception("Error archiving expired memories for org=%s", org_id)
-                errors = len(expired_ids)
+                logger.exception("Reaper pass failed")
+            try:
+                await asyncio.wait_for(stop.wait(), timeout=interval_seconds)
+            except asyncio.TimeoutError:
+                pass
 
-        logger.info(
-            "Reaper org=%s: checked=%d expired=%d archived=%d errors=%d",
-            org_id,
-            checked,
-            checked,
-            archived,
-            errors,
-        )
-        return ReapResult(
-            checked=checked,
-            expired=checked,
-            archived=archived,
-            errors=errors,
-        )
+
+class _BorrowedSession:
+    """Async context manager lending a caller-owned session to one batch.
+
+    The batch runs in a savepoint, so a failure undoes only the batch and
+    the caller's transaction stays usable; nothing is committed.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+        self._savepoint: Any = None
+
+    async def __aenter__(self) -> AsyncSession:
+        self._savepoint = await self._session.begin_nested()
+        return self._session
+
+    async def __aexit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        if exc_type is not None:
+            await self._savepoint.rollback()
+        else:
+            await self._savepoint.commit()
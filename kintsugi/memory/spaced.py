@@ -3,15 +3,23 @@
 Memories are scheduled for review using Fibonacci-sequence intervals.
 Each successful access bumps the counter, increasing the gap until
 the next review — the classic spaced-repetition curve.
+
+``access_count`` and ``next_review_at`` are persisted on ``memory_units``.
+Accesses update both in one statement (the interval lookup runs in SQL),
+and due memories are a single range scan over the partial index on
+``(org_id, next_review_at)``.
 """
 
 from __future__ import annotations
 
 import logging
+from collections.abc import Sequence
 from dataclasses import dataclass
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, timezone
+from typing import Any
 
-from sqlalchemy import select, update
+from sqlalchemy import func, literal_column, select, update
+from sqlalchemy.dialects.postgresql import array
 from sqlalchemy.ext.asyncio import AsyncSession
 
 logger = logging.getLogger(__name__)
@@ -39,6 +47,17 @@ def fib_interval(access_count: int) -> int:
     return FIBONACCI[idx]
 
 
+def _next_review_expr(access_count: Any, now: datetime) -> Any:
+    """SQL for ``now + fib_interval(access_count + 1)`` days.
+
+    Evaluated against the row's pre-update ``access_count`` so the counter
+    and schedule advance together in one UPDATE.
+    """
+    days = array([literal_column(str(d)) for d in FIBONACCI])
+    idx = func.least(access_count + 1, len(FIBONACCI) - 1) + 1  # 1-based arrays
+    return now + func.make_interval(0, 0, 0, days[idx])
+
+
 # ---------------------------------------------------------------------------
 # Data types
 # ---------------------------------------------------------------------------
@@ -86,46 +105,36 @@ class SpacedRetrieval:
 
         now = datetime.now(timezone.utc)
 
-        # Memories with next_review_at <= now, ordered by most overdue
-        # Exclude archived memories
+        # The memory_layer predicate matches ix_memory_units_review_due.
         stmt = (
-            select(MemoryUnit)
+            select(
+                MemoryUnit.id,
+                MemoryUnit.content,
+                MemoryUnit.significance,
+                MemoryUnit.access_count,
+                MemoryUnit.next_review_at,
+            )
             .where(
                 MemoryUnit.org_id == org_id,
                 MemoryUnit.memory_layer != "archived",
+                MemoryUnit.next_review_at <= now,
                 MemoryUnit.expires_at.is_(None) | (MemoryUnit.expires_at > now),
             )
-            .where(
-                # Due: next_review_at is null (never reviewed) or in the past
-                (MemoryUnit.updated_at.isnot(None))  # exists
-            )
-            .order_by(MemoryUnit.updated_at.asc())
-            .limit(max_count * 3)  # over-fetch to filter in Python
+            .order_by(MemoryUnit.next_review_at.asc())
+            .limit(max_count)
         )
 
         result = await session.execute(stmt)
-        rows = result.scalars().all()
-
-        due: list[DueMemory] = []
-        for row in rows:
-            last = row.updated_at or row.created_at
-            interval_days = fib_interval(getattr(row, "_access_count", 0) if hasattr(row, "_access_count") else 0)
-            next_review = last + timedelta(days=interval_days)
-            if next_review <= now:
-                overdue = (now - next_review).days
-                due.append(
-                    DueMemory(
-                        id=str(row.id),
-                        content=row.content,
-                        significance=row.significance,
-                        access_count=0,
-                        days_overdue=overdue,
-                    )
-                )
-
-        # Sort most overdue first, limit
-        due.sort(key=lambda d: d.days_overdue, reverse=True)
-        return due[:max_count]
+        return [
+            DueMemory(
+                id=str(row.id),
+                content=row.content,
+                significance=row.significance,
+                access_count=row.access_count,
+                days_overdue=(now - row.next_review_at).days,
+            )
+            for row in result.all()
+        ]
 
     async def record_access(
         self,
@@ -134,19 +143,46 @@ class SpacedRetrieval:
     ) -> None:
         """Record that a memory was accessed (retrieved/reviewed).
 
-        Bumps ``updated_at`` to now so the next Fibonacci interval
-        is computed from the current time.
+        Increments ``access_count``, stamps ``last_accessed_at`` and
+        reschedules ``next_review_at`` to ``now + fib_interval(access_count)``
+        in a single UPDATE.
 
         Args:
             memory_id: UUID of the memory unit.
             session: Active async database session.
         """
+        await self.record_access_many([memory_id], session)
+        logger.debug("Recorded access for memory %s", memory_id)
+
+    async def record_access_many(
+        self,
+        memory_ids: Sequence[str],
+        session: AsyncSession,
+    ) -> int:
+        """Record accesses for a whole review session in one statement.
+
+        Args:
+            memory_ids: UUIDs of the reviewed memory units.
+            session: Active async database session.
+
+        Returns:
+            Number of memory units updated.
+        """
+        if not memory_ids:
+            return 0
+
         from kintsugi.models.base import MemoryUnit
 
         now = datetime.now(timezone.utc)
-        await session.execute(
+        result = await session.execute(
             update(MemoryUnit)
-            .where(MemoryUnit.id == memory_id)
-            .values(updated_at=now)
+            .where(MemoryUnit.id.in_(list(memory_ids)))
+            .values(
+                access_count=MemoryUnit.access_count + 1,
+                last_accessed_at=now,
+                updated_at=now,
+                next_review_at=_next_review_expr(MemoryUnit.access_count, now),
+            )
+            .execution_options(synchronize_session=False)
         )
-        logger.debug("Recorded access for memory %s", memory_id)
+        return result.rowcount
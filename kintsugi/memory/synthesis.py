@@ -0,0 +1,211 @@
+"""Bounded-concurrency LLM synthesis for CMA Stage 2.
+
+:class:`SynthesisScheduler` sits between :func:`cma_stage2.synthesize_cluster`
+and the injected ``llm_call``:
+
+- at most ``max_concurrency`` synthesis calls are in flight at once;
+- an optional per-org token bucket caps the request rate for each org;
+- concurrent requests for the same insight id share one LLM call
+  (insight ids are a hash of the sorted source ids, so identical clusters
+  produce identical prompts);
+- a :class:`SynthesisCache` keyed by insight id lets a re-run of the
+  Dreamer skip clusters it already synthesized.
+
+Only successful completions are cached; failures propagate so the caller
+can fall back to deduplicated concatenation as before.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Awaitable, Callable, Optional, Protocol
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_CONCURRENCY: int = 8
+DEFAULT_ORG: str = "default"
+
+# (system_prompt, user_prompt) -> response_text
+LLMCall = Callable[[str, str], Awaitable[str]]
+
+
+# ---------------------------------------------------------------------------
+# Synthesis cache
+# ---------------------------------------------------------------------------
+
+
+class SynthesisCache(Protocol):
+    """Storage for synthesized insight text, keyed by insight id."""
+
+    def get(self, insight_id: str) -> Optional[str]: ...
+
+    def put(self, insight_id: str, content: str) -> None: ...
+
+
+class InMemorySynthesisCache:
+    """Process-local :class:`SynthesisCache`."""
+
+    def __init__(self) -> None:
+        self._data: dict[str, str] = {}
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, insight_id: str) -> Optional[str]:
+        return self._data.get(insight_id)
+
+    def put(self, insight_id: str, content: str) -> None:
+        self._data[insight_id] = content
+
+
+class FileSynthesisCache(InMemorySynthesisCache):
+    """Persistent :class:`SynthesisCache` backed by an append-only JSONL file.
+
+    The file is replayed on construction (last write wins), so a later
+    process sees everything earlier runs synthesized.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        super().__init__()
+        self._path = Path(path)
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        if self._path.exists():
+            with open(self._path, encoding="utf-8") as fh:
+                for line in fh:
+                    try:
+                        record = json.loads(line)
+                        self._data[record["id"]] = record["content"]
+                    except (json.JSONDecodeError, KeyError, TypeError):
+                        logger.warning("Skipping corrupt synthesis cache line in %s", self._path)
+
+    def put(self, insight_id: str, content: str) -> None:
+        if self._data.get(insight_id) == content:
+            return
+        super().put(insight_id, content)
+        with open(self._path, "a", encoding="utf-8") as fh:
+            fh.write(json.dumps({"id": insight_id, "content": content}) + "\n")
+
+
+# ---------------------------------------------------------------------------
+# Per-org rate limiting
+# ---------------------------------------------------------------------------
+
+
+class OrgRateLimiter:
+    """Async token bucket per org: ``rate`` requests/second, ``burst`` capacity."""
+
+    def __init__(self, rate: float, burst: float | None = None) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1.0, rate)
+        self._buckets: dict[str, tuple[float, float]] = {}  # org -> (tokens, last)
+
+    async def acquire(self, org_id: str) -> None:
+        """Wait until *org_id* has a token, then consume it."""
+        while True:
+            now = time.monotonic()
+            tokens, last = self._buckets.get(org_id, (self.burst, now))
+            tokens = min(self.burst, tokens + (now - last) * self.rate)
+            if tokens >= 1.0:
+                self._buckets[org_id] = (tokens - 1.0, now)
+                return
+            self._buckets[org_id] = (tokens, now)
+            await asyncio.sleep((1.0 - tokens) / self.rate)
+
+
+# ---------------------------------------------------------------------------
+# Scheduler
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class SynthesisStats:
+    """Counters for a :class:`SynthesisScheduler`."""
+
+    llm_calls: int = 0
+    coalesced: int = 0
+    cache_hits: int = 0
+    failures: int = 0
+
+    def to_dict(self) -> dict[str, int]:
+        return asdict(self)
+
+
+class SynthesisScheduler:
+    """Run cluster-synthesis LLM calls with concurrency, rate and dedup control.
+
+    Args:
+        max_concurrency: Upper bound on simultaneous LLM calls.
+        rate_per_second: Per-org request rate; ``None`` disables limiting.
+        burst: Token-bucket capacity per org (defaults to the rate).
+        cache: Optional :class:`SynthesisCache` consulted before calling.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        rate_per_second: float | None = None,
+        burst: float | None = None,
+        cache: SynthesisCache | None = None,
+    ) -> None:
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be >= 1")
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._limiter = OrgRateLimiter(rate_per_second, burst) if rate_per_second else None
+        self._cache = cache
+        self._inflight: dict[str, asyncio.Future[str]] = {}
+        self.stats = SynthesisStats()
+
+    async def complete(
+        self,
+        insight_id: str,
+        system: str,
+        user: str,
+        llm_call: LLMCall,
+        org_id: str | None = None,
+    ) -> str:
+        """Return the synthesis for *insight_id*, calling the LLM at most once."""
+        if self._cache is not None:
+            cached = self._cache.get(insight_id)
+            if cached is not None:
+                self.stats.cache_hits += 1
+                return cached
+
+        pending = self._inflight.get(insight_id)
+        if pending is not None:
+            self.stats.coalesced += 1
+            return await asyncio.shield(pending)
+
+        future: asyncio.Future[str] = asyncio.get_running_loop().create_future()
+        self._inflight[insight_id] = future
+        try:
+            content = await self._call(system, user, llm_call, org_id or DEFAULT_ORG)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as exc:
+            self.stats.failures += 1
+            future.set_exception(exc)
+            # Waiters re-raise; mark retrieved so an unawaited future stays quiet.
+            future.exception()
+            raise
+        else:
+            future.set_result(content)
+            if self._cache is not None:
+                self._cache.put(insight_id, content)
+            return content
+        finally:
+            self._inflight.pop(insight_id, None)
+
+    async def _call(self, system: str, user: str, llm_call: LLMCall, org_id: str) -> str:
+        if self._limiter is not None:
+            await self._limiter.acquire(org_id)
+        async with self._semaphore:
+            self.stats.llm_calls += 1
+            return await llm_call(system, user)
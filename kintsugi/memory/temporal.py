@@ -3,16 +3,32 @@
 Every significant system event is recorded immutably in the
 ``temporal_memories`` table, providing a complete audit trail for
 governance, debugging, and memory archaeology.
+
+Two durability modes (``TEMPORAL_LOG_DURABILITY``):
+
+- ``sync`` (default): the event is flushed in the caller's session and
+  commits or rolls back with the request.
+- ``buffered``: the event is queued on a :class:`TemporalWriteBuffer`
+  and group-committed with other events in one multi-row INSERT.  The
+  caller gets the event id immediately; a full queue makes callers wait
+  (backpressure) rather than growing without bound.  Transient database
+  errors are retried with backoff; an event the database rejects is
+  dropped on its own, not with the rest of its batch.
 """
 
 from __future__ import annotations
 
+import asyncio
 import enum
 import logging
+import uuid
+from collections.abc import Callable
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timezone
+from typing import Any
 
-from sqlalchemy import select
+from sqlalchemy import func, insert, select
+from sqlalchemy.exc import DataError, DBAPIError, IntegrityError, StatementError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 logger = logging.getLogger(__name__)
@@ -56,8 +72,199 @@ class TemporalEvent:
 # ---------------------------------------------------------------------------
 
 
+class TemporalWriteBuffer:
+    """Write-behind queue that group-commits temporal events.
+
+    A single writer task takes up to *batch_size* queued events (waiting at
+    most *flush_interval* seconds for a batch to fill) and writes them with
+    one multi-row INSERT in a fresh session from *session_factory*.
+
+    A batch that fails on a transient error (connection lost, database
+    restarting, ...) is retried up to *max_retries* times, doubling the
+    wait from *retry_backoff* seconds; after that it is counted in
+    ``failed`` and dropped.  A batch rejected for its data (bad value,
+    constraint violation) is split in halves and retried, so only the
+    offending events are dropped.
+
+    Args:
+        session_factory: Callable returning an async session context
+            manager, e.g. :data:`kintsugi.db.async_session`.
+        batch_size: Maximum events per INSERT / transaction.
+        flush_interval: Maximum seconds an event waits for its batch.
+        max_queue: Queue bound; :meth:`append` waits while it is full.
+        max_retries: Retries of a batch after a transient error.
+        retry_backoff: Seconds before the first retry.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Any],
+        *,
+        batch_size: int = 500,
+        flush_interval: float = 0.05,
+        max_queue: int = 10_000,
+        max_retries: int = 3,
+        retry_backoff: float = 0.1,
+    ) -> None:
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be >= 1, got {batch_size}")
+        self._session_factory = session_factory
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._max_retries = max_retries
+        self._retry_backoff = retry_backoff
+        self._queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue(maxsize=max_queue)
+        self._task: asyncio.Task[None] | None = None
+        self._closed = False
+        self.written = 0
+        self.batches = 0
+        self.failed = 0
+
+    @property
+    def pending(self) -> int:
+        return self._queue.qsize()
+
+    def start(self) -> None:
+        """Start the writer task on the running loop."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="temporal-write-buffer")
+
+    async def append(
+        self,
+        org_id: Any,
+        category: str,
+        message: str,
+        metadata: dict | None,
+    ) -> str:
+        """Queue one event and return its id; waits while the queue is full.
+
+        ``created_at`` is stamped here, so events keep their logical time
+        however long they wait in the queue.
+
+        Raises:
+            RuntimeError: If the buffer has been closed.
+        """
+        if self._closed:
+            raise RuntimeError("TemporalWriteBuffer is closed")
+        event_id = uuid.uuid4()
+        await self._queue.put({
+            "id": event_id,
+            "org_id": org_id if isinstance(org_id, uuid.UUID) else uuid.UUID(str(org_id)),
+            "category": category,
+            "message": message,
+            "metadata_json": metadata,
+            "created_at": datetime.now(timezone.utc),
+        })
+        return str(event_id)
+
+    async def flush(self) -> None:
+        """Wait until every event queued so far has been written (or failed)."""
+        await self._queue.join()
+
+    async def close(self) -> None:
+        """Reject new events, drain the queue and stop the writer."""
+        self._closed = True
+        if self._task is None:
+            return
+        await self.flush()
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        logger.info(
+            "Temporal write buffer closed: %d events in %d batches, %d failed",
+            self.written,
+            self.batches,
+            self.failed,
+        )
+
+    async def _next_batch(self) -> list[dict[str, Any]]:
+        loop = asyncio.get_running_loop()
+        batch = [await self._queue.get()]
+        deadline = loop.time() + self._flush_interval
+        while len(batch) < self._batch_size:
+            try:
+                batch.append(self._queue.get_nowait())
+                continue
+            except asyncio.QueueEmpty:
+                pass
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+            except TimeoutError:
+                break
+        return batch
+
+    async def _write(self, batch: list[dict[str, Any]]) -> None:
+        from kintsugi.models.base import TemporalMemory
+
+        delay = self._retry_backoff
+        for attempt in range(self._max_retries + 1):
+            try:
+                async with self._session_factory() as session:
+                    await session.execute(insert(TemporalMemory).values(batch))
+                    await session.commit()
+            except Exception as exc:
+                if _is_data_error(exc):
+                    if len(batch) == 1:
+                        self.failed += 1
+                        logger.error("Dropping temporal event %s: %s", batch[0]["id"], exc)
+                        return
+                    mid = len(batch) // 2
+                    await self._write(batch[:mid])
+                    await self._write(batch[mid:])
+                    return
+                if attempt == self._max_retries:
+                    self.failed += len(batch)
+                    logger.exception("Failed to write %d temporal events", len(batch))
+                    return
+                logger.warning(
+                    "Temporal event batch failed (%s); retrying in %.2fs", exc, delay
+                )
+                await asyncio.sleep(delay)
+                delay *= 2
+            else:
+                self.written += len(batch)
+                self.batches += 1
+                return
+
+    async def _run(self) -> None:
+        while True:
+            batch = await self._next_batch()
+            try:
+                await self._write(batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+
+def _is_data_error(exc: BaseException) -> bool:
+    """Whether *exc* is about the rows themselves rather than the database."""
+    if isinstance(exc, (DataError, IntegrityError)):
+        return True
+    # Values that could not be bound fail before reaching the database.
+    return isinstance(exc, StatementError) and not isinstance(exc, DBAPIError)
+
+
 class TemporalLog:
-    """Manages the append-only temporal event log."""
+    """Manages the append-only temporal event log.
+
+    Args:
+        buffer: Optional :class:`TemporalWriteBuffer`; when set, events are
+            group-committed by the buffer instead of flushed in the
+            caller's session.
+    """
+
+    def __init__(self, buffer: TemporalWriteBuffer | None = None) -> None:
+        self._buffer = buffer
+
+    @property
+    def buffer(self) -> TemporalWriteBuffer | None:
+        return self._buffer
 
     async def log_event(
         self,
@@ -79,6 +286,9 @@ class TemporalLog:
         Returns:
             String UUID of the created record.
         """
+        if self._buffer is not None:
+            return await self._buffer.append(org_id, category, message, metadata)
+
         from kintsugi.models.base import TemporalMemory
 
         row = TemporalMemory(
@@ -115,10 +325,15 @@ class TemporalLog:
             category: Filter by event category.
             start: Earliest ``created_at`` (inclusive).
             end: Latest ``created_at`` (inclusive).
-            keyword: Substring match on ``message``.
+            keyword: Full-text search on ``message`` (web-search syntax:
+                words, ``"quoted phrases"``, ``or``, ``-excluded``),
+                served by the GIN index on ``message_tsv``.
             limit: Maximum rows to return.
             session: Active async database session.
 
+        Giving *start* and/or *end* lets Postgres skip the monthly
+        partitions outside that range.
+
         Returns:
             List of matching :class:`TemporalEvent` objects.
         """
@@ -136,7 +351,9 @@ class TemporalLog:
         if end is not None:
             stmt = stmt.where(TemporalMemory.created_at <= end)
         if keyword is not None:
-            stmt = stmt.where(TemporalMemory.message.ilike(f"%{keyword}%"))
+            stmt = stmt.where(
+                TemporalMemory.message_tsv.op("@@")(func.websearch_to_tsquery("english", keyword))
+            )
 
         stmt = stmt.order_by(TemporalMemory.created_at.desc()).limit(limit)
 
@@ -153,3 +370,25 @@ class TemporalLog:
             )
             for r in rows
         ]
+
+
+# ---------------------------------------------------------------------------
+# Process-wide log
+# ---------------------------------------------------------------------------
+
+
+_temporal_log: TemporalLog | None = None
+
+
+def get_temporal_log() -> TemporalLog:
+    """Return the process-wide :class:`TemporalLog` (unbuffered by default)."""
+    global _temporal_log
+    if _temporal_log is None:
+        _temporal_log = TemporalLog()
+    return _temporal_log
+
+
+def set_temporal_log(log: TemporalLog | None) -> None:
+    """Install the process-wide log (the FastAPI lifespan does this)."""
+    global _temporal_log
+    _temporal_log = log
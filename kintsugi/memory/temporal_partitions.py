@@ -0,0 +1,238 @@
+"""Monthly partition maintenance for the temporal log.
+
+``temporal_memories`` is range-partitioned on ``created_at`` with one
+partition per calendar month (UTC), named ``temporal_memories_pYYYY_MM``,
+plus a ``temporal_memories_default`` catch-all.  Queries bounded by
+``created_at`` only touch the matching months.
+
+:class:`TemporalPartitionManager` keeps partitions created ahead of time
+and applies retention:
+
+- ``detach``: old months are detached and left as standalone tables, so
+  they drop out of every query but can still be dumped or re-attached.
+- ``drop``: old months are detached and dropped.
+
+If rows ever land in the default partition for a month that later gets
+its own partition, they are moved across when that partition is created
+(Postgres refuses to create the partition otherwise).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import re
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Optional
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+logger = logging.getLogger(__name__)
+
+PARENT_TABLE = "temporal_memories"
+DEFAULT_PARTITION = f"{PARENT_TABLE}_default"
+RETENTION_ACTIONS = ("detach", "drop")
+
+_COLUMNS = "id, org_id, category, message, metadata_json, created_at"
+
+_PARTITION_RE = re.compile(rf"^{PARENT_TABLE}_p(\d{{4}})_(\d{{2}})$")
+
+_LIST_PARTITIONS = text("""
+    SELECT c.relname
+    FROM pg_inherits i
+    JOIN pg_class c ON c.oid = i.inhrelid
+    JOIN pg_class p ON p.oid = i.inhparent
+    WHERE p.relname = :parent
+""")
+
+
+def month_start(dt: datetime) -> datetime:
+    """First instant (UTC) of the month containing *dt*."""
+    dt = dt.astimezone(timezone.utc) if dt.tzinfo else dt.replace(tzinfo=timezone.utc)
+    return dt.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def add_months(month: datetime, n: int) -> datetime:
+    """Shift a :func:`month_start` value by *n* months."""
+    index = month.year * 12 + month.month - 1 + n
+    return month.replace(year=index // 12, month=index % 12 + 1)
+
+
+def partition_name(month: datetime) -> str:
+    return f"{PARENT_TABLE}_p{month.year:04d}_{month.month:02d}"
+
+
+def parse_partition_name(name: str) -> Optional[datetime]:
+    """Return the month a partition covers, or ``None`` for other tables."""
+    m = _PARTITION_RE.match(name)
+    if m is None:
+        return None
+    return datetime(int(m.group(1)), int(m.group(2)), 1, tzinfo=timezone.utc)
+
+
+def _bound(month: datetime) -> str:
+    return month.strftime("%Y-%m-%d 00:00:00+00")
+
+
+@dataclass
+class MaintenanceResult:
+    """Partitions touched by one maintenance pass."""
+
+    created: list[str] = field(default_factory=list)
+    detached: list[str] = field(default_factory=list)
+    dropped: list[str] = field(default_factory=list)
+    rows_moved: int = 0
+
+
+class TemporalPartitionManager:
+    """Creates upcoming monthly partitions and retires old ones.
+
+    Args:
+        months_ahead: Months after the current one to keep created.
+        retain_months: Full months to keep before the current one
+            (``0`` = keep everything).
+        retention_action: ``"detach"`` or ``"drop"``.
+    """
+
+    def __init__(
+        self,
+        months_ahead: int = 3,
+        retain_months: int = 0,
+        retention_action: str = "detach",
+    ) -> None:
+        if months_ahead < 0 or retain_months < 0:
+            raise ValueError("months_ahead and retain_months must be >= 0")
+        if retention_action not in RETENTION_ACTIONS:
+            raise ValueError(
+                f"retention_action must be one of {RETENTION_ACTIONS}, got {retention_action!r}"
+            )
+        self.months_ahead = months_ahead
+        self.retain_months = retain_months
+        self.retention_action = retention_action
+
+    async def list_partitions(self, session: AsyncSession) -> dict[str, datetime]:
+        """Map attached monthly partition names to the month they cover."""
+        result = await session.execute(_LIST_PARTITIONS, {"parent": PARENT_TABLE})
+        partitions = {}
+        for (name,) in result.all():
+            month = parse_partition_name(name)
+            if month is not None:
+                partitions[name] = month
+        return partitions
+
+    async def _create_partition(
+        self, session: AsyncSession, month: datetime, result: MaintenanceResult,
+    ) -> None:
+        name = partition_name(month)
+        bounds = {"lo": month, "hi": add_months(month, 1)}
+        spilled = (await session.execute(
+            text(
+                f"SELECT count(*) FROM {DEFAULT_PARTITION} "
+                "WHERE created_at >= :lo AND created_at < :hi"
+            ),
+            bounds,
+        )).scalar_one()
+
+        create = (
+            f"CREATE TABLE {name} PARTITION OF {PARENT_TABLE} "
+            f"FOR VALUES FROM ('{_bound(month)}') TO ('{_bound(bounds['hi'])}')"
+        )
+        if not spilled:
+            await session.execute(text(create))
+        else:
+            # The default partition already holds rows for this month: take
+            # it out, create the month, move the rows, then put it back.
+            await session.execute(text(
+                f"ALTER TABLE {PARENT_TABLE} DETACH PARTITION {DEFAULT_PARTITION}"
+            ))
+            await session.execute(text(create))
+            await session.execute(
+                text(
+                    f"WITH moved AS (DELETE FROM {DEFAULT_PARTITION} "
+                    "WHERE created_at >= :lo AND created_at < :hi RETURNING *) "
+                    f"INSERT INTO {name} ({_COLUMNS}) SELECT {_COLUMNS} FROM moved"
+                ),
+                bounds,
+            )
+            await session.execute(text(
+                f"ALTER TABLE {PARENT_TABLE} ATTACH PARTITION {DEFAULT_PARTITION} DEFAULT"
+            ))
+            result.rows_moved += spilled
+            logger.warning("Moved %d temporal events from the default partition into %s",
+                           spilled, name)
+        result.created.append(name)
+
+    async def ensure_partitions(
+        self,
+        session: AsyncSession,
+        now: Optional[datetime] = None,
+        result: Optional[MaintenanceResult] = None,
+    ) -> MaintenanceResult:
+        """Create the current month's partition and the next *months_ahead*."""
+        result = result or MaintenanceResult()
+        existing = set(await self.list_partitions(session))
+        current = month_start(now or datetime.now(timezone.utc))
+        for offset in range(self.months_ahead + 1):
+            month = add_months(current, offset)
+            if partition_name(month) not in existing:
+                await self._create_partition(session, month, result)
+        return result
+
+    async def apply_retention(
+        self,
+        session: AsyncSession,
+        now: Optional[datetime] = None,
+        result: Optional[MaintenanceResult] = None,
+    ) -> MaintenanceResult:
+        """Detach (and optionally drop) months older than *retain_months*."""
+        result = result or MaintenanceResult()
+        if not self.retain_months:
+            return result
+        cutoff = add_months(month_start(now or datetime.now(timezone.utc)), -self.retain_months)
+        partitions = await self.list_partitions(session)
+        for name, month in sorted(partitions.items(), key=lambda p: p[1]):
+            if month >= cutoff:
+                continue
+            await session.execute(text(f"ALTER TABLE {PARENT_TABLE} DETACH PARTITION {name}"))
+            result.detached.append(name)
+            if self.retention_action == "drop":
+                await session.execute(text(f"DROP TABLE {name}"))
+                result.dropped.append(name)
+        return result
+
+    async def maintain(
+        self, session: AsyncSession, now: Optional[datetime] = None,
+    ) -> MaintenanceResult:
+        """Run :meth:`ensure_partitions` and :meth:`apply_retention`, then commit."""
+        result = MaintenanceResult()
+        await self.ensure_partitions(session, now, result)
+        await self.apply_retention(session, now, result)
+        await session.commit()
+        if result.created or result.detached:
+            logger.info(
+                "Temporal partitions: created %s, detached %s, dropped %s",
+                result.created, result.detached, result.dropped,
+            )
+        return result
+
+    async def run_periodically(
+        self,
+        session_factory: Callable[[], Any],
+        interval_seconds: float,
+        stop: Optional[asyncio.Event] = None,
+    ) -> None:
+        """Run :meth:`maintain` every *interval_seconds* until *stop* is set."""
+        stop = stop or asyncio.Event()
+        while not stop.is_set():
+            try:
+                async with session_factory() as session:
+                    await self.maintain(session)
+            except Exception:
+                logger.exception("Temporal partition maintenance failed")
+            try:
+                await asyncio.wait_for(stop.wait(), timeout=interval_seconds)
+            except TimeoutError:
+                pass
@@ -8,6 +8,8 @@ from datetime import datetime, timezone
 from pgvector.sqlalchemy import Vector
 from sqlalchemy import (
     Boolean,
+    CheckConstraint,
+    Computed,
     DateTime,
     Float,
     ForeignKey,
@@ -16,6 +18,7 @@ from sqlalchemy import (
     LargeBinary,
     String,
     Text,
+    text,
 )
 from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
@@ -48,6 +51,23 @@ class MemoryUnit(Base):
     __tablename__ = "memory_units"
     __table_args__ = (
         Index("ix_memory_significance_org", "significance", "org_id"),
+        Index(
+            "ix_memory_units_review_due",
+            "org_id",
+            "next_review_at",
+            postgresql_where=text("memory_layer <> 'archived'"),
+        ),
+        Index(
+            "ix_memory_units_expiry",
+            "expires_at",
+            postgresql_where=text("memory_layer <> 'archived' AND expires_at IS NOT NULL"),
+        ),
+        Index(
+            "ix_memory_units_decay",
+            "org_id",
+            "id",
+            postgresql_where=text("memory_layer <> 'archived' AND last_accessed_at IS NOT NULL"),
+        ),
     )
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=_uuid)
@@ -62,6 +82,16 @@ class MemoryUnit(Base):
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), default=_utcnow, onupdate=_utcnow
     )
+    access_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+    last_accessed_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    # First review is fib_interval(0) = 1 day after creation.
+    next_review_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=text("now() + interval '1 day'")
+    )
 
     organization: Mapped["Organization"] = relationship(back_populates="memories")
     embedding: Mapped["MemoryEmbedding | None"] = relationship(back_populates="memory")
@@ -121,6 +151,56 @@ class MemoryMetadata(Base):
     memory: Mapped["MemoryUnit"] = relationship(back_populates="metadata_row")
 
 
+class MemoryLink(Base):
+    """Undirected edge between two related memories (``source_id < target_id``).
+
+    Written by the Dreamer's enrichment phase; see
+    :mod:`kintsugi.memory.enrichment`.
+    """
+
+    __tablename__ = "memory_links"
+    __table_args__ = (
+        Index("ix_memory_links_target", "target_id"),
+        Index("ix_memory_links_org", "org_id"),
+        CheckConstraint("source_id < target_id", name="ck_memory_links_ordered"),
+    )
+
+    source_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("memory_units.id", ondelete="CASCADE"), primary_key=True
+    )
+    target_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("memory_units.id", ondelete="CASCADE"), primary_key=True
+    )
+    org_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("organizations.id", ondelete="CASCADE"), nullable=False
+    )
+    kind: Mapped[str] = mapped_column(String(32), nullable=False)
+    score: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    shared_tags: Mapped[list | None] = mapped_column(JSONB, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=_utcnow)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=_utcnow, onupdate=_utcnow
+    )
+
+
+class MemoryIngestCheckpoint(Base):
+    """Progress of a resumable bulk ingestion job (one row per org and job)."""
+
+    __tablename__ = "memory_ingest_checkpoints"
+
+    org_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("organizations.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    job_id: Mapped[str] = mapped_column(String(128), primary_key=True)
+    lines_committed: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    memories_committed: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=_utcnow, onupdate=_utcnow
+    )
+
+
 class MemoryArchive(Base):
     __tablename__ = "memory_archives"
 
@@ -133,12 +213,44 @@ class MemoryArchive(Base):
     content_hash: Mapped[str] = mapped_column(String(64), nullable=False, index=True)
     archived_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=_utcnow)
     is_immutable: Mapped[bool] = mapped_column(Boolean, default=True)
+    codec: Mapped[str] = mapped_column(
+        String(16), nullable=False, default="gzip", server_default="gzip"
+    )
+    dictionary_id: Mapped[uuid.UUID | None] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("archive_dictionaries.id"), nullable=True
+    )
+
+
+class ArchiveDictionary(Base):
+    """A trained per-org compression dictionary for the cold archive."""
+
+    __tablename__ = "archive_dictionaries"
+    __table_args__ = (
+        Index("ix_archive_dictionaries_org_created", "org_id", "created_at"),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=_uuid)
+    org_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("organizations.id", ondelete="CASCADE"), nullable=False
+    )
+    codec: Mapped[str] = mapped_column(String(16), nullable=False, default="zstd")
+    dictionary: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+    sample_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=_utcnow)
 
 
 class TemporalMemory(Base):
+    """Append-only event log, range-partitioned by month on ``created_at``.
+
+    Partitions are managed by :mod:`kintsugi.memory.temporal_partitions`.
+    """
+
     __tablename__ = "temporal_memories"
     __table_args__ = (
         Index("ix_temporal_created_category", "created_at", "category"),
+        Index("ix_temporal_org_created", "org_id", "created_at"),
+        Index("ix_temporal_message_tsv", "message_tsv", postgresql_using="gin"),
+        {"postgresql_partition_by": "RANGE (created_at)"},
     )
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=_uuid)
@@ -148,7 +260,13 @@ class TemporalMemory(Base):
     category: Mapped[str] = mapped_column(String(128), nullable=False)
     message: Mapped[str] = mapped_column(Text, nullable=False)
     metadata_json: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=_utcnow)
+    # Part of the primary key because Postgres requires the partition key there.
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), primary_key=True, default=_utcnow, server_default=text("now()")
+    )
+    message_tsv = mapped_column(
+        TSVECTOR, Computed("to_tsvector('english', message)", persisted=True)
+    )
 
 
 class IntentCapsule(Base):
@@ -19,6 +19,7 @@ Plugin Architecture:
     dedicated managers:
     - PluginLoader: Discovers and loads plugin modules
     - PluginSandbox: Provides isolated execution environment
+    - PluginWorkerPool: Worker processes that sandboxed calls run in
     - PluginRegistry: Central registry for active plugins
 
 Security:
@@ -67,6 +68,9 @@ from kintsugi.plugins.sandbox import (
     SandboxPolicy,
     SandboxViolation,
 )
+from kintsugi.plugins.worker_pool import (
+    PluginWorkerPool,
+)
 from kintsugi.plugins.registry import (
     PluginRegistry,
 )
@@ -86,6 +90,7 @@ __all__ = [
     "PluginSandbox",
     "SandboxPolicy",
     "SandboxViolation",
+    "PluginWorkerPool",
     # Registry
     "PluginRegistry",
 ]
@@ -0,0 +1,147 @@
+"""
+Wire format between PluginWorkerPool and its worker processes.
+
+Messages are pickled with protocol 5 and framed as::
+
+    <u32 n> <u32 k> <u64 len> * n  frame_0 ... frame_{n-1}
+
+Frame 0 is the pickle stream.  Frames 1..k hold ``bytes``/``bytearray``
+values of at least OUT_OF_BAND_MIN bytes, referenced from the stream by
+persistent id; the remaining frames are protocol 5 out-of-band buffers
+(arrays and other objects that support them).  Either way large payloads
+are written straight from the sender's memory instead of being copied
+into the pickle stream.
+
+Replies from a worker are untrusted: the host decodes them with
+:func:`decode_reply`, which only rebuilds plain data (scalars, strings,
+bytes and builtin containers) and never imports or calls anything else.
+
+Kept apart from ``_worker`` so the package never imports the module the
+workers run as ``__main__``.
+"""
+
+from typing import Any, Callable
+import io
+import pickle
+import struct
+
+_HEADER = struct.Struct("<II")
+_LENGTH = struct.Struct("<Q")
+HEADER_SIZE = _HEADER.size
+LENGTH_SIZE = _LENGTH.size
+
+OUT_OF_BAND_MIN = 64 * 1024
+
+# (module name, module file, class qualname)
+PluginSpec = tuple[str, str, str]
+
+
+class _Pickler(pickle.Pickler):
+    """Moves large bytes/bytearray values into frames of their own.
+
+    The C pickler does not consult ``reducer_override`` for exact bytes
+    and bytearray instances, but it does call ``persistent_id`` first for
+    every object.
+    """
+
+    def __init__(self, file: io.BytesIO, buffers: list[Any]):
+        super().__init__(file, protocol=5, buffer_callback=buffers.append)
+        self.frames: list[memoryview] = []
+
+    def persistent_id(self, obj: Any) -> Any:
+        kind = type(obj)
+        if (kind is bytes or kind is bytearray) and len(obj) >= OUT_OF_BAND_MIN:
+            self.frames.append(memoryview(obj))
+            return (kind.__name__, len(self.frames))
+        return None
+
+
+def encode(obj: Any) -> list[bytes | memoryview]:
+    """Pickle *obj* into frames ready to write, header first."""
+    buffers: list[pickle.PickleBuffer] = []
+    stream = io.BytesIO()
+    pickler = _Pickler(stream, buffers)
+    pickler.dump(obj)
+    frames: list[memoryview] = [
+        stream.getbuffer(), *pickler.frames, *(b.raw() for b in buffers),
+    ]
+    header = _HEADER.pack(len(frames), len(pickler.frames)) + b"".join(
+        _LENGTH.pack(frame.nbytes) for frame in frames
+    )
+    return [header, *frames]
+
+
+class _Unpickler(pickle.Unpickler):
+    def __init__(self, frames: list[Any], out_of_band: int):
+        super().__init__(io.BytesIO(frames[0]), buffers=frames[1 + out_of_band:])
+        self._frames = frames[:1 + out_of_band]
+
+    def persistent_load(self, pid: Any) -> Any:
+        kinds = {"bytes": bytes, "bytearray": bytearray}
+        if not (
+            isinstance(pid, tuple) and len(pid) == 2 and pid[0] in kinds
+            and isinstance(pid[1], int) and 0 < pid[1] < len(self._frames)
+        ):
+            raise pickle.UnpicklingError(f"Invalid frame reference {pid!r}")
+        kind, frame = kinds[pid[0]], self._frames[pid[1]]
+        return frame if type(frame) is kind else kind(frame)
+
+
+def decode(frames: list[Any], out_of_band: int) -> Any:
+    """Inverse of :func:`encode` (without the header), for trusted senders.
+
+    Args:
+        frames: The frames following the header.
+        out_of_band: ``k`` from the header.
+    """
+    return _Unpickler(frames, out_of_band).load()
+
+
+# The only global a reply may reference.  Everything else plain data needs
+# (dict, list, tuple, set, frozenset, str, bytes, bytearray, int, float,
+# bool, None) has its own pickle opcode or a frame reference.
+_REPLY_GLOBALS: dict[tuple[str, str], Any] = {
+    ("builtins", "complex"): complex,
+}
+
+
+class _ReplyUnpickler(_Unpickler):
+    def find_class(self, module: str, name: str) -> Any:
+        try:
+            return _REPLY_GLOBALS[(module, name)]
+        except KeyError:
+            raise pickle.UnpicklingError(
+                f"'{module}.{name}' is not allowed in a worker reply"
+            ) from None
+
+
+def decode_reply(frames: list[Any], out_of_band: int) -> Any:
+    """Decode an untrusted worker reply, allowing plain data only.
+
+    Raises:
+        pickle.UnpicklingError: If the reply references anything else or
+            is malformed.
+    """
+    try:
+        return _ReplyUnpickler(frames, out_of_band).load()
+    except pickle.UnpicklingError:
+        raise
+    except Exception as e:
+        raise pickle.UnpicklingError(f"Malformed worker reply: {e}") from e
+
+
+def parse_header(head: bytes) -> tuple[int, int]:
+    """Return ``(n, k)`` from the fixed part of a header."""
+    return _HEADER.unpack(head)
+
+
+def parse_lengths(data: bytes) -> tuple[int, ...]:
+    """Return the frame lengths following the fixed part of a header."""
+    return struct.unpack(f"<{len(data) // _LENGTH.size}Q", data)
+
+
+def read_message(read_exactly: Callable[[int], Any]) -> Any:
+    """Read one message from a trusted sender with a blocking read_exactly(n)."""
+    count, out_of_band = parse_header(read_exactly(HEADER_SIZE))
+    lengths = parse_lengths(read_exactly(LENGTH_SIZE * count))
+    return decode([read_exactly(n) for n in lengths], out_of_band)
@@ -0,0 +1,258 @@
+"""
+Plugin worker process for :class:`kintsugi.plugins.worker_pool.PluginWorkerPool`.
+
+Run as ``python -m kintsugi.plugins._worker``.  The first message on stdin
+carries the :class:`SandboxPolicy`; every later message is one plugin call
+and gets exactly one reply on stdout.  The policy is enforced on this
+process only:
+
+    - RLIMIT_AS is set once, to the worker's own footprint plus
+      ``max_memory_mb``.
+    - RLIMIT_CPU is moved before each call so the call gets
+      ``max_cpu_seconds`` on top of what the worker has already used.
+    - The RestrictedImporter sits on ``sys.meta_path`` for the duration
+      of each call.
+
+Messages use the framing in :mod:`kintsugi.plugins._wire`.  Replies hold
+plain data only (violations as dicts); the host refuses anything else.
+"""
+
+from functools import reduce
+from pathlib import Path
+from typing import Any, BinaryIO, Callable
+import asyncio
+import importlib
+import importlib.util
+import math
+import os
+import resource
+import signal
+import sys
+import traceback
+
+from kintsugi.plugins._wire import PluginSpec, encode, read_message
+from kintsugi.plugins.sandbox import RestrictedImporter, SandboxPolicy
+
+
+class CPULimitExceeded(BaseException):
+    """Raised into the running call by SIGXCPU.
+
+    A BaseException so that ``except Exception`` in plugin code does not
+    swallow it.
+    """
+
+
+def _on_sigxcpu(signum: int, frame: Any) -> None:
+    raise CPULimitExceeded()
+
+
+def _reader(stream: BinaryIO) -> Callable[[int], bytearray]:
+    def read_exactly(n: int) -> bytearray:
+        buf = bytearray(n)
+        view = memoryview(buf)
+        pos = 0
+        while pos < n:
+            got = stream.readinto(view[pos:])
+            if not got:
+                raise EOFError("host closed the channel")
+            pos += got
+        return buf
+
+    return read_exactly
+
+
+def _claim_stdio() -> tuple[BinaryIO, BinaryIO]:
+    """Move the protocol off fds 0/1 so plugin code cannot write into it."""
+    proto_in = os.fdopen(os.dup(0), "rb")
+    proto_out = os.fdopen(os.dup(1), "wb")
+    devnull = os.open(os.devnull, os.O_RDONLY)
+    os.dup2(devnull, 0)
+    os.close(devnull)
+    # Plugin prints end up in the host's stderr rather than the channel.
+    os.dup2(2, 1)
+    return proto_in, proto_out
+
+
+def _limit_memory(max_memory_mb: int) -> None:
+    try:
+        with open("/proc/self/statm") as f:
+            footprint = int(f.read().split()[0]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        footprint = 0
+    limit = footprint + max_memory_mb * 1024 * 1024
+    _, hard = resource.getrlimit(resource.RLIMIT_AS)
+    if hard != resource.RLIM_INFINITY:
+        limit = min(limit, hard)
+    try:
+        resource.setrlimit(resource.RLIMIT_AS, (limit, hard))
+    except (ValueError, OSError):
+        pass
+
+
+def _set_cpu_budget(seconds: float | None) -> None:
+    """Allow *seconds* more CPU time from now; None lifts the soft limit."""
+    _, hard = resource.getrlimit(resource.RLIMIT_CPU)
+    if seconds is None:
+        soft = hard
+    else:
+        usage = resource.getrusage(resource.RUSAGE_SELF)
+        soft = math.ceil(usage.ru_utime + usage.ru_stime + seconds)
+        if hard != resource.RLIM_INFINITY:
+            soft = min(soft, hard)
+    try:
+        resource.setrlimit(resource.RLIMIT_CPU, (soft, hard))
+    except (ValueError, OSError):
+        pass
+
+
+def _load_plugin(spec: PluginSpec) -> Any:
+    """Import the plugin module in this process and return its class."""
+    module_name, module_file, qualname = spec
+    module = sys.modules.get(module_name)
+    if module is None:
+        # Put the directory the dotted name is rooted in on sys.path so
+        # packages keep their relative imports.
+        path = Path(module_file)
+        path = path.parent if path.name == "__init__.py" else path.with_suffix("")
+        for part in reversed(module_name.split(".")):
+            if path.name != part:
+                break
+            path = path.parent
+        else:
+            if str(path) not in sys.path:
+                sys.path.insert(0, str(path))
+            module = importlib.import_module(module_name)
+    if module is None:
+        file_spec = importlib.util.spec_from_file_location(module_name, module_file)
+        if file_spec is None or file_spec.loader is None:
+            raise ImportError(f"Cannot load {module_file}")
+        module = importlib.util.module_from_spec(file_spec)
+        sys.modules[module_name] = module
+        file_spec.loader.exec_module(module)
+    return reduce(getattr, qualname.split("."), module)
+
+
+def _peak_memory_mb() -> float:
+    # ru_maxrss is in KiB on Linux.
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+class _Worker:
+    """State of one worker process: policy, importer, plugin instances.
+
+    An instance is built like PluginLoader builds it, then brought to the
+    host instance's lifecycle state: configure() with the host's
+    PluginConfig, and initialize() if the host instance was initialized.
+    It is rebuilt whenever that state changes.
+    """
+
+    def __init__(self, policy: SandboxPolicy):
+        self._policy = policy
+        self._importer = RestrictedImporter(policy)
+        self._plugins: dict[PluginSpec, tuple[dict[str, Any], Any]] = {}
+        self._loop = asyncio.new_event_loop()
+
+    def _build(self, spec: PluginSpec, lifecycle: dict[str, Any]) -> Any:
+        instance = _load_plugin(spec)()
+        if lifecycle["config"] is not None:
+            instance.configure(lifecycle["config"])
+        if lifecycle["initialized"]:
+            initialized = instance.initialize()
+            if asyncio.iscoroutine(initialized):
+                self._loop.run_until_complete(initialized)
+        return instance
+
+    def call(self, message: dict[str, Any]) -> dict[str, Any]:
+        reply: dict[str, Any] = {
+            "result": None,
+            "error": None,
+            "violation": None,
+            "recycle": False,
+            "violations": [],
+            "memory_used_mb": 0.0,
+        }
+        spec = message["plugin"]
+        try:
+            lifecycle = message["lifecycle"]
+            cached = self._plugins.get(spec)
+            if cached is not None and cached[0] == lifecycle:
+                instance = cached[1]
+            else:
+                instance = self._build(spec, lifecycle)
+                self._plugins[spec] = (lifecycle, instance)
+            func = getattr(instance, message["method"])
+        except Exception as e:
+            reply["error"] = f"Plugin could not be loaded in worker: {e}"
+            return reply
+
+        self._importer.clear()
+        _set_cpu_budget(self._policy.max_cpu_seconds)
+        sys.meta_path.insert(0, self._importer)
+        try:
+            if asyncio.iscoroutinefunction(func):
+                reply["result"] = self._loop.run_until_complete(
+                    func(*message["args"], **message["kwargs"])
+                )
+            else:
+                reply["result"] = func(*message["args"], **message["kwargs"])
+        except CPULimitExceeded:
+            reply["error"] = (
+                f"Execution exceeded CPU limit of {self._policy.max_cpu_seconds}s"
+            )
+            reply["violation"] = "cpu_limit"
+            reply["recycle"] = True
+        except MemoryError:
+            reply["error"] = "Execution exceeded memory limit"
+            reply["violation"] = "memory_limit"
+            reply["recycle"] = True
+        except Exception as e:
+            reply["error"] = f"Execution failed: {str(e)}"
+            reply["traceback"] = traceback.format_exc()
+        finally:
+            if self._importer in sys.meta_path:
+                sys.meta_path.remove(self._importer)
+            _set_cpu_budget(None)
+
+        reply["violations"] = [v.to_dict() for v in self._importer.violations]
+        reply["memory_used_mb"] = _peak_memory_mb()
+        return reply
+
+
+def main() -> None:
+    proto_in, proto_out = _claim_stdio()
+    read_exactly = _reader(proto_in)
+
+    def send(message: Any) -> None:
+        try:
+            frames = encode(message)
+        except Exception as e:
+            frames = encode({
+                "result": None,
+                "error": f"Result could not be returned from worker: {e}",
+                "violation": None,
+                "recycle": False,
+                "violations": message.get("violations", []),
+                "memory_used_mb": message.get("memory_used_mb", 0.0),
+            })
+        for frame in frames:
+            proto_out.write(frame)
+        proto_out.flush()
+
+    try:
+        policy = read_message(read_exactly)["policy"]
+    except EOFError:
+        return
+    _limit_memory(policy.max_memory_mb)
+    signal.signal(signal.SIGXCPU, _on_sigxcpu)
+    worker = _Worker(policy)
+
+    while True:
+        try:
+            message = read_message(read_exactly)
+        except EOFError:
+            return
+        send(worker.call(message))
+
+
+if __name__ == "__main__":
+    main()
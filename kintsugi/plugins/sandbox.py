@@ -13,6 +13,10 @@ Security Measures:
     - CPU time limits
     - Execution timeout
 
+Plugin methods run in worker processes (see kintsugi.plugins.worker_pool),
+which apply the memory/CPU limits and import restrictions to themselves,
+so the API server process is never limited.
+
 Example:
     from kintsugi.plugins.sandbox import PluginSandbox, SandboxPolicy
 
@@ -34,20 +38,23 @@ Example:
 
     # Execute plugin method in sandbox
     result = await sandbox.execute(plugin, "handle", request, context)
+
+    # Stop the worker processes on shutdown
+    await sandbox.close()
 """
 
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any
+from typing import TYPE_CHECKING, Any
 import asyncio
 import logging
-import resource
-import signal
-import sys
 import traceback
 
 from kintsugi.plugins.loader import LoadedPlugin, PluginState
 
+if TYPE_CHECKING:
+    from kintsugi.plugins.worker_pool import PluginWorkerPool
+
 logger = logging.getLogger(__name__)
 
 
@@ -72,6 +79,9 @@ class SandboxPolicy:
         allow_ctypes: Whether to allow ctypes/cffi.
         max_file_size_mb: Maximum file size for any file operation.
         allowed_paths: Paths the plugin can access (if filesystem allowed).
+        allow_unisolated: Whether plugins that cannot run in a worker
+            process may run inside the server with only the timeout
+            applied. Off by default: such calls fail.
 
     Example:
         # Restrictive policy for untrusted plugins
@@ -124,6 +134,7 @@ class SandboxPolicy:
     allow_ctypes: bool = False
     max_file_size_mb: int = 10
     allowed_paths: list[str] = field(default_factory=list)
+    allow_unisolated: bool = False
 
     def is_import_allowed(self, module_name: str) -> bool:
         """Check if a module import is allowed.
@@ -166,6 +177,7 @@ class SandboxPolicy:
             "max_execution_time": self.max_execution_time,
             "allow_subprocess": self.allow_subprocess,
             "allow_threading": self.allow_threading,
+            "allow_unisolated": self.allow_unisolated,
         }
 
 
@@ -205,6 +217,24 @@ class SandboxViolation:
             "timestamp": self.timestamp.isoformat(),
         }
 
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "SandboxViolation":
+        """Create from a dictionary produced by to_dict().
+
+        Args:
+            data: Dictionary representation.
+
+        Returns:
+            The SandboxViolation.
+        """
+        return cls(
+            violation_type=data["violation_type"],
+            message=data["message"],
+            severity=data["severity"],
+            location=data["location"],
+            timestamp=datetime.fromisoformat(data["timestamp"]),
+        )
+
 
 @dataclass
 class SandboxExecutionResult:
@@ -247,7 +277,8 @@ class RestrictedImporter:
     """Custom importer that enforces import restrictions.
 
     Installed as a meta path finder to intercept all import attempts
-    and check them against the sandbox policy.
+    and check them against the sandbox policy. PluginSandbox installs it
+    only inside plugin worker processes.
     """
 
     def __init__(self, policy: SandboxPolicy):
@@ -278,6 +309,24 @@ class RestrictedImporter:
             return self
         return None
 
+    def find_spec(self, fullname: str, path: Any = None, target: Any = None) -> None:
+        """Block disallowed imports (the finder API used since Python 3.4).
+
+        Args:
+            fullname: The full module name being imported.
+            path: The path (unused).
+            target: The target module (unused).
+
+        Returns:
+            None, to let the remaining finders handle an allowed import.
+
+        Raises:
+            ImportError: If the import is blocked.
+        """
+        if self.find_module(fullname, path) is not None:
+            self.load_module(fullname)
+        return None
+
     def load_module(self, fullname: str) -> None:
         """Block the import by raising an error.
 
@@ -294,17 +343,24 @@ class RestrictedImporter:
         """Get recorded violations."""
         return list(self._violations)
 
+    def clear(self) -> None:
+        """Forget recorded violations."""
+        self._violations.clear()
+
 
 class PluginSandbox:
     """Sandboxed execution environment for plugins.
 
     Provides a secure execution environment for plugin code with
-    resource limits and access controls.
+    resource limits and access controls. Methods run in a pool of
+    worker processes that is started on first use; call close() to
+    stop it.
 
     Attributes:
         _policy: The security policy to enforce.
         _execution_count: Number of executions performed.
         _total_violations: Total violations recorded.
+        _pool: Worker processes plugin methods run in.
 
     Example:
         sandbox = PluginSandbox(SandboxPolicy(
@@ -319,17 +375,30 @@ class PluginSandbox:
         result = await sandbox.execute(plugin, "handle", request)
     """
 
-    def __init__(self, policy: SandboxPolicy | None = None):
+    def __init__(
+        self,
+        policy: SandboxPolicy | None = None,
+        workers: int = 4,
+        max_calls_per_worker: int = 500,
+        max_concurrent_per_plugin: int = 2,
+    ):
         """Initialize the sandbox.
 
         Args:
             policy: The security policy to use. Defaults to a
                    restrictive policy.
+            workers: Number of worker processes.
+            max_calls_per_worker: Calls after which a worker is replaced.
+            max_concurrent_per_plugin: Concurrent calls allowed into any
+                   one plugin.
         """
         self._policy = policy or SandboxPolicy()
         self._execution_count = 0
         self._total_violations: list[SandboxViolation] = []
-        self._restricted_importer: RestrictedImporter | None = None
+        self._workers = workers
+        self._max_calls_per_worker = max_calls_per_worker
+        self._max_concurrent_per_plugin = max_concurrent_per_plugin
+        self._pool: "PluginWorkerPool | None" = None
 
     @property
     def policy(self) -> SandboxPolicy:
@@ -343,6 +412,26 @@ class PluginSandbox:
             policy: The new policy to use.
         """
         self._policy = policy
+        if self._pool is not None:
+            self._pool.set_policy(policy)
+
+    def _get_pool(self) -> "PluginWorkerPool":
+        if self._pool is None:
+            from kintsugi.plugins.worker_pool import PluginWorkerPool
+
+            self._pool = PluginWorkerPool(
+                self._policy,
+                size=self._workers,
+                max_calls_per_worker=self._max_calls_per_worker,
+                max_concurrent_per_plugin=self._max_concurrent_per_plugin,
+            )
+        return self._pool
+
+    async def close(self) -> None:
+        """Stop the worker processes."""
+        if self._pool is not None:
+            await self._pool.close()
+            self._pool = None
 
     def validate_plugin(self, plugin: LoadedPlugin) -> list[SandboxViolation]:
         """Validate a plugin against the sandbox policy.
@@ -509,8 +598,13 @@ class PluginSandbox:
     ) -> SandboxExecutionResult:
         """Execute a plugin method in the sandbox.
 
-        Runs the specified method with resource limits and
-        access controls in place.
+        Runs the specified method in a worker process that enforces the
+        policy's resource limits and import restrictions. The worker's
+        instance gets the host instance's configure()/initialize()
+        state. A plugin whose class a worker cannot import from a source
+        file fails with a "not_isolated" violation, unless the policy
+        sets ``allow_unisolated``; then it runs in-process with only the
+        timeout applied and the result carries a "not_isolated" warning.
 
         Args:
             plugin: The plugin to execute.
@@ -522,7 +616,6 @@ class PluginSandbox:
             SandboxExecutionResult with the outcome.
         """
         self._execution_count += 1
-        violations: list[SandboxViolation] = []
 
         if plugin.instance is None:
             return SandboxExecutionResult(
@@ -536,12 +629,52 @@ class PluginSandbox:
                 error=f"Method '{method}' not found on plugin",
             )
 
-        # Set up resource limits
-        old_limits = self._set_resource_limits()
+        pool = self._get_pool()
+        problem = pool.isolation_problem(plugin)
+        if problem is not None and self._policy.allow_unisolated:
+            result = await self._execute_inline(problem, plugin, method, *args, **kwargs)
+        else:
+            result = await pool.call(plugin, method, *args, **kwargs)
+
+        # Record violations
+        self._total_violations.extend(result.violations)
+
+        return result
 
-        # Install restricted importer
-        self._restricted_importer = RestrictedImporter(self._policy)
-        sys.meta_path.insert(0, self._restricted_importer)
+    async def _execute_inline(
+        self,
+        reason: str,
+        plugin: LoadedPlugin,
+        method: str,
+        *args: Any,
+        **kwargs: Any,
+    ) -> SandboxExecutionResult:
+        """Run a plugin method in this process with only a timeout.
+
+        Only used when the policy sets ``allow_unisolated``.
+
+        Args:
+            reason: Why the plugin cannot run in a worker process.
+            plugin: The plugin to execute.
+            method: The method name to call.
+            *args: Positional arguments for the method.
+            **kwargs: Keyword arguments for the method.
+
+        Returns:
+            SandboxExecutionResult with the outcome.
+        """
+        logger.warning(
+            f"Plugin {plugin.metadata.name} cannot run in a worker process "
+            f"({reason}); executing in-process without resource limits"
+        )
+        violations = [SandboxViolation(
+            violation_type="not_isolated",
+            message=(
+                f"Executed in-process without resource limits or import "
+                f"restrictions: {reason}"
+            ),
+            severity="warning",
+        )]
 
         start_time = asyncio.get_event_loop().time()
         result = None
@@ -585,21 +718,8 @@ class PluginSandbox:
             error = f"Execution failed: {str(e)}"
             logger.debug(traceback.format_exc())
 
-        finally:
-            # Remove restricted importer
-            if self._restricted_importer in sys.meta_path:
-                sys.meta_path.remove(self._restricted_importer)
-            violations.extend(self._restricted_importer.violations)
-            self._restricted_importer = None
-
-            # Restore resource limits
-            self._restore_resource_limits(old_limits)
-
         execution_time = (asyncio.get_event_loop().time() - start_time) * 1000
 
-        # Record violations
-        self._total_violations.extend(violations)
-
         return SandboxExecutionResult(
             success=error is None,
             result=result,
@@ -608,55 +728,6 @@ class PluginSandbox:
             violations=violations,
         )
 
-    def _set_resource_limits(self) -> dict[str, Any]:
-        """Set resource limits for sandbox execution.
-
-        Returns:
-            Dictionary of old limits to restore later.
-        """
-        old_limits = {}
-
-        try:
-            # Set memory limit
-            memory_bytes = self._policy.max_memory_mb * 1024 * 1024
-            old_limits['memory'] = resource.getrlimit(resource.RLIMIT_AS)
-            resource.setrlimit(
-                resource.RLIMIT_AS,
-                (memory_bytes, memory_bytes)
-            )
-        except (ValueError, resource.error):
-            pass
-
-        try:
-            # Set CPU time limit
-            old_limits['cpu'] = resource.getrlimit(resource.RLIMIT_CPU)
-            resource.setrlimit(
-                resource.RLIMIT_CPU,
-                (self._policy.max_cpu_seconds, self._policy.max_cpu_seconds)
-            )
-        except (ValueError, resource.error):
-            pass
-
-        return old_limits
-
-    def _restore_resource_limits(self, old_limits: dict[str, Any]) -> None:
-        """Restore previous resource limits.
-
-        Args:
-            old_limits: Dictionary of limits to restore.
-        """
-        try:
-            if 'memory' in old_limits:
-                resource.setrlimit(resource.RLIMIT_AS, old_limits['memory'])
-        except (ValueError, resource.error):
-            pass
-
-        try:
-            if 'cpu' in old_limits:
-                resource.setrlimit(resource.RLIMIT_CPU, old_limits['cpu'])
-        except (ValueError, resource.error):
-            pass
-
     def get_execution_stats(self) -> dict[str, Any]:
         """Get sandbox execution statistics.
 
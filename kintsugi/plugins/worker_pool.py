@@ -0,0 +1,383 @@
+"""
+Process pool for sandboxed plugin calls.
+
+PluginSandbox used to enforce its policy by calling ``setrlimit`` on the
+API server itself and pushing a RestrictedImporter onto the global
+``sys.meta_path`` around every plugin call, which throttled (or killed)
+every other request in the process.  PluginWorkerPool instead runs plugin
+methods in long-lived worker processes (see :mod:`kintsugi.plugins._worker`)
+that apply the policy to themselves:
+
+    - Calls are dispatched asynchronously to the next idle worker; each
+      plugin may hold at most ``max_concurrent_per_plugin`` workers at once.
+    - Arguments and results cross the pipe as pickle protocol 5 frames with
+      out-of-band buffers (see :mod:`kintsugi.plugins._wire`).  Results
+      must be plain data: the host never unpickles plugin-defined objects,
+      and a reply that references any other class or callable becomes an
+      "unsafe_result" error.
+    - Wall-clock timeouts kill the worker; workers are also replaced after
+      ``max_calls_per_worker`` calls, after a CPU or memory limit was hit,
+      and when the policy changes.
+
+Example:
+    pool = PluginWorkerPool(SandboxPolicy(max_memory_mb=128), size=4)
+    result = await pool.call(plugin, "handle", request)
+    await pool.close()
+"""
+
+from pathlib import Path
+from typing import Any
+import asyncio
+import logging
+import os
+import pickle
+import sys
+import time
+
+from kintsugi.plugins._wire import (
+    HEADER_SIZE,
+    LENGTH_SIZE,
+    PluginSpec,
+    decode_reply,
+    encode,
+    parse_header,
+    parse_lengths,
+)
+from kintsugi.plugins.loader import LoadedPlugin
+from kintsugi.plugins.sandbox import (
+    SandboxExecutionResult,
+    SandboxPolicy,
+    SandboxViolation,
+)
+from kintsugi.plugins.sdk import PluginConfig
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_POOL_SIZE = 4
+DEFAULT_MAX_CALLS_PER_WORKER = 500
+DEFAULT_MAX_CONCURRENT_PER_PLUGIN = 2
+
+# Directory containing the kintsugi package, for the workers' sys.path.
+_PACKAGE_ROOT = str(Path(__file__).resolve().parents[2])
+
+
+def plugin_spec(plugin: LoadedPlugin) -> PluginSpec | None:
+    """Describe how a worker can import and instantiate *plugin*.
+
+    Returns None when the plugin does not come from an importable source
+    file (for example a class defined inside a function).
+    """
+    module = plugin.module
+    plugin_class = plugin.plugin_class or type(plugin.instance)
+    module_name = getattr(module, "__name__", None)
+    module_file = getattr(module, "__file__", None)
+    qualname = getattr(plugin_class, "__qualname__", "")
+    if not isinstance(module_name, str) or not isinstance(module_file, str):
+        return None
+    if getattr(plugin_class, "__module__", None) != module_name or "<" in qualname:
+        return None
+    return (module_name, module_file, qualname)
+
+
+class _WorkerProcess:
+    """One worker process and the policy generation it was started with."""
+
+    def __init__(self) -> None:
+        self.proc: asyncio.subprocess.Process | None = None
+        self.generation = -1
+        self.calls = 0
+
+    @property
+    def alive(self) -> bool:
+        return self.proc is not None and self.proc.returncode is None
+
+    async def start(self, policy: SandboxPolicy, generation: int) -> None:
+        env = dict(os.environ)
+        env["PYTHONPATH"] = os.pathsep.join(
+            p for p in (_PACKAGE_ROOT, env.get("PYTHONPATH")) if p
+        )
+        self.proc = await asyncio.create_subprocess_exec(
+            sys.executable, "-m", "kintsugi.plugins._worker",
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            env=env,
+        )
+        self.generation = generation
+        self.calls = 0
+        await self.send({"policy": policy})
+
+    async def send(self, message: Any) -> None:
+        assert self.proc is not None and self.proc.stdin is not None
+        self.proc.stdin.writelines(encode(message))
+        await self.proc.stdin.drain()
+
+    async def receive(self) -> tuple[list[bytes], int]:
+        """Read the frames of one reply; decoding is up to the caller."""
+        assert self.proc is not None and self.proc.stdout is not None
+        reader = self.proc.stdout
+        try:
+            count, out_of_band = parse_header(await reader.readexactly(HEADER_SIZE))
+            lengths = parse_lengths(await reader.readexactly(LENGTH_SIZE * count))
+            frames = [await reader.readexactly(n) for n in lengths]
+        except asyncio.IncompleteReadError as e:
+            raise ConnectionError("plugin worker exited") from e
+        return frames, out_of_band
+
+    async def stop(self) -> None:
+        if self.alive:
+            assert self.proc is not None
+            self.proc.kill()
+            await self.proc.wait()
+        self.proc = None
+
+
+class PluginWorkerPool:
+    """Pool of worker processes that run plugin methods under a policy.
+
+    Attributes:
+        size: Number of worker processes (concurrent calls overall).
+        max_calls_per_worker: Calls after which a worker is replaced.
+        max_concurrent_per_plugin: Default cap on concurrent calls into
+            one plugin.
+        plugin_limits: Per-plugin overrides of that cap, by plugin name.
+    """
+
+    def __init__(
+        self,
+        policy: SandboxPolicy | None = None,
+        size: int = DEFAULT_POOL_SIZE,
+        max_calls_per_worker: int = DEFAULT_MAX_CALLS_PER_WORKER,
+        max_concurrent_per_plugin: int = DEFAULT_MAX_CONCURRENT_PER_PLUGIN,
+        plugin_limits: dict[str, int] | None = None,
+    ):
+        """Initialize the pool; workers start on first use.
+
+        Args:
+            policy: Policy the workers enforce. Defaults to SandboxPolicy().
+            size: Number of worker processes.
+            max_calls_per_worker: Recycle a worker after this many calls.
+            max_concurrent_per_plugin: Concurrent calls allowed per plugin.
+            plugin_limits: Per-plugin concurrency caps overriding the default.
+        """
+        if size < 1:
+            raise ValueError("size must be >= 1")
+        self._policy = policy or SandboxPolicy()
+        self._generation = 0
+        self.size = size
+        self.max_calls_per_worker = max_calls_per_worker
+        self.max_concurrent_per_plugin = max_concurrent_per_plugin
+        self.plugin_limits = dict(plugin_limits or {})
+        self._workers: list[_WorkerProcess] = []
+        self._idle: asyncio.Queue[_WorkerProcess] | None = None
+        self._plugin_slots: dict[str, asyncio.Semaphore] = {}
+
+    @property
+    def policy(self) -> SandboxPolicy:
+        """Get the policy new calls run under."""
+        return self._policy
+
+    def set_policy(self, policy: SandboxPolicy) -> None:
+        """Switch policy; each worker is restarted before its next call.
+
+        Args:
+            policy: The new policy to enforce.
+        """
+        self._policy = policy
+        self._generation += 1
+
+    @staticmethod
+    def _lifecycle(plugin: LoadedPlugin) -> dict[str, Any]:
+        """What a worker replays so its instance matches the host's.
+
+        The host instance's PluginConfig (if it was configured) and
+        whether it was initialized.  Nothing else about the host instance
+        is inspected or carried over; plugin code never runs in the host.
+        """
+        instance = plugin.instance
+        config = getattr(instance, "config", None)
+        return {
+            "config": config if isinstance(config, PluginConfig) else None,
+            "initialized": getattr(instance, "is_initialized", False) is True,
+        }
+
+    def isolation_problem(self, plugin: LoadedPlugin) -> str | None:
+        """Explain why *plugin* cannot run in a worker, or return None.
+
+        Args:
+            plugin: The plugin to check.
+
+        Returns:
+            A reason string, or None if call() can run the plugin.
+        """
+        if plugin_spec(plugin) is None:
+            return "plugin cannot be imported from a source file"
+        return None
+
+    def _slots(self, plugin_name: str) -> asyncio.Semaphore:
+        slots = self._plugin_slots.get(plugin_name)
+        if slots is None:
+            limit = self.plugin_limits.get(plugin_name, self.max_concurrent_per_plugin)
+            slots = self._plugin_slots[plugin_name] = asyncio.Semaphore(max(1, limit))
+        return slots
+
+    async def call(
+        self,
+        plugin: LoadedPlugin,
+        method: str,
+        *args: Any,
+        **kwargs: Any,
+    ) -> SandboxExecutionResult:
+        """Run ``plugin.<method>(*args, **kwargs)`` in a worker process.
+
+        The worker imports the plugin's module and instantiates its class
+        itself, the same way PluginLoader does, then replays configure()
+        with the host instance's PluginConfig and initialize() if the host
+        instance was initialized.  Other state set on the host instance is
+        not carried over.  Plugins a worker cannot import are refused with
+        a "not_isolated" violation; see :meth:`isolation_problem`.
+
+        Args:
+            plugin: The plugin to call; see :func:`plugin_spec`.
+            method: The method name to call.
+            *args: Positional arguments for the method.
+            **kwargs: Keyword arguments for the method.
+
+        Returns:
+            SandboxExecutionResult with the outcome.
+        """
+        problem = self.isolation_problem(plugin)
+        if problem is not None:
+            error = f"Plugin cannot run in a worker process: {problem}"
+            return SandboxExecutionResult(
+                success=False,
+                error=error,
+                violations=[SandboxViolation(
+                    violation_type="not_isolated",
+                    message=error,
+                    severity="error",
+                )],
+            )
+        try:
+            message = encode({
+                "plugin": plugin_spec(plugin),
+                "lifecycle": self._lifecycle(plugin),
+                "method": method,
+                "args": args,
+                "kwargs": kwargs,
+            })
+        except Exception as e:
+            return SandboxExecutionResult(
+                success=False,
+                error=f"Arguments could not be sent to worker: {e}",
+            )
+
+        if self._idle is None:
+            self._idle = asyncio.Queue()
+            self._workers = [_WorkerProcess() for _ in range(self.size)]
+            for worker in self._workers:
+                self._idle.put_nowait(worker)
+
+        async with self._slots(plugin.metadata.name):
+            worker = await self._idle.get()
+            try:
+                return await self._run(worker, message)
+            finally:
+                self._idle.put_nowait(worker)
+
+    async def _run(
+        self, worker: _WorkerProcess, message: list[Any],
+    ) -> SandboxExecutionResult:
+        policy = self._policy
+        start = time.monotonic()
+        try:
+            if worker.generation != self._generation or (
+                worker.calls >= self.max_calls_per_worker
+            ):
+                await worker.stop()
+            if not worker.alive:
+                await worker.start(policy, self._generation)
+            worker.calls += 1
+            assert worker.proc is not None and worker.proc.stdin is not None
+            worker.proc.stdin.writelines(message)
+            await worker.proc.stdin.drain()
+            frames, out_of_band = await asyncio.wait_for(
+                worker.receive(), timeout=policy.max_execution_time,
+            )
+        except asyncio.TimeoutError:
+            await worker.stop()
+            error = f"Execution timed out after {policy.max_execution_time}s"
+            return SandboxExecutionResult(
+                success=False,
+                error=error,
+                execution_time_ms=(time.monotonic() - start) * 1000,
+                violations=[SandboxViolation(
+                    violation_type="timeout",
+                    message=error,
+                    severity="error",
+                )],
+            )
+        except (ConnectionError, OSError) as e:
+            logger.warning(f"Plugin worker failed: {e}")
+            await worker.stop()
+            error = f"Plugin worker exited during execution: {e}"
+            return SandboxExecutionResult(
+                success=False,
+                error=error,
+                execution_time_ms=(time.monotonic() - start) * 1000,
+                violations=[SandboxViolation(
+                    violation_type="worker_crash",
+                    message=error,
+                    severity="error",
+                )],
+            )
+        except BaseException:
+            # Cancelled mid-call: the reply stream is out of step.
+            await worker.stop()
+            raise
+
+        try:
+            reply = decode_reply(frames, out_of_band)
+        except pickle.UnpicklingError as e:
+            error = f"Plugin returned a value that is not plain data: {e}"
+            return SandboxExecutionResult(
+                success=False,
+                error=error,
+                execution_time_ms=(time.monotonic() - start) * 1000,
+                violations=[SandboxViolation(
+                    violation_type="unsafe_result",
+                    message=error,
+                    severity="error",
+                )],
+            )
+
+        if reply["recycle"]:
+            await worker.stop()
+        if reply.get("traceback"):
+            logger.debug(reply["traceback"])
+        violations = [SandboxViolation.from_dict(v) for v in reply["violations"]]
+        if reply["violation"]:
+            violations.append(SandboxViolation(
+                violation_type=reply["violation"],
+                message=reply["error"],
+                severity="error",
+            ))
+        return SandboxExecutionResult(
+            success=reply["error"] is None,
+            result=reply["result"],
+            error=reply["error"],
+            execution_time_ms=(time.monotonic() - start) * 1000,
+            memory_used_mb=reply["memory_used_mb"],
+            violations=violations,
+        )
+
+    async def close(self) -> None:
+        """Stop every worker process."""
+        for worker in self._workers:
+            await worker.stop()
+        self._workers = []
+        self._idle = None
+        self._plugin_slots = {}
+
+    def __repr__(self) -> str:
+        alive = sum(1 for w in self._workers if w.alive)
+        return f"<PluginWorkerPool size={self.size} alive={alive}>"
@@ -18,6 +18,7 @@ from kintsugi.security.invariants import (
     InvariantResult,
 )
 from kintsugi.security.monitor import (
+    PatternProfile,
     SecurityMonitor,
     SecurityVerdict,
     Severity,
@@ -25,8 +26,10 @@ from kintsugi.security.monitor import (
 )
 from kintsugi.security.pii import (
     PIIDetection,
+    PIIEngine,
     PIIRedactor,
     RedactionResult,
+    StreamingRedactor,
     pii_redaction_middleware,
 )
 from kintsugi.security.sandbox import (
@@ -34,6 +37,12 @@ from kintsugi.security.sandbox import (
     SandboxResult,
     ShadowSandbox,
 )
+from kintsugi.security.sandbox_pool import SandboxPool
+from kintsugi.security.scan_cache import (
+    ScanCache,
+    ScanCacheStats,
+    get_scan_cache,
+)
 from kintsugi.security.skill_provenance import (
     ProvenanceConfig,
     ProvenanceRecord,
@@ -52,6 +61,11 @@ from kintsugi.security.shield import (
     ShieldDecision,
     ShieldVerdict,
 )
+from kintsugi.security.shield_state import (
+    InProcessShieldState,
+    RedisShieldState,
+    ShieldState,
+)
 
 __all__ = [
     # intent_capsule
@@ -71,7 +85,11 @@ __all__ = [
     "ShieldConfig",
     "ShieldDecision",
     "ShieldVerdict",
+    "InProcessShieldState",
+    "RedisShieldState",
+    "ShieldState",
     # monitor
+    "PatternProfile",
     "SecurityMonitor",
     "SecurityVerdict",
     "Severity",
@@ -80,11 +98,18 @@ __all__ = [
     "SandboxContext",
     "SandboxResult",
     "ShadowSandbox",
+    "SandboxPool",
     # pii
     "PIIDetection",
+    "PIIEngine",
     "PIIRedactor",
     "RedactionResult",
+    "StreamingRedactor",
     "pii_redaction_middleware",
+    # scan cache
+    "ScanCache",
+    "ScanCacheStats",
+    "get_scan_cache",
     # invariants
     "InvariantChecker",
     "InvariantContext",
@@ -0,0 +1,186 @@
+"""Warm interpreter for :class:`kintsugi.security.sandbox_pool.SandboxPool`.
+
+Run as ``python3 _sandbox_worker.py WORKDIR``.  Reads one JSON job per
+line on stdin (``{"code": ..., "max_output": ...}``) and, for each, forks
+a child that runs the code as ``WORKDIR/script.py`` in its own session.
+Interpreter startup is paid once; every job still gets a fresh process,
+and WORKDIR is emptied before each job.
+
+Replies on stdout, one JSON line each: ``{"pid": ...}`` once the child is
+running (the host kills its process group on timeout), then
+``{"stdout", "stderr", "exit_code", "truncated"}`` when it has exited.
+
+Only the standard library may be imported here.
+"""
+
+import json
+import os
+import select
+import shutil
+import signal
+import sys
+import traceback
+
+_READ_SIZE = 65536
+
+
+def _reset(workdir):
+    for name in os.listdir(workdir):
+        path = os.path.join(workdir, name)
+        if os.path.isdir(path) and not os.path.islink(path):
+            shutil.rmtree(path, ignore_errors=True)
+        else:
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+
+
+def _run_child(workdir, script, out_w, err_w, proto_fds):
+    """In the forked child: become the script and never return."""
+    code = 1
+    try:
+        os.setsid()
+        for fd in proto_fds:
+            os.close(fd)
+        devnull = os.open(os.devnull, os.O_RDONLY)
+        os.dup2(devnull, 0)
+        os.dup2(out_w, 1)
+        os.dup2(err_w, 2)
+        for fd in (devnull, out_w, err_w):
+            if fd > 2:
+                os.close(fd)
+        sys.stdin = open(0, "r", closefd=False)
+        sys.stdout = open(1, "w", buffering=1, closefd=False)
+        sys.stderr = open(2, "w", buffering=1, closefd=False)
+        signal.signal(signal.SIGPIPE, signal.SIG_DFL)
+        os.chdir(workdir)
+        sys.argv = [script]
+        sys.path[0] = workdir
+
+        with open(script, encoding="utf-8") as fh:
+            source = fh.read()
+        globs = {"__name__": "__main__", "__file__": script, "__builtins__": __builtins__}
+        try:
+            exec(compile(source, script, "exec"), globs)
+            code = 0
+        except SystemExit as exc:
+            if exc.code is None:
+                code = 0
+            elif isinstance(exc.code, int):
+                code = exc.code
+            else:
+                print(exc.code, file=sys.stderr)
+                code = 1
+        except SyntaxError as exc:
+            traceback.print_exception(type(exc), exc, None)
+        except BaseException as exc:  # noqa: BLE001 - report like the interpreter
+            # Skip this frame so the traceback starts in the script.
+            traceback.print_exception(type(exc), exc, exc.__traceback__.tb_next)
+    finally:
+        try:
+            sys.stdout.flush()
+            sys.stderr.flush()
+        except Exception:  # noqa: BLE001
+            pass
+        os._exit(code & 0xFF)
+
+
+def _collect(pid, out_r, err_r, max_output):
+    """Read both pipes (keeping *max_output* bytes of each) until the child exits."""
+    buffers = {out_r: bytearray(), err_r: bytearray()}
+    truncated = False
+    open_fds = [out_r, err_r]
+    pidfd = os.pidfd_open(pid) if hasattr(os, "pidfd_open") else None
+    status = None
+    while status is None:
+        watch = open_fds + ([pidfd] if pidfd is not None else [])
+        ready, _, _ = select.select(watch, [], [], None if pidfd is not None else 0.01)
+        for fd in ready:
+            if fd == pidfd:
+                continue
+            chunk = os.read(fd, _READ_SIZE)
+            if not chunk:
+                open_fds.remove(fd)
+                continue
+            room = max_output - len(buffers[fd])
+            if len(chunk) > room:
+                truncated = True
+            if room > 0:
+                buffers[fd] += chunk[:room]
+        done, wait_status = os.waitpid(pid, os.WNOHANG)
+        if done:
+            status = wait_status
+    if pidfd is not None:
+        os.close(pidfd)
+
+    # Anything the script left running in its session goes with it.
+    try:
+        os.killpg(pid, signal.SIGKILL)
+    except OSError:
+        pass
+    while open_fds:
+        ready, _, _ = select.select(open_fds, [], [], 0.1)
+        if not ready:
+            break
+        for fd in ready:
+            chunk = os.read(fd, _READ_SIZE)
+            if not chunk:
+                open_fds.remove(fd)
+                continue
+            room = max_output - len(buffers[fd])
+            if len(chunk) > room:
+                truncated = True
+            if room > 0:
+                buffers[fd] += chunk[:room]
+    os.close(out_r)
+    os.close(err_r)
+    return (
+        buffers[out_r].decode("utf-8", "replace"),
+        buffers[err_r].decode("utf-8", "replace"),
+        os.waitstatus_to_exitcode(status),
+        truncated,
+    )
+
+
+def main():
+    workdir = sys.argv[1]
+    # Keep the protocol off fds 0/1 so jobs cannot write into it.
+    proto_in = os.fdopen(os.dup(0), "rb")
+    proto_out = os.fdopen(os.dup(1), "wb")
+    devnull = os.open(os.devnull, os.O_RDWR)
+    os.dup2(devnull, 0)
+    os.dup2(devnull, 1)
+    os.close(devnull)
+    proto_fds = (proto_in.fileno(), proto_out.fileno())
+
+    def reply(message):
+        proto_out.write(json.dumps(message).encode("utf-8") + b"\n")
+        proto_out.flush()
+
+    for line in proto_in:
+        job = json.loads(line)
+        _reset(workdir)
+        script = os.path.join(workdir, "script.py")
+        with open(script, "w", encoding="utf-8") as fh:
+            fh.write(job["code"])
+
+        out_r, out_w = os.pipe()
+        err_r, err_w = os.pipe()
+        sys.stdout.flush()
+        sys.stderr.flush()
+        pid = os.fork()
+        if pid == 0:
+            os.close(out_r)
+            os.close(err_r)
+            _run_child(workdir, script, out_w, err_w, proto_fds)
+        os.close(out_w)
+        os.close(err_w)
+        reply({"pid": pid})
+        stdout, stderr, exit_code, truncated = _collect(pid, out_r, err_r, job["max_output"])
+        reply({"stdout": stdout, "stderr": stderr, "exit_code": exit_code,
+               "truncated": truncated})
+
+
+if __name__ == "__main__":
+    main()
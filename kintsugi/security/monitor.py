@@ -3,14 +3,31 @@
 Scans shell commands and free text for dangerous patterns, injection attempts,
 and PII leakage indicators.  Patterns are compiled once and matched in O(n)
 per input string.
+
+Each scan checks patterns in severity order (CRITICAL first) and stops at
+the first match, which is the same verdict as scanning everything and
+keeping the most severe, earliest-registered hit.  Patterns can carry
+*literals*, substrings one of which every match must contain; for ASCII
+input a pattern whose literals are all absent is skipped without running
+its regex.  (A single combined alternation was measured and is slower
+than separate searches with CPython's ``re``, which loses its literal
+prefix optimisations on alternations.)
+
+With a :class:`~kintsugi.security.scan_cache.ScanCache`, verdicts for
+repeated inputs are served from the cache; entries are keyed by the
+pattern-library version, so :meth:`SecurityMonitor.add_pattern` retires
+them.
 """
 
 from __future__ import annotations
 
 import re
+import time
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import List, Optional
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from kintsugi.security.scan_cache import MISS, ScanCache, library_version
 
 
 # ---------------------------------------------------------------------------
@@ -50,6 +67,7 @@ class _Pattern:
     severity: Severity
     description: str
     verdict: Verdict
+    literals: Tuple[str, ...] = ()  # one of these is in every match; () = always check
 
 
 def _compile(pattern: str, flags: int = re.IGNORECASE) -> re.Pattern[str]:
@@ -57,29 +75,29 @@ def _compile(pattern: str, flags: int = re.IGNORECASE) -> re.Pattern[str]:
 
 
 _DANGEROUS_SHELL: List[_Pattern] = [
-    _Pattern(_compile(r"\brm\s+(-\w*)?r\w*\s+/\s*$|rm\s+-rf\s+/"), Severity.CRITICAL, "Recursive delete of root filesystem", Verdict.BLOCK),
-    _Pattern(_compile(r"\bchmod\s+777\b"), Severity.HIGH, "World-writable permission change", Verdict.BLOCK),
-    _Pattern(_compile(r"\bcurl\b.*\|\s*\bbash\b"), Severity.CRITICAL, "Piping remote content to shell", Verdict.BLOCK),
-    _Pattern(_compile(r"\bwget\b.*\|\s*\bsh\b"), Severity.CRITICAL, "Piping remote content to shell", Verdict.BLOCK),
-    _Pattern(_compile(r"\bdd\s+if=/dev/"), Severity.HIGH, "Raw device read via dd", Verdict.BLOCK),
-    _Pattern(_compile(r"\bmkfs\b"), Severity.CRITICAL, "Filesystem format command", Verdict.BLOCK),
-    _Pattern(_compile(r">\s*/dev/sd[a-z]"), Severity.CRITICAL, "Direct write to block device", Verdict.BLOCK),
-    _Pattern(_compile(r"\b:(){ :\|:& };:"), Severity.CRITICAL, "Fork bomb", Verdict.BLOCK),
-    _Pattern(_compile(r"\bshutdown\b|\breboot\b|\binit\s+0\b"), Severity.HIGH, "System shutdown/reboot command", Verdict.BLOCK),
-    _Pattern(_compile(r"\bsudo\s+rm\b"), Severity.HIGH, "Privileged file deletion", Verdict.WARN),
+    _Pattern(_compile(r"\brm\s+(-\w*)?r\w*\s+/\s*$|rm\s+-rf\s+/"), Severity.CRITICAL, "Recursive delete of root filesystem", Verdict.BLOCK, ("rm",)),
+    _Pattern(_compile(r"\bchmod\s+777\b"), Severity.HIGH, "World-writable permission change", Verdict.BLOCK, ("chmod",)),
+    _Pattern(_compile(r"\bcurl\b.*\|\s*\bbash\b"), Severity.CRITICAL, "Piping remote content to shell", Verdict.BLOCK, ("curl",)),
+    _Pattern(_compile(r"\bwget\b.*\|\s*\bsh\b"), Severity.CRITICAL, "Piping remote content to shell", Verdict.BLOCK, ("wget",)),
+    _Pattern(_compile(r"\bdd\s+if=/dev/"), Severity.HIGH, "Raw device read via dd", Verdict.BLOCK, ("if=/dev/",)),
+    _Pattern(_compile(r"\bmkfs\b"), Severity.CRITICAL, "Filesystem format command", Verdict.BLOCK, ("mkfs",)),
+    _Pattern(_compile(r">\s*/dev/sd[a-z]"), Severity.CRITICAL, "Direct write to block device", Verdict.BLOCK, ("/dev/sd",)),
+    _Pattern(_compile(r"\b:(){ :\|:& };:"), Severity.CRITICAL, "Fork bomb", Verdict.BLOCK, ("|:&",)),
+    _Pattern(_compile(r"\bshutdown\b|\breboot\b|\binit\s+0\b"), Severity.HIGH, "System shutdown/reboot command", Verdict.BLOCK, ("shutdown", "reboot", "init")),
+    _Pattern(_compile(r"\bsudo\s+rm\b"), Severity.HIGH, "Privileged file deletion", Verdict.WARN, ("sudo",)),
 ]
 
 _SQL_INJECTION: List[_Pattern] = [
-    _Pattern(_compile(r"('\s*(OR|AND)\s+'[^']*'\s*=\s*'[^']*')"), Severity.HIGH, "Classic SQL injection tautology", Verdict.BLOCK),
-    _Pattern(_compile(r";\s*(DROP|DELETE|UPDATE|INSERT|ALTER)\s+", re.IGNORECASE), Severity.HIGH, "SQL statement injection via semicolon", Verdict.BLOCK),
-    _Pattern(_compile(r"UNION\s+(ALL\s+)?SELECT", re.IGNORECASE), Severity.HIGH, "UNION SELECT injection", Verdict.BLOCK),
-    _Pattern(_compile(r"--\s*$", re.MULTILINE), Severity.MEDIUM, "SQL comment termination", Verdict.WARN),
+    _Pattern(_compile(r"('\s*(OR|AND)\s+'[^']*'\s*=\s*'[^']*')"), Severity.HIGH, "Classic SQL injection tautology", Verdict.BLOCK, ("=",)),
+    _Pattern(_compile(r";\s*(DROP|DELETE|UPDATE|INSERT|ALTER)\s+", re.IGNORECASE), Severity.HIGH, "SQL statement injection via semicolon", Verdict.BLOCK, (";",)),
+    _Pattern(_compile(r"UNION\s+(ALL\s+)?SELECT", re.IGNORECASE), Severity.HIGH, "UNION SELECT injection", Verdict.BLOCK, ("union",)),
+    _Pattern(_compile(r"--\s*$", re.MULTILINE), Severity.MEDIUM, "SQL comment termination", Verdict.WARN, ("--",)),
 ]
 
 _PATH_TRAVERSAL: List[_Pattern] = [
-    _Pattern(_compile(r"\.\./\.\./"), Severity.HIGH, "Path traversal (double dot-dot-slash)", Verdict.BLOCK),
-    _Pattern(_compile(r"%2e%2e[/\\%]", re.IGNORECASE), Severity.HIGH, "URL-encoded path traversal", Verdict.BLOCK),
-    _Pattern(_compile(r"\.\.[/\\]"), Severity.MEDIUM, "Simple path traversal", Verdict.WARN),
+    _Pattern(_compile(r"\.\./\.\./"), Severity.HIGH, "Path traversal (double dot-dot-slash)", Verdict.BLOCK, ("../../",)),
+    _Pattern(_compile(r"%2e%2e[/\\%]", re.IGNORECASE), Severity.HIGH, "URL-encoded path traversal", Verdict.BLOCK, ("%2e%2e",)),
+    _Pattern(_compile(r"\.\.[/\\]"), Severity.MEDIUM, "Simple path traversal", Verdict.WARN, ("..",)),
 ]
 
 _TEXT_PATTERNS: List[_Pattern] = [
@@ -88,6 +106,35 @@ _TEXT_PATTERNS: List[_Pattern] = [
 ]
 
 
+_ALLOW = SecurityVerdict(verdict=Verdict.ALLOW, reason="No dangerous patterns detected.")
+
+
+# ---------------------------------------------------------------------------
+# Profiling
+# ---------------------------------------------------------------------------
+
+@dataclass
+class PatternProfile:
+    """Per-pattern counters collected when profiling is enabled.
+
+    ``checks`` counts regex evaluations, ``skipped`` the scans where the
+    literal prefilter ruled the pattern out, and ``hits`` the evaluations
+    that matched.
+    """
+
+    description: str
+    severity: Severity
+    target: str
+    checks: int = 0
+    skipped: int = 0
+    hits: int = 0
+    seconds: float = 0.0
+
+    @property
+    def mean_us(self) -> float:
+        return self.seconds / self.checks * 1e6 if self.checks else 0.0
+
+
 # ---------------------------------------------------------------------------
 # SecurityMonitor
 # ---------------------------------------------------------------------------
@@ -97,11 +144,23 @@ class SecurityMonitor:
 
     Maintains a library of compiled regex patterns and checks commands or
     free text against them, returning the most severe match.
+
+    Args:
+        profile: Record per-pattern check counts, hits and regex time
+            (see :meth:`pattern_profile`).  Off by default; it adds a
+            clock read around every regex evaluation.
+        cache: Optional verdict cache, usually the shared one from
+            :func:`~kintsugi.security.scan_cache.get_scan_cache`.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, profile: bool = False, cache: Optional[ScanCache] = None) -> None:
         self._command_patterns: List[_Pattern] = list(_DANGEROUS_SHELL)
         self._text_patterns: List[_Pattern] = list(_TEXT_PATTERNS)
+        self._ordered: Dict[str, List[Tuple[_Pattern, Tuple[str, ...], bool, int]]] = {}
+        self._profiling = profile
+        self._profiles: Dict[int, PatternProfile] = {}
+        self._cache = cache
+        self._version: Optional[str] = None
 
     # -- public API ---------------------------------------------------------
 
@@ -111,11 +170,11 @@ class SecurityMonitor:
         Returns the verdict for the highest-severity match, or ALLOW if
         no patterns trigger.
         """
-        return self._scan(cmd, self._command_patterns)
+        return self._scan(cmd, "command")
 
     def check_text(self, text: str) -> SecurityVerdict:
         """Scan free text for injection attempts, traversal, etc."""
-        return self._scan(text, self._text_patterns)
+        return self._scan(text, "text")
 
     def add_pattern(
         self,
@@ -125,6 +184,7 @@ class SecurityMonitor:
         *,
         target: str = "command",
         verdict: str = "BLOCK",
+        literals: Sequence[str] = (),
     ) -> None:
         """Register a custom pattern at runtime.
 
@@ -134,36 +194,123 @@ class SecurityMonitor:
             description: Human-readable explanation.
             target:      'command' or 'text'.
             verdict:     'ALLOW', 'WARN', or 'BLOCK'.
+            literals:    Optional substrings, one of which every match
+                         contains (compared case-insensitively); lets
+                         scans skip the regex when none is present.
         """
         entry = _Pattern(
             regex=_compile(pattern),
             severity=Severity(severity.upper()),
             description=description,
             verdict=Verdict(verdict.upper()),
+            literals=tuple(lit.lower() for lit in literals),
         )
         if target == "text":
             self._text_patterns.append(entry)
         else:
             self._command_patterns.append(entry)
+        self._ordered.clear()
+        self._version = None
+
+    @property
+    def library_version(self) -> str:
+        """Fingerprint of the registered patterns; changes on :meth:`add_pattern`."""
+        if self._version is None:
+            self._version = library_version(*(
+                [(p.regex.pattern, p.regex.flags, p.severity.value, p.description,
+                  p.verdict.value) for p in patterns]
+                for patterns in (self._command_patterns, self._text_patterns)
+            ))
+        return self._version
+
+    def pattern_profile(self) -> List[PatternProfile]:
+        """Profiling counters, most total regex time first."""
+        return sorted(self._profiles.values(), key=lambda p: p.seconds, reverse=True)
 
     # -- internals ----------------------------------------------------------
 
     _SEVERITY_ORDER = {Severity.LOW: 0, Severity.MEDIUM: 1, Severity.HIGH: 2, Severity.CRITICAL: 3}
 
-    def _scan(self, text: str, patterns: List[_Pattern]) -> SecurityVerdict:
-        worst: Optional[_Pattern] = None
-        matched_str: Optional[str] = None
-        for pat in patterns:
-            m = pat.regex.search(text)
-            if m:
-                if worst is None or self._SEVERITY_ORDER[pat.severity] > self._SEVERITY_ORDER[worst.severity]:
-                    worst = pat
-                    matched_str = m.group(0)
-        if worst is None:
-            return SecurityVerdict(verdict=Verdict.ALLOW, reason="No dangerous patterns detected.")
+    def _patterns(self, target: str) -> List[_Pattern]:
+        return self._text_patterns if target == "text" else self._command_patterns
+
+    def _plan(self, target: str) -> List[Tuple[_Pattern, Tuple[str, ...], bool, int]]:
+        """Patterns in scan order with literals, case sensitivity and index."""
+        plan = self._ordered.get(target)
+        if plan is None:
+            # Stable sort: within a severity, registration order is kept.
+            ordered = sorted(
+                enumerate(self._patterns(target)),
+                key=lambda ip: self._SEVERITY_ORDER[ip[1].severity],
+                reverse=True,
+            )
+            plan = [
+                (p, p.literals, bool(p.regex.flags & re.IGNORECASE), i) for i, p in ordered
+            ]
+            self._ordered[target] = plan
+        return plan
+
+    def _scan(self, text: str, target: str) -> SecurityVerdict:
+        cache = self._cache
+        key = None
+        if cache is not None:
+            key = cache.key((f"monitor:{target}", self.library_version), text)
+            if key is not None:
+                cached = cache.get(key)
+                if cached is not MISS:
+                    if cached is None:
+                        return _ALLOW
+                    index, start, end = cached
+                    return self._verdict(self._patterns(target)[index], text[start:end])
+
+        found = self._search(text, target)
+        if key is not None:
+            cache.put(key, None if found is None else (found[0], found[1].start(), found[1].end()))
+        if found is None:
+            return _ALLOW
+        return self._verdict(self._patterns(target)[found[0]], found[1].group(0))
+
+    @staticmethod
+    def _verdict(pat: _Pattern, matched: str) -> SecurityVerdict:
         return SecurityVerdict(
-            verdict=worst.verdict,
-            reason=worst.description,
-            matched_pattern=matched_str,
-            severity=worst.severity,
+            verdict=pat.verdict,
+            reason=pat.description,
+            matched_pattern=matched,
+            severity=pat.severity,
         )
+
+    def _search(self, text: str, target: str) -> Optional[Tuple[int, "re.Match[str]"]]:
+        """Index and match of the pattern that decides *text*, if any."""
+        # Literal skipping is exact only for ASCII input: there, ignoring
+        # case in the regex is the same as comparing lowercased strings.
+        lowered = text.lower() if text.isascii() else None
+        for pat, literals, ignore_case, index in self._plan(target):
+            if lowered is not None and literals:
+                haystack = lowered if ignore_case else text
+                for lit in literals:
+                    if lit in haystack:
+                        break
+                else:
+                    if self._profiling:
+                        self._profile(pat, target).skipped += 1
+                    continue
+            if self._profiling:
+                start = time.perf_counter()
+                m = pat.regex.search(text)
+                stats = self._profile(pat, target)
+                stats.seconds += time.perf_counter() - start
+                stats.checks += 1
+                stats.hits += m is not None
+            else:
+                m = pat.regex.search(text)
+            if m:
+                return index, m
+        return None
+
+    def _profile(self, pat: _Pattern, target: str) -> PatternProfile:
+        stats = self._profiles.get(id(pat))
+        if stats is None:
+            stats = self._profiles[id(pat)] = PatternProfile(
+                description=pat.description, severity=pat.severity, target=target,
+            )
+        return stats
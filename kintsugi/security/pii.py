@@ -4,13 +4,34 @@ Provides regex-based detection of common PII types (email, phone, SSN,
 credit card with Luhn validation, IP address, date of birth) and a
 redaction engine with mask/remove modes.  Includes a FastAPI middleware
 factory for automatic response-body redaction.
+
+Detection is done by :class:`PIIEngine`, which folds every pattern into
+one alternation of named groups and scans each string once.  Patterns may
+declare a cheap ``requires`` prefilter (a substring or regex that every
+match must contain); text that meets none of them -- most chat messages
+-- skips regex work entirely, and patterns whose prefilter fails are left
+out of the alternation for that string.
 """
 
 from __future__ import annotations
 
+import codecs
 import re
 from dataclasses import dataclass, field
-from typing import Callable, Dict, List, Optional, Sequence, Set
+from typing import (
+    AsyncIterator,
+    Callable,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
+
+from kintsugi.security.scan_cache import MISS, ScanCache, library_version
 
 
 # ---------------------------------------------------------------------------
@@ -60,11 +81,27 @@ def _luhn_check(digits: str) -> bool:
 # Pattern definitions
 # ---------------------------------------------------------------------------
 
+# Each pattern is a dict with ``type``, a compiled ``regex``, an optional
+# ``validator`` (called with the matched text) and optional hints for
+# PIIEngine: ``requires``, a substring or compiled regex present in any
+# text the pattern can match; ``first_chars``, the body of a character
+# class covering every character a match can start with; and
+# ``max_length``, the longest match worth catching, which sizes the
+# carry-over window of StreamingRedactor.
+
+DEFAULT_MAX_MATCH_LENGTH = 256
+
+_HAS_DIGIT = re.compile(r"\d")
+_HAS_DOB_LABEL = re.compile(r"(?i)dob|birth")
+
 _PII_PATTERNS: List[Dict] = [
     {
         "type": "EMAIL",
         "regex": re.compile(r"[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+"),
         "validator": None,
+        "requires": "@",
+        "first_chars": r"a-zA-Z0-9_.+-",
+        "max_length": 254,
     },
     {
         "type": "PHONE",
@@ -76,11 +113,17 @@ _PII_PATTERNS: List[Dict] = [
             r"(?!\d)"
         ),
         "validator": None,
+        "requires": _HAS_DIGIT,
+        "first_chars": r"\d+(",
+        "max_length": 17,
     },
     {
         "type": "SSN",
         "regex": re.compile(r"(?<!\d)\d{3}-\d{2}-\d{4}(?!\d)"),
         "validator": None,
+        "requires": _HAS_DIGIT,
+        "first_chars": r"\d",
+        "max_length": 11,
     },
     {
         "type": "CREDIT_CARD",
@@ -90,6 +133,9 @@ _PII_PATTERNS: List[Dict] = [
             r"(?!\d)"
         ),
         "validator": lambda m: _luhn_check(re.sub(r"[\s-]", "", m)),
+        "requires": _HAS_DIGIT,
+        "first_chars": r"\d",
+        "max_length": 19,
     },
     {
         "type": "IP_ADDRESS",
@@ -100,6 +146,9 @@ _PII_PATTERNS: List[Dict] = [
             r"(?!\d)"
         ),
         "validator": None,
+        "requires": _HAS_DIGIT,
+        "first_chars": r"\d",
+        "max_length": 15,
     },
     {
         "type": "DATE_OF_BIRTH",
@@ -109,42 +158,225 @@ _PII_PATTERNS: List[Dict] = [
             r"(\d{1,2}[/\-]\d{1,2}[/\-]\d{2,4}|\d{4}[/\-]\d{1,2}[/\-]\d{1,2})"
         ),
         "validator": None,
+        "requires": _HAS_DOB_LABEL,
+        "first_chars": r"dDbB",
+        "max_length": 64,
     },
 ]
 
 
+# ---------------------------------------------------------------------------
+# Single-pass engine
+# ---------------------------------------------------------------------------
+
+_FLAG_LETTERS = (
+    (re.ASCII, "a"),
+    (re.IGNORECASE, "i"),
+    (re.MULTILINE, "m"),
+    (re.DOTALL, "s"),
+    (re.VERBOSE, "x"),
+)
+_LEADING_FLAGS = re.compile(r"^\(\?[aiLmsux]+\)")
+_BACKREFERENCE = re.compile(r"\\[1-9]|\(\?P=")
+
+
+def _scoped_source(regex: "re.Pattern[str]") -> str:
+    """*regex* as a self-contained group, with its flags scoped to it."""
+    source = _LEADING_FLAGS.sub("", regex.pattern, count=1)
+    letters = "".join(letter for flag, letter in _FLAG_LETTERS if regex.flags & flag)
+    if regex.flags & re.VERBOSE:
+        source += "\n"  # a trailing comment must not swallow the ")"
+    return f"(?{letters}:{source})" if letters else f"(?:{source})"
+
+
+def _has_backreference(regex: "re.Pattern[str]") -> bool:
+    """Whether *regex* refers back to its own groups (which renumber when combined)."""
+    return _BACKREFERENCE.search(regex.pattern) is not None
+
+
+class PIIEngine:
+    """Finds every pattern's matches in one scan of the text.
+
+    The patterns are compiled into a single alternation, one named group
+    per pattern, in list order, built only from the patterns whose
+    ``requires`` prefilter the text passes.  Matches are leftmost-first
+    and do not overlap; where several patterns match at the same position
+    the first one listed that also passes its validator wins.  Patterns that cannot
+    be folded in (numbered backreferences, clashing group names) are
+    scanned on their own and merged into the result.
+    """
+
+    def __init__(self, patterns: Sequence[Dict]) -> None:
+        self._patterns = list(patterns)
+        self._combinable: List[int] = []
+        self._standalone: List[int] = []
+        group_names: Set[str] = set()
+        for i, pat in enumerate(self._patterns):
+            regex = pat["regex"]
+            names = set(regex.groupindex)
+            if _has_backreference(regex) or names & group_names:
+                self._standalone.append(i)
+            else:
+                self._combinable.append(i)
+                group_names |= names
+        # Patterns sharing a prefilter are gated by a single check.
+        self._ungated: Tuple[int, ...] = ()
+        gates: Dict[int, Tuple[object, List[int]]] = {}
+        for i in self._combinable:
+            requires = self._patterns[i].get("requires")
+            if requires is None:
+                self._ungated += (i,)
+            else:
+                gates.setdefault(id(requires), (requires, []))[1].append(i)
+        self._gates = [(requires, tuple(members)) for requires, members in gates.values()]
+        self._compiled: Dict[Tuple[int, ...], Tuple["re.Pattern[str]", Dict[int, int]]] = {}
+        self.max_match_length = max(
+            (p.get("max_length") or DEFAULT_MAX_MATCH_LENGTH for p in self._patterns),
+            default=DEFAULT_MAX_MATCH_LENGTH,
+        )
+
+    def _active(self, text: str) -> Tuple[int, ...]:
+        """Indexes of combinable patterns whose prefilter *text* passes."""
+        active = self._ungated
+        for requires, members in self._gates:
+            if requires in text if isinstance(requires, str) else requires.search(text):
+                active += members
+        return tuple(sorted(active)) if len(self._gates) > 1 else active
+
+    def _alternation(
+        self, active: Tuple[int, ...],
+    ) -> Tuple["re.Pattern[str]", Dict[int, int]]:
+        """Compiled alternation for *active* and its group -> pattern map."""
+        cached = self._compiled.get(active)
+        if cached is None:
+            source = "|".join(
+                f"(?P<_pii{i}>{_scoped_source(self._patterns[i]['regex'])})"
+                for i in active
+            )
+            first = [self._patterns[i].get("first_chars") for i in active]
+            if all(first):
+                # A one-character guard lets the scan reject most positions
+                # without trying every branch.
+                guard = "|".join(f"[{chars}]" for chars in dict.fromkeys(first))
+                source = f"(?=(?:{guard}))(?:{source})"
+            combined = re.compile(source)
+            groups = {combined.groupindex[f"_pii{i}"]: i for i in active}
+            cached = self._compiled[active] = (combined, groups)
+        return cached
+
+    def _detection(self, index: int, start: int, end: int, value: str) -> Optional[PIIDetection]:
+        pat = self._patterns[index]
+        validator = pat.get("validator")
+        if validator and not validator(value):
+            return None
+        return PIIDetection(pii_type=pat["type"], start=start, end=end, original=value)
+
+    def _fallback(
+        self, text: str, start: int, active: Tuple[int, ...], after: int,
+    ) -> Optional[PIIDetection]:
+        """The next pattern after *after* that matches and validates at *start*."""
+        for i in active[active.index(after) + 1:]:
+            m = self._patterns[i]["regex"].match(text, start)
+            if m is not None:
+                det = self._detection(i, m.start(), m.end(), m.group(0))
+                if det is not None:
+                    return det
+        return None
+
+    def scan(self, text: str, pos: int = 0) -> List[PIIDetection]:
+        """Return non-overlapping detections sorted by start position.
+
+        Scanning starts at *pos*; text before it is only seen by lookbehinds.
+        """
+        detections: List[PIIDetection] = []
+        active = self._active(text)
+        if active:
+            combined, groups = self._alternation(active)
+            cursor, length = pos, len(text)
+            while cursor <= length:
+                m = combined.search(text, cursor)
+                if m is None:
+                    break
+                index = groups[m.lastindex]
+                det = self._detection(index, m.start(), m.end(), m.group(0))
+                if det is None:
+                    det = self._fallback(text, m.start(), active, index)
+                if det is None:
+                    cursor = m.start() + 1
+                    continue
+                detections.append(det)
+                cursor = det.end if det.end > det.start else det.end + 1
+
+        if not self._standalone:
+            return detections
+        for i in self._standalone:
+            for m in self._patterns[i]["regex"].finditer(text, pos):
+                det = self._detection(i, m.start(), m.end(), m.group(0))
+                if det is not None:
+                    detections.append(det)
+        detections.sort(key=lambda d: (d.start, d.start - d.end))
+        merged: List[PIIDetection] = []
+        for det in detections:
+            if not merged or det.start >= merged[-1].end:
+                merged.append(det)
+        return merged
+
+
 # ---------------------------------------------------------------------------
 # PIIRedactor
 # ---------------------------------------------------------------------------
 
 class PIIRedactor:
-    """Detects and redacts PII from arbitrary text."""
+    """Detects and redacts PII from arbitrary text.
+
+    Extra patterns are appended after the built-in ones, so a built-in
+    type wins when both match at the same position.
+
+    With a *cache* (usually the shared one from
+    :func:`~kintsugi.security.scan_cache.get_scan_cache`), repeated texts
+    reuse earlier detections.  Only ``(type, start, end)`` spans are
+    cached, never the detected values.
+    """
 
-    def __init__(self, extra_patterns: Optional[List[Dict]] = None) -> None:
+    def __init__(
+        self,
+        extra_patterns: Optional[List[Dict]] = None,
+        cache: Optional[ScanCache] = None,
+    ) -> None:
         self._patterns = list(_PII_PATTERNS)
         if extra_patterns:
             self._patterns.extend(extra_patterns)
+        self._engine = PIIEngine(self._patterns)
+        self._cache = cache
+        self._namespace = ("pii", library_version(*(
+            (p["type"], p["regex"].pattern, p["regex"].flags, repr(p.get("validator")))
+            for p in self._patterns
+        )))
 
     def detect(self, text: str) -> List[PIIDetection]:
-        """Return all PII detections sorted by start position."""
-        detections: List[PIIDetection] = []
-        for pat in self._patterns:
-            for m in pat["regex"].finditer(text):
-                value = m.group(0)
-                validator = pat.get("validator")
-                if validator and not validator(value):
-                    continue
-                detections.append(
-                    PIIDetection(
-                        pii_type=pat["type"],
-                        start=m.start(),
-                        end=m.end(),
-                        original=value,
-                    )
-                )
-        detections.sort(key=lambda d: d.start)
+        """Return all PII detections sorted by start position.
+
+        Detections never overlap: a span claimed by one match is not
+        reported again as (part of) another.
+        """
+        cache = self._cache
+        if cache is None:
+            return self._engine.scan(text)
+        key = cache.key(self._namespace, text)
+        if key is None:
+            return self._engine.scan(text)
+        spans = cache.get(key)
+        if spans is not MISS:
+            return [PIIDetection(t, start, end, text[start:end]) for t, start, end in spans]
+        detections = self._engine.scan(text)
+        cache.put(key, tuple((d.pii_type, d.start, d.end) for d in detections))
         return detections
 
+    @property
+    def max_match_length(self) -> int:
+        """Longest match any pattern is expected to produce."""
+        return self._engine.max_match_length
+
     def redact(self, text: str, mode: str = "mask") -> RedactionResult:
         """Redact PII from *text*.
 
@@ -179,6 +411,128 @@ class PIIRedactor:
         )
 
 
+# ---------------------------------------------------------------------------
+# Streaming redaction
+# ---------------------------------------------------------------------------
+
+# Characters of already-emitted text kept in front of the next scan so
+# that lookbehinds such as ``(?<!\d)`` see the real preceding character.
+_LOOKBEHIND_CONTEXT = 8
+
+
+class StreamingRedactor:
+    """Redacts a text stream chunk by chunk with a bounded carry-over.
+
+    Each :meth:`feed` scans the held-back tail of the previous chunk plus
+    the new one, emits everything that can no longer be part of a match
+    and holds back the last ``window`` characters (the longest match the
+    patterns produce), so PII split across chunk boundaries is still
+    caught.  The output is the same as redacting the concatenated text in
+    one go, as long as no match is longer than ``window``.
+
+    Args:
+        redactor: Detector to use; a default PIIRedactor if omitted.
+        mode: ``"mask"`` or ``"remove"``, as for :meth:`PIIRedactor.redact`.
+        window: Carry-over size in characters; defaults to the redactor's
+            :attr:`~PIIRedactor.max_match_length`.
+        boundary: Optional record separator (``"\n\n"`` for SSE).  Text up
+            to the last separator seen is released immediately instead of
+            waiting for the window to fill.
+    """
+
+    def __init__(
+        self,
+        redactor: Optional[PIIRedactor] = None,
+        mode: str = "mask",
+        window: Optional[int] = None,
+        boundary: Optional[str] = None,
+    ) -> None:
+        self._redactor = redactor or PIIRedactor()
+        self.mode = mode
+        self.window = window or self._redactor.max_match_length
+        self.boundary = boundary
+        self.detections_count = 0
+        self._types_seen: Set[str] = set()
+        self._context = ""
+        self._pending = ""
+
+    @property
+    def types_found(self) -> List[str]:
+        return sorted(self._types_seen)
+
+    def feed(self, chunk: str) -> str:
+        """Add *chunk* and return the redacted text that is now safe to send."""
+        self._pending += chunk
+        return self._release(final=False)
+
+    def flush(self) -> str:
+        """Return whatever is still held back, redacted; call once at the end."""
+        return self._release(final=True)
+
+    def _release(self, final: bool) -> str:
+        text = self._context + self._pending
+        start, end = len(self._context), len(text)
+        if final:
+            cut = end
+        else:
+            cut = end - self.window
+            if self.boundary:
+                last = text.rfind(self.boundary, start)
+                if last >= 0:
+                    cut = max(cut, last + len(self.boundary))
+            if cut <= start:
+                return ""
+
+        parts: List[str] = []
+        prev_end = start
+        for det in self._redactor._engine.scan(text, start):
+            if det.start >= cut:
+                break
+            if det.end > cut:
+                if det.end == end and not final:
+                    # Reaches the end of what we have: more text could
+                    # still change it, so hold it back.
+                    cut = det.start
+                    break
+                cut = det.end
+            parts.append(text[prev_end:det.start])
+            if self.mode == "mask":
+                parts.append(f"[REDACTED_{det.pii_type}]")
+            prev_end = det.end
+            self.detections_count += 1
+            self._types_seen.add(det.pii_type)
+        parts.append(text[prev_end:cut])
+
+        self._context = text[max(0, cut - _LOOKBEHIND_CONTEXT):cut]
+        self._pending = text[cut:]
+        return "".join(parts)
+
+
+def is_redactable(headers: Mapping[str, str]) -> bool:
+    """Whether a body with these headers is uncompressed text or JSON."""
+    encoding = headers.get("content-encoding", "identity").strip().lower()
+    if encoding not in ("", "identity"):
+        return False
+    content_type = headers.get("content-type", "")
+    return "text" in content_type or "json" in content_type
+
+
+async def redact_stream(
+    chunks: AsyncIterator[Union[bytes, str]],
+    stream: StreamingRedactor,
+) -> AsyncIterator[bytes]:
+    """Redact a UTF-8 body iterator incrementally, yielding encoded chunks."""
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    async for chunk in chunks:
+        text = chunk if isinstance(chunk, str) else decoder.decode(chunk)
+        out = stream.feed(text)
+        if out:
+            yield out.encode("utf-8")
+    out = stream.feed(decoder.decode(b"", final=True)) + stream.flush()
+    if out:
+        yield out.encode("utf-8")
+
+
 # ---------------------------------------------------------------------------
 # FastAPI middleware factory
 # ---------------------------------------------------------------------------
@@ -189,6 +543,11 @@ def pii_redaction_middleware(
 ):
     """Return a FastAPI middleware function that redacts PII from response bodies.
 
+    Bodies are redacted as they stream (see :class:`StreamingRedactor`), so
+    large exports and server-sent events are never buffered whole; SSE is
+    released event by event.  Compressed bodies and non-text content types
+    are passed through without being read.
+
     Usage::
 
         from fastapi import FastAPI
@@ -205,33 +564,27 @@ def pii_redaction_middleware(
     _skip: Set[str] = set(skip_paths or [])
 
     async def middleware(request, call_next):  # type: ignore[no-untyped-def]
-        from starlette.responses import Response, StreamingResponse
+        from starlette.responses import StreamingResponse
         response = await call_next(request)
 
         # Skip configured paths
         if any(request.url.path.startswith(p) for p in _skip):
             return response
 
-        # Only process text-like content types
-        ct = response.headers.get("content-type", "")
-        if "text" not in ct and "json" not in ct:
+        # Only process uncompressed text-like content types
+        if not is_redactable(response.headers):
             return response
 
-        # Read body
-        body_parts: List[bytes] = []
-        async for chunk in response.body_iterator:  # type: ignore[attr-defined]
-            if isinstance(chunk, str):
-                body_parts.append(chunk.encode("utf-8"))
-            else:
-                body_parts.append(chunk)
-        body = b"".join(body_parts).decode("utf-8", errors="replace")
-
-        result = _redactor.redact(body)
-
-        return Response(
-            content=result.redacted_text,
+        ct = response.headers.get("content-type", "")
+        stream = StreamingRedactor(
+            _redactor, boundary="\n\n" if "event-stream" in ct else None,
+        )
+        # The redacted length is unknown up front.
+        headers = {k: v for k, v in response.headers.items() if k.lower() != "content-length"}
+        return StreamingResponse(
+            redact_stream(response.body_iterator, stream),  # type: ignore[attr-defined]
             status_code=response.status_code,
-            headers=dict(response.headers),
+            headers=headers,
             media_type=response.media_type,
         )
 
@@ -3,6 +3,10 @@
 Creates isolated temporary directories and runs code snippets in a
 subprocess with enforced timeouts.  Designed as a pre-flight check so
 that destructive or long-running code never touches the host environment.
+
+``execute_in_sandbox`` starts a new interpreter per call and blocks; async
+callers should use ``execute``, which runs on a warm
+:class:`~kintsugi.security.sandbox_pool.SandboxPool`.
 """
 
 from __future__ import annotations
@@ -15,7 +19,10 @@ import uuid
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict
+from typing import TYPE_CHECKING, Dict, Optional
+
+if TYPE_CHECKING:
+    from kintsugi.security.sandbox_pool import SandboxPool
 
 
 @dataclass(frozen=True)
@@ -36,19 +43,47 @@ class SandboxResult:
     exit_code: int
     timed_out: bool
     execution_time_ms: float
+    output_truncated: bool = False
 
 
 class ShadowSandbox:
     """Manages ephemeral sandbox directories and subprocess execution."""
 
-    def __init__(self, base_dir: str | None = None) -> None:
+    def __init__(self, base_dir: str | None = None, pool_size: int = 2) -> None:
         """
         Args:
-            base_dir: Optional root for sandbox temp dirs. Defaults to the
-                      system temp directory.
+            base_dir:  Optional root for sandbox temp dirs. Defaults to the
+                       system temp directory.
+            pool_size: Warm workers started by the first ``execute`` call.
         """
         self._base_dir = base_dir
         self._sandboxes: Dict[str, SandboxContext] = {}
+        self._pool_size = pool_size
+        self._pool: Optional[SandboxPool] = None
+
+    async def execute(
+        self,
+        code: str,
+        timeout: float = 30,
+        max_output: Optional[int] = None,
+    ) -> SandboxResult:
+        """Async ``execute_in_sandbox`` on a warm worker pool.
+
+        Each call still runs in a fresh process and a freshly emptied
+        directory, without the interpreter startup or blocking the loop.
+        Output beyond *max_output* bytes per stream is dropped.
+        """
+        if self._pool is None:
+            from kintsugi.security.sandbox_pool import SandboxPool
+
+            self._pool = SandboxPool(size=self._pool_size, base_dir=self._base_dir)
+        return await self._pool.run(code, timeout=timeout, max_output=max_output)
+
+    async def close_pool(self) -> None:
+        """Stop the warm workers started by :meth:`execute`."""
+        if self._pool is not None:
+            await self._pool.close()
+            self._pool = None
 
     def create_sandbox(self) -> SandboxContext:
         """Create a new isolated temporary directory.
@@ -0,0 +1,231 @@
+"""Warm worker pool for sandboxed code execution.
+
+:meth:`ShadowSandbox.execute_in_sandbox` starts a new ``python3`` for
+every snippet (tens of ms of interpreter startup) and blocks in
+``subprocess.run``, which stalls the event loop when called from async
+code.  :class:`SandboxPool` keeps *size* interpreters running, each with
+its own working directory, and hands jobs to whichever is idle:
+
+- each worker forks a fresh child per job, so jobs never share a process,
+  and empties its working directory before every job;
+- jobs are submitted with ``await pool.run(code)``;
+- per-job timeouts kill the job's whole process group, and stdout/stderr
+  are each capped at ``max_output`` bytes (``output_truncated`` is set
+  on the result when anything was dropped).
+
+A worker that dies is replaced on the next job.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import shutil
+import signal
+import tempfile
+import time
+from pathlib import Path
+from typing import List, Optional
+
+from kintsugi.security.sandbox import SandboxResult
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_POOL_SIZE = 2
+DEFAULT_MAX_OUTPUT = 1 << 20  # bytes per stream
+# How long a worker gets to report a killed job before it is killed too.
+KILL_GRACE = 5.0
+
+_WORKER_SCRIPT = str(Path(__file__).with_name("_sandbox_worker.py"))
+
+
+class _Worker:
+    """One warm interpreter and its working directory."""
+
+    def __init__(self, base_dir: Optional[str], max_output: int) -> None:
+        self.path = tempfile.mkdtemp(prefix="kintsugi_sandbox_pool_", dir=base_dir)
+        self._max_output = max_output
+        self.proc: Optional[asyncio.subprocess.Process] = None
+        self._job_pid: Optional[int] = None
+
+    @property
+    def alive(self) -> bool:
+        return self.proc is not None and self.proc.returncode is None
+
+    async def start(self) -> None:
+        # JSON may escape every output byte as \\uXXXX.
+        limit = 2 * 6 * self._max_output + 65536
+        self.proc = await asyncio.create_subprocess_exec(
+            "python3", _WORKER_SCRIPT, self.path,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+            cwd=self.path,
+            env={"PATH": "/usr/bin:/bin", "HOME": self.path},
+            limit=limit,
+        )
+
+    async def _reply(self) -> dict:
+        assert self.proc is not None and self.proc.stdout is not None
+        line = await self.proc.stdout.readline()
+        if not line:
+            raise ConnectionError("sandbox worker exited")
+        return json.loads(line)
+
+    async def run(self, code: str, timeout: float, max_output: int) -> SandboxResult:
+        assert self.proc is not None and self.proc.stdin is not None
+        start = time.monotonic()
+        self.proc.stdin.write(
+            json.dumps({"code": code, "max_output": max_output}).encode("utf-8") + b"\n"
+        )
+        await self.proc.stdin.drain()
+        self._job_pid = (await self._reply())["pid"]
+
+        timed_out = False
+        remaining = timeout - (time.monotonic() - start)
+        try:
+            done = await asyncio.wait_for(self._reply(), max(remaining, 0.0))
+        except asyncio.TimeoutError:
+            timed_out = True
+            self._kill_job()
+            try:
+                await asyncio.wait_for(self._reply(), KILL_GRACE)
+            except asyncio.TimeoutError:
+                # The job survived the kill or the worker is stuck; either
+                # way its reply stream can no longer be trusted.
+                logger.warning("Sandbox worker %s did not report a killed job", self.path)
+                await self.stop()
+        self._job_pid = None
+        elapsed_ms = (time.monotonic() - start) * 1000.0
+
+        if timed_out:
+            return SandboxResult(
+                stdout="",
+                stderr=f"Execution timed out after {timeout}s.",
+                exit_code=-1,
+                timed_out=True,
+                execution_time_ms=round(elapsed_ms, 2),
+            )
+        return SandboxResult(
+            stdout=done["stdout"],
+            stderr=done["stderr"],
+            exit_code=done["exit_code"],
+            timed_out=False,
+            execution_time_ms=round(elapsed_ms, 2),
+            output_truncated=done["truncated"],
+        )
+
+    def _kill_job(self) -> None:
+        if self._job_pid is not None:
+            try:
+                os.killpg(self._job_pid, signal.SIGKILL)
+            except OSError:
+                pass
+
+    async def stop(self) -> None:
+        self._kill_job()
+        self._job_pid = None
+        if self.alive:
+            assert self.proc is not None
+            self.proc.kill()
+            await self.proc.wait()
+        self.proc = None
+
+    def remove(self) -> None:
+        shutil.rmtree(self.path, ignore_errors=True)
+
+
+class SandboxPool:
+    """Pool of warm sandbox interpreters with an async job API.
+
+    Args:
+        size:       Number of workers (concurrent jobs).
+        base_dir:   Root for the workers' directories; system temp if None.
+        timeout:    Default per-job wall-clock limit in seconds.
+        max_output: Largest stdout/stderr kept per job, in bytes.  Per-job
+                    caps may be lower, not higher.
+
+    Use as ``async with SandboxPool() as pool: await pool.run(code)``, or
+    call :meth:`start` / :meth:`close` explicitly.
+    """
+
+    def __init__(
+        self,
+        size: int = DEFAULT_POOL_SIZE,
+        base_dir: Optional[str] = None,
+        timeout: float = 30,
+        max_output: int = DEFAULT_MAX_OUTPUT,
+    ) -> None:
+        if size < 1:
+            raise ValueError("size must be >= 1")
+        self.size = size
+        self.timeout = timeout
+        self.max_output = max_output
+        self._base_dir = base_dir
+        self._workers: List[_Worker] = []
+        self._idle: Optional[asyncio.Queue[_Worker]] = None
+
+    async def __aenter__(self) -> SandboxPool:
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        await self.close()
+
+    async def start(self) -> None:
+        """Start every worker; called by ``run`` on first use."""
+        if self._idle is not None:
+            return
+        self._idle = asyncio.Queue()
+        self._workers = [_Worker(self._base_dir, self.max_output) for _ in range(self.size)]
+        await asyncio.gather(*(w.start() for w in self._workers))
+        for worker in self._workers:
+            self._idle.put_nowait(worker)
+
+    async def run(
+        self,
+        code: str,
+        timeout: Optional[float] = None,
+        max_output: Optional[int] = None,
+    ) -> SandboxResult:
+        """Run *code* as a script on the next idle worker.
+
+        Returns the same :class:`SandboxResult` as
+        ``ShadowSandbox.execute_in_sandbox``.
+        """
+        await self.start()
+        assert self._idle is not None
+        timeout = self.timeout if timeout is None else timeout
+        cap = self.max_output if max_output is None else min(max_output, self.max_output)
+
+        worker = await self._idle.get()
+        try:
+            if not worker.alive:
+                await worker.start()
+            return await worker.run(code, timeout, cap)
+        except ConnectionError as exc:
+            logger.warning("Sandbox worker %s failed: %s", worker.path, exc)
+            await worker.stop()
+            return SandboxResult(
+                stdout="",
+                stderr=f"Sandbox worker failed: {exc}",
+                exit_code=-1,
+                timed_out=False,
+                execution_time_ms=0.0,
+            )
+        except BaseException:
+            # Cancelled mid-job: the reply stream is out of step, start over.
+            await worker.stop()
+            raise
+        finally:
+            self._idle.put_nowait(worker)
+
+    async def close(self) -> None:
+        """Stop every worker and remove their directories."""
+        for worker in self._workers:
+            await worker.stop()
+            worker.remove()
+        self._workers = []
+        self._idle = None
@@ -0,0 +1,171 @@
+"""Bounded verdict cache shared by the security and PII scanners.
+
+Retried messages, widget reconnects that replay history, broadcast
+templates and Oracle re-reviews send the same strings through
+:meth:`SecurityMonitor.check_text` and :meth:`PIIRedactor.redact` again
+and again.  :class:`ScanCache` remembers each scan's outcome by a digest
+of the scanned text so that repeats skip the regex work.
+
+What is stored never contains the scanned text:
+
+- keys are ``(namespace, keyed BLAKE2b digest)``.  The BLAKE2b key is
+  random per cache instance, so a digest cannot be checked against
+  guessed values (an SSN has only 10^9 candidates) outside this process;
+- values are offsets, pattern indices and PII type names.  On a hit the
+  scanner rebuilds matched substrings from the text it was just given.
+
+The namespace carries the scanner's pattern-library version, so adding a
+pattern moves that scanner onto fresh keys; its old entries are never hit
+again and age out through the LRU.  Texts longer than
+``max_text_length`` are not cached -- hashing them costs a good share of
+scanning them, and large bodies rarely repeat verbatim.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+DEFAULT_MAX_ENTRIES = 10_000
+DEFAULT_MAX_TEXT_LENGTH = 16_384
+
+CacheKey = Tuple[Hashable, bytes]
+
+# Returned by get() on a miss; ``None`` is a legitimate cached value.
+MISS: Any = object()
+
+
+def library_version(*parts: Any) -> str:
+    """Short stable fingerprint of a pattern library description."""
+    return hashlib.blake2b(repr(parts).encode("utf-8"), digest_size=8).hexdigest()
+
+
+@dataclass
+class ScanCacheStats:
+    """Counters for a :class:`ScanCache`."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    bypassed: int = 0  # texts too long to cache
+
+    @property
+    def lookups(self) -> int:
+        return self.hits + self.misses
+
+    @property
+    def hit_rate(self) -> float:
+        return self.hits / self.lookups if self.lookups else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data["lookups"] = self.lookups
+        data["hit_rate"] = round(self.hit_rate, 4)
+        return data
+
+
+class ScanCache:
+    """LRU of scan results keyed by a digest of the scanned text.
+
+    Args:
+        max_entries: Maximum number of results kept; the least recently
+            used one is evicted first.
+        max_text_length: Longer texts bypass the cache.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_text_length: int = DEFAULT_MAX_TEXT_LENGTH,
+    ) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be >= 1")
+        self._max_entries = max_entries
+        self._max_text_length = max_text_length
+        self._secret = os.urandom(32)
+        self._entries: "OrderedDict[CacheKey, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = ScanCacheStats()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def key(self, namespace: Hashable, text: str) -> Optional[CacheKey]:
+        """Cache key for *text* in *namespace*, or ``None`` if it is not cacheable."""
+        if len(text) > self._max_text_length:
+            with self._lock:
+                self.stats.bypassed += 1
+            return None
+        digest = hashlib.blake2b(
+            text.encode("utf-8", "surrogatepass"), digest_size=16, key=self._secret,
+        ).digest()
+        return namespace, digest
+
+    def get(self, key: CacheKey) -> Any:
+        """The cached value for *key*, or :data:`MISS`."""
+        with self._lock:
+            value = self._entries.get(key, MISS)
+            if value is MISS:
+                self.stats.misses += 1
+            else:
+                self._entries.move_to_end(key)
+                self.stats.hits += 1
+            return value
+
+    def put(self, key: CacheKey, value: Any) -> None:
+        """Store *value* under *key*; it must not contain scanned text."""
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                self.stats.evictions += 1
+
+    def clear(self) -> None:
+        """Drop every entry and reset counters."""
+        with self._lock:
+            self._entries.clear()
+            self.stats = ScanCacheStats()
+
+    def info(self) -> Dict[str, Any]:
+        """Counters plus current size and limits."""
+        return {
+            "entries": len(self._entries),
+            "max_entries": self._max_entries,
+            "max_text_length": self._max_text_length,
+            **self.stats.to_dict(),
+        }
+
+
+_cache: Optional[ScanCache] = None
+
+
+def get_scan_cache() -> Optional[ScanCache]:
+    """Return the process-wide :class:`ScanCache`, or ``None`` if disabled.
+
+    Configured from the ``SCAN_CACHE_*`` settings on first use;
+    ``SCAN_CACHE_MAX_ENTRIES = 0`` turns caching off.
+    """
+    global _cache
+    if _cache is None:
+        from kintsugi.config.settings import settings
+
+        if settings.SCAN_CACHE_MAX_ENTRIES <= 0:
+            return None
+        _cache = ScanCache(
+            max_entries=settings.SCAN_CACHE_MAX_ENTRIES,
+            max_text_length=settings.SCAN_CACHE_MAX_TEXT_LENGTH,
+        )
+    return _cache
+
+
+def reset_scan_cache() -> None:
+    """Clear and discard the process-wide cache (used on shutdown/tests)."""
+    global _cache
+    if _cache is not None:
+        _cache.clear()
+    _cache = None
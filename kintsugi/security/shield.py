@@ -4,6 +4,12 @@ The Shield composes four independent enforcers -- budget, egress, rate-limit,
 and circuit-breaker -- and produces a single ALLOW/BLOCK verdict for every
 proposed agent action.  No soft overrides: if any enforcer blocks, the action
 is rejected.
+
+``check_action`` uses the enforcers' process-local state.  ``admit`` is the
+async entry point for concurrent callers: it checks and reserves in one
+atomic step, either on the local enforcers or on a shared
+:class:`~kintsugi.security.shield_state.ShieldState` (e.g. Redis, chosen
+by ``SHIELD_STATE_BACKEND``) so that limits hold across workers.
 """
 
 from __future__ import annotations
@@ -15,6 +21,14 @@ from enum import Enum
 from typing import Any, Dict, List, Optional
 from urllib.parse import urlparse
 
+from kintsugi.security.shield_state import (
+    BUDGET,
+    CIRCUIT,
+    Admission,
+    ShieldState,
+    get_shield_state,
+)
+
 
 # ---------------------------------------------------------------------------
 # Verdict
@@ -225,10 +239,26 @@ class Shield:
 
     Composes BudgetEnforcer, EgressValidator, RateLimiter, and CircuitBreaker
     into a single ``check_action`` call.
+
+    Args:
+        config: Limits for the enforcers.
+        state:  Shared backend used by :meth:`admit`, :meth:`record_result`
+                and :meth:`reset_circuit`.  ``None`` uses the backend
+                configured by ``SHIELD_STATE_BACKEND``; with the default
+                ``"memory"`` everything stays in this object's enforcers.
+        scope:  Namespace for this Shield's counters in *state*; Shields
+                with the same scope share budget, buckets and breakers.
     """
 
-    def __init__(self, config: ShieldConfig) -> None:
+    def __init__(
+        self,
+        config: ShieldConfig,
+        state: Optional[ShieldState] = None,
+        scope: str = "default",
+    ) -> None:
         self.config = config
+        self.state = state if state is not None else get_shield_state()
+        self.scope = scope
         self.budget = BudgetEnforcer(config.budget_session_limit, config.budget_daily_limit)
         self.egress = EgressValidator(config.egress_allowlist)
         self.rate_limiter = RateLimiter(config.rate_limits)
@@ -254,18 +284,107 @@ class Shield:
         """
         # Budget
         if cost > 0 and not self.budget.check_budget(cost):
-            return ShieldVerdict(ShieldDecision.BLOCK, f"Budget exceeded for action '{action_type}' (cost={cost}).")
+            return _budget_exceeded(action_type, cost)
 
         # Egress
         if url is not None and not self.egress.check_egress(url):
-            return ShieldVerdict(ShieldDecision.BLOCK, f"Egress blocked: domain not in allowlist for URL '{url}'.")
+            return _egress_blocked(url)
 
         # Circuit breaker (check before rate limiter so we don't waste tokens)
         if tool is not None and self.circuit_breaker.is_open(tool):
-            return ShieldVerdict(ShieldDecision.BLOCK, f"Circuit breaker open for tool '{tool}'.")
+            return _circuit_open(tool)
 
         # Rate limiter
         if tool is not None and not self.rate_limiter.check_rate(tool):
-            return ShieldVerdict(ShieldDecision.BLOCK, f"Rate limit exceeded for tool '{tool}'.")
+            return _rate_limited(tool)
+
+        return _ALLOWED
+
+    async def admit(
+        self,
+        action_type: str,
+        cost: float = 0.0,
+        url: Optional[str] = None,
+        tool: Optional[str] = None,
+    ) -> ShieldVerdict:
+        """Run all enforcers and, if allowed, reserve *cost* atomically.
+
+        Unlike ``check_action`` followed by ``budget.record_spend``, no
+        other caller can pass the budget check between the two, so
+        concurrent actions never overspend.  The spend is committed on
+        ALLOW; do not call ``record_spend`` for it again.
+        """
+        if self.state is None:
+            # No await in here: atomic with respect to other coroutines.
+            verdict = self.check_action(action_type, cost, url, tool)
+            if verdict.decision is ShieldDecision.ALLOW and cost > 0:
+                self.budget.record_spend(cost)
+            return verdict
+
+        if url is not None and not self.egress.check_egress(url):
+            # Same precedence as check_action: an over-budget action is
+            # reported as such even when its URL is also blocked.
+            if cost > 0 and await self._over_budget(cost):
+                return _budget_exceeded(action_type, cost)
+            return _egress_blocked(url)
+        bucket = self.config.rate_limits.get(tool) if tool is not None else None
+        blocked = await self.state.admit(self.scope, tool, Admission(
+            cost=cost,
+            session_limit=self.config.budget_session_limit,
+            daily_limit=self.config.budget_daily_limit,
+            threshold=self.config.circuit_breaker_threshold,
+            rate=float(bucket.get("rate", 1.0)) if bucket else 0.0,
+            burst=float(bucket.get("burst", 5.0)) if bucket else -1.0,
+        ))
+        if blocked is None:
+            return _ALLOWED
+        if blocked == BUDGET:
+            return _budget_exceeded(action_type, cost)
+        if blocked == CIRCUIT:
+            return _circuit_open(tool)
+        return _rate_limited(tool)
+
+    async def _over_budget(self, cost: float) -> bool:
+        assert self.state is not None
+        session, daily = await self.state.spent(self.scope)
+        return (
+            session + cost > self.config.budget_session_limit
+            or daily + cost > self.config.budget_daily_limit
+        )
+
+    async def record_result(self, tool: str, success: bool) -> None:
+        """Record a tool outcome with the circuit breaker (local or shared)."""
+        if self.state is None:
+            self.circuit_breaker.record_result(tool, success)
+        else:
+            await self.state.record_result(self.scope, tool, success)
+
+    async def reset_circuit(self, tool: str) -> None:
+        """Close the circuit for *tool* (local or shared)."""
+        if self.state is None:
+            self.circuit_breaker.reset(tool)
+        else:
+            await self.state.reset(self.scope, tool)
+
+
+_ALLOWED = ShieldVerdict(ShieldDecision.ALLOW, "All shield checks passed.")
+
+
+def _budget_exceeded(action_type: str, cost: float) -> ShieldVerdict:
+    return ShieldVerdict(
+        ShieldDecision.BLOCK, f"Budget exceeded for action '{action_type}' (cost={cost}).",
+    )
+
+
+def _egress_blocked(url: str) -> ShieldVerdict:
+    return ShieldVerdict(
+        ShieldDecision.BLOCK, f"Egress blocked: domain not in allowlist for URL '{url}'.",
+    )
+
+
+def _circuit_open(tool: Optional[str]) -> ShieldVerdict:
+    return ShieldVerdict(ShieldDecision.BLOCK, f"Circuit breaker open for tool '{tool}'.")
+
 
-        return ShieldVerdict(ShieldDecision.ALLOW, "All shield checks passed.")
+def _rate_limited(tool: Optional[str]) -> ShieldVerdict:
+    return ShieldVerdict(ShieldDecision.BLOCK, f"Rate limit exceeded for tool '{tool}'.")
@@ -0,0 +1,322 @@
+"""Shared state backends for the Shield enforcers.
+
+:class:`~kintsugi.security.shield.Shield` keeps its budget, token buckets
+and circuit breakers in process memory, so with four uvicorn workers every
+limit is effectively multiplied by four and breakers trip independently.
+A :class:`ShieldState` moves that state somewhere all workers can see it.
+
+Every admission is one atomic step -- budget check, breaker check, token
+take and budget reservation together -- so concurrent callers can never
+both pass a check that only one of them fits in:
+
+- :class:`InProcessShieldState` holds the counters in dicts under a lock;
+  useful for sharing limits between many ``Shield`` objects in one process
+  and as the reference for the Redis scripts.
+- :class:`RedisShieldState` runs the same logic as a Lua script on any
+  Redis-protocol server (one ``EVALSHA`` round trip per admission).  Keys
+  of one scope share a ``{hash tag}`` so the script also works on a
+  cluster.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
+
+# Returned by admit(): which check blocked, or None.
+BUDGET = "budget"
+CIRCUIT = "circuit"
+RATE = "rate"
+_BLOCKED = {1: BUDGET, 2: CIRCUIT, 3: RATE}
+
+DAY_TTL_SECONDS = 2 * 86_400
+DEFAULT_IDLE_TTL_SECONDS = 86_400
+
+
+def _utc_day(now: float) -> str:
+    return _day_name(int(now // 86_400))
+
+
+@lru_cache(maxsize=4)
+def _day_name(day_number: int) -> str:
+    return datetime.fromtimestamp(day_number * 86_400, timezone.utc).date().isoformat()
+
+
+@dataclass(frozen=True)
+class Admission:
+    """Limits and cost for one atomic Shield admission.
+
+    A negative ``threshold`` skips the circuit-breaker check and a
+    negative ``burst`` skips the token bucket (no rate limit configured).
+    """
+
+    cost: float
+    session_limit: float
+    daily_limit: float
+    threshold: int = -1
+    rate: float = 0.0
+    burst: float = -1.0
+    now: float = field(default_factory=time.time)
+
+    @property
+    def day(self) -> str:
+        return _utc_day(self.now)
+
+
+class ShieldState(ABC):
+    """Atomic counter operations behind :meth:`Shield.admit`."""
+
+    @abstractmethod
+    async def admit(self, scope: str, tool: Optional[str], admission: Admission) -> Optional[str]:
+        """Check and reserve in one step; return the blocking check or ``None``."""
+
+    @abstractmethod
+    async def record_result(self, scope: str, tool: str, success: bool) -> int:
+        """Record a tool outcome; return the consecutive-failure count."""
+
+    @abstractmethod
+    async def failures(self, scope: str, tool: str) -> int:
+        """Current consecutive-failure count for *tool*."""
+
+    @abstractmethod
+    async def reset(self, scope: str, tool: str) -> None:
+        """Close the circuit for *tool*."""
+
+    @abstractmethod
+    async def spent(self, scope: str, now: Optional[float] = None) -> Tuple[float, float]:
+        """``(session, today)`` spend for *scope*."""
+
+
+# ---------------------------------------------------------------------------
+# In-process
+# ---------------------------------------------------------------------------
+
+class InProcessShieldState(ShieldState):
+    """Shield counters in process memory, guarded by a lock.
+
+    Operations never await while holding state, so they are atomic for
+    coroutines as well as threads.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._session: Dict[str, float] = {}
+        self._daily: Dict[str, Tuple[str, float]] = {}  # scope -> (day, spent)
+        self._failures: Dict[Tuple[str, str], int] = {}
+        self._buckets: Dict[Tuple[str, str], Tuple[float, float]] = {}  # tokens, last
+
+    async def admit(self, scope: str, tool: Optional[str], admission: Admission) -> Optional[str]:
+        return _BLOCKED.get(self.admit_now(scope, tool, admission))
+
+    def admit_now(self, scope: str, tool: Optional[str], a: Admission) -> int:
+        """Synchronous :meth:`admit`, returning the script's status code."""
+        day = a.day
+        with self._lock:
+            if a.cost > 0:
+                spent_day, daily = self._daily.get(scope, (day, 0.0))
+                if spent_day != day:
+                    daily = 0.0
+                session = self._session.get(scope, 0.0)
+                if session + a.cost > a.session_limit or daily + a.cost > a.daily_limit:
+                    return 1
+            if tool is not None and a.threshold >= 0:
+                if self._failures.get((scope, tool), 0) >= a.threshold:
+                    return 2
+            if tool is not None and a.burst >= 0:
+                tokens, last = self._buckets.get((scope, tool), (a.burst, a.now))
+                tokens = min(a.burst, tokens + max(0.0, a.now - last) * a.rate)
+                if tokens < 1.0:
+                    self._buckets[(scope, tool)] = (tokens, a.now)
+                    return 3
+                self._buckets[(scope, tool)] = (tokens - 1.0, a.now)
+            if a.cost > 0:
+                self._session[scope] = session + a.cost
+                self._daily[scope] = (day, daily + a.cost)
+            return 0
+
+    async def record_result(self, scope: str, tool: str, success: bool) -> int:
+        with self._lock:
+            count = 0 if success else self._failures.get((scope, tool), 0) + 1
+            self._failures[(scope, tool)] = count
+            return count
+
+    async def failures(self, scope: str, tool: str) -> int:
+        return self._failures.get((scope, tool), 0)
+
+    async def reset(self, scope: str, tool: str) -> None:
+        with self._lock:
+            self._failures[(scope, tool)] = 0
+
+    async def spent(self, scope: str, now: Optional[float] = None) -> Tuple[float, float]:
+        day = _utc_day(now if now is not None else time.time())
+        spent_day, daily = self._daily.get(scope, (day, 0.0))
+        return self._session.get(scope, 0.0), daily if spent_day == day else 0.0
+
+
+# ---------------------------------------------------------------------------
+# Redis
+# ---------------------------------------------------------------------------
+
+# KEYS: session spend, daily spend, breaker failures, token bucket (hash)
+# ARGV: now_ms, cost, session_limit, daily_limit, day_ttl, threshold,
+#       rate (tokens/s), burst, idle_ttl
+# Returns 0 (admitted), 1 (budget), 2 (circuit open) or 3 (rate limited).
+ADMIT_SCRIPT = """
+local now = tonumber(ARGV[1])
+local cost = tonumber(ARGV[2])
+local threshold = tonumber(ARGV[6])
+local rate = tonumber(ARGV[7])
+local burst = tonumber(ARGV[8])
+local idle_ttl = tonumber(ARGV[9])
+if cost > 0 then
+  local session = tonumber(redis.call('GET', KEYS[1]) or '0')
+  local daily = tonumber(redis.call('GET', KEYS[2]) or '0')
+  if session + cost > tonumber(ARGV[3]) or daily + cost > tonumber(ARGV[4]) then
+    return 1
+  end
+end
+if threshold >= 0 and tonumber(redis.call('GET', KEYS[3]) or '0') >= threshold then
+  return 2
+end
+if burst >= 0 then
+  local bucket = redis.call('HMGET', KEYS[4], 'tokens', 'last')
+  local tokens = tonumber(bucket[1]) or burst
+  local last = tonumber(bucket[2]) or now
+  tokens = math.min(burst, tokens + math.max(0, now - last) * rate / 1000)
+  local allowed = tokens >= 1
+  if allowed then
+    tokens = tokens - 1
+  end
+  redis.call('HSET', KEYS[4], 'tokens', tostring(tokens), 'last', tostring(now))
+  redis.call('EXPIRE', KEYS[4], idle_ttl)
+  if not allowed then
+    return 3
+  end
+end
+if cost > 0 then
+  redis.call('INCRBYFLOAT', KEYS[1], ARGV[2])
+  redis.call('EXPIRE', KEYS[1], idle_ttl)
+  redis.call('INCRBYFLOAT', KEYS[2], ARGV[2])
+  redis.call('EXPIRE', KEYS[2], tonumber(ARGV[5]))
+end
+return 0
+"""
+
+# KEYS: breaker failures; ARGV: success (1/0), idle_ttl
+RESULT_SCRIPT = """
+local count = 0
+if ARGV[1] == '0' then
+  count = redis.call('INCR', KEYS[1])
+else
+  redis.call('SET', KEYS[1], '0')
+end
+redis.call('EXPIRE', KEYS[1], tonumber(ARGV[2]))
+return count
+"""
+
+
+class RedisShieldState(ShieldState):
+    """Shield counters on a Redis-protocol server, shared by every worker.
+
+    Args:
+        client: An asyncio Redis client (``redis.asyncio.Redis`` or
+            anything with ``evalsha``/``script_load``/``get``/``delete``).
+        prefix: Key prefix.
+        idle_ttl: Seconds after the last write before session spend,
+            buckets and breaker counts expire.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        prefix: str = "kintsugi:shield",
+        idle_ttl: int = DEFAULT_IDLE_TTL_SECONDS,
+    ) -> None:
+        self._client = client
+        self._prefix = prefix
+        self._idle_ttl = idle_ttl
+        self._shas: Dict[str, str] = {}
+
+    def _key(self, scope: str, *parts: str) -> str:
+        return ":".join((self._prefix, "{" + scope + "}", *parts))
+
+    async def _run(self, script: str, keys: Tuple[str, ...], *args: Any) -> Any:
+        sha = self._shas.get(script)
+        if sha is None:
+            sha = self._shas[script] = hashlib.sha1(script.encode("utf-8")).hexdigest()
+        try:
+            return await self._client.evalsha(sha, len(keys), *keys, *args)
+        except Exception as exc:
+            # redis-py raises NoScriptError and strips the NOSCRIPT code
+            # from its message; other clients may only have the message.
+            if type(exc).__name__ != "NoScriptError" and "NOSCRIPT" not in str(exc):
+                raise
+        await self._client.script_load(script)
+        return await self._client.evalsha(sha, len(keys), *keys, *args)
+
+    async def admit(self, scope: str, tool: Optional[str], admission: Admission) -> Optional[str]:
+        a = admission
+        keys = (
+            self._key(scope, "spend", "session"),
+            self._key(scope, "spend", a.day),
+            self._key(scope, "failures", tool or ""),
+            self._key(scope, "bucket", tool or ""),
+        )
+        status = await self._run(
+            ADMIT_SCRIPT, keys,
+            int(a.now * 1000), repr(float(a.cost)), repr(float(a.session_limit)),
+            repr(float(a.daily_limit)), DAY_TTL_SECONDS,
+            a.threshold if tool is not None else -1,
+            repr(float(a.rate)), repr(float(a.burst)) if tool is not None else "-1",
+            self._idle_ttl,
+        )
+        return _BLOCKED.get(int(status))
+
+    async def record_result(self, scope: str, tool: str, success: bool) -> int:
+        count = await self._run(
+            RESULT_SCRIPT, (self._key(scope, "failures", tool),),
+            "1" if success else "0", self._idle_ttl,
+        )
+        return int(count)
+
+    async def failures(self, scope: str, tool: str) -> int:
+        value = await self._client.get(self._key(scope, "failures", tool))
+        return int(value or 0)
+
+    async def reset(self, scope: str, tool: str) -> None:
+        await self._client.delete(self._key(scope, "failures", tool))
+
+    async def spent(self, scope: str, now: Optional[float] = None) -> Tuple[float, float]:
+        day = _utc_day(now if now is not None else time.time())
+        session = await self._client.get(self._key(scope, "spend", "session"))
+        daily = await self._client.get(self._key(scope, "spend", day))
+        return float(session or 0.0), float(daily or 0.0)
+
+
+_state: Optional[ShieldState] = None
+
+
+def get_shield_state() -> Optional[ShieldState]:
+    """Process-wide shared state from ``SHIELD_STATE_BACKEND``, or ``None``.
+
+    Used by every :class:`Shield` built without an explicit ``state``.
+    ``"memory"`` (the default) returns ``None``: each Shield keeps its own
+    in-process enforcers.  ``"redis"`` connects to ``REDIS_URL`` on first
+    use.
+    """
+    global _state
+    if _state is None:
+        from kintsugi.config.settings import settings
+
+        if settings.SHIELD_STATE_BACKEND == "memory":
+            return None
+        import redis.asyncio as redis_asyncio
+
+        _state = RedisShieldState(redis_asyncio.from_url(settings.REDIS_URL))
+    return _state
@@ -0,0 +1,41 @@
+"""Add memory_ingest_checkpoints for resumable bulk ingestion.
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-16
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import UUID
+
+revision: str = "003"
+down_revision: Union[str, None] = "002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "memory_ingest_checkpoints",
+        sa.Column(
+            "org_id",
+            UUID(as_uuid=True),
+            sa.ForeignKey("organizations.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("job_id", sa.String(128), primary_key=True),
+        sa.Column("lines_committed", sa.Integer, nullable=False, server_default="0"),
+        sa.Column("memories_committed", sa.Integer, nullable=False, server_default="0"),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("memory_ingest_checkpoints")
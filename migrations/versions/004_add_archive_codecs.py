@@ -0,0 +1,59 @@
+"""Add codec columns and per-org dictionaries to the cold archive.
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-16
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import UUID
+
+revision: str = "004"
+down_revision: Union[str, None] = "003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "archive_dictionaries",
+        sa.Column("id", UUID(as_uuid=True), primary_key=True),
+        sa.Column(
+            "org_id",
+            UUID(as_uuid=True),
+            sa.ForeignKey("organizations.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("codec", sa.String(16), nullable=False, server_default="zstd"),
+        sa.Column("dictionary", sa.LargeBinary, nullable=False),
+        sa.Column("sample_count", sa.Integer, nullable=False, server_default="0"),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+    )
+    op.create_index(
+        "ix_archive_dictionaries_org_created", "archive_dictionaries", ["org_id", "created_at"]
+    )
+
+    # Existing rows were all written by the gzip path.
+    op.add_column(
+        "memory_archives",
+        sa.Column("codec", sa.String(16), nullable=False, server_default="gzip"),
+    )
+    op.add_column(
+        "memory_archives",
+        sa.Column(
+            "dictionary_id",
+            UUID(as_uuid=True),
+            sa.ForeignKey("archive_dictionaries.id"),
+            nullable=True,
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("memory_archives", "dictionary_id")
+    op.drop_column("memory_archives", "codec")
+    op.drop_index("ix_archive_dictionaries_org_created", table_name="archive_dictionaries")
+    op.drop_table("archive_dictionaries")
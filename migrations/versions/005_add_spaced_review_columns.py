@@ -0,0 +1,53 @@
+"""Persist spaced-retrieval state on memory_units.
+
+Adds access_count and next_review_at, backfills next_review_at from the
+last touch (first interval is 1 day), and a partial index serving the
+due-memory range scan.
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-16
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "005"
+down_revision: Union[str, None] = "004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "memory_units",
+        sa.Column("access_count", sa.Integer, nullable=False, server_default="0"),
+    )
+    op.add_column(
+        "memory_units",
+        sa.Column("next_review_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.execute(
+        "UPDATE memory_units "
+        "SET next_review_at = COALESCE(updated_at, created_at, now()) + interval '1 day'"
+    )
+    op.alter_column(
+        "memory_units",
+        "next_review_at",
+        nullable=False,
+        server_default=sa.text("now() + interval '1 day'"),
+    )
+    op.create_index(
+        "ix_memory_units_review_due",
+        "memory_units",
+        ["org_id", "next_review_at"],
+        postgresql_where=sa.text("memory_layer <> 'archived'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_memory_units_review_due", table_name="memory_units")
+    op.drop_column("memory_units", "next_review_at")
+    op.drop_column("memory_units", "access_count")
@@ -0,0 +1,29 @@
+"""Partial index for the batched expiration reaper.
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-16
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "006"
+down_revision: Union[str, None] = "005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_memory_units_expiry",
+        "memory_units",
+        ["expires_at"],
+        postgresql_where=sa.text("memory_layer <> 'archived' AND expires_at IS NOT NULL"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_memory_units_expiry", table_name="memory_units")
@@ -0,0 +1,115 @@
+"""Partition temporal_memories by month and add full-text search.
+
+Rebuilds ``temporal_memories`` as a table range-partitioned on
+``created_at`` (one partition per UTC month plus a default), with a
+generated ``message_tsv`` column and GIN index.  The primary key becomes
+``(id, created_at)`` because Postgres requires the partition key in it.
+Existing rows are copied into the new table.
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-16
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "007"
+down_revision: Union[str, None] = "006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+MONTHS_AHEAD = 3
+
+_COLUMNS = "id, org_id, category, message, metadata_json, created_at"
+
+
+def upgrade() -> None:
+    op.execute("ALTER TABLE temporal_memories RENAME TO temporal_memories_legacy")
+    op.execute(
+        "ALTER INDEX ix_temporal_created_category RENAME TO ix_temporal_legacy_created_category"
+    )
+    op.execute(
+        "ALTER TABLE temporal_memories_legacy "
+        "RENAME CONSTRAINT temporal_memories_pkey TO temporal_memories_legacy_pkey"
+    )
+
+    op.execute("""
+        CREATE TABLE temporal_memories (
+            id uuid NOT NULL,
+            org_id uuid NOT NULL REFERENCES organizations(id) ON DELETE CASCADE,
+            category varchar(128) NOT NULL,
+            message text NOT NULL,
+            metadata_json jsonb,
+            created_at timestamptz NOT NULL DEFAULT now(),
+            message_tsv tsvector GENERATED ALWAYS AS (to_tsvector('english', message)) STORED,
+            PRIMARY KEY (id, created_at)
+        ) PARTITION BY RANGE (created_at)
+    """)
+    op.execute(
+        "CREATE INDEX ix_temporal_created_category ON temporal_memories (created_at, category)"
+    )
+    op.execute("CREATE INDEX ix_temporal_org_created ON temporal_memories (org_id, created_at)")
+    op.execute("CREATE INDEX ix_temporal_message_tsv ON temporal_memories USING gin (message_tsv)")
+
+    # One partition per month from the oldest event through MONTHS_AHEAD
+    # months from now; anything outside that lands in the default partition.
+    # Months are stepped as UTC wall-clock timestamps and the bounds written
+    # with an explicit +00, so the session TimeZone cannot shift them.
+    op.execute(f"""
+        DO $$
+        DECLARE
+            m timestamp := date_trunc('month', coalesce(
+                (SELECT min(created_at) FROM temporal_memories_legacy), now()) AT TIME ZONE 'UTC');
+            last timestamp := date_trunc('month', now() AT TIME ZONE 'UTC')
+                + interval '{MONTHS_AHEAD} months';
+        BEGIN
+            WHILE m <= last LOOP
+                EXECUTE format(
+                    'CREATE TABLE %I PARTITION OF temporal_memories FOR VALUES FROM (%L) TO (%L)',
+                    'temporal_memories_p' || to_char(m, 'YYYY_MM'),
+                    to_char(m, 'YYYY-MM-DD') || ' 00:00:00+00',
+                    to_char(m + interval '1 month', 'YYYY-MM-DD') || ' 00:00:00+00');
+                m := m + interval '1 month';
+            END LOOP;
+        END $$
+    """)
+    op.execute("CREATE TABLE temporal_memories_default PARTITION OF temporal_memories DEFAULT")
+
+    op.execute(f"""
+        INSERT INTO temporal_memories ({_COLUMNS})
+        SELECT id, org_id, category, message, metadata_json, coalesce(created_at, now())
+        FROM temporal_memories_legacy
+    """)
+    op.execute("DROP TABLE temporal_memories_legacy")
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE temporal_memories RENAME TO temporal_memories_partitioned")
+    op.execute(
+        "ALTER INDEX ix_temporal_created_category "
+        "RENAME TO ix_temporal_partitioned_created_category"
+    )
+    op.execute(
+        "ALTER TABLE temporal_memories_partitioned "
+        "RENAME CONSTRAINT temporal_memories_pkey TO temporal_memories_partitioned_pkey"
+    )
+    op.execute("""
+        CREATE TABLE temporal_memories (
+            id uuid PRIMARY KEY,
+            org_id uuid NOT NULL REFERENCES organizations(id) ON DELETE CASCADE,
+            category varchar(128) NOT NULL,
+            message text NOT NULL,
+            metadata_json jsonb,
+            created_at timestamptz DEFAULT now()
+        )
+    """)
+    op.execute(
+        "CREATE INDEX ix_temporal_created_category ON temporal_memories (created_at, category)"
+    )
+    op.execute(f"""
+        INSERT INTO temporal_memories ({_COLUMNS})
+        SELECT {_COLUMNS} FROM temporal_memories_partitioned
+    """)
+    op.execute("DROP TABLE temporal_memories_partitioned CASCADE")
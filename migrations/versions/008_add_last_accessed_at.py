@@ -0,0 +1,41 @@
+"""Track last access on memory_units for set-based significance decay.
+
+Adds last_accessed_at (stamped by SpacedRetrieval.record_access_many),
+backfills it from updated_at for memories that have been accessed, and a
+partial index serving the id-ordered decay batches.
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-16
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "008"
+down_revision: Union[str, None] = "007"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "memory_units",
+        sa.Column("last_accessed_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.execute(
+        "UPDATE memory_units SET last_accessed_at = updated_at WHERE access_count > 0"
+    )
+    op.create_index(
+        "ix_memory_units_decay",
+        "memory_units",
+        ["org_id", "id"],
+        postgresql_where=sa.text("memory_layer <> 'archived' AND last_accessed_at IS NOT NULL"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_memory_units_decay", table_name="memory_units")
+    op.drop_column("memory_units", "last_accessed_at")
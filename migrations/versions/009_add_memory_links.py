@@ -0,0 +1,55 @@
+"""Add memory_links for cross-domain enrichment edges.
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-10-16
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+
+revision: str = "009"
+down_revision: Union[str, None] = "008"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "memory_links",
+        sa.Column(
+            "source_id",
+            UUID(as_uuid=True),
+            sa.ForeignKey("memory_units.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column(
+            "target_id",
+            UUID(as_uuid=True),
+            sa.ForeignKey("memory_units.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column(
+            "org_id",
+            UUID(as_uuid=True),
+            sa.ForeignKey("organizations.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("kind", sa.String(32), nullable=False),
+        sa.Column("score", sa.Float, nullable=False, server_default="0.0"),
+        sa.Column("shared_tags", JSONB, nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.CheckConstraint("source_id < target_id", name="ck_memory_links_ordered"),
+    )
+    op.create_index("ix_memory_links_target", "memory_links", ["target_id"])
+    op.create_index("ix_memory_links_org", "memory_links", ["org_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_memory_links_org", table_name="memory_links")
+    op.drop_index("ix_memory_links_target", table_name="memory_links")
+    op.drop_table("memory_links")
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""Benchmark CMA Stage 2 affinity + clustering.
+
+Compares the original pairwise Python loop against the vectorized dense
+matrix, and dense average-linkage clustering against the blocked
+(threshold-graph) mode.  Dense clustering is skipped for sizes whose
+matrices would not fit in DENSE_MEMORY_LIMIT.
+
+Run with:
+    python scripts/bench_cma_stage2.py [n ...]
+"""
+
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+
+import numpy as np
+
+# Add parent to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from kintsugi.memory.cma_stage2 import (  # noqa: E402
+    DEFAULT_BETA,
+    DEFAULT_LAMBDA,
+    DEFAULT_THRESHOLD,
+    Fact,
+    _affinity_matrix_pairwise,
+    _linkage_labels,
+    build_affinity_matrix,
+    cluster_facts,
+)
+
+DIM = 768
+LOOP_LIMIT = 1000  # the pairwise loop is too slow to time beyond this
+DENSE_MEMORY_LIMIT = 4 * 2**30  # bytes; dense clustering is skipped above this
+
+
+def dense_bytes(n: int) -> int:
+    """Rough peak of dense clustering: affinity, distance and condensed matrices."""
+    return int(2.5 * n * n * 8)
+
+
+def cluster_dense(facts: list[Fact]) -> list[list[Fact]]:
+    """Dense average-linkage clustering at any size.
+
+    ``cluster_facts(block_size=None)`` switches to the blocked mode above
+    DENSE_CLUSTER_LIMIT, so it cannot be used as the dense baseline.
+    """
+    labels = _linkage_labels(facts, DEFAULT_BETA, DEFAULT_LAMBDA, DEFAULT_THRESHOLD)
+    clusters: dict[int, list[Fact]] = {}
+    for fact, label in zip(facts, labels):
+        clusters.setdefault(int(label), []).append(fact)
+    return list(clusters.values())
+
+
+def make_facts(n: int, seed: int = 0) -> list[Fact]:
+    """Facts around n/20 topics, spread over 30 days."""
+    rng = np.random.default_rng(seed)
+    topics = rng.standard_normal((max(1, n // 20), DIM))
+    base = datetime(2025, 1, 1)
+    facts = []
+    for i in range(n):
+        vec = topics[i % len(topics)] + rng.standard_normal(DIM) * 0.3
+        facts.append(Fact(
+            id=f"f{i}",
+            content=f"fact {i}",
+            embedding=(vec / np.linalg.norm(vec)).astype(np.float32),
+            timestamp=base + timedelta(minutes=float(rng.uniform(0, 30 * 1440))),
+        ))
+    return facts
+
+
+def timed(fn, *args, **kwargs):
+    t0 = time.perf_counter()
+    result = fn(*args, **kwargs)
+    return result, time.perf_counter() - t0
+
+
+def bench(n: int) -> None:
+    facts = make_facts(n)
+    dense_fits = dense_bytes(n) <= DENSE_MEMORY_LIMIT
+    print(f"\nn = {n}")
+
+    if n <= LOOP_LIMIT:
+        ref, t_loop = timed(_affinity_matrix_pairwise, facts)
+        vec, t_vec = timed(build_affinity_matrix, facts)
+        err = float(np.max(np.abs(ref - vec)))
+        print(f"  affinity  loop       {t_loop * 1000:10.1f} ms")
+        print(f"  affinity  vectorized {t_vec * 1000:10.1f} ms"
+              f"  ({t_loop / t_vec:.0f}x, max |diff| {err:.1e})")
+    elif dense_fits:
+        _, t_vec = timed(build_affinity_matrix, facts)
+        print(f"  affinity  vectorized {t_vec * 1000:10.1f} ms"
+              f"  ({n * n * 8 / 2**20:.0f} MiB dense)")
+
+    blocked, t_blocked = timed(cluster_facts, facts, block_size=512)
+    if not dense_fits:
+        print(f"  cluster   dense      {'skipped':>10}     "
+              f"(~{dense_bytes(n) / 2**30:.1f} GiB > {DENSE_MEMORY_LIMIT / 2**30:.0f} GiB)")
+        print(f"  cluster   blocked    {t_blocked * 1000:10.1f} ms  ({len(blocked)} clusters)")
+        return
+    dense, t_dense = timed(cluster_dense, facts)
+    same = [[f.id for f in c] for c in dense] == [[f.id for f in c] for c in blocked]
+    print(f"  cluster   dense      {t_dense * 1000:10.1f} ms  ({len(dense)} clusters)")
+    print(f"  cluster   blocked    {t_blocked * 1000:10.1f} ms  (identical: {same})")
+
+
+def main() -> None:
+    sizes = [int(a) for a in sys.argv[1:]] or [250, 1000, 5000]
+    print("=" * 60)
+    print("CMA Stage 2 — affinity / clustering benchmark")
+    print("=" * 60)
+    for n in sizes:
+        bench(n)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""Benchmark cold-archive codecs on synthetic dialogue windows.
+
+Compares the original per-window gzip path against zstd with and without
+a trained dictionary: total compression ratio and compress / decompress
+throughput over the raw window bytes.
+
+Run with:
+    python scripts/bench_cold_archive.py [n_windows ...]
+"""
+
+import os
+import random
+import sys
+import time
+
+# Add parent to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from kintsugi.memory.archive_codecs import (  # noqa: E402
+    GzipCodec,
+    ZstdCodec,
+    train_dictionary,
+)
+
+TOPICS = ["food bank", "volunteer shift", "grant report", "board meeting", "donor list"]
+ASKS = ["when is the next", "who is covering the", "can you summarise the", "remind me about the"]
+
+
+def make_windows(n: int, seed: int = 0) -> list[bytes]:
+    """Short, repetitive user/assistant windows like those Stage 1 archives."""
+    rng = random.Random(seed)
+    windows = []
+    for i in range(n):
+        turns = []
+        for _ in range(rng.randint(2, 6)):
+            topic = rng.choice(TOPICS)
+            turns.append(f"user: {rng.choice(ASKS)} {topic}?")
+            turns.append(
+                f"assistant: the {topic} is on day {rng.randint(1, 28)} at "
+                f"{rng.randint(8, 18)}:00, ticket #{rng.randint(1000, 9999)}."
+            )
+        windows.append("\n".join(turns).encode("utf-8"))
+    return windows
+
+
+def bench_codec(name: str, codec, windows: list[bytes]) -> None:
+    raw = sum(len(w) for w in windows)
+
+    t0 = time.perf_counter()
+    blobs = [codec.compress(w) for w in windows]
+    t_c = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    for b in blobs:
+        codec.decompress(b)
+    t_d = time.perf_counter() - t0
+
+    packed = sum(len(b) for b in blobs)
+    print(f"  {name:<12} ratio {raw / packed:5.2f}x"
+          f"   compress {raw / t_c / 2**20:8.1f} MiB/s"
+          f"   decompress {raw / t_d / 2**20:8.1f} MiB/s")
+
+
+def bench(n: int) -> None:
+    windows = make_windows(n)
+    train, test = windows[: n // 2], windows[n // 2:]
+    print(f"\nn = {n}  ({sum(len(w) for w in test) / 1024:.0f} KiB measured,"
+          f" dictionary trained on the other {len(train)})")
+
+    t0 = time.perf_counter()
+    dictionary = train_dictionary(train)
+    print(f"  dictionary  {len(dictionary)} bytes in {(time.perf_counter() - t0) * 1000:.0f} ms")
+
+    bench_codec("gzip-6", GzipCodec(), test)
+    bench_codec("zstd-3", ZstdCodec(), test)
+    bench_codec("zstd-3+dict", ZstdCodec(dictionary=dictionary), test)
+
+
+def main() -> None:
+    sizes = [int(a) for a in sys.argv[1:]] or [1000, 10000]
+    print("=" * 60)
+    print("Cold archive — codec benchmark")
+    print("=" * 60)
+    for n in sizes:
+        bench(n)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""Latency benchmark for /api/memory/search against a seeded Postgres.
+
+Compares the original path (three statements with a text-literal query
+vector, serialized on one AsyncSession, then Python-side Stage 3 fusion)
+with :func:`kintsugi.memory.hybrid_search.hybrid_search`, which binds the
+vector natively and fuses server-side in a single statement.
+
+Requires a migrated database (``alembic upgrade head``) at DATABASE_URL.
+
+Run with:
+    DATABASE_URL=postgresql+asyncpg://... python scripts/bench_memory_search.py \\
+        --seed 20000 --queries 200
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+import uuid
+
+import numpy as np
+
+# Add parent to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import text  # noqa: E402
+
+from kintsugi.db import async_session  # noqa: E402
+from kintsugi.memory.cma_stage3 import ScoredResult, retrieve  # noqa: E402
+from kintsugi.memory.hybrid_search import hybrid_search  # noqa: E402
+
+DIM = 768
+WORDS = (
+    "grant budget volunteer donor board meeting deadline food pantry housing "
+    "report outreach newsletter event schedule training shift coalition rent"
+).split()
+
+_LEGACY_VIEWS = {
+    "dense": """
+        SELECT mu.id, mu.content, mu.significance, mu.memory_layer, mu.created_at,
+               1 - (me.embedding <=> :query_vec::vector) AS score
+        FROM memory_units mu
+        JOIN memory_embeddings me ON me.memory_id = mu.id
+        WHERE mu.org_id = :org_id
+        ORDER BY me.embedding <=> :query_vec::vector
+        LIMIT :limit
+    """,
+    "lexical": """
+        SELECT mu.id, mu.content, mu.significance, mu.memory_layer, mu.created_at,
+               ts_rank(ml.tsv, plainto_tsquery('english', :query)) AS score
+        FROM memory_units mu
+        JOIN memory_lexical ml ON ml.memory_id = mu.id
+        WHERE mu.org_id = :org_id AND ml.tsv @@ plainto_tsquery('english', :query)
+        ORDER BY score DESC
+        LIMIT :limit
+    """,
+    "symbolic": """
+        SELECT mu.id, mu.content, mu.significance, mu.memory_layer, mu.created_at,
+               (10 - mu.significance)::float / 10.0 AS score
+        FROM memory_units mu
+        WHERE mu.org_id = :org_id
+        ORDER BY mu.significance ASC, mu.created_at DESC
+        LIMIT :limit
+    """,
+}
+
+
+def _vec_literal(vec) -> str:
+    return "[" + ",".join(str(float(v)) for v in vec) + "]"
+
+
+def _random_vec(rng: np.random.Generator) -> np.ndarray:
+    v = rng.standard_normal(DIM).astype(np.float32)
+    return v / np.linalg.norm(v)
+
+
+async def seed(org_id: uuid.UUID, n: int, rng: np.random.Generator) -> None:
+    print(f"Seeding {n} memories for org {org_id} ...")
+    async with async_session() as session:
+        await session.execute(
+            text("INSERT INTO organizations (id, name) VALUES (:id, :name) ON CONFLICT DO NOTHING"),
+            {"id": org_id, "name": f"bench-{org_id.hex[:8]}"},
+        )
+        for start in range(0, n, 1000):
+            units, embs, lex = [], [], []
+            for _ in range(start, min(start + 1000, n)):
+                mid = uuid.uuid4()
+                content = " ".join(rng.choice(WORDS, size=12))
+                units.append({"id": mid, "org_id": org_id, "content": content,
+                              "significance": int(rng.integers(1, 11))})
+                embs.append({"id": uuid.uuid4(), "memory_id": mid, "embedding": _random_vec(rng)})
+                lex.append({"id": uuid.uuid4(), "memory_id": mid, "content": content})
+            await session.execute(text(
+                "INSERT INTO memory_units (id, org_id, content, significance) "
+                "VALUES (:id, :org_id, :content, :significance)"), units)
+            await session.execute(text(
+                "INSERT INTO memory_embeddings (id, memory_id, embedding) "
+                "VALUES (:id, :memory_id, CAST(:embedding AS vector))"), embs)
+            await session.execute(text(
+                "INSERT INTO memory_lexical (id, memory_id, tsv) "
+                "VALUES (:id, :memory_id, to_tsvector('english', :content))"), lex)
+        await session.commit()
+
+
+async def run_legacy(session, vec, query, org_id, limit) -> None:
+    lit = _vec_literal(vec)
+    params = {"query_vec": lit, "query": query, "org_id": str(org_id), "limit": limit}
+    views = {}
+    for name, sql in _LEGACY_VIEWS.items():
+        keys = [k for k in params if f":{k}" in sql]
+        rows = (await session.execute(text(sql), {k: params[k] for k in keys})).fetchall()
+        views[name] = [
+            ScoredResult(id=str(r.id), content=r.content, score=float(r.score), source=name)
+            for r in rows
+        ]
+    retrieve(query, dense_results=views["dense"], lexical_results=views["lexical"],
+             symbolic_results=views["symbolic"], n_results=limit)
+
+
+async def run_server(session, vec, query, org_id, limit) -> None:
+    await hybrid_search(session, query, vec, str(org_id), n_results=limit)
+
+
+async def bench(name, fn, org_id, n_queries, limit, rng) -> None:
+    timings = []
+    async with async_session() as session:
+        for _ in range(n_queries):
+            vec = _random_vec(rng)
+            query = " ".join(rng.choice(WORDS, size=3))
+            t0 = time.perf_counter()
+            await fn(session, vec, query, org_id, limit)
+            timings.append((time.perf_counter() - t0) * 1000)
+    timings.sort()
+    p95 = timings[int(0.95 * (len(timings) - 1))]
+    print(f"  {name:<8} p50 {statistics.median(timings):7.2f} ms   p95 {p95:7.2f} ms")
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--org-id", type=uuid.UUID, default=None)
+    parser.add_argument("--seed", type=int, default=0, help="memories to insert first")
+    parser.add_argument("--queries", type=int, default=100)
+    parser.add_argument("--limit", type=int, default=10)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    org_id = args.org_id or uuid.uuid4()
+    if args.seed:
+        await seed(org_id, args.seed, rng)
+
+    print("=" * 60)
+    print(f"Memory search latency ({args.queries} queries, limit {args.limit})")
+    print("=" * 60)
+    await bench("legacy", run_legacy, org_id, args.queries, args.limit, rng)
+    await bench("server", run_server, org_id, args.queries, args.limit, rng)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
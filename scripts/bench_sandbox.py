@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""Throughput benchmark: cold-spawn sandbox vs the warm worker pool.
+
+Runs the same small snippet through
+
+- ``ShadowSandbox.execute_in_sandbox`` (new temp dir and ``python3`` per
+  call), one at a time and from ``--concurrency`` threads, and
+- :class:`kintsugi.security.sandbox_pool.SandboxPool` with
+  ``--concurrency`` workers, one job at a time and ``--concurrency`` at
+  once,
+
+and reports executions/sec for each.
+
+Run with:
+    python scripts/bench_sandbox.py --jobs 200 --concurrency 4
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+# Add parent to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from kintsugi.security.sandbox import ShadowSandbox  # noqa: E402
+from kintsugi.security.sandbox_pool import SandboxPool  # noqa: E402
+
+SNIPPET = """
+import json
+rows = [{"id": i, "total": i * 3} for i in range(200)]
+print(json.dumps(sum(r["total"] for r in rows)))
+"""
+EXPECTED = f"{sum(i * 3 for i in range(200))}\n"
+
+
+def report(label: str, jobs: int, elapsed: float, results: list) -> None:
+    assert all(r.stdout == EXPECTED for r in results), "unexpected output"
+    print(f"  {label:<34} {jobs / elapsed:8.1f} exec/s   {elapsed / jobs * 1000:7.2f} ms/exec")
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--jobs", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=4)
+    args = parser.parse_args()
+    n, c = args.jobs, args.concurrency
+
+    print("=" * 72)
+    print(f"Sandbox executions ({n} jobs, concurrency {c})")
+    print("=" * 72)
+
+    sandbox = ShadowSandbox()
+    t0 = time.perf_counter()
+    results = [sandbox.execute_in_sandbox(SNIPPET) for _ in range(n)]
+    report("cold spawn, sequential", n, time.perf_counter() - t0, results)
+
+    sem = asyncio.Semaphore(c)
+
+    async def cold() -> object:
+        async with sem:
+            return await asyncio.to_thread(sandbox.execute_in_sandbox, SNIPPET)
+
+    t0 = time.perf_counter()
+    results = await asyncio.gather(*(cold() for _ in range(n)))
+    report(f"cold spawn, {c} threads", n, time.perf_counter() - t0, results)
+
+    async with SandboxPool(size=c) as pool:
+        t0 = time.perf_counter()
+        results = [await pool.run(SNIPPET) for _ in range(n)]
+        report("warm pool, sequential", n, time.perf_counter() - t0, results)
+
+        t0 = time.perf_counter()
+        results = await asyncio.gather(*(pool.run(SNIPPET) for _ in range(n)))
+        report(f"warm pool, {c} workers", n, time.perf_counter() - t0, results)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""Contention benchmark for Shield admission.
+
+Many coroutines share one Shield and each spends a small cost per call.
+Every call awaits once (like the tool call it guards) before it records
+the spend.  The benchmark compares:
+
+- ``check_action`` + ``record_spend``, the pattern used before
+  ``Shield.admit``: the check and the spend sit on opposite sides of the
+  await, so concurrent callers overspend;
+- ``Shield.admit`` on the Shield's own enforcers;
+- ``Shield.admit`` on a shared :class:`InProcessShieldState`;
+- ``Shield.admit`` on :class:`RedisShieldState`, only when ``--redis-url``
+  is given (per-call time is then dominated by the round trip).
+
+It reports per-call overhead, calls allowed and total spend against the
+session limit.  In-process overhead is checked against ``--budget-us``.
+
+Run with:
+    python scripts/bench_shield.py --coroutines 1000 --calls 20 [--redis-url redis://...]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+import uuid
+
+# Add parent to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from kintsugi.security.shield import Shield, ShieldConfig, ShieldDecision  # noqa: E402
+from kintsugi.security.shield_state import InProcessShieldState, RedisShieldState  # noqa: E402
+
+COST = 0.01
+
+
+async def legacy(shield: Shield) -> bool:
+    verdict = shield.check_action("llm", cost=COST, tool="search")
+    await asyncio.sleep(0)
+    if verdict.decision is ShieldDecision.ALLOW:
+        shield.budget.record_spend(COST)
+        return True
+    return False
+
+
+async def admitted(shield: Shield) -> bool:
+    verdict = await shield.admit("llm", cost=COST, tool="search")
+    await asyncio.sleep(0)
+    return verdict.decision is ShieldDecision.ALLOW
+
+
+async def run(label: str, shield: Shield, call, coroutines: int, calls: int,
+              budget_us: float = 0.0) -> None:
+    async def worker() -> int:
+        return sum([await call(shield) for _ in range(calls)])
+
+    # Baseline: the same coroutines doing only the await.
+    async def idle() -> None:
+        for _ in range(calls):
+            await asyncio.sleep(0)
+
+    t0 = time.perf_counter()
+    await asyncio.gather(*(idle() for _ in range(coroutines)))
+    baseline = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    allowed = sum(await asyncio.gather(*(worker() for _ in range(coroutines))))
+    elapsed = time.perf_counter() - t0
+
+    total = coroutines * calls
+    overhead_us = max(0.0, elapsed - baseline) / total * 1e6
+    if shield.state is None:
+        spent = shield.budget.session_spent
+    else:
+        spent = (await shield.state.spent(shield.scope))[0]
+    limit = shield.config.budget_session_limit
+    status = ""
+    if budget_us:
+        status = "ok" if overhead_us <= budget_us else f"OVER {budget_us:.0f} us budget"
+    print(f"  {label:<28} {overhead_us:7.2f} us/call   allowed {allowed:6d}/{total}"
+          f"   spent {spent:8.2f}/{limit:.2f}"
+          f"{'   OVERSPENT' if spent > limit + 1e-9 else ''}   {status}")
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--coroutines", type=int, default=1000)
+    parser.add_argument("--calls", type=int, default=20, help="admissions per coroutine")
+    parser.add_argument("--budget-us", type=float, default=20.0,
+                        help="per-call overhead budget for in-process admission")
+    parser.add_argument("--redis-url", default="", help="also run against this Redis")
+    args = parser.parse_args()
+
+    total = args.coroutines * args.calls
+    config = ShieldConfig(
+        # Room for half of the calls, so the limit is hit under contention.
+        budget_session_limit=COST * total / 2,
+        budget_daily_limit=COST * total,
+        rate_limits={"search": {"rate": 0.0, "burst": float(total)}},
+    )
+
+    print("=" * 72)
+    print(f"Shield admission under contention ({args.coroutines} coroutines x "
+          f"{args.calls} calls)")
+    print("=" * 72)
+    await run("check_action+record_spend", Shield(config), legacy,
+              args.coroutines, args.calls)
+    await run("admit (own enforcers)", Shield(config), admitted,
+              args.coroutines, args.calls, args.budget_us)
+    await run("admit (InProcessShieldState)", Shield(config, state=InProcessShieldState()),
+              admitted, args.coroutines, args.calls, args.budget_us)
+    if args.redis_url:
+        import redis.asyncio as redis_asyncio
+
+        client = redis_asyncio.from_url(args.redis_url)
+        state = RedisShieldState(client, prefix=f"bench:{uuid.uuid4().hex[:8]}")
+        await run("admit (RedisShieldState)", Shield(config, state=state), admitted,
+                  args.coroutines, args.calls)
+        await client.aclose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""Query benchmark for the partitioned, full-text-indexed temporal log.
+
+Seeds synthetic events (10M by default) spread over 24 months into
+``temporal_memories`` and, for comparison, into an unpartitioned copy
+without the tsvector column (``bench_temporal_flat``), the layout before
+migration 007.  Then it times the queries ``TemporalLog.query_events``
+issues:
+
+- keyword over all time: ``ILIKE '%kw%'`` (flat) vs ``message_tsv @@``
+- keyword within one month: the same, with a ``created_at`` range, which
+  the partitioned table prunes to a single partition
+- latest events in one month (no keyword)
+
+Seeding is done server-side with ``generate_series`` in 1M-row steps.
+
+Requires a migrated database (``alembic upgrade head``) at DATABASE_URL.
+
+Run with:
+    DATABASE_URL=postgresql+asyncpg://... python scripts/bench_temporal_log.py \\
+        --seed 10000000 --queries 50
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import sys
+import time
+import uuid
+from datetime import datetime, timezone
+
+# Add parent to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import text  # noqa: E402
+
+from kintsugi.db import async_session  # noqa: E402
+from kintsugi.memory.temporal_partitions import (  # noqa: E402
+    TemporalPartitionManager,
+    add_months,
+    month_start,
+)
+
+MONTHS = 24
+STEP = 1_000_000
+WORDS = (
+    "grant budget volunteer donor board meeting deadline pantry housing "
+    "report outreach newsletter schedule training shift coalition rent"
+).split()
+CATEGORIES = ["DECISION", "MEMORY", "SECURITY", "interaction"]
+
+_SEED = """
+    INSERT INTO {table} (id, org_id, category, message, metadata_json, created_at)
+    SELECT gen_random_uuid(), :org_id,
+           (CAST(:categories AS text[]))[1 + (g % 4)],
+           array_to_string(ARRAY(
+               SELECT (CAST(:words AS text[]))[1 + ((g * 7 + k * 13) % :n_words)]
+               FROM generate_series(1, 8) k), ' '),
+           NULL,
+           CAST(:origin AS timestamptz) + make_interval(months => :months) * (g::float8 / :total)
+    FROM generate_series(CAST(:lo AS bigint), CAST(:hi AS bigint) - 1) g
+"""
+
+QUERIES = {
+    "keyword, all time": (
+        "SELECT id FROM bench_temporal_flat WHERE org_id = :org_id "
+        "AND message ILIKE :pattern ORDER BY created_at DESC LIMIT 50",
+        "SELECT id FROM temporal_memories WHERE org_id = :org_id "
+        "AND message_tsv @@ websearch_to_tsquery('english', :kw) "
+        "ORDER BY created_at DESC LIMIT 50",
+    ),
+    "keyword, one month": (
+        "SELECT id FROM bench_temporal_flat WHERE org_id = :org_id "
+        "AND created_at >= :lo AND created_at < :hi "
+        "AND message ILIKE :pattern ORDER BY created_at DESC LIMIT 50",
+        "SELECT id FROM temporal_memories WHERE org_id = :org_id "
+        "AND created_at >= :lo AND created_at < :hi "
+        "AND message_tsv @@ websearch_to_tsquery('english', :kw) "
+        "ORDER BY created_at DESC LIMIT 50",
+    ),
+    "latest, one month": (
+        "SELECT id FROM bench_temporal_flat WHERE org_id = :org_id "
+        "AND created_at >= :lo AND created_at < :hi ORDER BY created_at DESC LIMIT 50",
+        "SELECT id FROM temporal_memories WHERE org_id = :org_id "
+        "AND created_at >= :lo AND created_at < :hi ORDER BY created_at DESC LIMIT 50",
+    ),
+}
+
+
+async def seed(org_id: uuid.UUID, n: int, origin: datetime) -> None:
+    print(f"Seeding {n} events over {MONTHS} months for org {org_id} ...")
+    async with async_session() as session:
+        partitions = TemporalPartitionManager(months_ahead=0)
+        for m in range(MONTHS):
+            await partitions.ensure_partitions(session, add_months(origin, m))
+        await session.execute(
+            text("INSERT INTO organizations (id, name) VALUES (:id, :name) ON CONFLICT DO NOTHING"),
+            {"id": org_id, "name": f"bench-{org_id.hex[:8]}"},
+        )
+        await session.execute(text("""
+            CREATE TABLE IF NOT EXISTS bench_temporal_flat (
+                id uuid PRIMARY KEY, org_id uuid NOT NULL, category varchar(128) NOT NULL,
+                message text NOT NULL, metadata_json jsonb, created_at timestamptz
+            )
+        """))
+        await session.execute(text(
+            "CREATE INDEX IF NOT EXISTS ix_bench_flat_created_category "
+            "ON bench_temporal_flat (created_at, category)"
+        ))
+        await session.commit()
+
+        params = {
+            "org_id": org_id, "categories": CATEGORIES, "words": WORDS,
+            "n_words": len(WORDS), "origin": origin, "months": MONTHS,
+            "total": n,
+        }
+        for table in ("temporal_memories", "bench_temporal_flat"):
+            t0 = time.perf_counter()
+            for lo in range(0, n, STEP):
+                await session.execute(
+                    text(_SEED.format(table=table)), {**params, "lo": lo, "hi": min(lo + STEP, n)},
+                )
+                await session.commit()
+            print(f"  {table:<20} {n / (time.perf_counter() - t0):10.0f} rows/s")
+        await session.execute(text("ANALYZE temporal_memories"))
+        await session.execute(text("ANALYZE bench_temporal_flat"))
+        await session.commit()
+
+
+async def bench(org_id: uuid.UUID, origin: datetime, n_queries: int) -> None:
+    rng = random.Random(0)
+    async with async_session() as session:
+        for label, (flat_sql, part_sql) in QUERIES.items():
+            results = []
+            for sql in (flat_sql, part_sql):
+                timings = []
+                for _ in range(n_queries):
+                    kw = rng.choice(WORDS)
+                    lo = add_months(origin, rng.randrange(MONTHS))
+                    params = {"org_id": org_id, "kw": kw, "pattern": f"%{kw}%",
+                              "lo": lo, "hi": add_months(lo, 1)}
+                    keys = {k: v for k, v in params.items() if f":{k}" in sql}
+                    t0 = time.perf_counter()
+                    (await session.execute(text(sql), keys)).fetchall()
+                    timings.append((time.perf_counter() - t0) * 1000)
+                timings.sort()
+                results.append((statistics.median(timings),
+                                timings[int(0.95 * (len(timings) - 1))]))
+            (f50, f95), (p50, p95) = results
+            print(f"  {label:<20} flat p50 {f50:8.2f} ms  p95 {f95:8.2f} ms"
+                  f"   partitioned p50 {p50:8.2f} ms  p95 {p95:8.2f} ms")
+
+        lo = add_months(origin, MONTHS // 2)
+        plan = (await session.execute(
+            text("EXPLAIN " + QUERIES["keyword, one month"][1]),
+            {"org_id": org_id, "kw": "grant", "lo": lo, "hi": add_months(lo, 1)},
+        )).scalars().all()
+        scanned = sorted({w for line in plan for w in line.split()
+                          if w.startswith("temporal_memories_p")})
+        print(f"\n  one-month plan touches partitions: {', '.join(scanned) or '-'}")
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--org-id", type=uuid.UUID, default=None)
+    parser.add_argument("--seed", type=int, default=10_000_000, help="events to insert first")
+    parser.add_argument("--queries", type=int, default=50)
+    args = parser.parse_args()
+
+    org_id = args.org_id or uuid.uuid4()
+    origin = add_months(month_start(datetime.now(timezone.utc)), -(MONTHS - 1))
+    if args.seed:
+        await seed(org_id, args.seed, origin)
+
+    print("=" * 72)
+    print(f"Temporal log query latency ({args.queries} queries each)")
+    print("=" * 72)
+    await bench(org_id, origin, args.queries)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
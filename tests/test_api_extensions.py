@@ -239,6 +239,17 @@ class TestPIIRedactionMiddleware:
             assert "user@example.com" not in r.text
             assert r.headers.get("x-pii-redacted") == "true"
 
+    @pytest.mark.asyncio
+    async def test_large_json_is_streamed(self):
+        app = _make_app()
+        transport = ASGITransport(app=app)
+        with patch("kintsugi.api.middleware.settings.PII_BUFFER_LIMIT_BYTES", 8):
+            async with AsyncClient(transport=transport, base_url="http://test") as client:
+                r = await client.get("/api/data")
+        assert r.headers.get("x-pii-redacted") == "streamed"
+        assert r.json() == {"email": "[REDACTED_EMAIL]", "name": "Alice"}
+        assert "content-length" not in r.headers
+
     @pytest.mark.asyncio
     async def test_non_json_gets_false_header(self):
         app = _make_app()
@@ -0,0 +1,88 @@
+"""Tests for kintsugi.memory.archive_codecs."""
+
+from __future__ import annotations
+
+import pickle
+
+import pytest
+
+from kintsugi.memory.archive_codecs import (
+    MIN_TRAINING_SAMPLES,
+    GzipCodec,
+    ZstdCodec,
+    get_codec,
+    train_dictionary,
+)
+from kintsugi.memory.cold_archive import _compress, _decompress
+
+
+def _windows(n: int) -> list[bytes]:
+    return [
+        (
+            f"user: can you remind me when the volunteer shift {i} starts?\n"
+            f"assistant: the shift {i} starts at {8 + i % 4}:00 at the community hall."
+        ).encode()
+        for i in range(n)
+    ]
+
+
+class TestGzipCodec:
+    def test_matches_legacy_format(self):
+        data = "user: hi\nassistant: hello".encode()
+        assert _decompress(GzipCodec().compress(data)) == data.decode()
+        assert GzipCodec().decompress(_compress("legacy row")) == b"legacy row"
+
+    def test_rejects_dictionary(self):
+        with pytest.raises(ValueError):
+            get_codec("gzip", b"dict")
+
+
+class TestZstdCodec:
+    def test_round_trip(self):
+        codec = get_codec("zstd")
+        assert codec.name == "zstd"
+        assert codec.decompress(codec.compress(b"hello " * 50)) == b"hello " * 50
+
+    def test_dictionary_improves_ratio(self):
+        samples = _windows(200)
+        dictionary = train_dictionary(samples, dict_size=4096)
+        plain, trained = ZstdCodec(), ZstdCodec(dictionary=dictionary)
+
+        probe = samples[7]
+        assert trained.decompress(trained.compress(probe)) == probe
+        assert len(trained.compress(probe)) < len(plain.compress(probe))
+
+    def test_picklable_for_process_pools(self):
+        dictionary = train_dictionary(_windows(200), dict_size=4096)
+        codec = ZstdCodec(level=5, dictionary=dictionary)
+        blob = codec.compress(b"user: x\nassistant: y")
+
+        clone = pickle.loads(pickle.dumps(codec))
+        assert clone.level == 5
+        assert clone.decompress(blob) == b"user: x\nassistant: y"
+
+    def test_contexts_are_per_thread(self):
+        from concurrent.futures import ThreadPoolExecutor
+
+        codec = ZstdCodec(dictionary=train_dictionary(_windows(200), dict_size=4096))
+        windows = _windows(64)
+
+        def round_trip(data: bytes) -> tuple[bool, object]:
+            ok = codec.decompress(codec.compress(data)) == data
+            return ok, codec._contexts()[0]
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(pool.map(round_trip, windows * 4))
+        assert all(ok for ok, _ in results)
+        main = codec._contexts()[0]
+        assert main is codec._contexts()[0]
+        assert all(cctx is not main for _, cctx in results)
+
+    def test_too_few_samples(self):
+        with pytest.raises(ValueError, match="samples"):
+            train_dictionary(_windows(MIN_TRAINING_SAMPLES - 1))
+
+
+def test_unknown_codec():
+    with pytest.raises(ValueError, match="Unknown archive codec"):
+        get_codec("lz4")
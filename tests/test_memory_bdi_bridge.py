@@ -8,6 +8,7 @@ import pytest
 
 from kintsugi.memory.bdi_bridge import (
     BDIBridge,
+    BDIIndex,
     Belief,
     Desire,
     Intention,
@@ -297,3 +298,76 @@ class TestProcessPipeline:
         beliefs, ranked = bridge.process_pipeline([], [], [])
         assert beliefs == []
         assert ranked == []
+
+    def test_pipeline_matches_chained_methods(self):
+        bridge = BDIBridge()
+        mems = [
+            {"id": str(i), "content": f"fact {i % 4}", "significance": i % 10,
+             "tags": [["ai"], ["ops"], []][i % 3], "score": round(0.1 * (i % 5), 2)}
+            for i in range(30)
+        ]
+        desires = [
+            Desire(id="d1", description="ai", priority=0.8, related_tags=["ai"]),
+            Desire(id="d2", description="ops", priority=0.3, related_tags=["ops"]),
+        ]
+        intentions = [
+            Intention(id="i1", goal="g", status="active",
+                      belief_ids=[BDIBridge._content_hash("fact 1"), "7"]),
+        ]
+        chained = bridge.prioritize_by_intentions(
+            bridge.apply_desire_bias(mems, desires), intentions,
+        )
+        _, ranked = bridge.process_pipeline(mems, desires, intentions)
+        assert ranked == chained
+
+
+# ---------------------------------------------------------------------------
+# Index cache
+# ---------------------------------------------------------------------------
+
+
+class TestIndexCache:
+    def test_index_reused_per_version(self):
+        bridge = BDIBridge()
+        desires = [Desire(id="d1", description="x", priority=1.0, related_tags=["ai"])]
+        first = bridge.index(desires, [], version=3)
+        assert bridge.index(desires, [], version=3) is first
+        assert bridge.index(desires, [], version=4) is not first
+        assert bridge.index(desires, []) is not bridge.index(desires, [])
+
+    def test_same_version_of_other_org_is_not_reused(self):
+        bridge = BDIBridge()
+        ours = bridge.index(
+            [Desire(id="d1", description="x", priority=1.0, related_tags=["ai"])], [],
+            version=1, org_id="org-a",
+        )
+        theirs = bridge.index([], [], version=1, org_id="org-b")
+        assert theirs is not ours and not theirs.has_desires
+        assert bridge.index([], [], version=1, org_id="org-a") is ours
+
+    def test_inverted_index_keeps_best_boost(self):
+        index = BDIIndex.build([
+            Desire(id="a", description="a", priority=0.5, related_tags=["x"], boost_factor=2.0),
+            Desire(id="b", description="b", priority=1.0, related_tags=["x", "y"]),
+        ])
+        assert index.tag_boosts == {"x": 1.5, "y": pytest.approx(1.3)}
+
+    def test_store_revision_invalidates(self):
+        from datetime import datetime, timezone
+
+        from kintsugi.bdi import BDIDesire, BDIStore, DesireStatus
+
+        store = BDIStore("org")
+        bridge = BDIBridge(store=store)
+        assert store.revision == store.get_snapshot().version == 1
+        index = bridge.index([], [], version=store.revision, org_id="org")
+        assert bridge.index([], [], version=store.revision, org_id="org") is index
+
+        store.add_desire(BDIDesire(
+            id="d1", content="serve members", priority=0.5, status=DesireStatus.ACTIVE,
+            related_tags=["members"], measurable=False, metric=None,
+            created_at=datetime.now(timezone.utc),
+        ))
+        assert store.revision == 2
+        assert store.get_snapshot().version == 2
+        assert "org" not in bridge._indexes
@@ -0,0 +1,290 @@
+"""Tests for kintsugi.memory.bulk_ingest (resumable NDJSON ingestion)."""
+
+from __future__ import annotations
+
+import json
+import uuid
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from kintsugi.memory.bulk_ingest import (
+    BulkMemory,
+    ingest_ndjson,
+    iter_ndjson_lines,
+    parse_memory_line,
+    write_chunk,
+)
+
+ORG = str(uuid.uuid4())
+
+
+class FakeResult:
+    def __init__(self, row=None):
+        self._row = row
+
+    def first(self):
+        return self._row
+
+
+class FakeDriverConnection:
+    """asyncpg-like: COPY joins the open transaction, else autocommits."""
+
+    def __init__(self, session):
+        self.session = session
+
+    def is_in_transaction(self):
+        return self.session.in_transaction
+
+    async def copy_records_to_table(self, table, *, records, columns):
+        if table == self.session.fail_copy:
+            raise RuntimeError(f"COPY into {table} failed")
+        statement = (f"COPY {table}", records)
+        if self.session.in_transaction:
+            self.session.pending.append(statement)
+        else:
+            self.session.transactions.append([statement])
+
+
+class FakeConnection:
+    def __init__(self, session):
+        self.dialect = SimpleNamespace(driver=session.driver)
+        self._session = session
+
+    async def get_raw_connection(self):
+        return SimpleNamespace(driver_connection=FakeDriverConnection(self._session))
+
+
+class FakeSession:
+    """Records statements; commits snapshot them as one transaction.
+
+    Like SQLAlchemy's asyncpg adapter, the transaction only opens on the
+    first ``execute`` after a commit.
+    """
+
+    def __init__(self, checkpoint=None, driver="psycopg"):
+        self.checkpoint = checkpoint
+        self.driver = driver
+        self.fail_copy = None
+        self.in_transaction = False
+        self.pending: list[tuple[str, object]] = []
+        self.transactions: list[list[tuple[str, object]]] = []
+
+    async def connection(self):
+        return FakeConnection(self)
+
+    async def execute(self, stmt, params=None):
+        self.in_transaction = True
+        sql = str(stmt)
+        if "FROM memory_ingest_checkpoints" in sql:
+            return FakeResult(self.checkpoint)
+        self.pending.append((sql, params))
+        return FakeResult()
+
+    async def commit(self):
+        self.transactions.append(self.pending)
+        self.pending = []
+        self.in_transaction = False
+
+
+class FakeProvider:
+    model_id = "fake-model"
+
+    def __init__(self):
+        self.batches: list[list[str]] = []
+
+    async def embed_batch(self, texts):
+        self.batches.append(list(texts))
+        return [np.zeros(4, dtype=np.float32) for _ in texts]
+
+
+async def _stream(*chunks):
+    for chunk in chunks:
+        yield chunk
+
+
+def _ndjson(n: int) -> bytes:
+    return b"".join(
+        json.dumps({"content": f"note {i}", "significance": 3}).encode() + b"\n"
+        for i in range(n)
+    )
+
+
+def _units(transaction):
+    return [p for sql, p in transaction if "INSERT INTO memory_units" in sql]
+
+
+class TestParseMemoryLine:
+    def test_defaults(self):
+        m = parse_memory_line('{"content": "hello"}')
+        assert m == BulkMemory(content="hello")
+
+    def test_full(self):
+        m = parse_memory_line(
+            '{"content": "x", "significance": 9, "entity_type": "event", "extra": {"a": 1}}'
+        )
+        assert (m.significance, m.entity_type, m.extra) == (9, "event", {"a": 1})
+
+    @pytest.mark.parametrize("line", [
+        "not json",
+        "[1, 2]",
+        '{"content": ""}',
+        '{"content": "x", "significance": 11}',
+        '{"content": "x", "significance": true}',
+        '{"content": "x", "extra": [1]}',
+    ])
+    def test_rejects(self, line):
+        with pytest.raises(ValueError):
+            parse_memory_line(line)
+
+
+class TestIterNdjsonLines:
+    @pytest.mark.asyncio
+    async def test_lines_split_across_chunks(self):
+        text = "é first\nsecond\r\nthird".encode()
+        chunks = [text[i:i + 3] for i in range(0, len(text), 3)]
+        lines = [line async for line in iter_ndjson_lines(_stream(*chunks))]
+        assert lines == ["é first", "second", "third"]
+
+
+class TestIngestNdjson:
+    @pytest.mark.asyncio
+    async def test_one_batch_and_transaction_per_chunk(self):
+        session, provider = FakeSession(), FakeProvider()
+        seen = []
+        progress = await ingest_ndjson(
+            session, ORG, _stream(_ndjson(5)), provider,
+            job_id="job-1", chunk_size=2,
+            on_progress=lambda p: seen.append(p.lines_committed),
+        )
+        assert progress.memories_committed == 5
+        assert progress.chunks_committed == 3
+        assert [len(b) for b in provider.batches] == [2, 2, 1]
+        assert seen == [2, 4, 5]
+
+        first = session.transactions[0]
+        assert len(_units(first)) == 1 and len(_units(first)[0]) == 2
+        assert any("memory_lexical" in sql for sql, _ in first)
+        checkpoint = [p for sql, p in first if "INSERT INTO memory_ingest_checkpoints" in sql]
+        assert checkpoint == [{
+            "job_id": "job-1", "org_id": ORG, "lines_committed": 2, "memories_committed": 2,
+        }]
+
+    @pytest.mark.asyncio
+    async def test_checkpoint_scoped_to_org(self):
+        session = FakeSession()
+        await ingest_ndjson(session, ORG, _stream(_ndjson(1)), FakeProvider(), job_id="j")
+        (sql,) = [s for s, _ in session.transactions[0] if "memory_ingest_checkpoints" in s]
+        assert "ON CONFLICT (org_id, job_id)" in sql
+
+    @pytest.mark.asyncio
+    async def test_insert_path_casts_embeddings(self):
+        session = FakeSession()
+        await ingest_ndjson(session, ORG, _stream(_ndjson(2)), FakeProvider())
+        ((sql, params),) = [
+            (s, p) for s, p in session.transactions[0] if "INSERT INTO memory_embeddings" in s
+        ]
+        assert "CAST(:embedding AS vector)" in sql
+        assert [p["embedding"] for p in params] == ["[0.0,0.0,0.0,0.0]"] * 2
+
+    @pytest.mark.asyncio
+    async def test_resumes_after_checkpoint(self):
+        session = FakeSession(checkpoint=SimpleNamespace(lines_committed=3, memories_committed=3))
+        provider = FakeProvider()
+        progress = await ingest_ndjson(
+            session, ORG, _stream(_ndjson(5)), provider, job_id="job-1", chunk_size=10,
+        )
+        assert progress.resumed_from == 3
+        assert provider.batches == [["note 3", "note 4"]]
+        assert progress.memories_committed == 5
+        assert progress.lines_committed == 5
+
+    @pytest.mark.asyncio
+    async def test_rejected_lines_are_reported_and_counted(self):
+        body = b'{"content": "ok"}\n\nbad\n{"content": "ok 2"}\n'
+        session, provider = FakeSession(), FakeProvider()
+        progress = await ingest_ndjson(session, ORG, _stream(body), provider)
+        assert progress.memories_committed == 2
+        assert progress.lines_committed == 4
+        assert progress.rejected == [(3, "invalid JSON: Expecting value")]
+
+    @pytest.mark.asyncio
+    async def test_invalid_chunk_size(self):
+        with pytest.raises(ValueError):
+            await ingest_ndjson(FakeSession(), ORG, _stream(b""), FakeProvider(), chunk_size=0)
+
+
+class TestCopyPath:
+    @staticmethod
+    def _checkpoints(session):
+        return [
+            p for t in session.transactions for sql, p in t
+            if "INSERT INTO memory_ingest_checkpoints" in sql
+        ]
+
+    @staticmethod
+    def _copied(session, table):
+        return [
+            r for t in session.transactions for sql, rows in t
+            if sql == f"COPY {table}" for r in rows
+        ]
+
+    @pytest.mark.asyncio
+    async def test_copies_join_the_chunk_transaction(self):
+        session = FakeSession(driver="asyncpg")
+        progress = await ingest_ndjson(
+            session, ORG, _stream(_ndjson(5)), FakeProvider(), job_id="job-1", chunk_size=2,
+        )
+        assert progress.memories_committed == 5
+        assert len(session.transactions) == 3
+        for transaction in session.transactions:
+            statements = [sql for sql, _ in transaction]
+            assert "memory_ingest_checkpoints" in statements[0]
+            assert {"COPY memory_units", "COPY memory_embeddings", "COPY memory_metadata"} \
+                <= set(statements)
+        assert len(self._copied(session, "memory_units")) == 5
+
+    @pytest.mark.asyncio
+    async def test_failed_chunk_commits_nothing_and_resumes_cleanly(self):
+        session = FakeSession(driver="asyncpg")
+
+        def fail_next_chunk(_progress):
+            session.fail_copy = "memory_embeddings"
+
+        with pytest.raises(RuntimeError):
+            await ingest_ndjson(
+                session, ORG, _stream(_ndjson(5)), FakeProvider(),
+                job_id="job-1", chunk_size=2, on_progress=fail_next_chunk,
+            )
+        # Only the first chunk reached the database; the second chunk's
+        # memory_units COPY is in the transaction that was never committed.
+        assert self._checkpoints(session) == [{
+            "job_id": "job-1", "org_id": ORG, "lines_committed": 2, "memories_committed": 2,
+        }]
+        first = [r[2] for r in self._copied(session, "memory_units")]
+        assert first == ["note 0", "note 1"]
+
+        checkpoint = self._checkpoints(session)[-1]
+        resumed = FakeSession(
+            checkpoint=SimpleNamespace(
+                lines_committed=checkpoint["lines_committed"],
+                memories_committed=checkpoint["memories_committed"],
+            ),
+            driver="asyncpg",
+        )
+        progress = await ingest_ndjson(
+            resumed, ORG, _stream(_ndjson(5)), FakeProvider(), job_id="job-1", chunk_size=2,
+        )
+        rest = [r[2] for r in self._copied(resumed, "memory_units")]
+        assert first + rest == [f"note {i}" for i in range(5)]
+        assert progress.memories_committed == 5
+
+    @pytest.mark.asyncio
+    async def test_copy_outside_a_transaction_is_refused(self):
+        session = FakeSession(driver="asyncpg")
+        with pytest.raises(RuntimeError, match="autocommit"):
+            await write_chunk(
+                session, ORG, [BulkMemory(content="x")], [np.zeros(4)], model="m",
+            )
+        assert session.transactions == [] and session.pending == []
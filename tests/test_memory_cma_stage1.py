@@ -18,8 +18,10 @@ from kintsugi.memory.cma_stage1 import (
     _window_text,
     filter_windows,
     normalize_window,
+    normalize_windows,
     run_stage1,
     score_entropy,
+    score_entropy_batch,
     segment_dialogue,
 )
 from kintsugi.memory.embeddings import EmbeddingProvider
@@ -361,3 +363,119 @@ class TestRunStage1:
             window_size=10, stride=5, threshold=0.0,
         )
         assert len(result.retained_windows) == 1
+
+
+# ---------------------------------------------------------------------------
+# Batched / concurrent path
+# ---------------------------------------------------------------------------
+
+
+class CountingBatchProvider(MockEmbeddingProvider):
+    def __init__(self):
+        self.embed_calls = 0
+        self.batch_calls = 0
+
+    async def embed(self, text: str) -> np.ndarray:
+        self.embed_calls += 1
+        return await super().embed(text)
+
+    async def embed_batch(self, texts: list[str]) -> list[np.ndarray]:
+        self.batch_calls += 1
+        rng_vecs = []
+        for t in texts:
+            rng = np.random.RandomState(hash(t) % 2**31)
+            vec = rng.randn(DIM).astype(np.float32)
+            vec /= np.linalg.norm(vec) + 1e-9
+            rng_vecs.append(vec)
+        return rng_vecs
+
+
+class TestBatchedStage1:
+    @pytest.mark.asyncio
+    async def test_score_entropy_batch_matches_serial(self):
+        provider = MockEmbeddingProvider()
+        serial = segment_dialogue(_make_turns(30), window_size=4, stride=2)
+        batched = segment_dialogue(_make_turns(30), window_size=4, stride=2)
+
+        prev = None
+        for w in serial:
+            await score_entropy(w, prev, provider)
+            prev = w.embedding
+        scores = await score_entropy_batch(batched, provider)
+
+        assert scores[0] == 1.0
+        for s_w, b_w, score in zip(serial, batched, scores):
+            assert b_w.entropy_score == score
+            assert b_w.entropy_score == pytest.approx(s_w.entropy_score, abs=1e-6)
+
+    @pytest.mark.asyncio
+    async def test_score_entropy_batch_empty(self):
+        assert await score_entropy_batch([], MockEmbeddingProvider()) == []
+
+    @pytest.mark.asyncio
+    async def test_score_entropy_batch_zero_vectors(self):
+        provider = ConstantEmbeddingProvider(np.zeros(DIM, dtype=np.float32))
+        windows = segment_dialogue(_make_turns(6), window_size=2, stride=2)
+        scores = await score_entropy_batch(windows, provider)
+        assert scores == [1.0, 1.0, 1.0]
+
+    @pytest.mark.asyncio
+    async def test_single_embed_batch_call(self):
+        provider = CountingBatchProvider()
+        await run_stage1(
+            _make_turns(40), provider, _valid_llm_call,
+            window_size=5, stride=5, threshold=0.0, batched=True,
+        )
+        assert provider.batch_calls == 1
+        assert provider.embed_calls == 0
+
+    @pytest.mark.asyncio
+    async def test_batched_output_identical_to_serial(self):
+        turns = _make_turns(40)
+        kwargs = dict(window_size=6, stride=3, threshold=0.5, conditions={"stance": "x"})
+        serial = await run_stage1(turns, MockEmbeddingProvider(), _valid_llm_call, **kwargs)
+        batched = await run_stage1(
+            turns, MockEmbeddingProvider(), _valid_llm_call, batched=True, **kwargs
+        )
+        assert batched.retained_facts == serial.retained_facts
+        assert [w.start_idx for w in batched.retained_windows] == [
+            w.start_idx for w in serial.retained_windows
+        ]
+        assert [w.start_idx for w in batched.archived_windows] == [
+            w.start_idx for w in serial.archived_windows
+        ]
+
+    @pytest.mark.asyncio
+    async def test_async_llm_call_supported(self):
+        async def llm(system: str, user: str) -> str:
+            return _valid_llm_call(system, user)
+
+        w = Window(turns=_make_turns(3), start_idx=0, end_idx=3)
+        facts = await normalize_window(w, llm)
+        assert [f.content for f in facts] == ["Fact A from window", "Fact B from window"]
+
+    @pytest.mark.asyncio
+    async def test_normalize_windows_bounded_concurrency(self):
+        import asyncio
+
+        in_flight = 0
+        peak = 0
+
+        async def llm(system: str, user: str) -> str:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.001)
+            in_flight -= 1
+            return _valid_llm_call(system, user)
+
+        windows = segment_dialogue(_make_turns(40), window_size=2, stride=2)
+        results = await normalize_windows(windows, llm, max_concurrency=3)
+        assert len(results) == len(windows)
+        assert peak == 3
+        assert [r[0].source_window_idx for r in results] == [w.start_idx for w in windows]
+
+    @pytest.mark.asyncio
+    async def test_normalize_windows_rejects_zero_concurrency(self):
+        with pytest.raises(ValueError):
+            await normalize_windows([], _valid_llm_call, max_concurrency=0)
@@ -10,6 +10,7 @@ import pytest
 from kintsugi.memory.cma_stage2 import (
     Fact,
     Insight,
+    _affinity_matrix_pairwise,
     _cosine_similarity,
     _deterministic_id,
     _fallback_synthesis,
@@ -17,10 +18,14 @@ from kintsugi.memory.cma_stage2 import (
     _mean_embedding,
     _merge_tags,
     _temporal_days,
+    _temporal_horizon,
+    affinity_edges,
+    DriftStats,
     build_affinity_matrix,
     cluster_facts,
     compute_affinity,
     consolidate,
+    consolidate_incremental,
     synthesize_cluster,
 )
 
@@ -164,6 +169,65 @@ class TestBuildAffinityMatrix:
         m = build_affinity_matrix(facts)
         np.testing.assert_array_almost_equal(np.diag(m), np.ones(3))
 
+    def test_matches_pairwise_reference(self):
+        facts = [
+            _make_fact(id=f"f{i}", timestamp=datetime(2025, 1, 1) + timedelta(hours=7 * i))
+            for i in range(12)
+        ]
+        facts[3].embedding = np.zeros(DIM, dtype=np.float32)
+        np.testing.assert_allclose(
+            build_affinity_matrix(facts, beta=0.7, lam=0.3),
+            _affinity_matrix_pairwise(facts, beta=0.7, lam=0.3),
+            atol=1e-6,
+        )
+
+    def test_empty(self):
+        assert build_affinity_matrix([]).shape == (0, 0)
+
+
+def _scattered_facts(n: int, seed: int = 0) -> list[Fact]:
+    """Facts drawn around a few topic centroids, spread over ~60 days."""
+    rng = np.random.RandomState(seed)
+    centroids = rng.randn(5, DIM)
+    facts = []
+    for i in range(n):
+        vec = centroids[i % 5] + rng.randn(DIM) * 0.15
+        facts.append(_make_fact(
+            id=f"s{i}",
+            embedding=vec.astype(np.float32),
+            timestamp=datetime(2025, 1, 1) + timedelta(hours=float(rng.uniform(0, 1440))),
+        ))
+    return facts
+
+
+class TestAffinityEdges:
+    def test_edges_match_dense_threshold(self):
+        facts = _scattered_facts(60)
+        threshold = 0.8
+        dense = build_affinity_matrix(facts)
+        expected = {
+            (min(i, j), max(i, j))
+            for i, j in zip(*np.nonzero(dense >= threshold)) if i != j
+        }
+        rows, cols = affinity_edges(facts, threshold=threshold, block_size=7)
+        got = {(min(i, j), max(i, j)) for i, j in zip(rows.tolist(), cols.tolist())}
+        assert got == expected
+
+    def test_no_edges_for_single_fact(self):
+        rows, cols = affinity_edges([_make_fact()])
+        assert len(rows) == len(cols) == 0
+
+    def test_invalid_block_size(self):
+        with pytest.raises(ValueError):
+            affinity_edges(_scattered_facts(3), block_size=0)
+
+    def test_temporal_horizon(self):
+        assert _temporal_horizon(0.6, 0.1, 0.5) == float("inf")
+        assert _temporal_horizon(0.6, 0.0, 0.9) == float("inf")
+        h = _temporal_horizon(0.6, 0.1, 0.85)
+        # At the horizon a perfect semantic match sits exactly at threshold.
+        assert 0.6 + 0.4 * np.exp(-0.1 * h) == pytest.approx(0.85, abs=1e-6)
+
 
 # ---------------------------------------------------------------------------
 # cluster_facts
@@ -203,6 +267,25 @@ class TestClusterFacts:
         clusters = cluster_facts([f1, f2], threshold=0.5)
         assert len(clusters) == 1
 
+    @pytest.mark.parametrize("threshold", [0.6, 0.8, 0.9])
+    def test_blocked_mode_matches_dense(self, threshold):
+        facts = _scattered_facts(80, seed=3)
+        dense = cluster_facts(facts, threshold=threshold)
+        blocked = cluster_facts(facts, threshold=threshold, block_size=16)
+        assert [[f.id for f in c] for c in blocked] == [[f.id for f in c] for c in dense]
+
+    def test_large_input_uses_blocked_mode(self, monkeypatch):
+        import kintsugi.memory.cma_stage2 as stage2
+
+        calls = []
+        real = stage2._blocked_labels
+        monkeypatch.setattr(stage2, "DENSE_CLUSTER_LIMIT", 10)
+        monkeypatch.setattr(
+            stage2, "_blocked_labels", lambda *a: calls.append(a) or real(*a)
+        )
+        cluster_facts(_scattered_facts(20))
+        assert calls
+
 
 # ---------------------------------------------------------------------------
 # synthesize_cluster
@@ -336,3 +419,147 @@ class TestConsolidate:
         insights = await consolidate(facts, threshold=0.99)
         # All singletons
         assert len(insights) == 3
+
+
+# ---------------------------------------------------------------------------
+# consolidate_incremental
+# ---------------------------------------------------------------------------
+
+
+def _axis(i: int) -> np.ndarray:
+    v = np.zeros(DIM, dtype=np.float32)
+    v[i] = 1.0
+    return v
+
+
+def _near(i: int, seed: int) -> np.ndarray:
+    v = _axis(i) + np.random.RandomState(seed).randn(DIM).astype(np.float32) * 0.01
+    return v / np.linalg.norm(v)
+
+
+def _existing_insight(i: int, n_sources: int = 10) -> Insight:
+    return Insight(
+        id=f"ins{i}",
+        content=f"topic {i}",
+        embedding=_axis(i),
+        source_ids=[f"old{i}-{k}" for k in range(n_sources)],
+        significance=5,
+        tags=[],
+        timestamp=datetime(2025, 1, 1),
+    )
+
+
+class TestDriftStats:
+    def test_unassigned_ratio(self):
+        assert DriftStats().unassigned_ratio == 0.0
+        assert DriftStats(new_facts=4, assigned=1).unassigned_ratio == 0.75
+
+    def test_needs_full_recluster(self):
+        assert DriftStats(new_facts=4, assigned=1).needs_full_recluster()
+        assert DriftStats(new_facts=4, assigned=4, max_centroid_shift=0.3).needs_full_recluster()
+        assert not DriftStats(new_facts=4, assigned=4).needs_full_recluster()
+
+
+class TestConsolidateIncremental:
+    @pytest.mark.asyncio
+    async def test_no_new_facts(self):
+        existing = [_existing_insight(0)]
+        result = await consolidate_incremental([], existing)
+        assert result.insights == existing
+        assert not result.updated and not result.created
+
+    @pytest.mark.asyncio
+    async def test_no_existing_falls_back_to_full(self):
+        result = await consolidate_incremental(_make_similar_facts(3), [], threshold=0.5)
+        assert result.created
+        assert result.insights == result.created
+
+    @pytest.mark.asyncio
+    async def test_assigns_to_matching_insight_only(self):
+        calls: list[str] = []
+
+        async def mock_llm(sys: str, usr: str) -> str:
+            calls.append(usr)
+            return "merged topic 0"
+
+        existing = [_existing_insight(0), _existing_insight(1), _existing_insight(2)]
+        t = datetime(2025, 1, 1, 12)
+        new = [
+            _make_fact(id="n1", embedding=_near(0, 1), timestamp=t),
+            _make_fact(id="n2", embedding=_near(0, 2), timestamp=t),
+        ]
+        result = await consolidate_incremental(new, existing, llm_call=mock_llm)
+
+        assert not result.full_recluster
+        assert len(calls) == 1  # only the touched insight is re-synthesized
+        assert result.superseded_ids == ["ins0"]
+        assert len(result.updated) == 1
+        updated = result.updated[0]
+        assert updated.content == "merged topic 0"
+        assert updated.source_ids == existing[0].source_ids + ["n1", "n2"]
+        assert updated.id != "ins0"
+        ids = {ins.id for ins in result.insights}
+        assert {"ins1", "ins2", updated.id} == ids
+        assert result.stats.assigned == 2
+
+    @pytest.mark.asyncio
+    async def test_unassigned_facts_consolidated_separately(self):
+        existing = [_existing_insight(0), _existing_insight(1)]
+        t = datetime(2025, 1, 1, 12)
+        new = [
+            _make_fact(id="n1", embedding=_near(0, 1), timestamp=t),
+            _make_fact(id="n2", embedding=_near(0, 2), timestamp=t),
+            _make_fact(id="n3", embedding=_near(5, 3), timestamp=t),
+        ]
+        result = await consolidate_incremental(new, existing)
+        assert not result.full_recluster
+        assert len(result.created) == 1
+        assert result.created[0].source_ids == ["n3"]
+        assert len(result.insights) == 3
+
+    @pytest.mark.asyncio
+    async def test_drift_triggers_full_recluster(self):
+        existing = [_existing_insight(0), _existing_insight(1)]
+        t = datetime(2025, 1, 1, 12)
+        new = [
+            _make_fact(id=f"n{i}", embedding=_near(5, i), timestamp=t)
+            for i in range(3)
+        ]
+        result = await consolidate_incremental(new, existing)
+        assert result.full_recluster
+        assert result.stats.unassigned_ratio == 1.0
+        # Untouched existing insights survive a re-cluster unchanged.
+        ids = {ins.id for ins in result.insights}
+        assert {"ins0", "ins1"} <= ids
+        assert result.superseded_ids == []
+        merged = [ins for ins in result.created if len(ins.source_ids) == 3]
+        assert merged and sorted(merged[0].source_ids) == ["n0", "n1", "n2"]
+
+    @pytest.mark.asyncio
+    async def test_full_recluster_synthesizes_each_cluster_once(self):
+        calls: list[str] = []
+
+        async def mock_llm(sys: str, usr: str) -> str:
+            calls.append(usr)
+            return "merged"
+
+        existing = [_existing_insight(0), _existing_insight(1)]
+        t = datetime(2025, 1, 1, 12)
+        new = [
+            _make_fact(id="n1", embedding=_near(0, 1), timestamp=t),
+            _make_fact(id="n2", embedding=_near(5, 2), timestamp=t),
+        ]
+        result = await consolidate_incremental(
+            new, existing, llm_call=mock_llm, max_unassigned_ratio=0.0
+        )
+        assert result.full_recluster
+        # ins0 + n1 is synthesized by the re-cluster only, not beforehand.
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_centroid_weighted_by_source_count(self):
+        existing = [_existing_insight(0, n_sources=99)]
+        new = [_make_fact(id="n1", embedding=_near(0, 7), timestamp=datetime(2025, 1, 1))]
+        result = await consolidate_incremental(new, existing)
+        assert result.stats.max_centroid_shift < 1e-4
+        assert result.updated[0].timestamp == datetime(2025, 1, 1)
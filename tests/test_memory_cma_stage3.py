@@ -42,6 +42,13 @@ class TestQueryProfile:
         with pytest.raises(AttributeError):
             p.complexity = "lookup"  # type: ignore[misc]
 
+    def test_ef_search_grows_with_complexity(self):
+        lookup = estimate_complexity("Who is Alice?")
+        conceptual = estimate_complexity("Why did the agent change its strategy after the board meeting?")
+        assert lookup.complexity == "lookup"
+        assert conceptual.complexity == "conceptual"
+        assert lookup.ef_search < conceptual.ef_search
+
 
 # ---------------------------------------------------------------------------
 # ScoredResult
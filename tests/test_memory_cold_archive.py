@@ -175,6 +175,8 @@ class TestRetrieveArchive:
         mock_row.entropy_score = 0.4
         mock_row.content_hash = _sha256(compressed)
         mock_row.archived_at = now
+        mock_row.codec = "gzip"
+        mock_row.dictionary_id = None
 
         session = AsyncMock()
         mock_result = MagicMock()
@@ -326,3 +328,242 @@ class TestVerifyIntegrity:
         assert report.total_checked == 2
         assert report.passed == 1
         assert report.failed == 1
+
+
+# ---------------------------------------------------------------------------
+# Keyset pagination and executor offload
+# ---------------------------------------------------------------------------
+
+def _archive_row(i: int, text: str = "", hash_ok: bool = True):
+    data = _compress(text or f"window {i}")
+    row = MagicMock()
+    row.id = f"id{i:03d}"
+    row.content_compressed = data
+    row.entropy_score = 0.1
+    row.content_hash = _sha256(data) if hash_ok else "corrupted"
+    row.archived_at = datetime(2024, 1, 1 + i)
+    row.codec = "gzip"
+    row.dictionary_id = None
+    return row
+
+
+class _PagedSession:
+    """Serves successive pages and records the statements issued."""
+
+    def __init__(self, rows, page_size):
+        self.pages = [rows[i:i + page_size] for i in range(0, len(rows), page_size)]
+        self.statements = []
+
+    async def execute(self, stmt):
+        self.statements.append(stmt)
+        result = MagicMock()
+        result.scalars.return_value.all.return_value = (
+            self.pages.pop(0) if self.pages else []
+        )
+        return result
+
+
+class _CountingExecutor:
+    def __init__(self):
+        from concurrent.futures import ThreadPoolExecutor
+
+        self.pool = ThreadPoolExecutor(max_workers=1)
+        self.calls = 0
+
+    def submit(self, fn, *args):
+        self.calls += 1
+        return self.pool.submit(fn, *args)
+
+
+class TestPagination:
+    def test_invalid_page_size(self):
+        with pytest.raises(ValueError):
+            ColdArchive(page_size=0)
+
+    @pytest.mark.asyncio
+    async def test_iter_archive_pages_with_keyset(self):
+        rows = [_archive_row(i) for i in range(5)]
+        session = _PagedSession(rows, page_size=2)
+        executor = _CountingExecutor()
+        ca = ColdArchive(executor=executor, page_size=2)
+
+        windows = [
+            w async for w in ca.iter_archive(
+                "00000000-0000-0000-0000-000000000001",
+                (datetime(2024, 1, 1), datetime(2024, 12, 31)),
+                session,
+            )
+        ]
+
+        assert [w.content for w in windows] == [f"window {i}" for i in range(5)]
+        assert len(session.statements) == 3
+        assert executor.calls == 3
+        sql = str(session.statements[1])
+        assert "LIMIT" in sql
+        assert "(memory_archives.archived_at, memory_archives.id) >" in sql
+
+    @pytest.mark.asyncio
+    async def test_verify_integrity_resumable(self):
+        rows = [_archive_row(i, hash_ok=i != 3) for i in range(6)]
+        ca = ColdArchive(page_size=2)
+
+        first = await ca.verify_integrity(
+            "00000000-0000-0000-0000-000000000001",
+            _PagedSession(rows, page_size=2),
+            max_rows=4,
+        )
+        assert first.complete is False
+        assert first.total_checked == 4
+        assert first.failed_ids == ["id003"]
+        assert first.last_checked_id == "id003"
+
+        rest = await ca.verify_integrity(
+            "00000000-0000-0000-0000-000000000001",
+            _PagedSession(rows[4:], page_size=2),
+            after_id=first.last_checked_id,
+        )
+        assert rest.complete is True
+        assert rest.total_checked == 2
+        assert rest.passed == 2
+
+
+# ---------------------------------------------------------------------------
+# Codecs and re-compaction
+# ---------------------------------------------------------------------------
+
+class _DictionarySession(_PagedSession):
+    """Answers dictionary lookups separately from archive pages."""
+
+    def __init__(self, rows, page_size, dictionaries=()):
+        super().__init__(rows, page_size)
+        self.dictionaries = list(dictionaries)
+        self.commits = 0
+        self.add = MagicMock()
+        self.add_all = MagicMock()
+        self.flush = AsyncMock()
+
+    async def execute(self, stmt):
+        if "FROM archive_dictionaries" in str(stmt):
+            result = MagicMock()
+            result.scalars.return_value.first.return_value = (
+                self.dictionaries[0] if self.dictionaries else None
+            )
+            result.scalars.return_value.all.return_value = self.dictionaries
+            return result
+        return await super().execute(stmt)
+
+    async def commit(self):
+        self.commits += 1
+
+
+def _dictionary_row():
+    from kintsugi.memory.archive_codecs import train_dictionary
+
+    samples = [
+        f"user: when is shift {i}?\nassistant: shift {i} starts at {i % 9}:00.".encode()
+        for i in range(200)
+    ]
+    row = MagicMock()
+    row.id = "dict-1"
+    row.dictionary = train_dictionary(samples, dict_size=2048)
+    return row
+
+
+class TestCodecs:
+    def test_unknown_codec(self):
+        with pytest.raises(ValueError):
+            ColdArchive(codec="lz4")
+
+    @pytest.mark.asyncio
+    async def test_zstd_write_uses_org_dictionary_and_mixed_rows_read(self):
+        from kintsugi.memory.archive_codecs import ZstdCodec
+
+        dictionary = _dictionary_row()
+        session = _DictionarySession([], page_size=10, dictionaries=[dictionary])
+        ca = ColdArchive(codec="zstd", page_size=10)
+        window = Window(
+            turns=[Turn(role="user", content="when is shift 4?", timestamp=datetime.now())],
+            start_idx=0, end_idx=0,
+        )
+
+        with patch("kintsugi.models.base.MemoryArchive") as model:
+            await ca.archive_window("00000000-0000-0000-0000-000000000001", window, 0.2, session)
+        kwargs = model.call_args[1]
+        assert kwargs["codec"] == "zstd"
+        assert kwargs["dictionary_id"] == "dict-1"
+        assert kwargs["content_hash"] == _sha256(kwargs["content_compressed"])
+
+        zstd_row = _archive_row(1)
+        zstd_row.content_compressed = kwargs["content_compressed"]
+        zstd_row.codec, zstd_row.dictionary_id = "zstd", "dict-1"
+        reader = ColdArchive(page_size=10)
+        session = _DictionarySession([_archive_row(0), zstd_row], 10, [dictionary])
+        windows = await reader.retrieve_archive(
+            "00000000-0000-0000-0000-000000000001",
+            (datetime(2024, 1, 1), datetime(2024, 12, 31)),
+            session,
+        )
+        assert [w.content for w in windows] == ["window 0", "user: when is shift 4?"]
+        assert isinstance(reader._codec("zstd", "dict-1"), ZstdCodec)
+
+    @pytest.mark.asyncio
+    async def test_newest_dictionary_reloaded_after_ttl(self):
+        org = "00000000-0000-0000-0000-000000000001"
+        newer = _dictionary_row()
+        newer.id = "dict-2"
+        session = _DictionarySession([], page_size=10)
+        ca = ColdArchive(codec="zstd", dictionary_ttl=60)
+
+        with patch("kintsugi.memory.cold_archive.time.monotonic", return_value=100.0):
+            assert (await ca._write_codec(org, session))[1] is None
+        # Trained by another worker: not seen until the cached lookup expires.
+        session.dictionaries = [newer]
+        with patch("kintsugi.memory.cold_archive.time.monotonic", return_value=150.0):
+            assert (await ca._write_codec(org, session))[1] is None
+        with patch("kintsugi.memory.cold_archive.time.monotonic", return_value=161.0):
+            assert (await ca._write_codec(org, session))[1] == "dict-2"
+
+    @pytest.mark.asyncio
+    async def test_recompact_rewrites_verified_rows(self):
+        rows = [_archive_row(i, text="user: hi\nassistant: hello " * 20, hash_ok=i != 1)
+                for i in range(3)]
+        session = _DictionarySession(rows, page_size=2)
+        ca = ColdArchive(codec="zstd", page_size=2)
+
+        result = await ca.recompact("00000000-0000-0000-0000-000000000001", session)
+
+        assert (result.scanned, result.recompacted, result.corrupt) == (3, 2, 1)
+        assert result.corrupt_ids == ["id001"]
+        assert result.complete is True
+        assert session.commits == 2
+        assert rows[1].codec == "gzip"
+        for r in (rows[0], rows[2]):
+            assert r.codec == "zstd"
+            assert r.content_hash == _sha256(r.content_compressed)
+        windows = [w async for w in ColdArchive(page_size=5).iter_archive(
+            "00000000-0000-0000-0000-000000000001",
+            (datetime(2024, 1, 1), datetime(2024, 12, 31)),
+            _DictionarySession([rows[0]], 5),
+        )]
+        assert windows[0].content == "user: hi\nassistant: hello " * 20
+        assert "IS DISTINCT FROM" in str(session.statements[0])
+
+
+class TestArchiveContents:
+    @pytest.mark.asyncio
+    async def test_archives_texts_in_one_flush(self):
+        session = _DictionarySession([], page_size=10)
+        ca = ColdArchive()
+        with patch("kintsugi.models.base.MemoryArchive") as model:
+            model.side_effect = lambda **kw: MagicMock(id=f"a{model.call_count}", **kw)
+            ids = await ca.archive_contents("org1", ["first", "second"], session)
+
+        assert ids == ["a1", "a2"]
+        (rows,), _ = session.add_all.call_args
+        assert [_decompress(r.content_compressed) for r in rows] == ["first", "second"]
+        assert all(r.content_hash == _sha256(r.content_compressed) for r in rows)
+        session.flush.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_empty(self):
+        assert await ColdArchive().archive_contents("org1", [], AsyncMock()) == []
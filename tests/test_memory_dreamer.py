@@ -0,0 +1,252 @@
+"""Tests for kintsugi.memory.dreamer (paged, concurrent dream cycles)."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from kintsugi.memory.dreamer import (
+    Dreamer,
+    DreamerConfig,
+    FileDreamCheckpoints,
+    InMemoryDreamCheckpoints,
+)
+
+NOW = datetime.now(timezone.utc)
+
+
+def _memories(n: int) -> list[dict]:
+    old = NOW - timedelta(days=400)
+    return [
+        {
+            "id": f"m{i:04d}",
+            "content": f"memory {i}",
+            "significance": 2 if i % 2 else 8,
+            "last_accessed": old,
+            "created_at": old,
+        }
+        for i in range(n)
+    ]
+
+
+class PagedStore:
+    """Keyset-paged fake store with an optional per-page delay."""
+
+    def __init__(self, memories: list[dict], delay: float = 0.0):
+        self.memories = memories
+        self.delay = delay
+        self.calls: list[tuple[str, str | None, int]] = []
+
+    async def __call__(self, query, after_id, limit):
+        self.calls.append((query, after_id, limit))
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        rows = [m for m in self.memories if after_id is None or m["id"] > after_id]
+        return rows[:limit]
+
+
+class TestPaging:
+    @pytest.mark.asyncio
+    async def test_decay_and_archive_cover_every_page(self):
+        store = PagedStore(_memories(25))
+        updated, archived = [], []
+        dreamer = Dreamer(
+            config=DreamerConfig(page_size=10),
+            memory_pages=store,
+            update_memory=lambda mid, upd: updated.append(mid),
+            archive_memory=archived.append,
+        )
+        report = await dreamer.dream(phases=["decay", "archive"])
+
+        assert report.memories_decayed == 25
+        assert report.memories_archived == 12
+        assert report.phases["decay"].pages == 3
+        assert report.phases["decay"].processed == 25
+        assert report.phases["archive"].completed
+        decay_cursors = [after for q, after, _ in store.calls if q == "all_active"]
+        assert None in decay_cursors and "m0019" in decay_cursors
+
+    @pytest.mark.asyncio
+    async def test_legacy_memory_store_is_a_single_page(self):
+        mems = _memories(3)
+        archived = []
+        dreamer = Dreamer(
+            memory_store=lambda query, limit: mems,
+            archive_memory=archived.append,
+        )
+        report = await dreamer.dream(phases=["archive"])
+        assert archived == ["m0001"]
+        assert report.phases["archive"].pages == 1
+
+
+class TestBatchedWrites:
+    @pytest.mark.asyncio
+    async def test_one_batch_write_per_page(self):
+        updates, archives = [], []
+        dreamer = Dreamer(
+            config=DreamerConfig(page_size=10),
+            memory_pages=PagedStore(_memories(25)),
+            update_memories=updates.append,
+            archive_memories=archives.append,
+        )
+        report = await dreamer.dream(phases=["decay", "archive"])
+
+        assert [len(u) for u in updates] == [10, 10, 5]
+        assert updates[0]["m0000"] == {"significance": 1}
+        assert [len(a) for a in archives] == [5, 5, 2]
+        assert report.memories_decayed == 25
+        assert report.memories_archived == 12
+
+    @pytest.mark.asyncio
+    async def test_bulk_maintenance_skips_fetching(self):
+        class Bulk:
+            async def decay(self, now, half_life_days):
+                return 7
+
+            async def archive_stale(self, now, after_days, below):
+                return 3
+
+        store = PagedStore(_memories(5))
+        dreamer = Dreamer(memory_pages=store, bulk_maintenance=Bulk())
+        report = await dreamer.dream(phases=["decay", "archive"])
+        assert (report.memories_decayed, report.memories_archived) == (7, 3)
+        assert store.calls == []
+
+
+class TestEnrichment:
+    @pytest.mark.asyncio
+    async def test_links_go_to_sink(self):
+        recent = [
+            {"id": "a", "tags": ["grant", "deadline"], "domain": "grants"},
+            {"id": "b", "tags": ["grant", "deadline"], "domain": "ops"},
+            {"id": "c", "tags": ["grant", "deadline"], "domain": "grants"},
+        ]
+        saved = []
+        dreamer = Dreamer(memory_store=lambda query, limit: recent, link_sink=saved.extend)
+        report = await dreamer.dream(phases=["enrichment"])
+        assert report.connections_found == 2
+        assert {(lk.source_id, lk.target_id) for lk in saved} == {("a", "b"), ("b", "c")}
+
+
+class TestBudgetsAndCheckpoints:
+    @pytest.mark.asyncio
+    async def test_budget_stops_phase_and_next_cycle_resumes(self):
+        store = PagedStore(_memories(50), delay=0.02)
+        checkpoints = InMemoryDreamCheckpoints()
+        updated = []
+        dreamer = Dreamer(
+            config=DreamerConfig(page_size=10, phase_budgets={"decay": 0.03}),
+            memory_pages=store,
+            update_memory=lambda mid, upd: updated.append(mid),
+            checkpoints=checkpoints,
+            org_id="org-1",
+        )
+
+        first = await dreamer.dream(phases=["decay"])
+        assert not first.phases["decay"].completed
+        assert first.incomplete_phases == ["decay"]
+        assert "to resume: decay" in first.summary()
+        cursor = checkpoints.load("org-1:decay")
+        assert cursor == updated[-1]
+
+        dreamer._config.phase_budgets.clear()
+        second = await dreamer.dream(phases=["decay"])
+        assert second.phases["decay"].resumed_from == cursor
+        assert second.phases["decay"].completed
+        assert checkpoints.load("org-1:decay") is None
+        assert sorted(updated) == [m["id"] for m in store.memories]
+
+    @pytest.mark.asyncio
+    async def test_failed_phase_keeps_last_good_cursor(self):
+        memories = _memories(30)
+        checkpoints = InMemoryDreamCheckpoints()
+
+        def update(mid, upd):
+            if mid == "m0015":
+                raise RuntimeError("db gone")
+
+        dreamer = Dreamer(
+            config=DreamerConfig(page_size=10),
+            memory_pages=PagedStore(memories),
+            update_memory=update,
+            checkpoints=checkpoints,
+        )
+        report = await dreamer.dream(phases=["decay"])
+        assert report.errors == ["decay: db gone"]
+        assert report.incomplete_phases == []
+        assert checkpoints.load("default:decay") == "m0009"
+
+    def test_file_checkpoints_persist(self, tmp_path):
+        path = tmp_path / "dreamer.json"
+        FileDreamCheckpoints(path).save("org:decay", "m0042")
+        assert FileDreamCheckpoints(path).load("org:decay") == "m0042"
+
+
+class TestConsolidation:
+    @pytest.mark.asyncio
+    async def test_consolidate_fn_gets_scheduler_and_org(self):
+        from kintsugi.memory.synthesis import SynthesisScheduler
+
+        seen: list[dict] = []
+
+        async def consolidate(facts, llm_call, **kwargs):
+            seen.append(kwargs)
+            return ["insight"]
+
+        async def llm_call(prompt):
+            return ""
+
+        scheduler = SynthesisScheduler()
+        dreamer = Dreamer(
+            memory_pages=PagedStore(_memories(3)),
+            consolidate_fn=consolidate,
+            llm_call=llm_call,
+            synthesis=scheduler,
+            org_id="org-1",
+        )
+        report = await dreamer.dream(phases=["consolidation"])
+        assert report.facts_consolidated == 1
+        assert seen == [{"scheduler": scheduler, "org_id": "org-1"}]
+
+
+class TestConcurrency:
+    @pytest.mark.asyncio
+    async def test_slow_consolidation_does_not_block_other_phases(self):
+        started, release = asyncio.Event(), asyncio.Event()
+        finished: list[str] = []
+
+        async def consolidate(facts, llm_call):
+            started.set()
+            await release.wait()
+            finished.append("consolidation")
+            return ["insight"]
+
+        def activity_source(days):
+            finished.append("suggestions")
+            return []
+
+        async def llm_call(prompt):
+            return ""
+
+        dreamer = Dreamer(
+            memory_pages=PagedStore(_memories(3)),
+            memory_store=lambda query, limit: [],
+            consolidate_fn=consolidate,
+            llm_call=llm_call,
+            activity_source=activity_source,
+        )
+        task = asyncio.create_task(dreamer.dream())
+        await started.wait()
+        await asyncio.sleep(0)
+        assert finished == ["suggestions"]
+        release.set()
+        report = await task
+        assert report.facts_consolidated == 1
+        assert finished == ["suggestions", "consolidation"]
+
+    @pytest.mark.asyncio
+    async def test_unknown_phase_rejected(self):
+        with pytest.raises(ValueError):
+            await Dreamer().dream(phases=["nap"])
@@ -0,0 +1,199 @@
+"""Tests for kintsugi.memory.embedding_cache module."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from kintsugi.memory.embedding_cache import (
+    CachedEmbeddingProvider,
+    EmbeddingCache,
+    ProviderRegistry,
+    cache_key,
+    get_provider_registry,
+    normalize_text,
+    reset_provider_registry,
+)
+from kintsugi.memory.embeddings import EmbeddingProvider, LocalEmbeddingProvider
+
+DIM = 4
+
+
+class CountingProvider(EmbeddingProvider):
+    """Deterministic provider that records every text it embeds."""
+
+    def __init__(self) -> None:
+        self.embedded: list[str] = []
+        self.batch_calls = 0
+
+    @property
+    def dimension(self) -> int:
+        return DIM
+
+    @property
+    def model_id(self) -> str:
+        return "counting"
+
+    async def embed(self, text: str) -> np.ndarray:
+        self.embedded.append(text)
+        return np.full(DIM, float(len(text)), dtype=np.float32)
+
+    async def embed_batch(self, texts: list[str]) -> list[np.ndarray]:
+        self.batch_calls += 1
+        return [await self.embed(t) for t in texts]
+
+
+# ---------------------------------------------------------------------------
+# Keys
+# ---------------------------------------------------------------------------
+
+
+class TestKeys:
+    def test_normalize_collapses_whitespace(self):
+        assert normalize_text("  hello \n\t world ") == "hello world"
+
+    def test_normalize_preserves_case(self):
+        assert normalize_text("Hello") != normalize_text("hello")
+
+    def test_key_is_model_scoped(self):
+        assert cache_key("a", "text") != cache_key("b", "text")
+        assert cache_key("a", "text  ") == cache_key("a", "text")
+
+
+# ---------------------------------------------------------------------------
+# EmbeddingCache
+# ---------------------------------------------------------------------------
+
+
+class TestEmbeddingCache:
+    def test_miss_then_hit(self):
+        cache = EmbeddingCache()
+        assert cache.get("m", "x") is None
+        cache.put("m", "x", np.ones(DIM, dtype=np.float32))
+        assert np.array_equal(cache.get("m", "x"), np.ones(DIM))
+        assert cache.stats.hits == 1
+        assert cache.stats.misses == 1
+        assert cache.stats.hit_rate == 0.5
+
+    def test_lru_eviction(self):
+        cache = EmbeddingCache(max_entries=2)
+        cache.put("m", "a", np.zeros(DIM))
+        cache.put("m", "b", np.zeros(DIM))
+        cache.get("m", "a")  # a becomes most recent
+        cache.put("m", "c", np.zeros(DIM))
+        assert cache.get("m", "b") is None
+        assert cache.get("m", "a") is not None
+        assert cache.stats.evictions == 1
+
+    def test_ttl_expiry(self):
+        cache = EmbeddingCache(ttl_seconds=10)
+        with patch("kintsugi.memory.embedding_cache.time.monotonic", return_value=100.0):
+            cache.put("m", "a", np.zeros(DIM))
+        with patch("kintsugi.memory.embedding_cache.time.monotonic", return_value=111.0):
+            assert cache.get("m", "a") is None
+        assert cache.stats.expirations == 1
+
+    def test_invalid_size(self):
+        with pytest.raises(ValueError):
+            EmbeddingCache(max_entries=0)
+
+    def test_disk_tier_survives_new_instance(self, tmp_path):
+        vec = np.arange(DIM, dtype=np.float32)
+        EmbeddingCache(disk_dir=tmp_path).put("org/model", "hello", vec)
+
+        fresh = EmbeddingCache(disk_dir=tmp_path)
+        got = fresh.get("org/model", "hello")
+        assert np.array_equal(got, vec)
+        assert fresh.stats.disk_hits == 1
+        assert len(fresh) == 1
+
+    def test_clear_resets_stats(self):
+        cache = EmbeddingCache()
+        cache.put("m", "a", np.zeros(DIM))
+        cache.get("m", "a")
+        cache.clear()
+        assert len(cache) == 0
+        assert cache.stats.lookups == 0
+
+    def test_stats_to_dict(self):
+        d = EmbeddingCache().stats.to_dict()
+        assert {"hits", "misses", "hit_rate", "lookups", "evictions"} <= set(d)
+
+
+# ---------------------------------------------------------------------------
+# CachedEmbeddingProvider
+# ---------------------------------------------------------------------------
+
+
+class TestCachedEmbeddingProvider:
+    @pytest.mark.asyncio
+    async def test_embed_caches(self):
+        inner = CountingProvider()
+        p = CachedEmbeddingProvider(inner, EmbeddingCache())
+        v1 = await p.embed("hello")
+        v2 = await p.embed("hello ")
+        assert np.array_equal(v1, v2)
+        assert inner.embedded == ["hello"]
+
+    @pytest.mark.asyncio
+    async def test_embed_batch_only_sends_misses_once(self):
+        inner = CountingProvider()
+        p = CachedEmbeddingProvider(inner, EmbeddingCache())
+        await p.embed("a")
+        out = await p.embed_batch(["a", "bb", "bb", "ccc"])
+        assert [float(v[0]) for v in out] == [1.0, 2.0, 2.0, 3.0]
+        assert inner.embedded == ["a", "bb", "ccc"]
+        assert inner.batch_calls == 1
+
+    @pytest.mark.asyncio
+    async def test_embed_batch_all_hits_skips_provider(self):
+        inner = CountingProvider()
+        p = CachedEmbeddingProvider(inner, EmbeddingCache())
+        await p.embed_batch(["a", "b"])
+        await p.embed_batch(["b", "a"])
+        assert inner.batch_calls == 1
+
+    def test_delegates_metadata(self):
+        inner = CountingProvider()
+        p = CachedEmbeddingProvider(inner, EmbeddingCache())
+        assert p.dimension == DIM
+        assert p.model_id == "counting"
+        assert p.provider is inner
+
+
+# ---------------------------------------------------------------------------
+# ProviderRegistry
+# ---------------------------------------------------------------------------
+
+
+class TestProviderRegistry:
+    def test_same_provider_reused(self):
+        reg = ProviderRegistry()
+        p1 = reg.get("local")
+        p2 = reg.get("local")
+        assert p1 is p2
+        assert isinstance(p1.provider, LocalEmbeddingProvider)
+
+    def test_different_models_pooled_separately(self):
+        reg = ProviderRegistry()
+        p1 = reg.get("local")
+        p2 = reg.get("local", model_name="custom/model")
+        assert p1 is not p2
+        assert p1.cache is p2.cache
+
+    def test_stats_and_close(self):
+        reg = ProviderRegistry()
+        reg.get("local")
+        stats = reg.stats()
+        assert stats["providers"] == ["sentence-transformers/all-mpnet-base-v2"]
+        reg.close()
+        assert reg.stats()["providers"] == []
+
+    def test_global_registry_singleton(self):
+        reset_provider_registry()
+        try:
+            assert get_provider_registry() is get_provider_registry()
+        finally:
+            reset_provider_registry()
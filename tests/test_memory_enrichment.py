@@ -0,0 +1,152 @@
+"""Tests for kintsugi.memory.enrichment (cross-domain memory links)."""
+
+from __future__ import annotations
+
+import random
+import uuid
+from unittest.mock import AsyncMock, MagicMock
+
+import numpy as np
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from kintsugi.memory.enrichment import (
+    BOTH,
+    EMBEDDING,
+    EnrichmentEngine,
+    find_embedding_links,
+    find_tag_links,
+    linked_memories,
+    save_links,
+)
+
+TAGS = ["grant", "budget", "volunteer", "donor", "board", "pantry", "housing", "rent"]
+
+
+def _random_memories(n, seed=0):
+    rng = random.Random(seed)
+    return [
+        {
+            "id": f"m{i:03d}",
+            "tags": rng.sample(TAGS, rng.randint(0, 4)),
+            "domain": rng.choice(["grants", "ops", "people"]),
+        }
+        for i in range(n)
+    ]
+
+
+def _brute_force_pairs(memories, min_shared):
+    pairs = set()
+    for i, a in enumerate(memories):
+        for b in memories[i + 1:]:
+            if len(set(a["tags"]) & set(b["tags"])) >= min_shared and a["domain"] != b["domain"]:
+                pairs.add(tuple(sorted((a["id"], b["id"]))))
+    return pairs
+
+
+def _edges(links):
+    return sorted((lk.source_id, lk.target_id, round(lk.score, 5)) for lk in links)
+
+
+class TestTagLinks:
+    def test_matches_pairwise_comparison(self):
+        memories = _random_memories(120)
+        links = find_tag_links(
+            [m["id"] for m in memories],
+            [m["tags"] for m in memories],
+            [m["domain"] for m in memories],
+        )
+        assert {(lk.source_id, lk.target_id) for lk in links} == _brute_force_pairs(memories, 2)
+        assert all(lk.source_id < lk.target_id for lk in links)
+
+    def test_score_and_shared_tags(self):
+        links = find_tag_links(
+            ["b", "a"], [["x", "y", "z"], ["x", "y"]], ["ops", "grants"],
+        )
+        assert len(links) == 1
+        assert (links[0].source_id, links[0].target_id) == ("a", "b")
+        assert links[0].shared_tags == ["x", "y"]
+        assert links[0].score == pytest.approx(2 / 3)
+
+    def test_overly_common_tags_are_ignored(self):
+        ids = [str(i) for i in range(5)]
+        links = find_tag_links(
+            ids, [["common", "x"]] * 5, ["a", "b", "c", "d", "e"], max_posting=4,
+        )
+        assert links == []
+
+
+class TestEmbeddingLinks:
+    def test_nearest_cross_domain_neighbours(self):
+        rng = np.random.default_rng(0)
+        base = rng.standard_normal((3, 16)).astype(np.float32)
+        # m0/m1 nearly identical but same domain; m2 close to m0 in another domain.
+        vectors = np.stack([base[0], base[0] + 0.01, base[0] + 0.05, base[1], base[2]])
+        links = find_embedding_links(
+            ["m0", "m1", "m2", "m3", "m4"],
+            vectors,
+            ["ops", "ops", "grants", "ops", "people"],
+            threshold=0.9,
+            block_size=2,
+        )
+        pairs = {(lk.source_id, lk.target_id) for lk in links}
+        assert pairs == {("m0", "m2"), ("m1", "m2")}
+        assert all(lk.kind == EMBEDDING and lk.score >= 0.9 for lk in links)
+
+    def test_block_size_does_not_change_result(self):
+        rng = np.random.default_rng(1)
+        vectors = rng.standard_normal((60, 8)).astype(np.float32)
+        ids = [f"m{i:02d}" for i in range(60)]
+        domains = [i % 3 for i in range(60)]
+        one = find_embedding_links(ids, vectors, domains, threshold=0.5, block_size=60)
+        many = find_embedding_links(ids, vectors, domains, threshold=0.5, block_size=7)
+        assert _edges(one) == _edges(many)
+
+
+class TestEnrichmentEngine:
+    def test_merges_tag_and_embedding_links(self):
+        v = np.ones(4, dtype=np.float32)
+        memories = [
+            {"id": "a", "tags": ["x", "y"], "domain": "ops", "embedding": v},
+            {"id": "b", "tags": ["x", "y"], "domain": "grants", "embedding": v},
+            {"id": "c", "tags": ["x"], "domain": "people"},
+        ]
+        links = EnrichmentEngine().find_links(memories)
+        assert len(links) == 1
+        assert links[0].kind == BOTH
+        assert links[0].score == pytest.approx(1.0)
+
+
+class TestPersistence:
+    @pytest.mark.asyncio
+    async def test_save_links_is_one_upsert(self):
+        session = AsyncMock()
+        links = find_tag_links(["a", "b"], [["x", "y"], ["x", "y"]], ["ops", "grants"])
+        a, b = str(uuid.uuid4()), str(uuid.uuid4())
+        links[0].source_id, links[0].target_id = min(a, b), max(a, b)
+
+        assert await save_links(session, str(uuid.uuid4()), links) == 1
+        session.execute.assert_awaited_once()
+        sql = str(session.execute.await_args.args[0].compile(dialect=postgresql.dialect()))
+        assert "INSERT INTO memory_links" in sql
+        assert "ON CONFLICT (source_id, target_id) DO UPDATE" in sql
+        assert "greatest(memory_links.score, excluded.score)" in sql
+
+    @pytest.mark.asyncio
+    async def test_save_no_links(self):
+        session = AsyncMock()
+        assert await save_links(session, "org", []) == 0
+        session.execute.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_linked_memories_follows_both_directions(self):
+        row = MagicMock(source_id="a", target_id="b", kind="tags", score=0.5, shared_tags=["x"])
+        session = AsyncMock()
+        session.execute.return_value = MagicMock()
+        session.execute.return_value.scalars.return_value.all.return_value = [row]
+
+        links = await linked_memories(session, [str(uuid.uuid4())], limit=5)
+        assert links[0].target_id == "b"
+        sql = str(session.execute.await_args.args[0].compile(dialect=postgresql.dialect()))
+        assert "memory_links.source_id IN" in sql and "memory_links.target_id IN" in sql
+        assert "ORDER BY memory_links.score DESC" in sql
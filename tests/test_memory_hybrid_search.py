@@ -0,0 +1,94 @@
+"""Tests for kintsugi.memory.hybrid_search (server-side Stage 3 fusion)."""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from kintsugi.memory.cma_stage3 import QueryProfile
+from kintsugi.memory.hybrid_search import hybrid_search
+
+
+class FakeResult:
+    def __init__(self, rows):
+        self._rows = rows
+
+    def fetchall(self):
+        return self._rows
+
+
+class FakeSession:
+    """Records executed statements and returns canned rows for the search."""
+
+    def __init__(self, rows=()):
+        self.rows = list(rows)
+        self.calls: list[tuple[str, dict]] = []
+
+    async def execute(self, stmt, params=None):
+        self.calls.append((str(stmt), params or {}))
+        return FakeResult(self.rows)
+
+
+def _row(id: str, score: float):
+    return SimpleNamespace(
+        id=id,
+        content=f"content {id}",
+        significance=3,
+        memory_layer="short_term",
+        created_at=datetime(2025, 1, 1, tzinfo=timezone.utc),
+        score=score,
+    )
+
+
+class TestHybridSearch:
+    @pytest.mark.asyncio
+    async def test_sets_ef_search_and_binds_profile_weights(self):
+        session = FakeSession()
+        vec = np.zeros(4, dtype=np.float32)
+        _, profile = await hybrid_search(
+            session, "Why did the agent change its strategy after the board meeting?",
+            vec, "org-1", n_results=5,
+        )
+        assert profile.complexity == "conceptual"
+
+        (set_sql, set_params), (search_sql, params) = session.calls
+        assert "hnsw.ef_search" in set_sql
+        assert set_params == {"ef_search": str(profile.ef_search)}
+        assert params["query_vec"] is vec
+        assert params["w_dense"] == profile.dense_weight
+        assert params["w_lexical"] == profile.lexical_weight
+        assert params["w_symbolic"] == profile.symbolic_weight
+        assert params["limit"] == params["candidates"] == 5
+        assert "sum(weight * norm)" in search_sql
+
+    @pytest.mark.asyncio
+    async def test_maps_rows_to_fused_results(self):
+        session = FakeSession([_row("a", 0.9), _row("b", 0.4)])
+        results, profile = await hybrid_search(session, "Who is Alice?", [0.0], "org-1")
+        assert [r.id for r in results] == ["a", "b"]
+        assert results[0].source == "fused"
+        assert results[0].content == "content a"
+        assert results[0].metadata["query_profile"] == profile.complexity == "lookup"
+        assert results[0].metadata["created_at"].startswith("2025-01-01")
+
+    @pytest.mark.asyncio
+    async def test_rrf_and_profile_override(self):
+        session = FakeSession()
+        override = QueryProfile("balanced", 0.4, 0.35, 0.25)
+        _, profile = await hybrid_search(
+            session, "Who is Alice?", [0.0], "org-1",
+            method="rrf", rrf_k=30, candidates=50, profile_override=override,
+        )
+        assert profile is override
+        search_sql, params = session.calls[1]
+        assert "1.0 / (:rrf_k + rank)" in search_sql
+        assert params["rrf_k"] == 30
+        assert params["candidates"] == 50
+
+    @pytest.mark.asyncio
+    async def test_unknown_method(self):
+        with pytest.raises(ValueError):
+            await hybrid_search(FakeSession(), "q", [0.0], "org-1", method="nope")
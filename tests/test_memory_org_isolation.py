@@ -10,6 +10,7 @@ from datetime import datetime
 from kintsugi.memory.org_isolation import (
     sql_set_org_context,
     sql_insert_memory,
+    sql_insert_memories,
     sql_hybrid_search,
     sql_delete_memory,
     sql_get_stats,
@@ -36,6 +37,13 @@ class TestSqlHelpers:
         assert "INSERT INTO org_memories" in sql
         assert "RETURNING" in sql
 
+    def test_insert_memories_sql(self):
+        sql = sql_insert_memories(3)
+        assert "INSERT INTO org_memories" in sql
+        assert sql.count("%s") == 21
+        with pytest.raises(ValueError):
+            sql_insert_memories(0)
+
     def test_hybrid_search_with_embedding(self):
         sql = sql_hybrid_search(has_embedding=True)
         assert "semantic" in sql
@@ -165,6 +173,46 @@ class TestOrgMemoryStoreStore:
         assert record.metadata == {}
 
 
+class TestOrgMemoryStoreStoreMany:
+    def test_one_statement_and_commit_per_chunk(self):
+        store, conn, cursor = _make_store()
+        items = ({"content": f"note {i}"} for i in range(5))
+        progress = []
+
+        stored = store.store_many(
+            items, chunk_size=2, on_progress=lambda c, s: progress.append((c, s)),
+        )
+        assert stored == 5
+        assert conn.commit.call_count == 3
+        assert progress == [(2, 2), (4, 4), (5, 5)]
+        inserts = [c for c in cursor.execute.call_args_list if "org_memories" in c[0][0]]
+        assert [len(c[0][1]) for c in inserts] == [14, 14, 7]
+
+    def test_skip_and_embed_batch(self):
+        store, conn, cursor = _make_store()
+        items = [
+            {"content": "a"},
+            {"content": "b"},
+            {"content": "c", "embedding_768": [1.0]},
+            {"content": "d"},
+        ]
+        embedded = []
+
+        def embed_batch(texts):
+            embedded.append(texts)
+            return [[0.5] for _ in texts]
+
+        assert store.store_many(items, skip=1, embed_batch=embed_batch) == 3
+        assert embedded == [["b", "d"]]
+
+    def test_invalid_item(self):
+        store, _, _ = _make_store()
+        with pytest.raises(ValueError, match="significance must be 1-10"):
+            store.store_many([{"content": "x", "significance": 0}])
+        with pytest.raises(ValueError):
+            store.store_many([{"tags": ["no content"]}])
+
+
 class TestOrgMemoryStoreSearch:
     def test_hybrid_search_with_embedding(self):
         store, conn, cursor = _make_store()
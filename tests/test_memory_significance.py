@@ -2,18 +2,24 @@
 
 from __future__ import annotations
 
-import sys
+import asyncio
 from datetime import datetime, timedelta, timezone
-from unittest.mock import AsyncMock, MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+from sqlalchemy.dialects import postgresql
+
+import numpy as np
 
 from kintsugi.memory.significance import (
+    BulkSignificanceMaintenance,
     MemoryLayer,
     ReapResult,
     compute_expiration,
     compute_layer,
     ExpiredMemoryReaper,
+    decay_significance,
 )
 
 
@@ -89,94 +95,227 @@ class TestComputeExpiration:
 
 
 # ---------------------------------------------------------------------------
-# ExpiredMemoryReaper — patch select/update to avoid SQLAlchemy validation
+# ExpiredMemoryReaper — batched UPDATE ... RETURNING, rows are canned
 # ---------------------------------------------------------------------------
 
 
-class TestExpiredMemoryReaper:
-    def _make_mock_mu(self):
-        """Create a mock MemoryUnit that works with patched select/update."""
-        mu = MagicMock()
-        mu.org_id = "org-1"
-        mu.expires_at = MagicMock()
-        mu.expires_at.isnot.return_value = True
-        mu.expires_at.__le__ = MagicMock(return_value=True)
-        mu.id = MagicMock()
-        mu.id.in_.return_value = True
-        return mu
+def _reap_session(*batches, expired=None):
+    """Mock session whose successive executes return *batches* of rows.
+
+    The first execute is the pass's count of *expired* rows, by default
+    the total number of rows in *batches*.
+    """
+    if expired is None:
+        expired = sum(len(rows) for rows in batches if not isinstance(rows, Exception))
+    count = MagicMock()
+    count.scalar_one.return_value = expired
+    results = [count]
+    for rows in batches:
+        if isinstance(rows, Exception):
+            results.append(rows)
+            continue
+        result = MagicMock()
+        result.all.return_value = rows
+        results.append(result)
+    session = AsyncMock()
+    session.execute = AsyncMock(side_effect=results)
+    session.savepoint = AsyncMock()
+    session.begin_nested = AsyncMock(return_value=session.savepoint)
+    return session
+
+
+def _reaped(n, org_id="org-1"):
+    return [SimpleNamespace(id=f"m{i}", org_id=org_id, content=f"memory {i}") for i in range(n)]
+
+
+class _SessionFactory:
+    def __init__(self, session):
+        self.session = session
+        self.opened = 0
+
+    def __call__(self):
+        factory = self
+
+        class _Ctx:
+            async def __aenter__(self):
+                factory.opened += 1
+                return factory.session
+
+            async def __aexit__(self, *exc):
+                return False
+
+        return _Ctx()
+
+
+# ---------------------------------------------------------------------------
+# Significance decay
+# ---------------------------------------------------------------------------
+
+
+class TestDecaySignificance:
+    def test_matches_scalar_rule(self):
+        sig = np.array([8, 8, 8, 1, 5, 3])
+        idle = np.array([10.0, 91.0, 270.0, 400.0, np.nan, 1000.0])
+        out = decay_significance(sig, idle, 90)
+        expected = [
+            s if not (d > 90 and s > 1) else max(1, int(s * 0.5 ** (d / 90)))
+            for s, d in zip(sig, idle)
+        ]
+        assert out.tolist() == expected
+        assert out.tolist() == [8, 3, 1, 1, 5, 1]
+
+
+def _id_session(*batches):
+    results = []
+    for ids in batches:
+        result = MagicMock()
+        result.scalars.return_value.all.return_value = ids
+        results.append(result)
+    session = AsyncMock()
+    session.execute = AsyncMock(side_effect=results)
+    return session
+
+
+class TestBulkSignificanceMaintenance:
+    def test_decay_statement(self):
+        bulk = BulkSignificanceMaintenance(MagicMock(), "org-1", batch_size=100)
+        stmt = bulk.decay_stmt(datetime.now(timezone.utc), 90, after_id="m9")
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+        assert sql.startswith("UPDATE memory_units SET significance=CAST(greatest(")
+        assert "floor(memory_units.significance * power(" in sql
+        assert "memory_units.id > " in sql
+        assert "ORDER BY memory_units.id" in sql
+        assert "FOR UPDATE SKIP LOCKED" in sql
+        assert sql.endswith("RETURNING memory_units.id")
 
     @pytest.mark.asyncio
-    async def test_reap_no_expired(self):
-        mock_result = MagicMock()
-        mock_result.scalars.return_value.all.return_value = []
+    async def test_decay_walks_forward_by_id(self):
+        session = _id_session(["a", "c"], ["d", "e"], ["f"])
+        factory = _SessionFactory(session)
+        bulk = BulkSignificanceMaintenance(factory, "org-1", batch_size=2)
+        assert await bulk.decay(datetime.now(timezone.utc), 90) == 5
+        assert factory.opened == 3
+        assert session.commit.await_count == 3
+        last = session.execute.await_args_list[-1].args[0]
+        assert last.compile().params["id_1"] == "e"
 
-        mock_session = AsyncMock()
-        mock_session.execute = AsyncMock(return_value=mock_result)
+    @pytest.mark.asyncio
+    async def test_archive_loops_until_short_batch(self):
+        session = _id_session(["a", "b"], [])
+        bulk = BulkSignificanceMaintenance(_SessionFactory(session), "org-1", batch_size=2)
+        assert await bulk.archive_stale(datetime.now(timezone.utc), 180, 2) == 2
+        sql = str(session.execute.await_args_list[0].args[0].compile(
+            dialect=postgresql.dialect()
+        ))
+        assert "SET memory_layer=" in sql
+        assert "memory_units.significance <= " in sql
 
-        mock_mu = self._make_mock_mu()
-        mock_select = MagicMock(return_value=MagicMock())
-        mock_update = MagicMock(return_value=MagicMock())
 
-        with patch.dict(sys.modules, {"kintsugi.models.base": MagicMock(MemoryUnit=mock_mu), "kintsugi.models": MagicMock()}), \
-             patch("kintsugi.memory.significance.select", mock_select), \
-             patch("kintsugi.memory.significance.update", mock_update):
-            reaper = ExpiredMemoryReaper()
-            result = await reaper.reap("org-1", mock_session)
+class TestExpiredMemoryReaper:
+    def test_invalid_batch_size(self):
+        with pytest.raises(ValueError):
+            ExpiredMemoryReaper(batch_size=0)
+
+    def test_batch_statement(self):
+        stmt = ExpiredMemoryReaper(batch_size=50)._batch_stmt("org-1", datetime.now(timezone.utc))
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+        assert sql.startswith("UPDATE memory_units SET memory_layer=")
+        assert "FOR UPDATE SKIP LOCKED" in sql
+        assert "LIMIT" in sql
+        assert "memory_units.org_id =" in sql
+        assert "RETURNING memory_units.id, memory_units.org_id" in sql
+        assert "memory_units.content" not in sql.split("RETURNING")[1]
+
+    def test_cross_org_statement_has_no_org_filter(self):
+        stmt = ExpiredMemoryReaper()._batch_stmt(None, datetime.now(timezone.utc))
+        assert "memory_units.org_id =" not in str(stmt.compile(dialect=postgresql.dialect()))
+
+    @pytest.mark.asyncio
+    async def test_reap_no_expired(self):
+        session = _reap_session([])
+        result = await ExpiredMemoryReaper().reap("org-1", session)
 
         assert isinstance(result, ReapResult)
         assert result.checked == 0
         assert result.archived == 0
         assert result.errors == 0
+        assert len(result.batches) == 1
+        session.commit.assert_not_awaited()
 
     @pytest.mark.asyncio
-    async def test_reap_with_expired(self):
-        row1 = MagicMock(id="m1")
-        row2 = MagicMock(id="m2")
+    async def test_reap_loops_until_short_batch(self):
+        session = _reap_session(_reaped(2), _reaped(2), _reaped(1))
+        result = await ExpiredMemoryReaper(batch_size=2).reap("org-1", session)
 
-        mock_select_result = MagicMock()
-        mock_select_result.scalars.return_value.all.return_value = [row1, row2]
-        mock_update_result = MagicMock()
+        assert result.checked == result.expired == result.archived == 5
+        assert [b.reaped for b in result.batches] == [2, 2, 1]
+        # The caller's session is never committed; each batch is a savepoint.
+        session.commit.assert_not_awaited()
+        assert session.savepoint.commit.await_count == 4
+        assert all(b.rows_per_second >= 0 for b in result.batches)
 
-        mock_session = AsyncMock()
-        mock_session.execute = AsyncMock(side_effect=[mock_select_result, mock_update_result])
-
-        mock_mu = self._make_mock_mu()
-        mock_select = MagicMock(return_value=MagicMock())
-        mock_update = MagicMock(return_value=MagicMock(return_value=MagicMock()))
-
-        with patch.dict(sys.modules, {"kintsugi.models.base": MagicMock(MemoryUnit=mock_mu), "kintsugi.models": MagicMock()}), \
-             patch("kintsugi.memory.significance.select", mock_select), \
-             patch("kintsugi.memory.significance.update", mock_update):
-            reaper = ExpiredMemoryReaper()
-            result = await reaper.reap("org-1", mock_session)
+    @pytest.mark.asyncio
+    async def test_checked_counts_rows_found_not_rows_archived(self):
+        # Four of the seven expired rows are locked by another worker.
+        session = _reap_session(_reaped(2), _reaped(1), expired=7)
+        result = await ExpiredMemoryReaper(batch_size=2).reap("org-1", session)
+        assert (result.checked, result.expired, result.archived) == (7, 7, 3)
+        count_sql = str(session.execute.await_args_list[0].args[0].compile(
+            dialect=postgresql.dialect()
+        ))
+        assert count_sql.startswith("SELECT count(*)")
+        assert "memory_units.memory_layer !=" in count_sql
 
-        assert result.checked == 2
-        assert result.expired == 2
+    @pytest.mark.asyncio
+    async def test_reap_respects_max_batches(self):
+        session = _reap_session(_reaped(2), _reaped(2))
+        result = await ExpiredMemoryReaper(batch_size=2, max_batches=1).reap("org-1", session)
         assert result.archived == 2
-        assert result.errors == 0
+        assert result.checked == 4
+        assert session.execute.await_count == 2
 
     @pytest.mark.asyncio
     async def test_reap_with_error(self):
-        row1 = MagicMock(id="m1")
-
-        mock_select_result = MagicMock()
-        mock_select_result.scalars.return_value.all.return_value = [row1]
-
-        mock_session = AsyncMock()
-        mock_session.execute = AsyncMock(side_effect=[mock_select_result, Exception("db error")])
+        session = _reap_session(_reaped(2), Exception("db error"))
+        result = await ExpiredMemoryReaper(batch_size=2).reap("org-1", session)
 
-        mock_mu = self._make_mock_mu()
-        mock_select = MagicMock(return_value=MagicMock())
-        mock_update = MagicMock(return_value=MagicMock(return_value=MagicMock()))
+        assert result.errors == 1
+        assert result.archived == 2
+        session.savepoint.rollback.assert_awaited_once()
+        session.rollback.assert_not_awaited()
+        session.commit.assert_not_awaited()
 
-        with patch.dict(sys.modules, {"kintsugi.models.base": MagicMock(MemoryUnit=mock_mu), "kintsugi.models": MagicMock()}), \
-             patch("kintsugi.memory.significance.select", mock_select), \
-             patch("kintsugi.memory.significance.update", mock_update):
-            reaper = ExpiredMemoryReaper()
-            result = await reaper.reap("org-1", mock_session)
+    @pytest.mark.asyncio
+    async def test_reap_all_moves_content_to_cold_archive(self):
+        rows = _reaped(2, "org-a") + _reaped(1, "org-b")
+        session = _reap_session(rows)
+        cold = MagicMock()
+        cold.archive_contents = AsyncMock(side_effect=lambda oid, contents, s: contents)
+        factory = _SessionFactory(session)
+
+        result = await ExpiredMemoryReaper(batch_size=10, cold_archive=cold).reap_all(factory)
+
+        assert result.archived == 3
+        assert result.cold_archived == 3
+        assert result.batches[0].org_id is None
+        assert factory.opened == 2  # count, then one batch
+        calls = {c.args[0]: c.args[1] for c in cold.archive_contents.await_args_list}
+        assert calls == {"org-a": ["memory 0", "memory 1"], "org-b": ["memory 0"]}
+        session.commit.assert_awaited_once()
 
-        assert result.errors == 1
-        assert result.archived == 0
+    @pytest.mark.asyncio
+    async def test_run_periodically_stops(self):
+        stop = asyncio.Event()
+        reaper = ExpiredMemoryReaper()
+        calls = []
+
+        async def fake_reap_all(factory):
+            calls.append(factory)
+            stop.set()
+
+        reaper.reap_all = fake_reap_all
+        await asyncio.wait_for(reaper.run_periodically("factory", 3600, stop=stop), timeout=1)
+        assert calls == ["factory"]
 
 
 class TestReapResult:
@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
-import sys
 from datetime import datetime, timedelta, timezone
-from unittest.mock import AsyncMock, MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+from sqlalchemy.dialects import postgresql
 
 from kintsugi.memory.spaced import (
     FIBONACCI,
@@ -50,39 +51,34 @@ class TestDueMemory:
 
 
 # ---------------------------------------------------------------------------
-# SpacedRetrieval — patch select/update to avoid SQLAlchemy validation
+# SpacedRetrieval — statements are compiled, rows are canned
 # ---------------------------------------------------------------------------
 
-def _make_spaced_session(rows):
-    """Helper: create mock session returning given rows from execute."""
+def _make_spaced_session(rows=()):
+    """Helper: mock session returning *rows* from ``execute(...).all()``."""
     mock_result = MagicMock()
-    mock_result.scalars.return_value.all.return_value = rows
+    mock_result.all.return_value = list(rows)
+    mock_result.rowcount = len(rows)
     mock_session = AsyncMock()
     mock_session.execute = AsyncMock(return_value=mock_result)
     return mock_session
 
 
-def _spaced_patches():
-    """Context manager patches for spaced retrieval tests."""
-    mock_mu = MagicMock()
-    # Make expires_at support comparison with datetime (used in query building)
-    mock_mu.expires_at.__gt__ = MagicMock(return_value=MagicMock())
-    mock_mu.expires_at.is_ = MagicMock(return_value=MagicMock())
-    mock_mu.expires_at.__or__ = MagicMock(return_value=MagicMock())
-    # select() returns a chainable mock
-    mock_select_chain = MagicMock()
-    mock_select = MagicMock(return_value=mock_select_chain)
-    mock_update = MagicMock(return_value=MagicMock(return_value=MagicMock()))
-    return (
-        patch.dict(sys.modules, {
-            "kintsugi.models.base": MagicMock(MemoryUnit=mock_mu),
-            "kintsugi.models": MagicMock(),
-        }),
-        patch("kintsugi.memory.spaced.select", mock_select),
-        patch("kintsugi.memory.spaced.update", mock_update),
+def _due_row(id, next_review_at, access_count=0, significance=5):
+    return SimpleNamespace(
+        id=id,
+        content=f"memory {id}",
+        significance=significance,
+        access_count=access_count,
+        next_review_at=next_review_at,
     )
 
 
+def _sql(session):
+    stmt = session.execute.call_args[0][0]
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
 class TestSpacedRetrieval:
     @pytest.mark.asyncio
     async def test_get_due_memories_no_session(self):
@@ -91,122 +87,56 @@ class TestSpacedRetrieval:
             await sr.get_due_memories("org-1", session=None)
 
     @pytest.mark.asyncio
-    async def test_get_due_memories_returns_overdue(self):
-        now = datetime.now(timezone.utc)
-        row = MagicMock()
-        row.id = "m1"
-        row.content = "test memory"
-        row.significance = 5
-        row.updated_at = now - timedelta(days=10)
-        row.created_at = now - timedelta(days=20)
-        # Ensure hasattr check for _access_count returns False
-        del row._access_count
-
-        mock_session = _make_spaced_session([row])
-        p1, p2, p3 = _spaced_patches()
-        with p1, p2, p3:
-            sr = SpacedRetrieval()
-            result = await sr.get_due_memories("org-1", session=mock_session)
-
-        assert len(result) == 1
-        assert result[0].id == "m1"
-        assert result[0].days_overdue >= 8
+    async def test_get_due_memories_single_index_range_query(self):
+        mock_session = _make_spaced_session()
+        await SpacedRetrieval().get_due_memories("org-1", max_count=7, session=mock_session)
 
-    @pytest.mark.asyncio
-    async def test_get_due_memories_not_yet_due(self):
-        now = datetime.now(timezone.utc)
-        row = MagicMock()
-        row.id = "m1"
-        row.content = "test"
-        row.significance = 5
-        row.updated_at = now
-        row.created_at = now - timedelta(days=5)
-        del row._access_count
-
-        mock_session = _make_spaced_session([row])
-        p1, p2, p3 = _spaced_patches()
-        with p1, p2, p3:
-            sr = SpacedRetrieval()
-            result = await sr.get_due_memories("org-1", session=mock_session)
-
-        assert len(result) == 0
-
-    @pytest.mark.asyncio
-    async def test_get_due_memories_uses_created_at_fallback(self):
-        now = datetime.now(timezone.utc)
-        row = MagicMock()
-        row.id = "m2"
-        row.content = "test"
-        row.significance = 3
-        row.updated_at = None
-        row.created_at = now - timedelta(days=10)
-        del row._access_count
-
-        mock_session = _make_spaced_session([row])
-        p1, p2, p3 = _spaced_patches()
-        with p1, p2, p3:
-            sr = SpacedRetrieval()
-            result = await sr.get_due_memories("org-1", session=mock_session)
-
-        assert len(result) == 1
+        mock_session.execute.assert_called_once()
+        sql = _sql(mock_session)
+        assert "memory_units.next_review_at <=" in sql
+        assert "memory_units.memory_layer !=" in sql
+        assert "ORDER BY memory_units.next_review_at ASC" in sql
+        assert "LIMIT" in sql
+        assert mock_session.execute.call_args[0][0].compile().params["param_1"] == 7
 
     @pytest.mark.asyncio
-    async def test_get_due_memories_respects_max_count(self):
+    async def test_get_due_memories_maps_rows(self):
         now = datetime.now(timezone.utc)
-        rows = []
-        for i in range(10):
-            r = MagicMock()
-            r.id = f"m{i}"
-            r.content = f"mem {i}"
-            r.significance = 5
-            r.updated_at = now - timedelta(days=10 + i)
-            r.created_at = now - timedelta(days=20)
-            del r._access_count
-            rows.append(r)
-
+        rows = [
+            _due_row("old", now - timedelta(days=40, hours=1), access_count=4),
+            _due_row("recent", now - timedelta(hours=2), access_count=1),
+        ]
         mock_session = _make_spaced_session(rows)
-        p1, p2, p3 = _spaced_patches()
-        with p1, p2, p3:
-            sr = SpacedRetrieval()
-            result = await sr.get_due_memories("org-1", max_count=3, session=mock_session)
+        result = await SpacedRetrieval().get_due_memories("org-1", session=mock_session)
 
-        assert len(result) <= 3
-
-    @pytest.mark.asyncio
-    async def test_get_due_memories_sorted_most_overdue_first(self):
-        now = datetime.now(timezone.utc)
-        row_recent = MagicMock()
-        row_recent.id = "recent"
-        row_recent.content = "r"
-        row_recent.significance = 5
-        row_recent.updated_at = now - timedelta(days=5)
-        row_recent.created_at = now - timedelta(days=20)
-        del row_recent._access_count
-
-        row_old = MagicMock()
-        row_old.id = "old"
-        row_old.content = "o"
-        row_old.significance = 5
-        row_old.updated_at = now - timedelta(days=50)
-        row_old.created_at = now - timedelta(days=60)
-        del row_old._access_count
-
-        mock_session = _make_spaced_session([row_recent, row_old])
-        p1, p2, p3 = _spaced_patches()
-        with p1, p2, p3:
-            sr = SpacedRetrieval()
-            result = await sr.get_due_memories("org-1", session=mock_session)
-
-        assert result[0].id == "old"
+        assert [d.id for d in result] == ["old", "recent"]
+        assert result[0].access_count == 4
+        assert result[0].days_overdue == 40
+        assert result[1].days_overdue == 0
 
     @pytest.mark.asyncio
     async def test_record_access(self):
-        mock_session = AsyncMock()
-        mock_session.execute = AsyncMock()
+        mock_session = _make_spaced_session()
+        await SpacedRetrieval().record_access("mem-123", mock_session)
 
-        p1, p2, p3 = _spaced_patches()
-        with p1, p2, p3:
-            sr = SpacedRetrieval()
-            await sr.record_access("mem-123", mock_session)
+        mock_session.execute.assert_called_once()
+        sql = _sql(mock_session)
+        assert sql.startswith("UPDATE memory_units SET")
+        assert "access_count=(memory_units.access_count +" in sql
+        assert "make_interval" in sql
+        assert "ARRAY[1, 1, 2, 3, 5, 8, 13, 21, 34, 55, 89, 144, 233]" in sql
 
+    @pytest.mark.asyncio
+    async def test_record_access_many_one_statement(self):
+        mock_session = _make_spaced_session([object()] * 3)
+        count = await SpacedRetrieval().record_access_many(["a", "b", "c"], mock_session)
+
+        assert count == 3
         mock_session.execute.assert_called_once()
+        assert "memory_units.id IN" in _sql(mock_session)
+
+    @pytest.mark.asyncio
+    async def test_record_access_many_empty(self):
+        mock_session = _make_spaced_session()
+        assert await SpacedRetrieval().record_access_many([], mock_session) == 0
+        mock_session.execute.assert_not_called()
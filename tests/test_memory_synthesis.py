@@ -0,0 +1,198 @@
+"""Tests for kintsugi.memory.synthesis and concurrent Stage 2 synthesis."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from kintsugi.memory.cma_stage2 import Fact, consolidate, synthesize_cluster
+from kintsugi.memory.synthesis import (
+    FileSynthesisCache,
+    InMemorySynthesisCache,
+    OrgRateLimiter,
+    SynthesisScheduler,
+)
+
+DIM = 8
+
+
+def _fact(id: str, axis: int, jitter: float = 0.0) -> Fact:
+    vec = np.zeros(DIM, dtype=np.float32)
+    vec[axis] = 1.0
+    vec[(axis + 1) % DIM] = jitter
+    return Fact(
+        id=id,
+        content=f"content {id}",
+        embedding=vec / np.linalg.norm(vec),
+        timestamp=datetime(2025, 1, 1),
+    )
+
+
+def _topic_facts(n_topics: int, per_topic: int = 2) -> list[Fact]:
+    return [
+        _fact(f"t{t}-{k}", axis=t, jitter=0.01 * k)
+        for t in range(n_topics)
+        for k in range(per_topic)
+    ]
+
+
+class SlowLLM:
+    """Async LLM mock that tracks concurrency."""
+
+    def __init__(self, delay: float = 0.01) -> None:
+        self.delay = delay
+        self.calls = 0
+        self.in_flight = 0
+        self.peak = 0
+
+    async def __call__(self, system: str, user: str) -> str:
+        self.calls += 1
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(self.delay)
+        self.in_flight -= 1
+        return "synth: " + user.splitlines()[1]
+
+
+# ---------------------------------------------------------------------------
+# Caches
+# ---------------------------------------------------------------------------
+
+
+class TestSynthesisCaches:
+    def test_in_memory(self):
+        cache = InMemorySynthesisCache()
+        assert cache.get("a") is None
+        cache.put("a", "x")
+        assert cache.get("a") == "x"
+        assert len(cache) == 1
+
+    def test_file_cache_persists(self, tmp_path):
+        path = tmp_path / "synth" / "cache.jsonl"
+        FileSynthesisCache(path).put("a", "first")
+        cache = FileSynthesisCache(path)
+        assert cache.get("a") == "first"
+        cache.put("a", "second")
+        assert FileSynthesisCache(path).get("a") == "second"
+
+    def test_file_cache_skips_corrupt_lines(self, tmp_path):
+        path = tmp_path / "cache.jsonl"
+        path.write_text('{"id": "a", "content": "ok"}\nnot json\n{"bad": 1}\n')
+        assert FileSynthesisCache(path).get("a") == "ok"
+
+
+# ---------------------------------------------------------------------------
+# Rate limiter
+# ---------------------------------------------------------------------------
+
+
+class TestOrgRateLimiter:
+    def test_invalid_rate(self):
+        with pytest.raises(ValueError):
+            OrgRateLimiter(0)
+
+    @pytest.mark.asyncio
+    async def test_orgs_have_independent_buckets(self):
+        limiter = OrgRateLimiter(rate=1.0, burst=1.0)
+        await limiter.acquire("org-a")
+        # org-b is not throttled by org-a's spend
+        await asyncio.wait_for(limiter.acquire("org-b"), timeout=0.1)
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(limiter.acquire("org-a"), timeout=0.1)
+
+
+# ---------------------------------------------------------------------------
+# Scheduler
+# ---------------------------------------------------------------------------
+
+
+class TestSynthesisScheduler:
+    def test_invalid_concurrency(self):
+        with pytest.raises(ValueError):
+            SynthesisScheduler(max_concurrency=0)
+
+    @pytest.mark.asyncio
+    async def test_coalesces_identical_requests(self):
+        llm = SlowLLM()
+        sched = SynthesisScheduler()
+        results = await asyncio.gather(*(
+            sched.complete("same", "sys", "user\nline", llm) for _ in range(5)
+        ))
+        assert results == ["synth: line"] * 5
+        assert llm.calls == 1
+        assert sched.stats.coalesced == 4
+
+    @pytest.mark.asyncio
+    async def test_cache_hit_skips_llm(self):
+        llm = SlowLLM()
+        cache = InMemorySynthesisCache()
+        cache.put("known", "cached text")
+        sched = SynthesisScheduler(cache=cache)
+        assert await sched.complete("known", "s", "u\nx", llm) == "cached text"
+        assert llm.calls == 0
+        assert sched.stats.cache_hits == 1
+
+    @pytest.mark.asyncio
+    async def test_failures_propagate_and_are_not_cached(self):
+        cache = InMemorySynthesisCache()
+        sched = SynthesisScheduler(cache=cache)
+
+        async def boom(system: str, user: str) -> str:
+            raise RuntimeError("down")
+
+        with pytest.raises(RuntimeError):
+            await sched.complete("k", "s", "u", boom)
+        assert cache.get("k") is None
+        assert sched.stats.failures == 1
+
+
+# ---------------------------------------------------------------------------
+# Stage 2 integration
+# ---------------------------------------------------------------------------
+
+
+class TestConcurrentConsolidation:
+    @pytest.mark.asyncio
+    async def test_insight_id_independent_of_member_order(self):
+        a, b = _fact("a", 0), _fact("b", 0, 0.01)
+        assert (await synthesize_cluster([a, b])).id == (await synthesize_cluster([b, a])).id
+
+    @pytest.mark.asyncio
+    async def test_bounded_concurrency_and_same_output(self):
+        facts = _topic_facts(6)
+        serial_llm = SlowLLM()
+        serial = await consolidate(facts, threshold=0.9, llm_call=serial_llm, max_depth=1)
+
+        llm = SlowLLM()
+        sched = SynthesisScheduler(max_concurrency=3)
+        concurrent = await consolidate(
+            facts, threshold=0.9, llm_call=llm, max_depth=1, scheduler=sched, org_id="org"
+        )
+
+        assert serial_llm.peak == 1
+        assert llm.peak == 3
+        assert llm.calls == 6
+        assert [(i.id, i.content) for i in concurrent] == [(i.id, i.content) for i in serial]
+
+    @pytest.mark.asyncio
+    async def test_rerun_served_from_persistent_cache(self, tmp_path):
+        facts = _topic_facts(4)
+        path = tmp_path / "synth.jsonl"
+
+        first_llm = SlowLLM(delay=0)
+        await consolidate(
+            facts, threshold=0.9, llm_call=first_llm, max_depth=1,
+            scheduler=SynthesisScheduler(cache=FileSynthesisCache(path)),
+        )
+        assert first_llm.calls == 4
+
+        rerun_llm = SlowLLM(delay=0)
+        sched = SynthesisScheduler(cache=FileSynthesisCache(path))
+        await consolidate(
+            facts, threshold=0.9, llm_call=rerun_llm, max_depth=1, scheduler=sched
+        )
+        assert rerun_llm.calls == 0
+        assert sched.stats.cache_hits == 4
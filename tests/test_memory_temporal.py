@@ -2,11 +2,22 @@
 
 from __future__ import annotations
 
+import asyncio
+import uuid
+
 import pytest
 from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 
-from kintsugi.memory.temporal import Category, TemporalEvent, TemporalLog
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.exc import DataError, OperationalError
+
+from kintsugi.memory.temporal import (
+    Category,
+    TemporalEvent,
+    TemporalLog,
+    TemporalWriteBuffer,
+)
 
 
 # ---------------------------------------------------------------------------
@@ -260,3 +271,161 @@ class TestTemporalLogQuery:
 
         assert len(events) == 3
         assert [e.id for e in events] == ["id0", "id1", "id2"]
+
+
+# ---------------------------------------------------------------------------
+# TemporalWriteBuffer (group commit)
+# ---------------------------------------------------------------------------
+
+ORG = str(uuid.uuid4())
+
+
+class _RecordingSession:
+    def __init__(self, sink, fail=False):
+        self.sink = sink
+        self.fail = fail
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def execute(self, stmt):
+        if self.fail:
+            raise RuntimeError("db down")
+        self.sink.append(stmt.compile().params)
+
+    async def commit(self):
+        pass
+
+
+def _factory(sink, fail=False):
+    return lambda: _RecordingSession(sink, fail)
+
+
+class TestTemporalWriteBuffer:
+    @pytest.mark.asyncio
+    async def test_events_are_group_committed(self):
+        statements = []
+        buf = TemporalWriteBuffer(_factory(statements), batch_size=3, flush_interval=0.5)
+        buf.start()
+        ids = [await buf.append(ORG, "MEMORY", f"m{i}", {"i": i}) for i in range(7)]
+        await buf.close()
+
+        assert buf.written == 7
+        assert buf.batches == 3
+        assert len(statements) == 3
+        assert len(set(ids)) == 7
+        first = statements[0]
+        assert first["id_m0"] == uuid.UUID(ids[0])
+        assert first["message_m2"] == "m2"
+        assert first["org_id_m0"] == uuid.UUID(ORG)
+
+    @pytest.mark.asyncio
+    async def test_partial_batch_flushes_after_interval(self):
+        statements = []
+        buf = TemporalWriteBuffer(_factory(statements), batch_size=100, flush_interval=0.01)
+        buf.start()
+        await buf.append(ORG, "MEMORY", "only", None)
+        await asyncio.wait_for(buf.flush(), 1)
+        assert buf.written == 1
+        await buf.close()
+
+    @pytest.mark.asyncio
+    async def test_full_queue_applies_backpressure(self):
+        buf = TemporalWriteBuffer(_factory([]), max_queue=1)
+        await buf.append(ORG, "MEMORY", "a", None)
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(buf.append(ORG, "MEMORY", "b", None), 0.05)
+        buf.start()
+        await buf.close()
+        assert buf.written == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_is_counted_and_writer_survives(self):
+        buf = TemporalWriteBuffer(_factory([], fail=True), flush_interval=0.01)
+        buf.start()
+        await buf.append(ORG, "MEMORY", "x", None)
+        await buf.flush()
+        assert (buf.failed, buf.written) == (1, 0)
+        await buf.close()
+
+    @pytest.mark.asyncio
+    async def test_transient_failure_is_retried(self):
+        statements = []
+        outages = [OperationalError("INSERT", {}, Exception("connection lost"))] * 2
+
+        class FlakySession(_RecordingSession):
+            async def execute(self, stmt):
+                if outages:
+                    raise outages.pop()
+                await super().execute(stmt)
+
+        buf = TemporalWriteBuffer(
+            lambda: FlakySession(statements), flush_interval=0.01, retry_backoff=0.001
+        )
+        buf.start()
+        for i in range(3):
+            await buf.append(ORG, "MEMORY", f"m{i}", None)
+        await buf.close()
+        assert (buf.written, buf.failed) == (3, 0)
+        assert len(statements) == 1
+
+    @pytest.mark.asyncio
+    async def test_rejected_event_is_dropped_alone(self):
+        statements = []
+
+        class PickySession(_RecordingSession):
+            async def execute(self, stmt):
+                if "bad" in stmt.compile().params.values():
+                    raise DataError("INSERT", {}, Exception("invalid input"))
+                await super().execute(stmt)
+
+        buf = TemporalWriteBuffer(
+            lambda: PickySession(statements), batch_size=8, flush_interval=0.5
+        )
+        buf.start()
+        for message in ["a", "b", "bad", "c", "d"]:
+            await buf.append(ORG, "MEMORY", message, None)
+        await buf.close()
+        assert (buf.written, buf.failed) == (4, 1)
+        written = [v for params in statements for k, v in params.items() if k.startswith("message")]
+        assert sorted(written) == ["a", "b", "c", "d"]
+
+    @pytest.mark.asyncio
+    async def test_append_after_close_raises(self):
+        buf = TemporalWriteBuffer(_factory([]))
+        await buf.close()
+        with pytest.raises(RuntimeError):
+            await buf.append(ORG, "MEMORY", "late", None)
+
+    @pytest.mark.asyncio
+    async def test_log_event_uses_buffer(self):
+        buffer = MagicMock()
+        buffer.append = AsyncMock(return_value="evt-1")
+        session = AsyncMock()
+        log = TemporalLog(buffer=buffer)
+        assert await log.log_event(ORG, "MEMORY", "hi", {}, session) == "evt-1"
+        buffer.append.assert_awaited_once_with(ORG, "MEMORY", "hi", {})
+        session.add.assert_not_called()
+
+
+class TestKeywordSearch:
+    @pytest.mark.asyncio
+    async def test_keyword_uses_fulltext_index_and_time_bounds(self):
+        session = AsyncMock()
+        session.execute.return_value = MagicMock()
+        session.execute.return_value.scalars.return_value.all.return_value = []
+        await TemporalLog().query_events(
+            org_id=ORG,
+            keyword="grant deadline",
+            start=datetime(2026, 9, 1),
+            end=datetime(2026, 10, 1),
+            session=session,
+        )
+        stmt = session.execute.await_args.args[0]
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+        assert "message_tsv @@ websearch_to_tsquery" in sql
+        assert "ILIKE" not in sql
+        assert "temporal_memories.created_at >=" in sql
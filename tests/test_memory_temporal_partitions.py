@@ -0,0 +1,150 @@
+"""Tests for kintsugi.memory.temporal_partitions (monthly partition upkeep)."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.schema import CreateTable
+
+from kintsugi.memory.temporal_partitions import (
+    DEFAULT_PARTITION,
+    TemporalPartitionManager,
+    add_months,
+    month_start,
+    parse_partition_name,
+    partition_name,
+)
+
+NOW = datetime(2026, 11, 17, 9, 30, tzinfo=timezone.utc)
+
+
+class FakeResult:
+    def __init__(self, rows=(), scalar=0):
+        self._rows = list(rows)
+        self._scalar = scalar
+
+    def all(self):
+        return self._rows
+
+    def scalar_one(self):
+        return self._scalar
+
+
+class FakeSession:
+    """Tracks attached partitions and rows parked in the default partition."""
+
+    def __init__(self, partitions=(), spilled=0):
+        self.partitions = set(partitions) | {DEFAULT_PARTITION}
+        self.spilled = spilled
+        self.sql: list[str] = []
+        self.commits = 0
+
+    async def execute(self, stmt, params=None):
+        sql = " ".join(str(stmt).split())
+        self.sql.append(sql)
+        if "FROM pg_inherits" in sql:
+            return FakeResult([(p,) for p in sorted(self.partitions)])
+        if sql.startswith("SELECT count(*)"):
+            return FakeResult(scalar=self.spilled)
+        return FakeResult()
+
+    async def commit(self):
+        self.commits += 1
+
+
+class TestMonthHelpers:
+    def test_month_start_normalises_to_utc(self):
+        local = datetime(2026, 3, 1, 0, 30, tzinfo=timezone.utc).astimezone(
+            timezone(timedelta(hours=2))
+        )
+        assert month_start(local) == datetime(2026, 3, 1, tzinfo=timezone.utc)
+
+    def test_add_months_crosses_years(self):
+        dec = datetime(2026, 12, 1, tzinfo=timezone.utc)
+        assert add_months(dec, 1) == datetime(2027, 1, 1, tzinfo=timezone.utc)
+        assert add_months(dec, -12) == datetime(2025, 12, 1, tzinfo=timezone.utc)
+
+    def test_partition_name_round_trip(self):
+        month = datetime(2026, 4, 1, tzinfo=timezone.utc)
+        assert partition_name(month) == "temporal_memories_p2026_04"
+        assert parse_partition_name(partition_name(month)) == month
+        assert parse_partition_name(DEFAULT_PARTITION) is None
+
+
+class TestEnsurePartitions:
+    @pytest.mark.asyncio
+    async def test_creates_missing_months_only(self):
+        session = FakeSession(partitions={"temporal_memories_p2026_11"})
+        result = await TemporalPartitionManager(months_ahead=2).ensure_partitions(session, NOW)
+
+        assert result.created == ["temporal_memories_p2026_12", "temporal_memories_p2027_01"]
+        creates = [s for s in session.sql if s.startswith("CREATE TABLE")]
+        assert creates[0] == (
+            "CREATE TABLE temporal_memories_p2026_12 PARTITION OF temporal_memories "
+            "FOR VALUES FROM ('2026-12-01 00:00:00+00') TO ('2027-01-01 00:00:00+00')"
+        )
+        assert not any("DETACH" in s for s in session.sql)
+
+    @pytest.mark.asyncio
+    async def test_moves_rows_out_of_default_partition(self):
+        session = FakeSession(spilled=5)
+        result = await TemporalPartitionManager(months_ahead=0).ensure_partitions(session, NOW)
+
+        assert result.rows_moved == 5
+        ddl = [s.split(" (")[0] for s in session.sql if not s.startswith("SELECT")]
+        assert ddl[0] == f"ALTER TABLE temporal_memories DETACH PARTITION {DEFAULT_PARTITION}"
+        assert ddl[1].startswith("CREATE TABLE temporal_memories_p2026_11")
+        assert ddl[2].startswith("WITH moved AS")
+        assert ddl[3] == (
+            f"ALTER TABLE temporal_memories ATTACH PARTITION {DEFAULT_PARTITION} DEFAULT"
+        )
+
+
+class TestRetention:
+    @pytest.mark.asyncio
+    async def test_disabled_by_default(self):
+        session = FakeSession(partitions={"temporal_memories_p2020_01"})
+        result = await TemporalPartitionManager().apply_retention(session, NOW)
+        assert result.detached == []
+        assert session.sql == []
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("action, dropped", [
+        ("detach", []),
+        ("drop", ["temporal_memories_p2026_08"]),
+    ])
+    async def test_retires_months_before_cutoff(self, action, dropped):
+        session = FakeSession(partitions={
+            "temporal_memories_p2026_08",
+            "temporal_memories_p2026_09",
+            "temporal_memories_p2026_11",
+        })
+        manager = TemporalPartitionManager(retain_months=2, retention_action=action)
+        result = await manager.apply_retention(session, NOW)
+
+        assert result.detached == ["temporal_memories_p2026_08"]
+        assert result.dropped == dropped
+        assert ("DROP TABLE temporal_memories_p2026_08" in session.sql) == (action == "drop")
+
+    def test_rejects_unknown_action(self):
+        with pytest.raises(ValueError):
+            TemporalPartitionManager(retention_action="archive")
+
+
+@pytest.mark.asyncio
+async def test_maintain_commits_once():
+    session = FakeSession()
+    result = await TemporalPartitionManager(months_ahead=1).maintain(session, NOW)
+    assert len(result.created) == 2
+    assert session.commits == 1
+
+
+def test_model_is_partitioned_with_generated_tsvector():
+    from kintsugi.models.base import TemporalMemory
+
+    ddl = str(CreateTable(TemporalMemory.__table__).compile(dialect=postgresql.dialect()))
+    assert "PARTITION BY RANGE (created_at)" in ddl
+    assert "GENERATED ALWAYS AS (to_tsvector('english', message)) STORED" in ddl
+    assert "PRIMARY KEY (id, created_at)" in ddl
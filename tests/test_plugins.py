@@ -685,7 +685,7 @@ class TestPluginSandbox:
     @pytest.mark.asyncio
     async def test_execute_runs_method(self):
         """Test execute() runs plugin method."""
-        sandbox = PluginSandbox()
+        sandbox = PluginSandbox(SandboxPolicy(allow_unisolated=True))
 
         # Create mock plugin
         mock_instance = MagicMock()
@@ -759,6 +759,319 @@ class TestPluginSandbox:
         assert d["execution_time_ms"] == 50.5
 
 
+# ===========================================================================
+# Process-isolated execution Tests
+# ===========================================================================
+
+WORKER_PLUGIN_SOURCE = """
+import asyncio
+import os
+import time
+
+
+class WorkerPlugin:
+    def handle(self, payload):
+        return {"echo": payload, "pid": os.getpid()}
+
+    async def double(self, x):
+        await asyncio.sleep(0)
+        return x * 2
+
+    def spin(self):
+        while True:
+            pass
+
+    def sleep(self):
+        time.sleep(30)
+
+    def interval(self):
+        start = time.monotonic()
+        time.sleep(0.05)
+        return start, time.monotonic()
+
+    def hog(self):
+        return len(bytearray(1 << 30))
+
+    def blocked(self):
+        import colorsys
+        return colorsys.__name__
+
+    def reverse(self, data):
+        return bytes(data)[::-1][:4], len(data)
+
+    def escape(self):
+        class Payload:
+            def __reduce__(self):
+                return (eval, ("__import__('os').getpid()",))
+
+        return {"payload": Payload()}
+
+    def set_counter(self, value):
+        self.counter = value
+
+
+from kintsugi.plugins.sdk import PluginBase
+
+
+class ConfiguredPlugin(PluginBase):
+    async def initialize(self):
+        await super().initialize()
+        self.greeting = "hello"
+
+    def whoami(self):
+        return self.config.get("user") if self.config else None, self.is_initialized
+"""
+
+
+def _load_worker_plugin(tmp_path: Path) -> LoadedPlugin:
+    """Load a plugin from a source file the way PluginLoader does."""
+    import importlib.util
+    import sys
+
+    module_path = tmp_path / "worker_plugin.py"
+    module_path.write_text(WORKER_PLUGIN_SOURCE)
+    spec = importlib.util.spec_from_file_location("worker_plugin", module_path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules["worker_plugin"] = module
+    spec.loader.exec_module(module)
+    return LoadedPlugin(
+        metadata=PluginMetadata(
+            name="worker_plugin",
+            version="1.0.0",
+            author="Test",
+            description="Test",
+        ),
+        module=module,
+        state=PluginState.LOADED,
+        plugin_class=module.WorkerPlugin,
+        instance=module.WorkerPlugin(),
+    )
+
+
+def _configured_plugin(worker_plugin: LoadedPlugin) -> LoadedPlugin:
+    module = worker_plugin.module
+    return LoadedPlugin(
+        metadata=worker_plugin.metadata,
+        module=module,
+        state=PluginState.LOADED,
+        plugin_class=module.ConfiguredPlugin,
+        instance=module.ConfiguredPlugin(),
+    )
+
+
+class TestProcessIsolation:
+    """Tests for PluginSandbox running plugins in worker processes."""
+
+    @pytest.fixture
+    async def sandbox(self):
+        sandbox = PluginSandbox(
+            SandboxPolicy(
+                max_cpu_seconds=1,
+                max_execution_time=10,
+                max_memory_mb=256,
+                allowed_imports=["json"],
+            ),
+            workers=2,
+        )
+        yield sandbox
+        await sandbox.close()
+
+    @pytest.fixture
+    def plugin(self, tmp_path):
+        return _load_worker_plugin(tmp_path)
+
+    @pytest.mark.asyncio
+    async def test_runs_in_worker_process(self, sandbox, plugin):
+        """Test sync and async methods run outside the server process."""
+        import os
+
+        result = await sandbox.execute(plugin, "handle", {"key": "value"})
+        assert result.success is True
+        assert result.result["echo"] == {"key": "value"}
+        assert result.result["pid"] != os.getpid()
+        assert result.violations == []
+
+        result = await sandbox.execute(plugin, "double", 21)
+        assert result.result == 42
+
+    @pytest.mark.asyncio
+    async def test_server_limits_untouched(self, sandbox, plugin):
+        """Test the server's rlimits and meta_path are never changed."""
+        import resource
+        import sys
+
+        before = (
+            resource.getrlimit(resource.RLIMIT_AS),
+            resource.getrlimit(resource.RLIMIT_CPU),
+            list(sys.meta_path),
+        )
+        calls = [sandbox.execute(plugin, "double", i) for i in range(10)]
+        results = await asyncio.gather(*calls)
+        assert [r.result for r in results] == [i * 2 for i in range(10)]
+        assert before == (
+            resource.getrlimit(resource.RLIMIT_AS),
+            resource.getrlimit(resource.RLIMIT_CPU),
+            list(sys.meta_path),
+        )
+
+    @pytest.mark.asyncio
+    async def test_cpu_limit(self, sandbox, plugin):
+        """Test CPU-bound calls are stopped and the sandbox keeps working."""
+        result = await sandbox.execute(plugin, "spin")
+        assert result.success is False
+        assert [v.violation_type for v in result.violations] == ["cpu_limit"]
+        assert (await sandbox.execute(plugin, "double", 1)).result == 2
+
+    @pytest.mark.asyncio
+    async def test_memory_limit(self, sandbox, plugin):
+        """Test allocations beyond max_memory_mb fail in the worker."""
+        result = await sandbox.execute(plugin, "hog")
+        assert result.success is False
+        assert [v.violation_type for v in result.violations] == ["memory_limit"]
+
+    @pytest.mark.asyncio
+    async def test_blocked_import(self, sandbox, plugin):
+        """Test the restricted importer is active inside the worker."""
+        result = await sandbox.execute(plugin, "blocked")
+        assert result.success is False
+        assert "blocked by sandbox policy" in result.error
+        assert [v.violation_type for v in result.violations] == ["blocked_import"]
+
+    @pytest.mark.asyncio
+    async def test_timeout_replaces_worker(self, plugin):
+        """Test wall-clock timeouts kill the worker."""
+        sandbox = PluginSandbox(SandboxPolicy(max_execution_time=0.5), workers=1)
+        try:
+            result = await sandbox.execute(plugin, "sleep")
+            assert result.success is False
+            assert "timed out" in result.error
+            assert (await sandbox.execute(plugin, "double", 2)).result == 4
+        finally:
+            await sandbox.close()
+
+    @pytest.mark.asyncio
+    async def test_large_buffers(self, sandbox, plugin):
+        """Test large binary arguments make the round trip."""
+        data = bytearray(b"x" * 5_000_000 + b"abcd")
+        result = await sandbox.execute(plugin, "reverse", data)
+        assert result.result == (b"dcba", len(data))
+
+    @pytest.mark.asyncio
+    async def test_reply_objects_never_unpickled_in_host(self, sandbox, plugin):
+        """Test a result with a malicious __reduce__ is refused, not run."""
+        import builtins
+
+        with patch.object(builtins, "eval", wraps=builtins.eval) as host_eval:
+            result = await sandbox.execute(plugin, "escape")
+        assert result.success is False
+        assert result.result is None
+        assert "builtins.eval" in result.error
+        assert [v.violation_type for v in result.violations] == ["unsafe_result"]
+        host_eval.assert_not_called()
+        assert (await sandbox.execute(plugin, "double", 3)).result == 6
+
+    @pytest.mark.asyncio
+    async def test_workers_recycled(self, plugin):
+        """Test workers are replaced after max_calls_per_worker calls."""
+        from kintsugi.plugins.worker_pool import PluginWorkerPool
+
+        pool = PluginWorkerPool(SandboxPolicy(), size=1, max_calls_per_worker=2)
+        try:
+            pids = [(await pool.call(plugin, "handle", i)).result["pid"] for i in range(4)]
+        finally:
+            await pool.close()
+        assert pids[0] == pids[1] != pids[2] == pids[3]
+
+    @pytest.mark.asyncio
+    async def test_per_plugin_concurrency_cap(self, plugin):
+        """Test one plugin cannot occupy more workers than its cap."""
+        from kintsugi.plugins.worker_pool import PluginWorkerPool
+
+        pool = PluginWorkerPool(
+            SandboxPolicy(), size=3, max_concurrent_per_plugin=1,
+        )
+        try:
+            results = await asyncio.gather(
+                *(pool.call(plugin, "interval") for _ in range(4))
+            )
+        finally:
+            await pool.close()
+        intervals = sorted(r.result for r in results)
+        assert all(a[1] <= b[0] for a, b in zip(intervals, intervals[1:]))
+
+    @pytest.mark.asyncio
+    async def test_set_policy_restarts_workers(self, sandbox, plugin):
+        """Test a new policy takes effect on the next call."""
+        first = await sandbox.execute(plugin, "handle", 1)
+        sandbox.set_policy(SandboxPolicy(allowed_imports=["json", "colorsys"]))
+        second = await sandbox.execute(plugin, "handle", 2)
+        assert first.result["pid"] != second.result["pid"]
+        assert (await sandbox.execute(plugin, "blocked")).success is True
+
+    @pytest.mark.asyncio
+    async def test_configuration_replayed_in_worker(self, sandbox, plugin):
+        """Test the worker instance gets the host's configure()/initialize()."""
+        configured = _configured_plugin(plugin)
+        assert (await sandbox.execute(configured, "whoami")).result == (None, False)
+
+        configured.instance.configure(PluginConfig(values={"user": "alice"}))
+        await configured.instance.initialize()
+        result = await sandbox.execute(configured, "whoami")
+        assert result.result == ("alice", True)
+        assert result.violations == []
+
+    @pytest.mark.asyncio
+    async def test_other_host_state_still_isolated(self, sandbox, plugin):
+        """Test host-side instance state never pulls a plugin into the server."""
+        import os
+        import threading
+
+        plugin.instance.set_counter(5)
+        plugin.instance._lock = threading.Lock()
+        result = await sandbox.execute(plugin, "handle", 1)
+        assert result.success is True
+        assert result.result["pid"] != os.getpid()
+        assert result.violations == []
+
+        result = await sandbox.execute(plugin, "blocked")
+        assert result.success is False
+        assert any(v.violation_type == "blocked_import" for v in result.violations)
+
+    @staticmethod
+    def _unimportable_plugin() -> LoadedPlugin:
+        return LoadedPlugin(
+            metadata=PluginMetadata(
+                name="inline_test",
+                version="1.0.0",
+                author="Test",
+                description="Test",
+            ),
+            module=MagicMock(),
+            state=PluginState.LOADED,
+            instance=MagicMock(handle=MagicMock(return_value="ok")),
+        )
+
+    @pytest.mark.asyncio
+    async def test_unimportable_plugin_fails_closed(self, sandbox):
+        """Test plugins without a source module are refused, not run in-process."""
+        loaded = self._unimportable_plugin()
+        result = await sandbox.execute(loaded, "handle")
+        assert result.success is False
+        assert [v.violation_type for v in result.violations] == ["not_isolated"]
+        assert result.violations[0].severity == "error"
+        loaded.instance.handle.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_unimportable_plugin_runs_inline_when_allowed(self, sandbox):
+        """Test allow_unisolated opts in to in-process execution with a warning."""
+        sandbox.set_policy(SandboxPolicy(allow_unisolated=True))
+        result = await sandbox.execute(self._unimportable_plugin(), "handle")
+        assert result.success is True
+        assert result.result == "ok"
+        assert [v.violation_type for v in result.violations] == ["not_isolated"]
+        assert result.violations[0].severity == "warning"
+
+
 # ===========================================================================
 # PluginRegistry Tests (10 tests)
 # ===========================================================================
@@ -1389,3 +1702,16 @@ class TestRestrictedImporter:
 
         assert len(importer.violations) == 1
         assert importer.violations[0].violation_type == "blocked_import"
+
+    def test_find_spec_blocks_import(self):
+        """Test find_spec() raises for blocked imports and defers otherwise."""
+        policy = SandboxPolicy(allowed_imports=["json"])
+        importer = RestrictedImporter(policy)
+
+        assert importer.find_spec("json") is None
+        with pytest.raises(ImportError):
+            importer.find_spec("smtplib")
+        assert len(importer.violations) == 1
+
+        importer.clear()
+        assert importer.violations == []
@@ -542,6 +542,66 @@ class TestSecurityMonitorSeverityOrdering:
         assert result.verdict == Verdict.BLOCK
 
 
+# =============================================================================
+# Test SecurityMonitor - Scan order, literal prefilter, profiling
+# =============================================================================
+
+class TestSecurityMonitorScanEngine:
+    """Severity-ordered scanning with early exit and literal skipping."""
+
+    def _profile(self, monitor):
+        return {p.description: p for p in monitor.pattern_profile()}
+
+    def test_stops_at_first_critical(self):
+        monitor = SecurityMonitor(profile=True)
+        result = monitor.check_command("sudo rm -rf /")
+
+        assert result.severity == Severity.CRITICAL
+        profile = self._profile(monitor)
+        assert profile["Recursive delete of root filesystem"].hits == 1
+        # HIGH patterns are never evaluated once a CRITICAL has matched.
+        assert "Privileged file deletion" not in profile
+
+    def test_first_registered_wins_within_severity(self):
+        monitor = SecurityMonitor()
+        result = monitor.check_command("shutdown now && chmod 777 /tmp")
+        assert result.reason == "World-writable permission change"
+
+    def test_literals_skip_regex_for_clean_text(self):
+        monitor = SecurityMonitor(profile=True)
+        monitor.check_text("Thanks for the update about the schedule")
+
+        profile = monitor.pattern_profile()
+        assert profile
+        assert all(p.checks == 0 and p.skipped == 1 for p in profile)
+
+    def test_non_ascii_text_is_not_prefiltered(self):
+        """Case-folding lookalikes still reach the regex."""
+        monitor = SecurityMonitor()
+        result = monitor.check_command("\u017fhutdown now")  # long s
+        assert result.verdict == Verdict.BLOCK
+
+    def test_custom_pattern_literals(self):
+        monitor = SecurityMonitor(profile=True)
+        monitor.add_pattern(r"exfil\w*", "CRITICAL", "Exfiltration", literals=["EXFIL"])
+        assert monitor.check_command("Exfiltrate the db").reason == "Exfiltration"
+        monitor.check_command("ls -la")
+        assert self._profile(monitor)["Exfiltration"].skipped == 1
+
+    def test_profile_counts_and_latency(self):
+        monitor = SecurityMonitor(profile=True)
+        for _ in range(3):
+            monitor.check_text("GET /a/../b")
+        stats = self._profile(monitor)["Simple path traversal"]
+        assert (stats.checks, stats.hits, stats.target) == (3, 3, "text")
+        assert stats.mean_us > 0
+
+    def test_profiling_off_by_default(self):
+        monitor = SecurityMonitor()
+        monitor.check_text("GET /a/../b")
+        assert monitor.pattern_profile() == []
+
+
 # =============================================================================
 # Test SecurityMonitor - Custom Patterns
 # =============================================================================
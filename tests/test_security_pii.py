@@ -23,9 +23,12 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from kintsugi.security.pii import (
     PIIDetection,
+    PIIEngine,
     RedactionResult,
     _luhn_check,
     PIIRedactor,
+    StreamingRedactor,
+    is_redactable,
     pii_redaction_middleware,
 )
 
@@ -332,6 +335,59 @@ class TestPIIDetectionEdgeCases:
         assert len(detections) == 1
 
 
+# =============================================================================
+# Test PIIEngine (single-pass scan)
+# =============================================================================
+
+class TestPIIEngine:
+    """Test the combined-alternation engine behind PIIRedactor.detect()."""
+
+    def test_clean_text_skips_regex_work(self):
+        """Text failing every prefilter never reaches a pattern regex."""
+        never = Mock()
+        never.pattern = "x"
+        never.flags = 0
+        never.groupindex = {}
+        engine = PIIEngine([{"type": "X", "regex": never, "requires": "@"}])
+        assert engine.scan("no at-sign or digits here") == []
+        never.search.assert_not_called()
+
+    def test_alternation_limited_to_prefiltered_patterns(self):
+        """Only patterns whose prefilter passes are compiled into the scan."""
+        redactor = PIIRedactor()
+        redactor.detect("call 555-123-4567")  # digits only: no EMAIL, no DOB
+        redactor.detect("mail a@b.co")  # "@" only: EMAIL alone
+        redactor.detect("a@b.co, DOB: 1/2/1990")
+        assert list(redactor._engine._compiled) == [(1, 2, 3, 4), (0,), (0, 1, 2, 3, 4, 5)]
+
+    def test_validator_failure_falls_back_to_next_pattern(self):
+        """A rejected match lets later patterns match at the same position."""
+        patterns = [
+            {"type": "FIRST", "regex": re.compile(r"\d{4}"), "validator": lambda v: False},
+            {"type": "SECOND", "regex": re.compile(r"\d{2}")},
+        ]
+        detections = PIIEngine(patterns).scan("ab 1234")
+        assert [(d.pii_type, d.original) for d in detections] == [
+            ("SECOND", "12"), ("SECOND", "34"),
+        ]
+
+    def test_inline_flags_are_scoped(self):
+        """A pattern's inline flags do not leak into other patterns."""
+        patterns = [
+            {"type": "KW", "regex": re.compile(r"(?i)secret")},
+            {"type": "UPPER", "regex": re.compile(r"ABC")},
+        ]
+        found = PIIEngine(patterns).scan("SeCrEt abc ABC")
+        assert [(d.pii_type, d.original) for d in found] == [("KW", "SeCrEt"), ("UPPER", "ABC")]
+
+    def test_backreference_pattern_scanned_separately(self):
+        """Patterns that cannot be folded into the alternation still match."""
+        extra = [{"type": "REPEAT", "regex": re.compile(r"\b(\w+) \1\b")}]
+        redactor = PIIRedactor(extra_patterns=extra)
+        detections = redactor.detect("say bye bye to a@b.co")
+        assert [d.pii_type for d in detections] == ["REPEAT", "EMAIL"]
+
+
 # =============================================================================
 # Test PIIRedactor with extra_patterns
 # =============================================================================
@@ -466,9 +522,20 @@ class TestPIIRedactionRemoveMode:
         text = "test@test.com555-123-4567"  # No space between
         result = redactor.redact(text, mode="remove")
 
-        assert result.detections_count == 2
+        # The email pattern's domain part swallows the digits, so the phone
+        # number is inside the email span and is not reported a second time.
+        assert result.detections_count == 1
         assert result.redacted_text == ""
 
+    def test_redact_overlap_not_double_counted(self):
+        """Overlapping matches are resolved to a single, leftmost span."""
+        redactor = PIIRedactor()
+        text = "Mail test@test.com555-123-4567 now"
+        result = redactor.redact(text, mode="mask")
+
+        assert result.redacted_text == "Mail [REDACTED_EMAIL] now"
+        assert result.types_found == ["EMAIL"]
+
 
 # =============================================================================
 # Test PIIRedactor.redact() - Edge Cases
@@ -582,6 +649,113 @@ class TestPIIRedactionMiddleware:
         assert callable(middleware)
 
 
+# =============================================================================
+# Test StreamingRedactor and the streaming middleware
+# =============================================================================
+
+def _feed_in_chunks(stream, text, size):
+    out = [stream.feed(text[i:i + size]) for i in range(0, len(text), size)]
+    return "".join(out) + stream.flush()
+
+
+class TestStreamingRedactor:
+    """Chunked redaction must match redacting the whole text at once."""
+
+    TEXT = (
+        "Reach maria.lopez@example.org or (555) 123-4567. "
+        + "Nothing to see here. " * 30
+        + "SSN 123-45-6789, card 4532 0151 1283 0366, host 192.168.10.24, "
+        + "DOB: 04/17/1986 and 5551234567"
+    )
+
+    @pytest.mark.parametrize("size", [1, 3, 7, 64, 10_000])
+    def test_matches_whole_text_redaction(self, size):
+        redactor = PIIRedactor()
+        stream = StreamingRedactor(redactor)
+        expected = redactor.redact(self.TEXT)
+
+        assert _feed_in_chunks(stream, self.TEXT, size) == expected.redacted_text
+        assert stream.detections_count == expected.detections_count
+        assert stream.types_found == expected.types_found
+
+    def test_holds_back_only_the_window(self):
+        stream = StreamingRedactor(window=10)
+        out = stream.feed("a" * 25 + " 555-12")
+        assert out == "a" * 22
+        assert stream.feed("3-4567 done") + stream.flush() == "aaa [REDACTED_PHONE] done"
+
+    def test_remove_mode(self):
+        stream = StreamingRedactor(mode="remove")
+        assert _feed_in_chunks(stream, "mail a@b.co now", 4) == "mail  now"
+
+    def test_boundary_releases_complete_events(self):
+        stream = StreamingRedactor(boundary="\n\n")
+        out = stream.feed("data: call 555-123-4567\n\ndata: par")
+        assert out == "data: call [REDACTED_PHONE]\n\n"
+        assert stream.flush() == "data: par"
+
+    def test_is_redactable(self):
+        assert is_redactable({"content-type": "application/json"})
+        assert is_redactable({"content-type": "text/event-stream", "content-encoding": "identity"})
+        assert not is_redactable({"content-type": "application/json", "content-encoding": "gzip"})
+        assert not is_redactable({"content-type": "image/png"})
+
+
+class TestStreamingMiddleware:
+    """The middleware factory streams bodies instead of buffering them."""
+
+    def _app(self, response_factory):
+        from fastapi import FastAPI
+
+        app = FastAPI()
+
+        @app.get("/stream")
+        async def stream():
+            return response_factory()
+
+        app.middleware("http")(pii_redaction_middleware())
+        return app
+
+    async def _get(self, app, path="/stream"):
+        from httpx import ASGITransport, AsyncClient
+
+        transport = ASGITransport(app=app)
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            return await client.get(path)
+
+    @pytest.mark.asyncio
+    async def test_sse_is_redacted_incrementally(self):
+        from starlette.responses import StreamingResponse
+
+        sent = []
+
+        async def events():
+            for chunk in ["data: mail a@b", ".co\n\n", "data: ok\n\n"]:
+                sent.append(chunk)
+                yield chunk.encode("utf-8")
+
+        app = self._app(lambda: StreamingResponse(events(), media_type="text/event-stream"))
+        r = await self._get(app)
+
+        assert r.text == "data: mail [REDACTED_EMAIL]\n\ndata: ok\n\n"
+        assert "content-length" not in r.headers
+        assert len(sent) == 3
+
+    @pytest.mark.asyncio
+    async def test_compressed_body_passes_through_unread(self):
+        from starlette.responses import Response
+
+        import gzip
+
+        raw = gzip.compress(b'{"email": "a@b.co"}')
+        app = self._app(lambda: Response(
+            raw, media_type="application/json", headers={"content-encoding": "gzip"},
+        ))
+        r = await self._get(app)
+        assert r.headers["content-length"] == str(len(raw))
+        assert r.json() == {"email": "a@b.co"}
+
+
 # =============================================================================
 # Integration Tests
 # =============================================================================
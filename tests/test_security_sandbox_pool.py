@@ -0,0 +1,144 @@
+"""Tests for kintsugi.security.sandbox_pool (warm sandbox workers)."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import signal
+
+import pytest
+
+from kintsugi.security.sandbox import ShadowSandbox
+from kintsugi.security import sandbox_pool
+from kintsugi.security.sandbox_pool import SandboxPool
+
+
+@pytest.fixture
+async def pool(tmp_path):
+    async with SandboxPool(size=2, base_dir=str(tmp_path), timeout=5) as p:
+        yield p
+
+
+class TestExecution:
+    @pytest.mark.asyncio
+    async def test_stdout_and_exit_code(self, pool):
+        result = await pool.run("import sys\nprint('hello')\nsys.exit(3)")
+        assert result.stdout == "hello\n"
+        assert result.exit_code == 3
+        assert not result.timed_out and not result.output_truncated
+
+    @pytest.mark.asyncio
+    async def test_errors_are_reported_like_the_interpreter(self, pool):
+        runtime = await pool.run("x = 1\n1 / 0")
+        syntax = await pool.run("def f(:\n    pass")
+        assert runtime.exit_code == 1 and "ZeroDivisionError" in runtime.stderr
+        assert 'script.py", line 2' in runtime.stderr
+        assert syntax.exit_code == 1 and "SyntaxError" in syntax.stderr
+
+    @pytest.mark.asyncio
+    async def test_environment_matches_cold_path(self, pool):
+        code = "import os\nprint(os.getcwd() == os.environ['HOME'], sorted(os.environ))"
+        result = await pool.run(code)
+        assert result.stdout.startswith("True")
+        assert result.stdout == ShadowSandbox().execute_in_sandbox(code).stdout
+
+
+class TestIsolation:
+    @pytest.mark.asyncio
+    async def test_directory_reset_between_jobs(self):
+        async with SandboxPool(size=1) as pool:
+            await pool.run("open('left.txt', 'w').write('x')\nimport os\nos.mkdir('d')")
+            result = await pool.run("import os\nprint(sorted(os.listdir('.')))")
+        assert result.stdout == "['script.py']\n"
+
+    @pytest.mark.asyncio
+    async def test_jobs_do_not_share_interpreter_state(self):
+        async with SandboxPool(size=1) as pool:
+            await pool.run("import builtins\nbuiltins.leak = 1")
+            result = await pool.run("import builtins\nprint(hasattr(builtins, 'leak'))")
+        assert result.stdout == "False\n"
+
+    @pytest.mark.asyncio
+    async def test_background_processes_are_killed(self, pool, tmp_path):
+        marker = tmp_path / "survived"
+        code = (
+            "import subprocess\n"
+            f"subprocess.Popen(['sh', '-c', 'sleep 1; touch {marker}'])\n"
+            "print('started')"
+        )
+        assert (await pool.run(code)).stdout == "started\n"
+        await asyncio.sleep(1.5)
+        assert not marker.exists()
+
+
+class TestLimits:
+    @pytest.mark.asyncio
+    async def test_timeout_kills_job_and_worker_survives(self):
+        async with SandboxPool(size=1) as pool:
+            result = await pool.run("while True:\n    pass", timeout=0.5)
+            after = await pool.run("print('ok')")
+        assert result.timed_out and result.exit_code == -1
+        assert "timed out" in result.stderr
+        assert after.stdout == "ok\n"
+
+    @pytest.mark.asyncio
+    async def test_unresponsive_worker_is_stopped_after_timeout(self, monkeypatch):
+        monkeypatch.setattr(sandbox_pool, "KILL_GRACE", 0.2)
+        async with SandboxPool(size=1) as pool:
+            worker = pool._workers[0]
+            # The kill never lands, so the worker never reports the job.
+            stuck: list[int] = []
+            monkeypatch.setattr(worker, "_kill_job", lambda: stuck.append(worker._job_pid))
+            try:
+                result = await asyncio.wait_for(
+                    pool.run("while True:\n    pass", timeout=0.3), 5
+                )
+                assert result.timed_out and result.exit_code == -1
+                assert not worker.alive
+            finally:
+                for pid in set(stuck) - {None}:
+                    os.killpg(pid, signal.SIGKILL)
+            monkeypatch.undo()
+            after = await pool.run("print('ok')")
+        assert after.stdout == "ok\n"
+
+    @pytest.mark.asyncio
+    async def test_output_is_capped(self, pool):
+        result = await pool.run("print('x' * 100000)", max_output=1000)
+        assert result.stdout == "x" * 1000
+        assert result.output_truncated
+        assert result.exit_code == 0
+
+    @pytest.mark.asyncio
+    async def test_dead_worker_is_replaced(self):
+        async with SandboxPool(size=1) as pool:
+            await pool.run("import os, signal\nos.kill(os.getppid(), signal.SIGKILL)")
+            result = await pool.run("print('back')")
+        assert result.stdout == "back\n"
+
+
+class TestConcurrency:
+    @pytest.mark.asyncio
+    async def test_many_jobs_on_few_workers(self, pool):
+        results = await asyncio.gather(*(pool.run(f"print({i} * 2)") for i in range(20)))
+        assert [r.stdout for r in results] == [f"{i * 2}\n" for i in range(20)]
+
+    @pytest.mark.asyncio
+    async def test_close_removes_worker_dirs(self, tmp_path):
+        pool = SandboxPool(size=2, base_dir=str(tmp_path))
+        await pool.run("print(1)")
+        assert len(os.listdir(tmp_path)) == 2
+        await pool.close()
+        assert os.listdir(tmp_path) == []
+
+
+@pytest.mark.asyncio
+async def test_shadow_sandbox_execute_uses_pool(tmp_path):
+    sandbox = ShadowSandbox(base_dir=str(tmp_path), pool_size=1)
+    try:
+        first = await sandbox.execute("print('a')")
+        second = await sandbox.execute("print('b')")
+    finally:
+        await sandbox.close_pool()
+    assert (first.stdout, second.stdout) == ("a\n", "b\n")
+    assert sandbox.execute_in_sandbox("print('cold')").stdout == "cold\n"
@@ -0,0 +1,123 @@
+"""Tests for kintsugi.security.scan_cache (shared verdict cache)."""
+
+from __future__ import annotations
+
+import pytest
+
+from kintsugi.security.monitor import SecurityMonitor, Verdict
+from kintsugi.security.pii import PIIRedactor
+from kintsugi.security.scan_cache import MISS, ScanCache
+
+SSN_TEXT = "The applicant listed SSN 123-45-6789 and maria@example.org on the form."
+
+
+class TestScanCache:
+    def test_lru_eviction_and_stats(self):
+        cache = ScanCache(max_entries=2)
+        keys = [cache.key("ns", t) for t in ("a", "b", "c")]
+        cache.put(keys[0], 1)
+        cache.put(keys[1], 2)
+        assert cache.get(keys[0]) == 1  # "a" is now most recent
+        cache.put(keys[2], 3)
+
+        assert cache.get(keys[1]) is MISS
+        assert cache.get(keys[2]) == 3
+        assert len(cache) == 2
+        info = cache.info()
+        assert (info["hits"], info["misses"], info["evictions"]) == (2, 1, 1)
+        assert info["hit_rate"] == pytest.approx(2 / 3, abs=1e-4)
+
+    def test_none_is_a_cached_value(self):
+        cache = ScanCache()
+        key = cache.key("ns", "clean")
+        cache.put(key, None)
+        assert cache.get(key) is None
+
+    def test_long_texts_bypass(self):
+        cache = ScanCache(max_text_length=10)
+        assert cache.key("ns", "x" * 11) is None
+        assert cache.stats.bypassed == 1
+
+    def test_digests_are_keyed_per_cache(self):
+        assert ScanCache().key("ns", "hello") != ScanCache().key("ns", "hello")
+
+    def test_rejects_empty_cache(self):
+        with pytest.raises(ValueError):
+            ScanCache(max_entries=0)
+
+
+class TestMonitorCache:
+    def test_hit_returns_same_verdict(self):
+        cache = ScanCache()
+        monitor = SecurityMonitor(cache=cache)
+        text = "x'; DROP TABLE users; --"
+        first = monitor.check_text(text)
+        second = monitor.check_text(text)
+
+        assert first == second == SecurityMonitor().check_text(text)
+        assert second.matched_pattern == "; DROP "
+        assert cache.stats.hits == 1
+
+    def test_allow_is_cached(self):
+        cache = ScanCache()
+        monitor = SecurityMonitor(cache=cache)
+        for _ in range(3):
+            assert monitor.check_command("ls -la").verdict == Verdict.ALLOW
+        assert (cache.stats.misses, cache.stats.hits) == (1, 2)
+
+    def test_targets_do_not_share_entries(self):
+        monitor = SecurityMonitor(cache=ScanCache())
+        assert monitor.check_text("rm -rf /").verdict == Verdict.ALLOW
+        assert monitor.check_command("rm -rf /").verdict == Verdict.BLOCK
+
+    def test_add_pattern_invalidates(self):
+        cache = ScanCache()
+        monitor = SecurityMonitor(cache=cache)
+        assert monitor.check_command("nc -l 4444").verdict == Verdict.ALLOW
+        version = monitor.library_version
+
+        monitor.add_pattern(r"\bnc\s+-l\b", "HIGH", "Netcat listener")
+        assert monitor.library_version != version
+        assert monitor.check_command("nc -l 4444").verdict == Verdict.BLOCK
+
+    def test_identical_libraries_share_entries(self):
+        cache = ScanCache()
+        SecurityMonitor(cache=cache).check_command("chmod 777 /srv")
+        verdict = SecurityMonitor(cache=cache).check_command("chmod 777 /srv")
+        assert verdict.verdict == Verdict.BLOCK
+        assert cache.stats.hits == 1
+
+
+class TestRedactorCache:
+    def test_hit_rebuilds_detections(self):
+        cache = ScanCache()
+        redactor = PIIRedactor(cache=cache)
+        first = redactor.redact(SSN_TEXT)
+        second = redactor.redact(SSN_TEXT, mode="remove")
+
+        assert first.redacted_text == PIIRedactor().redact(SSN_TEXT).redacted_text
+        assert "123-45-6789" not in second.redacted_text
+        assert second.types_found == first.types_found
+        assert redactor.detect(SSN_TEXT) == PIIRedactor().detect(SSN_TEXT)
+        assert cache.stats.hits == 2
+
+    def test_no_raw_pii_in_cache(self):
+        cache = ScanCache()
+        PIIRedactor(cache=cache).redact(SSN_TEXT)
+        SecurityMonitor(cache=cache).check_text(SSN_TEXT)
+
+        stored = repr(list(cache._entries.items()))
+        for value in ("123-45-6789", "maria@example.org", "123456789", "maria"):
+            assert value not in stored
+        assert b"123-45-6789" not in b"".join(digest for _, digest in cache._entries)
+
+    def test_extra_patterns_get_their_own_namespace(self):
+        import re
+
+        cache = ScanCache()
+        PIIRedactor(cache=cache).redact("badge K-4411 issued")
+        custom = PIIRedactor(
+            extra_patterns=[{"type": "BADGE", "regex": re.compile(r"K-\d{4}"), "validator": None}],
+            cache=cache,
+        )
+        assert custom.redact("badge K-4411 issued").types_found == ["BADGE"]
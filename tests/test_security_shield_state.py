@@ -0,0 +1,311 @@
+"""Tests for kintsugi.security.shield_state and Shield.admit (shared state)."""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import os
+import uuid
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock
+
+import pytest
+from redis.exceptions import NoScriptError
+
+from kintsugi.security.shield import Shield, ShieldConfig, ShieldDecision
+from kintsugi.security.shield_state import (
+    ADMIT_SCRIPT,
+    RESULT_SCRIPT,
+    Admission,
+    InProcessShieldState,
+    RedisShieldState,
+)
+
+
+class FakeRedis:
+    """Local stand-in for a Redis server, running the Shield scripts in Python.
+
+    Mirrors the Lua in shield_state line by line, including string storage
+    and redis-py's NoScriptError, and yields to the loop on every command
+    as a network client would.  Only used to interleave many concurrent
+    admissions; the scripts themselves run against ``lua_client``.
+    """
+
+    def __init__(self) -> None:
+        self.data: dict[str, object] = {}
+        self.loaded: set[str] = set()
+        self.calls = 0
+
+    async def script_load(self, script: str) -> str:
+        sha = hashlib.sha1(script.encode()).hexdigest()
+        self.loaded.add(sha)
+        return sha
+
+    async def evalsha(self, sha: str, numkeys: int, *keys_and_args):
+        await asyncio.sleep(0)
+        self.calls += 1
+        if sha not in self.loaded:
+            raise NoScriptError("No matching script. Please use EVAL.")
+        keys, args = keys_and_args[:numkeys], [str(a) for a in keys_and_args[numkeys:]]
+        if sha == hashlib.sha1(ADMIT_SCRIPT.encode()).hexdigest():
+            return self._admit(keys, args)
+        assert sha == hashlib.sha1(RESULT_SCRIPT.encode()).hexdigest()
+        if args[0] == "0":
+            count = int(self.data.get(keys[0], "0")) + 1
+            self.data[keys[0]] = str(count)
+            return count
+        self.data[keys[0]] = "0"
+        return 0
+
+    def _admit(self, keys, args) -> int:
+        now, cost = float(args[0]), float(args[1])
+        threshold, rate, burst = float(args[5]), float(args[6]), float(args[7])
+        if cost > 0:
+            session = float(self.data.get(keys[0], "0"))
+            daily = float(self.data.get(keys[1], "0"))
+            if session + cost > float(args[2]) or daily + cost > float(args[3]):
+                return 1
+        if threshold >= 0 and float(self.data.get(keys[2], "0")) >= threshold:
+            return 2
+        if burst >= 0:
+            bucket = self.data.get(keys[3], {})
+            tokens = float(bucket.get("tokens", burst))
+            last = float(bucket.get("last", now))
+            tokens = min(burst, tokens + max(0.0, now - last) * rate / 1000)
+            allowed = tokens >= 1
+            if allowed:
+                tokens -= 1
+            self.data[keys[3]] = {"tokens": str(tokens), "last": str(now)}
+            if not allowed:
+                return 3
+        if cost > 0:
+            for key in keys[:2]:
+                self.data[key] = str(float(self.data.get(key, "0")) + cost)
+        return 0
+
+    async def get(self, key: str):
+        value = self.data.get(key)
+        return value.encode() if isinstance(value, str) else None
+
+    async def delete(self, key: str) -> None:
+        self.data.pop(key, None)
+
+
+CONFIG = ShieldConfig(
+    budget_session_limit=10.0,
+    budget_daily_limit=100.0,
+    egress_allowlist=["example.org"],
+    rate_limits={"search": {"rate": 0.0, "burst": 3}},
+    circuit_breaker_threshold=2,
+)
+
+
+LUA_BACKENDS = ["fakeredis", "server"]
+
+
+@asynccontextmanager
+async def _lua_backend(kind: str):
+    """A client whose server runs ADMIT_SCRIPT and RESULT_SCRIPT for real.
+
+    ``fakeredis`` needs its Lua extra (``lupa``); ``server`` needs a Redis
+    at ``KINTSUGI_TEST_REDIS_URL``.  Each skips when unavailable.  Yields
+    the client and a RedisShieldState under a per-test key prefix, whose
+    keys are deleted afterwards.
+    """
+    if kind == "fakeredis":
+        fakeredis = pytest.importorskip("fakeredis")
+        pytest.importorskip("lupa")
+        client = fakeredis.FakeAsyncRedis()
+    else:
+        url = os.environ.get("KINTSUGI_TEST_REDIS_URL")
+        if not url:
+            pytest.skip("KINTSUGI_TEST_REDIS_URL not set")
+        import redis.asyncio as redis_asyncio
+
+        client = redis_asyncio.from_url(url)
+        try:
+            await client.ping()
+        except Exception as exc:
+            await client.aclose()
+            pytest.skip(f"Redis not reachable at {url}: {exc}")
+    prefix = f"kintsugi-test:{uuid.uuid4().hex}"
+    try:
+        yield client, RedisShieldState(client, prefix=prefix)
+    finally:
+        async for key in client.scan_iter(match=f"{prefix}:*"):
+            await client.delete(key)
+        await client.aclose()
+
+
+@pytest.fixture(params=LUA_BACKENDS)
+async def lua(request):
+    async with _lua_backend(request.param) as backend:
+        yield backend
+
+
+@pytest.fixture(params=["memory", *LUA_BACKENDS])
+async def state(request):
+    if request.param == "memory":
+        yield InProcessShieldState()
+        return
+    async with _lua_backend(request.param) as (_, redis_state):
+        yield redis_state
+
+
+class TestSharedState:
+    @pytest.mark.asyncio
+    async def test_workers_share_one_budget(self, state):
+        workers = [Shield(CONFIG, state=state, scope="org-1") for _ in range(4)]
+        verdicts = [await w.admit("llm", cost=3.0) for w in workers]
+        assert [v.decision for v in verdicts].count(ShieldDecision.ALLOW) == 3
+        assert "Budget exceeded" in verdicts[-1].reason
+        assert await state.spent("org-1") == (9.0, 9.0)
+
+    @pytest.mark.asyncio
+    async def test_workers_share_one_bucket(self, state):
+        workers = [Shield(CONFIG, state=state) for _ in range(2)]
+        allowed = [
+            (await workers[i % 2].admit("q", tool="search")).decision == ShieldDecision.ALLOW
+            for i in range(5)
+        ]
+        assert allowed == [True, True, True, False, False]
+
+    @pytest.mark.asyncio
+    async def test_breaker_trips_for_every_worker(self, state):
+        a, b = Shield(CONFIG, state=state), Shield(CONFIG, state=state)
+        await a.record_result("fetch", success=False)
+        await b.record_result("fetch", success=False)
+        verdict = await a.admit("x", tool="fetch")
+        assert "Circuit breaker open" in verdict.reason
+        assert await state.failures("default", "fetch") == 2
+
+        await b.reset_circuit("fetch")
+        assert (await a.admit("x", tool="fetch")).decision == ShieldDecision.ALLOW
+
+    @pytest.mark.asyncio
+    async def test_blocked_action_reserves_nothing(self, state):
+        shield = Shield(CONFIG, state=state, scope="s")
+        for _ in range(3):
+            await shield.admit("q", cost=1.0, tool="search")
+        verdict = await shield.admit("q", cost=1.0, tool="search")
+        assert "Rate limit" in verdict.reason
+        assert await state.spent("s") == (3.0, 3.0)
+
+    @pytest.mark.asyncio
+    async def test_concurrent_admissions_never_overspend(self, state):
+        shield = Shield(CONFIG, state=state)
+        verdicts = await asyncio.gather(*(shield.admit("llm", cost=1.0) for _ in range(50)))
+        assert sum(v.decision == ShieldDecision.ALLOW for v in verdicts) == 10
+        assert (await state.spent("default"))[0] == 10.0
+
+    @pytest.mark.asyncio
+    async def test_interleaved_admissions_never_overspend(self):
+        state = RedisShieldState(FakeRedis())
+        shields = [Shield(CONFIG, state=state) for _ in range(4)]
+        verdicts = await asyncio.gather(
+            *(shields[i % 4].admit("llm", cost=1.0) for i in range(50))
+        )
+        assert sum(v.decision == ShieldDecision.ALLOW for v in verdicts) == 10
+        assert (await state.spent("default"))[0] == 10.0
+
+    @pytest.mark.asyncio
+    async def test_scopes_are_independent(self, state):
+        await Shield(CONFIG, state=state, scope="a").admit("llm", cost=10.0)
+        verdict = await Shield(CONFIG, state=state, scope="b").admit("llm", cost=10.0)
+        assert verdict.decision == ShieldDecision.ALLOW
+
+
+class TestAdmit:
+    @pytest.mark.asyncio
+    async def test_local_admit_records_spend(self):
+        shield = Shield(CONFIG)
+        assert (await shield.admit("llm", cost=4.0)).decision == ShieldDecision.ALLOW
+        assert shield.budget.session_spent == 4.0
+        await shield.record_result("fetch", success=False)
+        assert shield.circuit_breaker._failures["fetch"] == 1
+
+    @pytest.mark.asyncio
+    async def test_egress_checked_locally(self):
+        client = AsyncMock()
+        shield = Shield(CONFIG, state=RedisShieldState(client))
+        verdict = await shield.admit("fetch", url="https://evil.test/x")
+        assert "Egress blocked" in verdict.reason
+        client.evalsha.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_budget_reported_before_egress(self, state):
+        shield = Shield(CONFIG, state=state)
+        local = Shield(CONFIG).check_action("fetch", cost=50.0, url="https://evil.test/x")
+        verdict = await shield.admit("fetch", cost=50.0, url="https://evil.test/x")
+        assert verdict == local
+        assert "Budget exceeded" in verdict.reason
+        assert await state.spent("default") == (0.0, 0.0)
+
+    @pytest.mark.asyncio
+    async def test_configured_backend_used_by_default(self, monkeypatch):
+        from kintsugi.security import shield_state
+
+        shared = InProcessShieldState()
+        monkeypatch.setattr(shield_state, "_state", shared)
+        assert Shield(CONFIG).state is shared
+        assert Shield(CONFIG, state=None).state is shared
+        monkeypatch.setattr(shield_state, "_state", None)
+        assert Shield(CONFIG).state is None
+
+    @pytest.mark.asyncio
+    async def test_daily_spend_rolls_over(self):
+        state = InProcessShieldState()
+        day = 1_760_000_000.0
+        assert await state.admit("s", None, Admission(90.0, 1000.0, 100.0, now=day)) is None
+        assert await state.admit("s", None, Admission(20.0, 1000.0, 100.0, now=day)) == "budget"
+        tomorrow = day + 86_400
+        assert await state.admit("s", None, Admission(20.0, 1000.0, 100.0, now=tomorrow)) is None
+        assert await state.spent("s", now=tomorrow) == (110.0, 20.0)
+
+
+
+class TestRedisScripts:
+    """ADMIT_SCRIPT and RESULT_SCRIPT on a real Lua interpreter."""
+
+    @pytest.mark.asyncio
+    async def test_keys_share_a_hash_tag_and_expire(self, lua):
+        lua_client, redis_state = lua
+        shield = Shield(CONFIG, state=redis_state, scope="org-9")
+        await shield.admit("q", cost=1.0, tool="search")
+        await shield.record_result("fetch", success=False)
+        keys = [key async for key in lua_client.scan_iter(match=f"{redis_state._prefix}:*")]
+        assert len(keys) == 4
+        assert all(b"{org-9}" in key for key in keys)
+        assert all([await lua_client.ttl(key) > 0 for key in keys])
+
+    @pytest.mark.asyncio
+    async def test_scripts_reload_after_flush(self, lua):
+        lua_client, redis_state = lua
+        shield = Shield(CONFIG, state=redis_state)
+        await shield.admit("llm", cost=1.0)
+        await lua_client.script_flush()
+        assert (await shield.admit("llm", cost=1.0)).decision == ShieldDecision.ALLOW
+        assert await redis_state.record_result("default", "fetch", False) == 1
+        assert await redis_state.spent("default") == (2.0, 2.0)
+
+    @pytest.mark.asyncio
+    async def test_scripts_match_in_process_state(self, lua):
+        _, redis_state = lua
+        reference = InProcessShieldState()
+        now = 1_760_000_000.0
+        search = dict(threshold=2, rate=1.0, burst=2.0)
+        admissions = [
+            ("search", Admission(4.0, 10.0, 100.0, **search, now=now)),
+            ("search", Admission(4.0, 10.0, 100.0, **search, now=now)),
+            ("search", Admission(1.0, 10.0, 100.0, **search, now=now)),
+            ("search", Admission(1.0, 10.0, 100.0, **search, now=now + 1.5)),
+            ("llm", Admission(5.0, 10.0, 100.0, now=now + 2)),
+            (None, Admission(1.0, 10.0, 100.0, now=now + 3)),
+        ]
+        for tool, admission in admissions:
+            assert await redis_state.admit("s", tool, admission) \
+                == await reference.admit("s", tool, admission)
+        for success in (False, False, True, False):
+            assert await redis_state.record_result("s", "fetch", success) \
+                == await reference.record_result("s", "fetch", success)
+        assert await redis_state.spent("s", now=now) == await reference.spent("s", now=now)